@@ -0,0 +1,9 @@
+"""
+Türkçe POS & Semantic Analyzer - Python API paketi
+
+Ağır bağımlılıklar (stanza, torch) import sırasında yüklenmez; model ilk
+analizde ya da ``warmup()`` çağrısında yüklenir. Modülleri doğrudan import edin:
+
+    from api.pos_semantic_analyzer import analyze_text
+    from api.main import check_sentence, detect_minimalist_errors
+"""
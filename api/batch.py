@@ -0,0 +1,572 @@
+"""
+Toplu Analiz (Batch/CLI) - Tekrar Eden Cümlelerin Elenmesi
+==========================================================
+
+Haber ve sosyal medya akışlarında cümlelerin önemli bir kısmı birebir veya
+neredeyse aynıdır (retweet, ajans metni). Bu modül Stanza'dan önce bir ön
+işleme aşaması ekler:
+
+1. Metin cümlelere bölünür (kısaltma ve sıra sayısı noktalarında bölünmez)
+2. Birebir tekrarlar normalize edilmiş (boşluk, noktalama) anahtarla bulunur
+3. (Opsiyonel) Yakın tekrarlar MinHash + LSH ile bulunur
+4. Her benzersiz cümlenin ilk görülen özgün hali bir kez analiz edilir,
+   sonuç tüm tekrarlara dağıtılır (normalize hal yalnızca anahtardır)
+
+Kullanım:
+    from api.batch import analyze_corpus
+
+    result = analyze_corpus(documents, near_duplicates=True)
+    result["documents"][0]["sentences"]     # analyze_text formatında
+    result["report"]["saved_ratio"]         # elenen iş oranı
+
+CLI (her satır bir doküman, çıktı JSONL):
+    python -m api.batch haberler.txt -o sonuc.jsonl --near-duplicates
+"""
+
+import argparse
+import re
+import sys
+import time
+import unicodedata
+import zlib
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from api.projection import Fields, parse_fields
+from src.centering import analyze_centering
+from src.instrumentation import stage
+from src.mentions import turkish_lower
+from src.serialization import JsonlWriter
+from src.tracing import (
+    JsonlSpanExporter, Span, disable_tracing, enable_tracing, finish_span, new_span, span,
+)
+
+# Varsayılan yakın-tekrar eşiği (tahmini Jaccard benzerliği)
+DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.9
+
+# MinHash parametreleri: 64 permütasyon = 16 bant x 4 satır
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Noktalama normalizasyonu: tipografik varyantlar -> ASCII karşılıkları
+_PUNCTUATION_MAP = str.maketrans({
+    '‘': "'", '’': "'", '‛': "'", '´': "'", '`': "'",
+    '“': '"', '”': '"', '„': '"', '«': '"', '»': '"',
+    '–': '-', '—': '-', '−': '-',
+    '…': '...',
+    '\u00a0': ' ', '\u200b': '',   # NBSP, zero-width space
+})
+_WHITESPACE = re.compile(r'\s+')
+_REPEATED_PUNCT = re.compile(r'([!?,;:])\1+')
+_SPACE_BEFORE_PUNCT = re.compile(r'\s+([.,;:!?])')
+
+# Stanza öncesi cümle sınırı adayı: . ! ? sonrası boşluk + büyük harf / tırnak
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=["\'(]?[A-ZÇĞİÖŞÜ0-9])')
+
+# Noktası cümle bitirmeyen kısaltmalar (küçük harf, noktasız)
+_ABBREVIATIONS = frozenset({
+    'dr', 'prof', 'doç', 'yrd', 'öğr', 'gör', 'arş', 'av', 'op', 'uzm', 'müh',
+    'sn', 'hz', 'gen', 'org', 'korg', 'tümg', 'tuğg', 'alb', 'yzb', 'bşk', 'müd',
+    'mah', 'cad', 'sok', 'bul', 'apt', 'blv', 'no', 'tel', 'ltd', 'şti', 'inc',
+    'vb', 'vs', 'vd', 'bkz', 'örn', 'yy', 'çev', 'haz', 'ed', 'bl', 's', 'sf',
+    'st', 'km', 'kg', 'mr', 'mrs', 'ms',
+})
+_OPENING_PUNCT = '"\'(['
+
+Analyzer = Callable[..., Dict[str, Any]]
+
+# Merkezleme motorunun okuduğu cümle alanları (alan seçimiyle birleştirilir)
+CENTERING_FIELDS = ("text", "words.text", "words.lemma", "words.upos", "words.feats",
+                    "words.deprel", "words.preference")
+
+
+# ========== NORMALİZASYON ==========
+
+def normalize_sentence(text: str) -> str:
+    """
+    Tekrar tespiti için cümleyi normalize et
+
+    - Unicode NFC
+    - Tipografik tırnak/kesme/tire -> ASCII (Ali’nin -> Ali'nin)
+    - Tekrarlı noktalama tekle (!!! -> !), noktalama öncesi boşluk silinir
+    - Boşluklar tek boşluğa indirilir
+
+    Büyük/küçük harf korunur: Stanza çıktısı (özel isimler) buna bağlıdır.
+    """
+    text = unicodedata.normalize('NFC', text).translate(_PUNCTUATION_MAP)
+    text = _REPEATED_PUNCT.sub(r'\1', text)
+    text = _WHITESPACE.sub(' ', text).strip()
+    return _SPACE_BEFORE_PUNCT.sub(r'\1', text)
+
+
+def _ends_with_abbreviation(fragment: str) -> bool:
+    """Parça cümle bitirmeyen bir noktayla mı bitiyor? (Dr. / 2. / A. / M.Ö.)"""
+    last = fragment.rsplit(None, 1)[-1].lstrip(_OPENING_PUNCT)
+    if not last.endswith('.'):
+        return False
+    body = last[:-1]
+    return (body.isdigit()                          # sıra sayısı: 2. Dünya Savaşı
+            or (len(body) == 1 and body.isalpha())  # ad baş harfi: Mustafa K. Atatürk
+            or '.' in body                          # noktalı kısaltma: M.Ö., T.C., A.Ş.
+            or turkish_lower(body) in _ABBREVIATIONS)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Dokümanı cümlelere böl (Stanza'dan önce, kural tabanlı)
+
+    Kısaltma (``Dr.``, ``vb.``), sıra sayısı (``2.``) ve baş harf (``K.``)
+    noktalarında bölünmez. Cümleler özgün metnin dilimleridir (yalnızca
+    baştaki/sondaki boşluk atılır).
+    """
+    text = text.strip()
+    if not text:
+        return []
+    sentences = []
+    start = 0
+    for boundary in _SENTENCE_BOUNDARY.finditer(text):
+        fragment = text[start:boundary.start()]
+        if _ends_with_abbreviation(fragment):
+            continue
+        sentences.append(fragment)
+        start = boundary.end()
+    sentences.append(text[start:])
+    return sentences
+
+
+# ========== MINHASH / LSH ==========
+
+class MinHasher:
+    """
+    Karakter shingle'ları üzerinde MinHash imzası
+
+    Hash fonksiyonları sabit tohumla üretilir; aynı cümle her süreçte aynı
+    imzayı verir.
+    """
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, shingle_size: int = SHINGLE_SIZE):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # (a*x + b) mod p evrensel hash ailesi (deterministik katsayılar)
+        self._coefficients = [
+            (zlib.crc32(f"a{i}".encode()) | 1, zlib.crc32(f"b{i}".encode()))
+            for i in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> set:
+        text = turkish_lower(text)
+        k = self.shingle_size
+        if len(text) <= k:
+            return {text}
+        return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in self.shingles(text)]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._coefficients
+        )
+
+    @staticmethod
+    def similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+        """İmzalardan tahmini Jaccard benzerliği"""
+        same = sum(1 for a, b in zip(sig_a, sig_b) if a == b)
+        return same / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """
+    LSH bant indeksi: imzası eşik üzerinde benzer olan ilk temsilciyi bulur
+    """
+
+    def __init__(self,
+                 threshold: float = DEFAULT_NEAR_DUPLICATE_THRESHOLD,
+                 num_perm: int = MINHASH_PERMUTATIONS,
+                 bands: int = LSH_BANDS):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm=num_perm)
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        self._signatures: List[Tuple[int, ...]] = []
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def query_or_add(self, text: str) -> Tuple[int, float]:
+        """
+        Benzer temsilci varsa (indeks, benzerlik), yoksa yeni temsilci olarak ekle
+
+        Returns:
+            (temsilci indeksi, benzerlik) - yeni eklenen için benzerlik 1.0
+        """
+        signature = self.hasher.signature(text)
+        best, best_score = -1, 0.0
+        seen = set()
+        for key in self._band_keys(signature):
+            for candidate in self._buckets.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                score = MinHasher.similarity(signature, self._signatures[candidate])
+                if score > best_score:
+                    best, best_score = candidate, score
+        if best >= 0 and best_score >= self.threshold:
+            return best, best_score
+
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        for key in self._band_keys(signature):
+            self._buckets[key].append(index)
+        return index, 1.0
+
+
+# ========== TEKRAR ELEME ==========
+
+class Deduplicator:
+    """
+    Cümleleri benzersiz temsilcilere eşler
+
+    ``add`` her cümle için temsilci indeksini döndürür; ``unique`` listesindeki
+    cümleler analiz edilecek olanlardır (temsilcinin ilk görülen özgün hali;
+    normalize hal yalnızca tekrar anahtarıdır).
+    """
+
+    def __init__(self,
+                 near_duplicates: bool = False,
+                 threshold: float = DEFAULT_NEAR_DUPLICATE_THRESHOLD):
+        self.unique: List[str] = []
+        self._exact: Dict[str, int] = {}
+        self._near = NearDuplicateIndex(threshold=threshold) if near_duplicates else None
+        self._near_to_unique: Dict[int, int] = {}
+        self.total = 0
+        self.exact_duplicates = 0
+        self.near_duplicates = 0
+
+    def add(self, sentence: str) -> Dict[str, Any]:
+        """
+        Returns:
+            {"unique_id": int, "normalized": str,
+             "duplicate": None | "exact" | "near", "similarity": float}
+        """
+        self.total += 1
+        normalized = normalize_sentence(sentence)
+
+        unique_id = self._exact.get(normalized)
+        if unique_id is not None:
+            self.exact_duplicates += 1
+            return {"unique_id": unique_id, "normalized": normalized,
+                    "duplicate": "exact", "similarity": 1.0}
+
+        if self._near is not None:
+            near_id, score = self._near.query_or_add(normalized)
+            if near_id in self._near_to_unique:
+                unique_id = self._near_to_unique[near_id]
+                self._exact[normalized] = unique_id
+                self.near_duplicates += 1
+                return {"unique_id": unique_id, "normalized": normalized,
+                        "duplicate": "near", "similarity": round(score, 4)}
+
+        unique_id = len(self.unique)
+        self.unique.append(sentence)
+        self._exact[normalized] = unique_id
+        if self._near is not None:
+            self._near_to_unique[near_id] = unique_id
+        return {"unique_id": unique_id, "normalized": normalized,
+                "duplicate": None, "similarity": 1.0}
+
+
+def analyze_corpus(documents: Iterable[str],
+                   include_semantics: bool = True,
+                   near_duplicates: bool = False,
+                   threshold: float = DEFAULT_NEAR_DUPLICATE_THRESHOLD,
+                   analyzer: Optional[Analyzer] = None,
+                   correlation_ids: Optional[Sequence[str]] = None,
+                   centering: bool = False,
+                   fields: Optional[Fields] = None) -> Dict[str, Any]:
+    """
+    Doküman listesini tekrar eleme ile analiz et
+
+    Args:
+        documents: Metinler (her biri bir doküman)
+        include_semantics: analyze_text'e iletilir
+        near_duplicates: MinHash ile yakın tekrarları da ele
+        threshold: Yakın tekrar için minimum tahmini Jaccard benzerliği
+        analyzer: ``analyze_text`` uyumlu fonksiyon (varsayılan: analyze_text)
+        correlation_ids: Doküman başına korelasyon kimliği (çıktıya
+            ``correlation_id`` olarak eklenir, tracing span'lerine iliştirilir).
+            None ve tracing açıksa span'lerde ``doc-<sıra>`` kullanılır.
+        centering: Her dokümana merkezleme analizi ekle (``centering`` anahtarı,
+            ``api.main.detect_centering_errors`` biçiminde)
+        fields: Cümle alanı seçimi (``api.projection``); analyzer'a ``fields``
+            olarak iletilir. centering=True ise merkezlemenin okuduğu kelime
+            alanları da analiz edilir, çıktı sonra seçime indirilir.
+
+    Returns:
+        {
+            "documents": [
+                {
+                    "text": str,
+                    "sentences": [...],          # analyze_text cümle formatı
+                    "occurrences": [
+                        {"text": str, "unique_id": int,
+                         "duplicate": None | "exact" | "near", "similarity": float}
+                    ],
+                    "correlation_id": str,       # sadece correlation_ids verildiyse
+                    "centering": {...}           # sadece centering=True ise
+                }
+            ],
+            "report": {...}                      # bkz. dedup raporu
+        }
+
+    NOT: Tekrarlara dağıtılan cümle sonuçları aynı dict nesnesini paylaşır;
+    değiştirmeden önce kopyalayın. Yakın tekrarlarda sonuç temsilci cümleye
+    aittir (``occurrences[i]["duplicate"] == "near"``).
+    """
+    if analyzer is None:
+        from api.pos_semantic_analyzer import analyze_text
+        analyzer = analyze_text
+
+    selection = parse_fields(fields) if fields is not None else None
+    analysis_selection = selection
+    if selection is not None:
+        if centering:
+            analysis_selection = selection.union(CENTERING_FIELDS)
+        analyzer = partial(analyzer, fields=analysis_selection)
+
+    with span("analyze_corpus") as batch_span:
+        dedup = Deduplicator(near_duplicates=near_duplicates, threshold=threshold)
+        plan: List[Tuple[str, List[Dict[str, Any]]]] = []
+        with stage("batch_plan"):
+            for text in documents:
+                occurrences = []
+                for sentence in split_sentences(text):
+                    entry = dedup.add(sentence)
+                    entry["text"] = sentence
+                    occurrences.append(entry)
+                plan.append((text, occurrences))
+
+        if correlation_ids is not None:
+            correlation_ids = list(correlation_ids)
+            if len(correlation_ids) != len(plan):
+                raise ValueError(
+                    f"correlation_ids has {len(correlation_ids)} entries for {len(plan)} documents"
+                )
+
+        _record_batch_metrics(len(plan), dedup)
+
+        start = time.perf_counter()
+        if batch_span is None:
+            unique_results = [
+                analyzer(sentence, include_semantics=include_semantics)["sentences"]
+                for sentence in dedup.unique
+            ]
+        else:
+            unique_results = _analyze_traced(batch_span, plan, dedup, analyzer, include_semantics,
+                                             correlation_ids or [f"doc-{i}" for i in range(len(plan))])
+        analysis_seconds = time.perf_counter() - start
+
+    output_documents = []
+    for index, (text, occurrences) in enumerate(plan):
+        sentences = []
+        for entry in occurrences:
+            sentences.extend(unique_results[entry["unique_id"]])
+            del entry["normalized"]
+        document = {
+            "text": text,
+            "sentences": sentences,
+            "occurrences": occurrences,
+        }
+        if correlation_ids is not None:
+            document["correlation_id"] = correlation_ids[index]
+        if centering:
+            with stage("centering"):
+                summary, steps = analyze_centering(sentences)
+            summary["centers"] = steps
+            document["centering"] = summary
+            if analysis_selection is not selection:
+                document["sentences"] = [selection.project_sentence(s) for s in sentences]
+        output_documents.append(document)
+
+    return {
+        "documents": output_documents,
+        "report": _dedup_report(dedup, analysis_seconds),
+    }
+
+
+def _analyze_traced(batch_span: Span,
+                    plan: List[Tuple[str, List[Dict[str, Any]]]],
+                    dedup: Deduplicator,
+                    analyzer: Analyzer,
+                    include_semantics: bool,
+                    correlation_ids: Sequence[str]) -> List[List[Dict[str, Any]]]:
+    """
+    Benzersiz cümleleri span'lerle analiz et
+
+    Her doküman için toplu işin başından itibaren süren bir ``document`` span'i
+    oluşur: ``batch.queue_seconds`` dokümanın ilk cümlesinin işlenmeye
+    başlamasına kadar geçen bekleme, ``batch.compute_seconds`` cümlelerinin
+    analiz süresidir. Cümle span'leri onu paylaşan dokümanların kimliklerini
+    taşır ve doküman span'lerine ``links`` ile bağlanır.
+    """
+    batch_start = batch_span._perf_start
+    users: List[List[int]] = [[] for _ in dedup.unique]
+    for index, (_, occurrences) in enumerate(plan):
+        for unique_id in dict.fromkeys(entry["unique_id"] for entry in occurrences):
+            users[unique_id].append(index)
+
+    document_spans = [
+        new_span("document", parent=batch_span, correlation_ids=[correlation_ids[index]],
+                 attributes={"document.index": index, "document.sentences": len(occurrences)},
+                 start_ns=batch_span.start_ns)
+        for index, (_, occurrences) in enumerate(plan)
+    ]
+    first_start: List[Optional[int]] = [None] * len(plan)
+    last_end = [time.perf_counter_ns()] * len(plan)
+    compute = [0] * len(plan)
+
+    unique_results = []
+    for unique_id, sentence in enumerate(dedup.unique):
+        indexes = users[unique_id]
+        with span("batch_sentence",
+                  correlation_ids=[correlation_ids[index] for index in indexes],
+                  attributes={"batch.unique_id": unique_id, "batch.documents": len(indexes)},
+                  links=[document_spans[index] for index in indexes]):
+            began = time.perf_counter_ns()
+            unique_results.append(analyzer(sentence, include_semantics=include_semantics)["sentences"])
+            ended = time.perf_counter_ns()
+        for index in indexes:
+            if first_start[index] is None:
+                first_start[index] = began
+            last_end[index] = ended
+            compute[index] += ended - began
+
+    for index, document_span in enumerate(document_spans):
+        began = first_start[index] if first_start[index] is not None else last_end[index]
+        document_span.set_attribute("batch.queue_seconds", round((began - batch_start) / 1e9, 6))
+        document_span.set_attribute("batch.compute_seconds", round(compute[index] / 1e9, 6))
+        finish_span(document_span, end_ns=batch_span.start_ns + (last_end[index] - batch_start))
+    return unique_results
+
+
+def _record_batch_metrics(documents: int, dedup: Deduplicator) -> None:
+    from src.metrics import BATCH_DOCUMENTS, BATCH_DUPLICATES, BATCH_SENTENCES, record_request
+
+    record_request("analyze_corpus", dedup.total, 0)
+    BATCH_DOCUMENTS.observe(documents)
+    BATCH_SENTENCES.observe(dedup.total)
+    if dedup.exact_duplicates:
+        BATCH_DUPLICATES.inc(dedup.exact_duplicates, kind="exact")
+    if dedup.near_duplicates:
+        BATCH_DUPLICATES.inc(dedup.near_duplicates, kind="near")
+
+
+def _dedup_report(dedup: Deduplicator, analysis_seconds: float) -> Dict[str, Any]:
+    """Elenen iş miktarı (cümle ve kaba token sayısı olarak)"""
+    analyzed_tokens = sum(len(s.split()) for s in dedup.unique)
+    skipped = dedup.exact_duplicates + dedup.near_duplicates
+    per_sentence = analysis_seconds / len(dedup.unique) if dedup.unique else 0.0
+    return {
+        "total_sentences": dedup.total,
+        "unique_sentences": len(dedup.unique),
+        "exact_duplicates": dedup.exact_duplicates,
+        "near_duplicates": dedup.near_duplicates,
+        "skipped_sentences": skipped,
+        "saved_ratio": round(skipped / dedup.total, 4) if dedup.total else 0.0,
+        "analyzed_tokens": analyzed_tokens,
+        "analysis_seconds": round(analysis_seconds, 4),
+        # Tekrarlar da analiz edilseydi harcanacak tahmini ek süre
+        "estimated_seconds_saved": round(per_sentence * skipped, 4),
+    }
+
+
+# ========== CLI ==========
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m api.batch",
+        description="Satır başına bir doküman analiz et (tekrar eden cümleler bir kez parse edilir)",
+    )
+    parser.add_argument("input", help="Girdi dosyası (UTF-8, '-' = stdin)")
+    parser.add_argument("-o", "--output", help="JSONL çıktı dosyası (varsayılan: stdout)")
+    parser.add_argument("--near-duplicates", action="store_true",
+                        help="MinHash ile yakın tekrarları da ele")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_NEAR_DUPLICATE_THRESHOLD,
+                        help="Yakın tekrar benzerlik eşiği (0-1)")
+    parser.add_argument("--no-semantics", action="store_true",
+                        help="Propositional semantics katmanını atla")
+    parser.add_argument("--centering", action="store_true",
+                        help="Doküman başına merkezleme (Cb/Cf, geçiş) analizi ekle")
+    parser.add_argument("--fields", metavar="LIST",
+                        help="Cümle alanı seçimi, ör. words.text,words.preference,semantics.proposition_type")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Doküman/cümle/aşama span'lerini JSONL olarak yaz (korelasyon kimliği: satır no)")
+    parser.add_argument("--profile-output", metavar="PATH",
+                        help="Çalışmayı örnekle, collapsed stack dosyası yaz (flamegraph girdisi)")
+    parser.add_argument("--profile-interval", type=float, default=None, metavar="SECONDS",
+                        help="Örnekleme aralığı (varsayılan: 0.005)")
+    args = parser.parse_args(argv)
+    if args.fields is not None:
+        try:
+            parse_fields(args.fields)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    if args.input == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(args.input, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    numbered = [(number, line) for number, line in enumerate(lines, 1) if line.strip()]
+    documents = [line for _, line in numbered]
+
+    exporter = None
+    if args.trace:
+        exporter = JsonlSpanExporter(args.trace)
+        enable_tracing(exporter)
+
+    profiler = None
+    if args.profile_output:
+        from src.sampling_profiler import DEFAULT_INTERVAL, SamplingProfiler
+        profiler = SamplingProfiler(interval=args.profile_interval or DEFAULT_INTERVAL).start()
+    try:
+        result = analyze_corpus(
+            documents,
+            include_semantics=not args.no_semantics,
+            near_duplicates=args.near_duplicates,
+            threshold=args.threshold,
+            correlation_ids=[f"line-{number}" for number, _ in numbered] if exporter else None,
+            centering=args.centering,
+            fields=args.fields,
+        )
+    finally:
+        if exporter is not None:
+            disable_tracing()
+            exporter.close()
+        if profiler is not None:
+            profiler.stop().write_collapsed(args.profile_output)
+            print(f"profil: {profiler.total_samples} örnek -> {args.profile_output}", file=sys.stderr)
+
+    with JsonlWriter(args.output or sys.stdout.buffer) as writer:
+        writer.write_all(result["documents"])
+
+    report = result["report"]
+    print(
+        f"{report['total_sentences']} cümle, {report['unique_sentences']} benzersiz "
+        f"({report['exact_duplicates']} birebir + {report['near_duplicates']} yakın tekrar), "
+        f"tasarruf: {report['saved_ratio']:.0%}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,16 +5,11 @@ Bu modül önermesel semantik analizini mevcut API'ye entegre eder.
 """
 
 from typing import Dict, Any, List
-import sys
-from pathlib import Path
 
-# Add src to path
-_src_path = Path(__file__).parent.parent / 'src'
-if str(_src_path) not in sys.path:
-    sys.path.insert(0, str(_src_path))
+from api.main import check_sentence
 
 try:
-    from propositional_semantics import (  # type: ignore
+    from src.propositional_semantics import (
         TurkishPropositionAnalyzer,
         analyze_sentence_with_stanza,
         PredicateType,
@@ -43,8 +38,6 @@ def check_sentence_enhanced(sentence: str) -> Dict[str, Any]:
             'theoretical_explanation': str  # YENİ: Teorik açıklama
         }
     """
-    from api.main import check_sentence
-    
     # Mevcut POS analizi
     pos_result = check_sentence(sentence)
     
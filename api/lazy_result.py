@@ -0,0 +1,203 @@
+"""
+Tembel (Lazy) Analiz Sonuçları
+==============================
+
+``analyze_text`` her cümle için kelime dict'lerini, morfoloji listelerini,
+söylem, bilgi yapısı ve önermesel semantiği (yeniden parse dahil) baştan
+üretir. Çoğu çağıran yalnızca ``preferences`` okur. Bu modüldeki sonuç
+nesnelerinde parse bir kez yapılır; cümle katmanları ilk erişildiklerinde
+hesaplanır ve saklanır:
+
+    preferences  → morfoloji + dedektör (kelime dict'i üretilmez)
+    words        → + kelime dict'leri
+    semantics    → + söylem/bilgi yapısı + önermesel semantik
+
+``to_dict()`` bugünkü ``analyze_text`` JSON'unu birebir üretir. Nesneler
+dict gibi de okunabilir (``result["sentences"][0]["preferences"]``).
+
+Kullanım:
+    from api.lazy_result import analyze_text_lazy
+
+    result = analyze_text_lazy(text)
+    for sentence in result.sentences:
+        sentence.preferences          # yalnızca bu katman hesaplanır
+    json.dumps(result.to_dict())     # analyze_text(text) ile aynı
+
+Sonuç cache'i (``enable_result_cache``) bu yolda kullanılmaz: cache tam
+cümle sonucu sakladığından tembelliği ortadan kaldırırdı.
+"""
+
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from error_detection.minimalist_pos_error_detection import MinimalistPOSErrorDetector
+from api.pos_semantic_analyzer import (
+    STANZA_PROCESSORS,
+    _PREFERENCE_TYPE_NAMES,
+    _detect_preferences,
+    _lexical_item,
+    _preference_entry,
+    _propositional_semantics,
+    _sentence_layers,
+    _word_data,
+    extract_morphology_from_text,
+    is_finite_verb,
+)
+from src.instrumentation import stage
+from src.metrics import record_preference, record_request
+from src.parser_backend import parse
+
+_SENTENCE_KEYS = ("text", "words", "preferences", "semantics")
+
+
+class LazySentence:
+    """Katmanları ilk erişimde hesaplanan cümle sonucu"""
+
+    def __init__(self, sent: Any, detector: MinimalistPOSErrorDetector, include_semantics: bool):
+        self._sent = sent
+        self._detector = detector
+        self._include_semantics = include_semantics
+        self.text: str = sent.text
+
+    # ---------- ara katmanlar ----------
+
+    @cached_property
+    def _lexical(self) -> Tuple[List[List[str]], List[str], List[bool]]:
+        """(morfolojiler, feats, bitimlilik) - kelime sırasıyla"""
+        with stage("morphology"):
+            morphologies = [extract_morphology_from_text(word.text) for word in self._sent.words]
+        feats = [word.feats if word.feats else "" for word in self._sent.words]
+        return morphologies, feats, [is_finite_verb(f) for f in feats]
+
+    @cached_property
+    def _preference_map(self) -> Dict[str, Dict[str, Any]]:
+        morphologies, _, finiteness = self._lexical
+        lex_items = [_lexical_item(word, morphology, is_finite)
+                     for word, morphology, is_finite in zip(self._sent.words, morphologies, finiteness)]
+        preference_map = _detect_preferences(self._detector, lex_items)
+        for word in self._sent.words:
+            preference = preference_map.get(word.text)
+            if preference:
+                record_preference(_PREFERENCE_TYPE_NAMES.get(preference["type"], preference["type"]))
+        return preference_map
+
+    @cached_property
+    def _layers(self) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], str]:
+        """(söylem, bilgi yapısı, bitimlilik) - _sentence_layers ile"""
+        with stage("sentence_layers"):
+            _, discourse, information, finiteness = _sentence_layers(
+                self.words, self._preference_map, self._include_semantics)
+        return discourse, information, finiteness
+
+    # ---------- analyze_text alanları ----------
+
+    @cached_property
+    def preferences(self) -> Optional[List[Dict[str, Any]]]:
+        preference_map = self._preference_map
+        summary = []
+        for word, feats in zip(self._sent.words, self._lexical[1]):
+            preference = preference_map.get(word.text)
+            if preference:
+                summary.append(_preference_entry(word.text, word.upos, word.deprel,
+                                                 feats.lower(), preference))
+        return summary if summary else None
+
+    @cached_property
+    def words(self) -> List[Dict[str, Any]]:
+        morphologies, feats, finiteness = self._lexical
+        preference_map = self._preference_map
+        words = []
+        for word, word_feats, morphology, is_finite in zip(self._sent.words, feats, morphologies, finiteness):
+            word_data = _word_data(word, word_feats, morphology, is_finite)
+            word_data["preference"] = preference_map.get(word.text)
+            words.append(word_data)
+        return words
+
+    @cached_property
+    def semantics(self) -> Optional[Dict[str, Any]]:
+        if not self._include_semantics:
+            return None
+        discourse, information, finiteness = self._layers
+        with stage("propositional_semantics"):
+            base_semantics = _propositional_semantics(self.text, finiteness)
+        if base_semantics:
+            base_semantics["discourse"] = discourse
+            base_semantics["information_structure"] = information
+        return base_semantics
+
+    # ---------- dict uyumluluğu ----------
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _SENTENCE_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _SENTENCE_KEYS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return _SENTENCE_KEYS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """analyze_text cümle çıktısı (tüm katmanlar hesaplanır)"""
+        return {
+            "text": self.text,
+            "words": self.words,
+            "preferences": self.preferences,
+            "semantics": self.semantics,
+        }
+
+
+class LazyAnalysis:
+    """analyze_text sonucunun tembel karşılığı"""
+
+    def __init__(self, text: str, sentences: List[LazySentence]):
+        self.text = text
+        self.sentences = sentences
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "text":
+            return self.text
+        if key == "sentences":
+            return self.sentences
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[LazySentence]:
+        return iter(self.sentences)
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """analyze_text(text, include_semantics) ile aynı dict"""
+        return {
+            "text": self.text,
+            "sentences": [sentence.to_dict() for sentence in self.sentences],
+        }
+
+
+def analyze_text_lazy(text: str, include_semantics: bool = True) -> LazyAnalysis:
+    """
+    Metni parse et, cümle katmanlarını erişime bırak
+
+    Args:
+        text: Türkçe metin
+        include_semantics: ``semantics`` katmanı hesaplanabilir mi? (False → None)
+
+    Returns:
+        LazyAnalysis - ``to_dict()`` analyze_text formatında
+    """
+    with stage("analyze_text_lazy"):
+        result, tokens = _lazy_analysis(text, include_semantics)
+    record_request("analyze_text_lazy", len(result.sentences), tokens)
+    return result
+
+
+def _lazy_analysis(text: str, include_semantics: bool) -> Tuple[LazyAnalysis, int]:
+    """Parse + tembel cümleler (metrik kaydetmez); (sonuç, token sayısı)"""
+    with stage("parse"):
+        doc = parse(text, STANZA_PROCESSORS)
+    detector = MinimalistPOSErrorDetector()
+    doc_sentences = getattr(doc, 'sentences', [])
+    sentences = [LazySentence(sent, detector, include_semantics) for sent in doc_sentences]
+    return LazyAnalysis(text, sentences), sum(len(sent.words) for sent in doc_sentences)
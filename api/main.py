@@ -3,47 +3,31 @@ Türkçe POS Tagging Tercih Tespiti - Basit Python API
 ==================================================
 
 Kullanım:
-    from api.main import check_sentence, detect_minimalist_errors
+    from api.main import check_sentence, detect_centering_errors, detect_minimalist_errors
     
     # Basit kontrol
     result = check_sentence("Ali'nin okuduğu kitap burada.")
     
     # Minimalist analiz
     errors = detect_minimalist_errors(words)
+    
+    # Söylem (merkezleme) analizi
+    discourse = detect_centering_errors(sentences)
 """
 
-import sys
-from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-# Parent directories'i path'e ekle
-parent_dir = Path(__file__).parent.parent
-if str(parent_dir) not in sys.path:
-    sys.path.insert(0, str(parent_dir))
-
-from error_detection.minimalist_pos_error_detection import (  # type: ignore
+from error_detection.minimalist_pos_error_detection import (
     MinimalistPOSErrorDetector,
     create_lexical_item
 )
+from src.pipeline_pool import register_pipeline
+from src.parser_backend import parse
+from src.metrics import record_preference, record_request
+from src.centering import analyze_centering
 
-# Stanza lazy import (sadece ihtiyaç olursa yükle)
-_stanza_pipeline = None
-
-def _get_stanza_pipeline():
-    """Stanza pipeline'ı lazy load et"""
-    global _stanza_pipeline
-    if _stanza_pipeline is None:
-        try:
-            import stanza
-            _stanza_pipeline = stanza.Pipeline('tr', processors='tokenize,pos,lemma,depparse', verbose=False)
-        except ImportError:
-            raise ImportError("Stanza kurulu değil. Yüklemek için: pip install stanza")
-        except Exception:
-            # Model yoksa indir
-            import stanza
-            stanza.download('tr')
-            _stanza_pipeline = stanza.Pipeline('tr', processors='tokenize,pos,lemma,depparse', verbose=False)
-    return _stanza_pipeline
+STANZA_PROCESSORS = 'tokenize,pos,lemma,depparse'
+register_pipeline(STANZA_PROCESSORS)  # warmup() listesine ekle
 
 
 def extract_morphology_from_text(text: str) -> List[str]:
@@ -249,6 +233,7 @@ def detect_minimalist_errors(words: List[Dict[str, Any]]) -> Dict[str, Any]:
     # Basit formata dönüştür
     errors = []
     for err in results.get('candidate_errors', []):
+        record_preference(err['type'].name if hasattr(err['type'], 'name') else str(err['type']))
         academic_type = format_error_type_academic(
             err['type'].value, 
             err['found_pos'], 
@@ -290,6 +275,52 @@ def detect_minimalist_errors(words: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def detect_centering_errors(sentences: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merkezleme Kuramı ile söylem tutarlılığı analizi (Cb/Cf, geçişler)
+    
+    Cümleler ``src.centering.CenteringEngine`` ile sırayla işlenir; her
+    cümlenin maliyeti pencere içindeki varlık sayısıyla sınırlıdır. Akış
+    halinde gelen cümleler için motoru doğrudan kullanın.
+    
+    Args:
+        sentences: Cümle listesi
+            - text (str): Cümle metni
+            - words (List[Dict]): text, pos/upos, dependency/deprel,
+              (opsiyonel) lemma, feats
+    
+    Returns:
+        {
+            "discourse_score": float,  # 0.0-4.0 (yüksek = tutarlı söylem)
+            "transitions": List[str],  # CONTINUE, RETAIN, SMOOTH-SHIFT, ROUGH-SHIFT, NO-CB
+            "transition_counts": Dict[str, int],
+            "error_count": int,
+            "errors": [                # CONTINUE dışındaki geçişler
+                {
+                    "sentence_index": int,
+                    "transition": str,
+                    "score": int,
+                    "severity": str    # high (ROUGH-SHIFT, NO-CB), medium, low
+                }
+            ],
+            "centers": [               # cümle başına Cf/Cb/Cp
+                {"index": int, "text": str, "cf": [...], "cb": str | None,
+                 "cp": str | None, "transition": str | None, "score": int | None}
+            ]
+        }
+    
+    Örnek:
+        >>> result = detect_centering_errors(sentences)
+        >>> result["transitions"]
+        ['CONTINUE']
+    """
+    summary, steps = analyze_centering(sentences)
+    record_request("detect_centering_errors", len(sentences),
+                   sum(len(sentence.get("words", [])) for sentence in sentences))
+    summary["centers"] = steps
+    return summary
+
+
 def check_sentence(text: str) -> Dict[str, Any]:
     """
     TEK SATIRDA POS HATA TESPİTİ
@@ -313,12 +344,13 @@ def check_sentence(text: str) -> Dict[str, Any]:
         >>> print(f"{result['total_errors']} hata bulundu")
         1 hata bulundu
     """
-    nlp = _get_stanza_pipeline()
-    doc = nlp(text)
+    # Aktif parser backend (varsayılan: Stanza havuzu; testlerde replay)
+    doc = parse(text, STANZA_PROCESSORS)
     
     # Parse edilmiş kelimeleri çıkar (FEATS dahil!)
     words = []
-    for sent in getattr(doc, 'sentences', []):
+    doc_sentences = getattr(doc, 'sentences', [])
+    for sent in doc_sentences:
         for word in sent.words:
             words.append({
                 "text": word.text,
@@ -330,6 +362,7 @@ def check_sentence(text: str) -> Dict[str, Any]:
     
     # Hata tespiti
     result = detect_minimalist_errors(words)
+    record_request("check_sentence", len(doc_sentences), len(words))
     
     return {
         "sentence": text,
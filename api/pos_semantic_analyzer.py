@@ -12,43 +12,40 @@ Kullanım:
     
     result = analyze_text("Ali'nin okuduğu kitap burada.")
     print(json.dumps(result, indent=2, ensure_ascii=False))
+
+Servis açılışı (cold start'ı ilk istekten önce öde):
+    from api.pos_semantic_analyzer import warmup, readiness
+
+    report = warmup()          # Tüm pipeline'ları yükle + kalibrasyon
+    readiness()["ready"]       # Health/readiness endpoint için
 """
 
-import sys
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any, Optional, Tuple
 import json
 
-# Parent directories'i path'e ekle
-parent_dir = Path(__file__).parent.parent
-error_detection_path = str(parent_dir / "error_detection")
-if error_detection_path not in sys.path:
-    sys.path.insert(0, error_detection_path)
-if str(parent_dir) not in sys.path:
-    sys.path.insert(0, str(parent_dir))
-
-from error_detection.minimalist_pos_error_detection import (  # type: ignore
+from error_detection.minimalist_pos_error_detection import (
     MinimalistPOSErrorDetector,
+    POSErrorType,
     create_lexical_item
 )
+from src import propositional_semantics
+from src.propositional_semantics import analyze_sentence_with_stanza
+from api.result_cache import get_result_cache, make_cache_key, rule_fingerprint
+from api.projection import Fields, FieldSelection, parse_fields
+from src.pipeline_pool import register_pipeline, readiness, warmup
+from src.parser_backend import parse
+from src.instrumentation import collect_timings, stage
+from src.metrics import record_preference, record_request
+from src.tracing import set_span_attribute
+from src.entity_index import EntityIndex
+from src.mentions import extract_mentions
 
-# Stanza lazy import
-_stanza_pipeline = None
-
-def _get_stanza_pipeline():
-    """Stanza pipeline'ı lazy load et"""
-    global _stanza_pipeline
-    if _stanza_pipeline is None:
-        try:
-            import stanza
-            _stanza_pipeline = stanza.Pipeline('tr', processors='tokenize,pos,lemma,depparse', verbose=False)
-        except ImportError:
-            raise ImportError("Stanza kurulu değil. Yüklemek için: pip install stanza")
-        except Exception:
-            import stanza
-            stanza.download('tr')
-            _stanza_pipeline = stanza.Pipeline('tr', processors='tokenize,pos,lemma,depparse', verbose=False)
-    return _stanza_pipeline
+STANZA_PROCESSORS = 'tokenize,pos,lemma,depparse'
+register_pipeline(STANZA_PROCESSORS)  # warmup() listesine ekle
+
+# Preference "type" değeri → POSErrorType adı (metrik etiketi)
+_PREFERENCE_TYPE_NAMES = {t.value: t.name for t in POSErrorType}
 
 
 def extract_morphology_from_text(text: str) -> List[str]:
@@ -76,17 +73,27 @@ def extract_morphology_from_text(text: str) -> List[str]:
     return morphology
 
 
-def analyze_discourse_features(words: List[Dict[str, Any]]) -> Dict[str, Any]:
+def analyze_discourse_features(words: List[Dict[str, Any]],
+                               entity_index: Optional[EntityIndex] = None) -> Dict[str, Any]:
     """
     Centering Theory tabanlı söylem özellikleri analizi
     
+    Args:
+        words: Cümlenin kelimeleri
+        entity_index: Önceki cümlelerin varlık indeksi (verilirse bağlam
+                      alanları eklenir; indeks güncellenmez)
+    
     Returns:
         {
             "topic_candidates": List[str],  # Cb (Backward-looking center) adayları
             "focus_entities": List[str],     # Cf (Forward-looking center) adayları
             "referential_density": float,    # Referential expression yoğunluğu
             "anaphora_present": bool,        # Anafor varlığı
-            "discourse_role_distribution": Dict[str, int]
+            "discourse_role_distribution": Dict[str, int],
+            # Yalnızca entity_index ile:
+            "discourse_old": List[str],      # Pencerede daha önce anılmış varlıklar (lemma)
+            "discourse_new": List[str],      # İlk kez anılan varlıklar (lemma)
+            "antecedents": [{"text": str, "antecedent": str | None}]  # 3. kişi adıl / sıfır adıl (∅) öncülleri
         }
     """
     topic_candidates = []
@@ -123,13 +130,74 @@ def analyze_discourse_features(words: List[Dict[str, Any]]) -> Dict[str, Any]:
     total_words = len([w for w in words if w.get("upos") not in ["PUNCT", "SYM"]])
     referential_density = referential_count / total_words if total_words > 0 else 0.0
     
-    return {
+    features = {
         "topic_candidates": topic_candidates[:3],  # En fazla 3 aday
         "focus_entities": focus_entities[:3],
         "referential_density": round(referential_density, 2),
         "anaphora_present": anaphora_count > 0,
         "discourse_role_distribution": discourse_roles
     }
+    if entity_index is not None:
+        features.update(_discourse_context(words, entity_index))
+    return features
+
+
+def _discourse_context(words: List[Dict[str, Any]], entity_index: EntityIndex) -> Dict[str, Any]:
+    """Varlık indeksine O(1) sorgularla cümlenin söylem bağlamı (merkezlemeyle aynı gönderimler)"""
+    antecedents = []
+
+    def resolve(number: Optional[str], text: str, position: int) -> str:
+        antecedent = entity_index.most_recent(number)
+        antecedents.append({"text": text, "antecedent": antecedent})
+        return antecedent or text
+
+    discourse_old = []
+    discourse_new = []
+    for mention in extract_mentions(words, resolve):
+        if mention.pronominal:
+            continue
+        target = discourse_old if entity_index.is_given(mention.entity) else discourse_new
+        if mention.entity not in target:
+            target.append(mention.entity)
+    return {
+        "discourse_old": discourse_old,
+        "discourse_new": discourse_new,
+        "antecedents": antecedents,
+    }
+
+
+def track_discourse(sentences: List[Dict[str, Any]],
+                    entity_index: Optional[EntityIndex] = None,
+                    window: int = 200):
+    """
+    Cümleleri sırayla varlık indeksine karşı işle (akış; uzun dokümanlar için)
+    
+    Her cümle önce indekse sorulur, sonra indekse eklenir; önceki cümleler
+    yeniden taranmaz ve bellek ``window`` cümleyle sınırlıdır.
+    
+    Args:
+        sentences: analyze_text ``sentences`` öğeleri (veya text/words dict'leri)
+        entity_index: Sürdürülecek indeks (None → yeni ``EntityIndex(window)``)
+    
+    Yields:
+        {"index": int, "text": str, "discourse": {...},  # analyze_discourse_features + bağlam
+         "mentions": [Mention.to_dict()]}
+    """
+    index = entity_index if entity_index is not None else EntityIndex(window=window)
+    for position, sentence in enumerate(sentences):
+        words = sentence.get("words", [])
+        text = sentence.get("text", "")
+        information_structure = (sentence.get("semantics") or {}).get("information_structure")
+        if information_structure is None:
+            information_structure = analyze_information_structure(words, text)
+        discourse = analyze_discourse_features(words, entity_index=index)
+        mentions = index.add_sentence(words, information_structure)
+        yield {
+            "index": position,
+            "text": text,
+            "discourse": discourse,
+            "mentions": [mention.to_dict() for mention in mentions],
+        }
 
 
 def analyze_information_structure(words: List[Dict[str, Any]], text: str) -> Dict[str, Any]:
@@ -236,20 +304,19 @@ def analyze_propositional_semantics(text: str, words: List[Dict[str, Any]]) -> O
     """
     # Clause finiteness kontrolü (root VERB var mı ve finit mi?)
     clause_finiteness = "non-finite"
-    root_verb = None
     
     for w in words:
         if w.get('deprel') == 'root' and w.get('upos') == 'VERB':
-            root_verb = w
             if w.get('is_finite'):
                 clause_finiteness = "finite"
             break
     
+    return _propositional_semantics(text, clause_finiteness)
+
+
+def _propositional_semantics(text: str, clause_finiteness: str) -> Optional[Dict[str, Any]]:
+    """analyze_propositional_semantics gövdesi (bitimlilik önceden hesaplanmış)"""
     try:
-        # Propositional semantics modülünü lazy import
-        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-        from propositional_semantics import analyze_sentence_with_stanza
-        
         result = analyze_sentence_with_stanza(text)
         
         # Hata kontrolü
@@ -261,18 +328,12 @@ def analyze_propositional_semantics(text: str, words: List[Dict[str, Any]]) -> O
         if not analyses:
             # Copula cümleleri için basit analiz (VERB yok, ADJ/NOUN root)
             # "Yüzme havuzu temiz" → synthetic (özgül nesne + state)
-            has_specific_subject = any(
-                w.get('feats') and ('case=acc' in w.get('feats', '').lower() or 
-                                   'prontype=dem' in w.get('feats', '').lower())
-                for w in words
-            )
-            
             return {
                 "proposition_type": "synthetic",
                 "predicate_type": "holistic",  # Copula = state = holistic
                 "generic_encoding": False,
                 "time_bound": False,
-                "verifiability": 0.7,
+                "verifiability": propositional_semantics.COPULA_VERIFIABILITY,
                 "clause_finiteness": clause_finiteness
             }
         
@@ -311,18 +372,266 @@ def analyze_propositional_semantics(text: str, words: List[Dict[str, Any]]) -> O
             "predicate_type": "holistic",
             "generic_encoding": False,
             "time_bound": False,
-            "verifiability": 0.5,
+            "verifiability": propositional_semantics.FALLBACK_VERIFIABILITY,
             "clause_finiteness": clause_finiteness
         }
 
 
-def analyze_text(text: str, include_semantics: bool = True) -> Dict[str, Any]:
+_TOPIC_DEPRELS = ("nsubj", "csubj")
+_FOCUS_DEPRELS = ("obj", "iobj", "obl")
+_BACKGROUND_DEPRELS = ("amod", "advmod", "nmod")
+_NOMINAL_POS = ("NOUN", "PROPN")
+_CONTENT_POS = ("NOUN", "PROPN", "PRON")
+_NON_WORD_POS = ("PUNCT", "SYM")
+
+
+def _sentence_layers(words: List[Dict[str, Any]],
+                     preference_map: Dict[str, Dict[str, Any]],
+                     include_semantics: bool):
+    """
+    Cümle katmanlarını kelimeler üzerinde tek geçişte hesapla
+    
+    Kelimelere preference ekler; preferences özetini, söylem özelliklerini
+    (analyze_discourse_features), bilgi yapısını (analyze_information_structure)
+    ve yüklem bitimliliğini (analyze_propositional_semantics) bu fonksiyonlarla
+    birebir aynı çıktıyla üretir. feats kelime başına bir kez küçük harfe çevrilir.
+    
+    Returns:
+        (preferences_summary, discourse_features | None,
+         information_structure | None, clause_finiteness)
+    """
+    preferences_summary = []
+    topic_candidates = []
+    focus_entities = []
+    given_entities = []
+    new_entities = []
+    discourse_roles = {"topic": 0, "focus": 0, "background": 0}
+    referential_count = 0
+    anaphora_count = 0
+    total_words = 0
+    first_content = None
+    clause_finiteness = "non-finite"
+    root_verb_seen = False
+    
+    for position, word_data in enumerate(words):
+        text = word_data["text"]
+        upos = word_data["upos"]
+        deprel = word_data["deprel"]
+        feats = (word_data["feats"] or "").lower()
+        is_topic = deprel in _TOPIC_DEPRELS
+        is_focus = deprel in _FOCUS_DEPRELS
+        definite = "case=acc" in feats or "prontype=dem" in feats
+        
+        preference = preference_map.get(text)
+        word_data["preference"] = preference
+        if preference:
+            preferences_summary.append(_preference_entry(text, upos, deprel, feats, preference))
+        
+        if not include_semantics:
+            continue
+        
+        # Söylem: topic / focus / background, anafor
+        if upos == "PRON" or is_topic:
+            topic_candidates.append(text)
+            discourse_roles["topic"] += 1
+            referential_count += 1
+        elif is_focus and upos in _NOMINAL_POS:
+            focus_entities.append(text)
+            discourse_roles["focus"] += 1
+        elif deprel in _BACKGROUND_DEPRELS:
+            discourse_roles["background"] += 1
+        if upos == "PRON" or "prontype=dem" in feats:
+            anaphora_count += 1
+        if upos not in _NON_WORD_POS:
+            total_words += 1
+        
+        # Bilgi yapısı: given / new, ilk içerik kelimesi
+        if upos in _NOMINAL_POS:
+            if definite:
+                given_entities.append(text)
+            elif "case=nom" in feats:
+                new_entities.append(text)
+        if first_content is None and upos in _CONTENT_POS:
+            first_content = position
+        
+        # Bitimlilik: ilk root VERB
+        if not root_verb_seen and deprel == "root" and upos == "VERB":
+            root_verb_seen = True
+            if word_data["is_finite"]:
+                clause_finiteness = "finite"
+    
+    if not include_semantics:
+        return preferences_summary, None, None, clause_finiteness
+    
+    discourse_features = {
+        "topic_candidates": topic_candidates[:3],
+        "focus_entities": focus_entities[:3],
+        "referential_density": round(referential_count / total_words, 2) if total_words > 0 else 0.0,
+        "anaphora_present": anaphora_count > 0,
+        "discourse_role_distribution": discourse_roles
+    }
+    
+    topic_position = "initial"
+    if first_content is not None:
+        total = len(words)
+        if first_content > total * 0.6:
+            topic_position = "final"
+        elif first_content > total * 0.3:
+            topic_position = "medial"
+    if len(given_entities) > len(new_entities):
+        packaging = "all-given"
+    elif len(new_entities) > len(given_entities):
+        packaging = "all-new"
+    else:
+        packaging = "topic-comment"
+    information_structure = {
+        "given_entities": given_entities,
+        "new_entities": new_entities,
+        "topic_position": topic_position,
+        "information_packaging": packaging
+    }
+    return preferences_summary, discourse_features, information_structure, clause_finiteness
+
+
+def _lexical_item(word: Any, morphology: List[str], is_finite: bool):
+    """Stanza kelimesinden dedektör girdisi (LexicalItem)"""
+    features = {}
+    if is_finite:
+        features["FINITE_VERB"] = True
+    
+    return create_lexical_item(
+        word=word.text,
+        pos=word.upos,
+        morphology=morphology,
+        features=features
+    )
+
+
+def _word_data(word: Any, feats: str, morphology: List[str], is_finite: bool) -> Dict[str, Any]:
+    """Word data (Stanza format + extensions); preference sonradan eklenir"""
+    return {
+        "id": word.id,
+        "text": word.text,
+        "lemma": word.lemma if word.lemma else None,
+        "upos": word.upos,
+        "xpos": word.xpos if word.xpos else None,
+        "feats": feats if feats else None,
+        "head": word.head,
+        "deprel": word.deprel,
+        "misc": None,  # Stanza'da misc field yok ama CONLL-U uyumluluğu için
+        "morphology": morphology,
+        "is_finite": is_finite
+    }
+
+
+def _detect_preferences(detector: MinimalistPOSErrorDetector, lex_items: List[Any]) -> Dict[str, Dict[str, Any]]:
+    """POS preferences tespit et: kelime metni → preference"""
+    with stage("detect_errors"):
+        detection_results = detector.detect_errors(lex_items)
+    
+    preference_map = {}
+    for err in detection_results.get('candidate_errors', []):
+        word_text = err['item'].word
+        preference_map[word_text] = {
+            "type": err['type'].value if hasattr(err['type'], 'value') else str(err['type']),
+            "expected_pos": err['expected_pos'],
+            "confidence": err['confidence'],
+            "reason": err['reason']
+        }
+    return preference_map
+
+
+def _preference_entry(text: str, upos: str, deprel: str, feats_lower: str,
+                      preference: Dict[str, Any]) -> Dict[str, Any]:
+    """Cümle düzeyi preferences özetinin tek öğesi"""
+    if deprel in _TOPIC_DEPRELS:
+        discourse_role = "topic"
+    elif deprel in _FOCUS_DEPRELS:
+        discourse_role = "focus"
+    else:
+        discourse_role = "background"
+    definite = "case=acc" in feats_lower or "prontype=dem" in feats_lower
+    return {
+        "word": text,
+        "stanza_pos": upos,
+        "suggested_pos": preference["expected_pos"],
+        "confidence": preference["confidence"],
+        "reason": preference["reason"],
+        "discourse_role": discourse_role,
+        "referential_status": "definite" if definite else "indefinite"
+    }
+
+
+def _analyze_sentence(sent: Any,
+                      detector: MinimalistPOSErrorDetector,
+                      include_semantics: bool) -> Dict[str, Any]:
+    """
+    Tek bir Stanza cümlesinden analyze_text'in cümle çıktısını üret
+    
+    Args:
+        sent: Stanza Sentence (.text, .words)
+        detector: Paylaşılan MinimalistPOSErrorDetector
+        include_semantics: Semantics katmanı hesaplansın mı?
+    """
+    words = []
+    lex_items = []
+    
+    with stage("morphology"):
+        morphologies = [extract_morphology_from_text(word.text) for word in sent.words]
+    
+    # Stanza kelimelerini çıkar
+    for word, morphology in zip(sent.words, morphologies):
+        feats = word.feats if word.feats else ""
+        is_finite = is_finite_verb(feats)
+        lex_items.append(_lexical_item(word, morphology, is_finite))
+        words.append(_word_data(word, feats, morphology, is_finite))
+    
+    preference_map = _detect_preferences(detector, lex_items)
+    
+    # Preference ekleme, özet, söylem ve bilgi yapısı: tek geçiş
+    with stage("sentence_layers"):
+        preferences_summary, discourse_features, information_structure, clause_finiteness = \
+            _sentence_layers(words, preference_map, include_semantics)
+    
+    # Sentence-level semantics
+    sentence_data = {
+        "text": sent.text,
+        "words": words,
+        "preferences": preferences_summary if preferences_summary else None,
+        "semantics": None
+    }
+    
+    # Propositional semantics + discourse features ekle
+    if include_semantics:
+        with stage("propositional_semantics"):
+            base_semantics = _propositional_semantics(sent.text, clause_finiteness)
+        
+        # Semantics'i genişlet
+        if base_semantics:
+            base_semantics["discourse"] = discourse_features
+            base_semantics["information_structure"] = information_structure
+        
+        sentence_data["semantics"] = base_semantics
+    
+    return sentence_data
+
+
+def analyze_text(text: str,
+                 include_semantics: bool = True,
+                 use_cache: bool = True,
+                 timings: bool = False,
+                 fields: Optional[Fields] = None) -> Dict[str, Any]:
     """
     Metni Stanza ile parse et ve POS preferences + semantics ekle
     
     Args:
         text: Türkçe metin
         include_semantics: Propositional semantics dahil edilsin mi?
+        use_cache: ``enable_result_cache()`` ile açılmış cümle cache'i kullanılsın mı?
+        timings: Sonuca aşama sürelerini (saniye) ``timings`` anahtarıyla ekle
+        fields: Cümle alanı seçimi (ör. "words.text,words.preference,semantics.proposition_type";
+                bkz. ``api.projection``). Verilirse cümlelerde yalnızca bu alanlar
+                bulunur; seçilmeyen katmanlar mümkün olduğunca hesaplanmaz.
         
     Returns:
         {
@@ -362,133 +671,234 @@ def analyze_text(text: str, include_semantics: bool = True) -> Dict[str, Any]:
                     ] | null,
                     "semantics": {...} | null
                 }
-            ]
+            ],
+            "timings": {                      # sadece timings=True ise
+                "parse": float,
+                "stanza.<processor>": float,  # iki parse'ın toplamı (Stanza backend)
+                "sentence": float,            # cümle başına işlemenin toplamı (parse hariç)
+                "morphology": float,
+                "detect_errors": float,
+                "propositional_semantics": float,   # semantics_reparse dahil
+                "semantics_reparse": float,
+                "sentence_layers": float,     # preference + söylem + bilgi yapısı (tek geçiş)
+                "total": float
+            }
         }
         
     Örnek:
         >>> result = analyze_text("Ali'nin okuduğu kitap burada.")
         >>> print(json.dumps(result, indent=2, ensure_ascii=False))
     """
-    nlp = _get_stanza_pipeline()
-    doc = nlp(text)
+    selection = parse_fields(fields) if fields is not None else None
+    if not timings:
+        with stage("analyze_text"):
+            return _analyze_text(text, include_semantics, use_cache, selection)
+    
+    with collect_timings() as stage_timings:
+        with stage("analyze_text"):
+            result = _analyze_text(text, include_semantics, use_cache, selection)
+    stage_timings["total"] = stage_timings.pop("analyze_text")
+    result["timings"] = {name: round(seconds, 6) for name, seconds in stage_timings.items()}
+    return result
+
+
+def _analyze_text(text: str,
+                  include_semantics: bool,
+                  use_cache: bool,
+                  selection: Optional[FieldSelection] = None) -> Dict[str, Any]:
+    if selection is not None:
+        # Seçilmeyen semantics katmanı hiç çalışmaz
+        include_semantics = include_semantics and selection.needs("semantics")
+        if not use_cache or get_result_cache() is None:
+            return _analyze_text_projected(text, include_semantics, selection)
+    
+    with stage("parse"):
+        doc = parse(text, STANZA_PROCESSORS)
     
+    # Type hint: doc has .sentences attribute (Stanza Document)
+    sentences = _analyze_sentences(getattr(doc, 'sentences', []), include_semantics, use_cache)
+    
+    _record_metrics(sentences)
+    if selection is not None:
+        sentences = [selection.project_sentence(sentence) for sentence in sentences]
+    return {
+        "text": text,
+        "sentences": sentences
+    }
+
+
+def _analyze_text_projected(text: str, include_semantics: bool, selection: FieldSelection) -> Dict[str, Any]:
+    """Cache yokken alan seçimi: tembel cümlelerden yalnızca seçili katmanlar üretilir"""
+    from api.lazy_result import _lazy_analysis  # döngüsel import
+    
+    lazy, tokens = _lazy_analysis(text, include_semantics)
+    sentences = [selection.project_sentence(sentence) for sentence in lazy.sentences]
+    record_request("analyze_text", len(sentences), tokens)
+    return {
+        "text": text,
+        "sentences": sentences
+    }
+
+
+def _analyze_sentences(doc_sentences: Any, include_semantics: bool, use_cache: bool) -> List[Dict[str, Any]]:
+    """Parse edilmiş cümleleri (cache'e bakarak) analyze_text cümle çıktısına çevir"""
     # Minimalist detector
     detector = MinimalistPOSErrorDetector()
     
+    # Cümle sonucu cache'i (açıksa): kural parmak izi kural sürümüne göre saklanır
+    cache = get_result_cache() if use_cache else None
+    if cache is not None:
+        fingerprint = rule_fingerprint()
+        layers = ("preferences", "semantics") if include_semantics else ("preferences",)
+    
     sentences = []
-    # Type hint: doc has .sentences attribute (Stanza Document)
-    doc_sentences = getattr(doc, 'sentences', [])
     for sent in doc_sentences:
-        words = []
-        lex_items = []
-        
-        # Stanza kelimelerini çıkar
-        for word in sent.words:
-            feats = word.feats if word.feats else ""
-            morphology = extract_morphology_from_text(word.text)
-            
-            # LexicalItem oluştur
-            features = {}
-            if is_finite_verb(feats):
-                features["FINITE_VERB"] = True
+        with stage("sentence"):
+            if cache is None:
+                sentences.append(_analyze_sentence(sent, detector, include_semantics))
+                continue
             
-            lex_item = create_lexical_item(
-                word=word.text,
-                pos=word.upos,
-                morphology=morphology,
-                features=features
-            )
-            lex_items.append(lex_item)
-            
-            # Word data (Stanza format + extensions)
-            word_data = {
-                "id": word.id,
-                "text": word.text,
-                "lemma": word.lemma if word.lemma else None,
-                "upos": word.upos,
-                "xpos": word.xpos if word.xpos else None,
-                "feats": feats if feats else None,
-                "head": word.head,
-                "deprel": word.deprel,
-                "misc": None,  # Stanza'da misc field yok ama CONLL-U uyumluluğu için
-                "morphology": morphology,
-                "is_finite": is_finite_verb(feats)
+            key = make_cache_key(sent.text, STANZA_PROCESSORS, layers, fingerprint)
+            sentence_data = cache.get(key)
+            set_span_attribute("cache.hit", sentence_data is not None)
+            if sentence_data is None:
+                sentence_data = _analyze_sentence(sent, detector, include_semantics)
+                cache.put(key, sentence_data)
+            sentences.append(sentence_data)
+    return sentences
+
+
+def reanalyze_text(previous: Dict[str, Any],
+                   text: str,
+                   include_semantics: bool = True,
+                   use_cache: bool = True,
+                   context: int = 1) -> Dict[str, Any]:
+    """
+    Düzenlenmiş metni önceki ``analyze_text`` sonucundan artımlı olarak analiz et
+    
+    Eski ve yeni metnin ortak öneki/soneki bulunur; düzenlemeye değen cümleler
+    (her iki yandan ``context`` komşu cümleyle, çünkü düzenleme cümle sınırını
+    kaydırabilir) yeniden parse edilir. Yeniden parse edilen bölgede metni
+    (hash'i) eski bölgedeki bir cümleyle aynı olan cümlelerin kural katmanları
+    tekrar çalıştırılmaz. Bölge dışındaki cümle sonuçları aynen kullanılır.
+    Söylem ve bilgi yapısı cümle içi olduğundan yalnızca değişen cümleler için
+    yeniden türetilir; doküman düzeyi katmanlar (``track_discourse``,
+    ``CenteringEngine``) ``incremental["changed"]`` indekslerinden devam edebilir.
+    Gecikme düzenlemenin boyutuyla ölçeklenir, doküman boyutuyla değil.
+    
+    Args:
+        previous: Aynı ``include_semantics`` ile alınmış ``analyze_text`` veya
+                  ``reanalyze_text`` sonucu (değişmeyen cümle dict'leri paylaşılır)
+        text: Düzenlenmiş metin
+        context: Düzenlemenin her iki yanında yeniden parse edilecek cümle sayısı
+    
+    Returns:
+        analyze_text formatı + {"incremental": {
+            "reused": int,         # önceki sonuçtan alınan cümle sayısı
+            "reanalyzed": int,     # kural katmanları yeniden çalışan cümle sayısı
+            "changed": List[int],  # yeni sonuçta yeniden analiz edilen cümle indeksleri
+            "reparsed_chars": int  # yeniden parse edilen metin uzunluğu
+        }}
+    """
+    with stage("reanalyze_text"):
+        old_text = previous.get("text", "")
+        old_sentences = previous.get("sentences", [])
+        spans = _sentence_spans(old_text, old_sentences)
+        if spans is None:
+            # Eski cümleler metinde bulunamadı (farklı parse/normalizasyon): tam analiz
+            result = _analyze_text(text, include_semantics, use_cache)
+            result["incremental"] = {
+                "reused": 0,
+                "reanalyzed": len(result["sentences"]),
+                "changed": list(range(len(result["sentences"]))),
+                "reparsed_chars": len(text),
             }
-            
-            words.append(word_data)
+            return result
         
-        # POS preferences tespit et
-        detection_results = detector.detect_errors(lex_items)
+        # Düzenlenen bölge: ortak önek ve sonek dışında kalan kısım
+        limit = min(len(old_text), len(text))
+        prefix = 0
+        while prefix < limit and old_text[prefix] == text[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_text[-1 - suffix] == text[-1 - suffix]:
+            suffix += 1
+        edit_end = len(old_text) - suffix
         
-        # Preferences'ları words'e ekle
-        preference_map = {}
-        for err in detection_results.get('candidate_errors', []):
-            word_text = err['item'].word
-            preference_map[word_text] = {
-                "type": err['type'].value if hasattr(err['type'], 'value') else str(err['type']),
-                "expected_pos": err['expected_pos'],
-                "confidence": err['confidence'],
-                "reason": err['reason']
-            }
+        # Baştaki korunan cümleler düzenlemeden önce biter, sondakiler sonra başlar
+        lo = bisect_left([end for _, end in spans], prefix)
+        hi = bisect_right([start for start, _ in spans], edit_end)
+        if old_text == text:
+            lo = hi = len(spans)
+        else:
+            lo = max(lo - context, 0)
+            hi = min(hi + context, len(spans))
         
-        # Her kelimeye preference ekle
-        for word_data in words:
-            word_data["preference"] = preference_map.get(word_data["text"])
-        
-        # Sentence-level preferences summary (Stanza'nın eksik etiketledikleri)
-        preferences_summary = []
-        for word_data in words:
-            if word_data["preference"]:
-                # Discourse role ekle
-                discourse_role = "background"
-                if word_data.get("deprel") in ["nsubj", "csubj"]:
-                    discourse_role = "topic"
-                elif word_data.get("deprel") in ["obj", "iobj", "obl"]:
-                    discourse_role = "focus"
-                
-                # Referential status
-                feats = (word_data.get("feats") or "").lower()
-                referential_status = "indefinite"
-                if "case=acc" in feats or "prontype=dem" in feats:
-                    referential_status = "definite"
-                
-                preferences_summary.append({
-                    "word": word_data["text"],
-                    "stanza_pos": word_data["upos"],
-                    "suggested_pos": word_data["preference"]["expected_pos"],
-                    "confidence": word_data["preference"]["confidence"],
-                    "reason": word_data["preference"]["reason"],
-                    "discourse_role": discourse_role,
-                    "referential_status": referential_status
-                })
-        
-        # Sentence-level semantics
-        sentence_data = {
-            "text": sent.text,
-            "words": words,
-            "preferences": preferences_summary if preferences_summary else None,
-            "semantics": None
-        }
+        region_start = spans[lo - 1][1] if lo > 0 else 0
+        region_end = spans[hi][0] if hi < len(spans) else len(old_text)
+        shift = len(text) - len(old_text)
+        region_text = text[region_start:region_end + shift]
         
-        # Propositional semantics + discourse features ekle
-        if include_semantics:
-            base_semantics = analyze_propositional_semantics(sent.text, words)
-            discourse_features = analyze_discourse_features(words)
-            information_structure = analyze_information_structure(words, sent.text)
-            
-            # Semantics'i genişlet
-            if base_semantics:
-                base_semantics["discourse"] = discourse_features
-                base_semantics["information_structure"] = information_structure
-            
-            sentence_data["semantics"] = base_semantics
+        # Bölgedeki eski cümleler: metin → sonuç (per-sentence hash)
+        previous_by_text = {sentence["text"]: sentence for sentence in old_sentences[lo:hi]}
         
-        sentences.append(sentence_data)
-    
-    return {
-        "text": text,
-        "sentences": sentences
-    }
+        middle: List[Dict[str, Any]] = []
+        analyzed: List[Dict[str, Any]] = []
+        if region_text.strip():
+            with stage("parse"):
+                doc = parse(region_text, STANZA_PROCESSORS)
+            pending = []
+            for sent in getattr(doc, 'sentences', []):
+                reused = previous_by_text.get(sent.text)
+                if reused is None:
+                    pending.append((len(middle), sent))
+                middle.append(reused)
+            results = _analyze_sentences([sent for _, sent in pending], include_semantics, use_cache)
+            for (position, _), sentence_data in zip(pending, results):
+                middle[position] = sentence_data
+            analyzed = results
+            changed = [lo + position for position, _ in pending]
+        else:
+            changed = []
+        
+        if analyzed:
+            _record_metrics(analyzed, entry_point="reanalyze_text")
+        
+        return {
+            "text": text,
+            "sentences": old_sentences[:lo] + middle + old_sentences[hi:],
+            "incremental": {
+                "reused": len(old_sentences) - (hi - lo) + len(middle) - len(analyzed),
+                "reanalyzed": len(analyzed),
+                "changed": changed,
+                "reparsed_chars": len(region_text),
+            },
+        }
+
+
+def _sentence_spans(text: str, sentences: List[Dict[str, Any]]) -> Optional[List[Tuple[int, int]]]:
+    """Cümlelerin metindeki (başlangıç, bitiş) konumları; bulunamazsa None"""
+    spans = []
+    cursor = 0
+    for sentence in sentences:
+        start = text.find(sentence["text"], cursor)
+        if start < 0:
+            return None
+        cursor = start + len(sentence["text"])
+        spans.append((start, cursor))
+    return spans
+
+
+def _record_metrics(sentences: List[Dict[str, Any]], entry_point: str = "analyze_text") -> None:
+    """İstek, cümle, token ve preference sayaçlarını güncelle (cache'ten gelenler dahil)"""
+    tokens = 0
+    for sentence_data in sentences:
+        tokens += len(sentence_data["words"])
+        for word_data in sentence_data["words"]:
+            preference = word_data["preference"]
+            if preference:
+                record_preference(_PREFERENCE_TYPE_NAMES.get(preference["type"], preference["type"]))
+    record_request(entry_point, len(sentences), tokens)
 
 
 def analyze_to_conllu(text: str) -> str:
@@ -0,0 +1,146 @@
+"""
+Çıktı Alan Seçimi (Field Projection)
+====================================
+
+``analyze_text`` cümle çıktısından yalnızca istenen alanları döndürmek için.
+Alanlar cümleye göre noktalı yollarla seçilir::
+
+    "words.text,words.preference,semantics.proposition_type"
+
+    {"text": "...", "sentences": [
+        {"words": [{"text": "Kuşlar", "preference": null}, ...],
+         "semantics": {"proposition_type": "analytic"}}]}
+
+Bir yolun ara düğümü tek başına verilirse (``words``, ``semantics.discourse``)
+alt ağacın tamamı döner. Bilinmeyen alan ``ValueError`` verir.
+
+İstenmeyen katmanlar mümkün olduğunda hesaplanmaz: ``semantics`` seçilmemişse
+semantik katmanı (yeniden parse dahil) çalışmaz; sonuç cache'i kapalıyken
+``api.lazy_result`` üzerinden yalnızca erişilen katmanlar üretilir.
+
+Kullanım:
+    analyze_text(text, fields="words.text,words.upos,words.preference")
+    analyze_corpus(documents, fields=["preferences"])
+    python -m api.batch haberler.txt --fields words.text,words.preference
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# analyze_text cümle şeması (anahtar sırası çıktı sırasıdır); None = yaprak
+_PREFERENCE = {"type": None, "expected_pos": None, "confidence": None, "reason": None}
+
+SENTENCE_SCHEMA: Dict[str, Any] = {
+    "text": None,
+    "words": {
+        "id": None, "text": None, "lemma": None, "upos": None, "xpos": None,
+        "feats": None, "head": None, "deprel": None, "misc": None,
+        "morphology": None, "is_finite": None, "preference": _PREFERENCE,
+    },
+    "preferences": {
+        "word": None, "stanza_pos": None, "suggested_pos": None, "confidence": None,
+        "reason": None, "discourse_role": None, "referential_status": None,
+    },
+    "semantics": {
+        "proposition_type": None, "predicate_type": None, "generic_encoding": None,
+        "time_bound": None, "verifiability": None, "clause_finiteness": None,
+        "discourse": {
+            "topic_candidates": None, "focus_entities": None, "referential_density": None,
+            "anaphora_present": None, "discourse_role_distribution": None,
+        },
+        "information_structure": {
+            "given_entities": None, "new_entities": None, "topic_position": None,
+            "information_packaging": None,
+        },
+    },
+}
+
+# Seçim ağacı: ((anahtar, alt ağaç | None), ...) şema sırasıyla; None = tüm değer
+Tree = Tuple[Tuple[str, Any], ...]
+Fields = Union[str, Sequence[str], 'FieldSelection']
+
+
+def _build(paths: Iterable[Tuple[str, ...]], schema: Dict[str, Any]) -> Tree:
+    grouped: Dict[str, List[Tuple[str, ...]]] = {}
+    for path in paths:
+        grouped.setdefault(path[0], []).append(path[1:])
+    tree = []
+    for key, subschema in schema.items():
+        if key not in grouped:
+            continue
+        rests = grouped[key]
+        if any(not rest for rest in rests):
+            tree.append((key, None))       # alt ağacın tamamı
+        else:
+            tree.append((key, _build(rests, subschema)))
+    return tuple(tree)
+
+
+def _validate(path: Tuple[str, ...]) -> None:
+    schema: Any = SENTENCE_SCHEMA
+    for depth, key in enumerate(path):
+        if schema is None or key not in schema:
+            parent = ".".join(path[:depth]) or "<sentence>"
+            valid = ", ".join(schema) if schema else "none"
+            raise ValueError(f"Unknown field {'.'.join(path)!r}: {parent} has fields: {valid}")
+        schema = schema[key]
+
+
+def _project(value: Any, tree: Optional[Tree]) -> Any:
+    if tree is None or value is None:
+        return value
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    return {key: _project(value[key], subtree) for key, subtree in tree if key in value}
+
+
+class FieldSelection:
+    """Doğrulanmış alan seçimi"""
+
+    def __init__(self, paths: Iterable[str]):
+        parsed = []
+        for path in paths:
+            path = path.strip()
+            if not path:
+                continue
+            parts = tuple(path.split('.'))
+            _validate(parts)
+            parsed.append(parts)
+        if not parsed:
+            raise ValueError("Field selection is empty")
+        self.paths: Tuple[str, ...] = tuple(".".join(parts) for parts in parsed)
+        self.tree: Tree = _build(parsed, SENTENCE_SCHEMA)
+        self._top = {key for key, _ in self.tree}
+
+    def __repr__(self):
+        return f"FieldSelection({','.join(self.paths)!r})"
+
+    def needs(self, layer: str) -> bool:
+        """Cümle düzeyi alan (text, words, preferences, semantics) seçili mi?"""
+        return layer in self._top
+
+    def union(self, other: Fields) -> 'FieldSelection':
+        return FieldSelection(self.paths + parse_fields(other).paths)
+
+    def project_sentence(self, sentence: Any) -> Dict[str, Any]:
+        """Cümle sonucunu (dict veya LazySentence) seçili alanlara indir"""
+        return {key: _project(sentence[key], subtree) for key, subtree in self.tree}
+
+    def project(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """analyze_text sonucunu seçili alanlara indir (text/timings korunur)"""
+        projected = dict(result)
+        projected["sentences"] = [self.project_sentence(s) for s in result["sentences"]]
+        return projected
+
+
+def parse_fields(fields: Fields) -> FieldSelection:
+    """
+    Alan seçimini çözümle
+
+    Args:
+        fields: Virgülle ayrılmış yollar, yol listesi veya FieldSelection
+    """
+    if isinstance(fields, FieldSelection):
+        return fields
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    return FieldSelection(fields)
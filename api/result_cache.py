@@ -0,0 +1,284 @@
+"""
+Cümle Düzeyinde Sonuç Cache'i
+=============================
+
+``analyze_text`` her cümle için preferences, önermesel değer, discourse ve
+information structure katmanlarını yeniden hesaplar (semantik katman ayrıca
+ikinci bir Stanza parse'ı yapar). Aynı cümleler tekrar geldiğinde bu cache
+hesaplanmış cümle çıktısını döndürür.
+
+Anahtar: (cümle metni, processor seti, istenen katmanlar, kural parmak izi)
+
+Kural parmak izi ``LEXICALIZED_mA``, ``NOMINAL_SUFFIXES``, ``ADJECTIVAL_NOUNS``,
+``TurkishPropositionAnalyzer`` marker listeleri, dedektörün güven sabitleri ve
+sonuca etki eden önermesel değer sabitlerinden (``src.propositional_semantics``)
+hesaplanır. Bunlardan biri değişirse eski kayıtlar otomatik olarak geçersiz olur.
+
+Her çağrıda canlı tabloların içerik anlık görüntüsü alınır (birkaç küçük
+tuple; µs altı). Görüntü değişmediyse saklanan iz döner; değiştiyse derlenmiş
+marker tabloları yeniden derlenir ve iz yeniden hesaplanır. Tablolar doğrudan
+(``compile_markers`` çağrılmadan) değiştirilse de iz ve sonuçlar tutarlı kalır.
+
+Kullanım:
+    from api.result_cache import enable_result_cache
+    from api.pos_semantic_analyzer import analyze_text
+
+    cache = enable_result_cache(max_entries=50_000, persist_path="cache.json")
+    analyze_text("Kuşlar uçar.")   # hesaplanır
+    analyze_text("Kuşlar uçar.")   # cache'ten
+    cache.save()                   # diske yaz (persist_path)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from error_detection.minimalist_pos_error_detection import MinimalistPOSErrorDetector
+from src import propositional_semantics
+from src.metrics import REGISTRY
+from src.propositional_semantics import TurkishPropositionAnalyzer
+
+CACHE_FORMAT_VERSION = 2
+
+# (sentence_text, processors, layers, fingerprint)
+CacheKey = Tuple[str, str, str, str]
+
+RULE_TABLES = ('LEXICALIZED_mA', 'NOMINAL_SUFFIXES', 'ADJECTIVAL_NOUNS',
+               'HOLISTIC_MARKERS', 'PARTITIVE_MARKERS', 'SPECIFICITY_MARKERS')
+
+# Dedektörün güven sabitleri (import sırasında bir kez; değerleri her çağrıda okunur)
+CONFIDENCE_CONSTANTS = tuple(sorted(
+    name for name in vars(MinimalistPOSErrorDetector) if name.startswith("CONFIDENCE_")))
+
+# (kural tabloları anlık görüntüsü, iz) - görüntü değişmedikçe iz yeniden hesaplanmaz
+_fingerprint_memo: Tuple[Optional[Tuple[Any, ...]], str] = (None, "")
+
+
+def _rule_state() -> Tuple[Any, ...]:
+    """Canlı kural tablolarının içerik kopyası (yerinde değişiklikler de görünür)"""
+    detector = MinimalistPOSErrorDetector
+    analyzer = TurkishPropositionAnalyzer
+    return (
+        tuple(detector.LEXICALIZED_mA),
+        tuple(detector.NOMINAL_SUFFIXES),
+        tuple(detector.ADJECTIVAL_NOUNS),
+        tuple(analyzer.HOLISTIC_MARKERS),
+        tuple(analyzer.PARTITIVE_MARKERS),
+        tuple(analyzer.SPECIFICITY_MARKERS),
+        tuple([getattr(detector, name) for name in CONFIDENCE_CONSTANTS]),
+        tuple([getattr(propositional_semantics, name) for name in propositional_semantics.PROPOSITIONAL_CONSTANTS]),
+    )
+
+
+def rule_fingerprint() -> str:
+    """
+    Kural tablolarının parmak izi (kısa SHA-1)
+
+    Her ``analyze_text`` çağrısında okunur; yalnızca tablolar değiştiğinde
+    yeniden hesaplanır.
+    """
+    global _fingerprint_memo
+    state = _rule_state()
+    memo_state, fingerprint = _fingerprint_memo
+    if memo_state == state:
+        return fingerprint
+    # Derlenmiş tablolar (marker anahtarları) hash'lenen listelerle aynı olsun
+    MinimalistPOSErrorDetector.compile_markers()
+    TurkishPropositionAnalyzer.compile_markers()
+    fingerprint = _compute_rule_fingerprint(state)
+    _fingerprint_memo = (state, fingerprint)
+    return fingerprint
+
+
+def _compute_rule_fingerprint(state: Tuple[Any, ...]) -> str:
+    *tables, confidence, propositional = state
+    payload = dict(zip(RULE_TABLES, tables))
+    payload["confidence"] = dict(zip(CONFIDENCE_CONSTANTS, confidence))
+    payload["propositional"] = dict(zip(propositional_semantics.PROPOSITIONAL_CONSTANTS, propositional))
+    # Sentetik değerler import sırasında tabloya gömülür; etkili değerler oradan okunur
+    payload["propositional_values"] = propositional_semantics.propositional_value_signature()
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def make_cache_key(sentence_text: str,
+                   processors: str,
+                   layers: Sequence[str],
+                   fingerprint: str) -> CacheKey:
+    """Cache anahtarı oluştur (katman sırası önemsiz)"""
+    return (sentence_text, processors, ",".join(sorted(layers)), fingerprint)
+
+
+class SentenceResultCache:
+    """
+    Thread-safe, sınırlı boyutlu (LRU) cümle sonucu cache'i
+
+    Değerler pickle olarak tutulur: ``get`` her seferinde bağımsız bir kopya
+    döndürür, böylece çağıranın sonucu değiştirmesi cache'i bozmaz (pickle
+    çözümü aynı dict için ``json.loads``'un yaklaşık yarısı kadar sürer).
+    """
+
+    def __init__(self, max_entries: int = 10000, persist_path: Optional[str] = None):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self._entries: 'OrderedDict[CacheKey, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        if persist_path and os.path.exists(persist_path):
+            self.load(persist_path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _check_fingerprint(self, fingerprint: str) -> None:
+        # Kurallar değiştiyse eski kayıtların hiçbiri artık geçerli değil
+        if self._fingerprint != fingerprint:
+            if self._entries:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+            self._fingerprint = fingerprint
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Kayıt varsa bağımsız bir kopyasını döndür, yoksa None"""
+        with self._lock:
+            self._check_fingerprint(key[3])
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(payload)
+
+    def put(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        """Cümle sonucunu kaydet (en eski kayıtlar ``max_entries`` aşılınca atılır)"""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._check_fingerprint(key[3])
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss sayaçları ve doluluk"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "fingerprint": self._fingerprint,
+        }
+
+    def save(self, path: Optional[str] = None) -> str:
+        """
+        Cache'i JSON olarak diske yaz (atomik: önce geçici dosya)
+
+        Returns:
+            Yazılan dosya yolu
+        """
+        path = path or self.persist_path
+        if not path:
+            raise ValueError("No path given and cache has no persist_path")
+        with self._lock:
+            data = {
+                "version": CACHE_FORMAT_VERSION,
+                "fingerprint": self._fingerprint,
+                "entries": [
+                    {"text": k[0], "processors": k[1], "layers": k[2], "value": pickle.loads(v)}
+                    for k, v in self._entries.items()
+                ],
+            }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, path: Optional[str] = None) -> int:
+        """
+        Diskten yükle; parmak izi güncel kurallarla uyuşmayan dosya yok sayılır
+
+        Returns:
+            Yüklenen kayıt sayısı
+        """
+        path = path or self.persist_path
+        if not path:
+            raise ValueError("No path given and cache has no persist_path")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        fingerprint = rule_fingerprint()
+        if data.get("version") != CACHE_FORMAT_VERSION or data.get("fingerprint") != fingerprint:
+            return 0
+
+        loaded = 0
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            for entry in data.get("entries", []):
+                key = (entry["text"], entry["processors"], entry["layers"], fingerprint)
+                self._entries[key] = pickle.dumps(entry["value"], protocol=pickle.HIGHEST_PROTOCOL)
+                loaded += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return loaded
+
+
+# ========== PROCESS-WIDE CACHE ==========
+
+_result_cache: Optional[SentenceResultCache] = None
+
+
+def enable_result_cache(max_entries: int = 10000,
+                        persist_path: Optional[str] = None) -> SentenceResultCache:
+    """``analyze_text`` için process-wide cache'i aç (varsa değiştirir)"""
+    global _result_cache
+    _result_cache = SentenceResultCache(max_entries=max_entries, persist_path=persist_path)
+    return _result_cache
+
+
+def disable_result_cache() -> None:
+    global _result_cache
+    _result_cache = None
+
+
+def get_result_cache() -> Optional[SentenceResultCache]:
+    """Açık cache'i döndür (kapalıysa None)"""
+    return _result_cache
+
+
+def _collect_cache_metrics():
+    """Prometheus: açık cache'in hit/miss sayaçları ve doluluğu"""
+    cache = _result_cache
+    if cache is None:
+        return
+    stats = cache.stats()
+    prefix = 'turkish_analyzer_result_cache_'
+    yield (prefix + 'requests_total', 'counter', 'Sentence result cache lookups',
+           [('', {'result': 'hit'}, stats['hits']), ('', {'result': 'miss'}, stats['misses'])])
+    yield (prefix + 'hit_ratio', 'gauge', 'Sentence result cache hit ratio', [('', {}, stats['hit_rate'])])
+    yield (prefix + 'entries', 'gauge', 'Entries in the sentence result cache', [('', {}, stats['entries'])])
+    yield (prefix + 'evictions_total', 'counter', 'LRU evictions', [('', {}, stats['evictions'])])
+
+
+REGISTRY.register_collector(_collect_cache_metrics)
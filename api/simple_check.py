@@ -11,32 +11,12 @@ Kullanım:
     result = check_sentence("Kuşlar uçar.", include_semantics=True)
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import stanza
 from typing import Dict, List, Any
 
-# Stanza pipeline (lazy load)
-_nlp: Any = None
-
-def get_nlp() -> Any:
-    global _nlp
-    if _nlp is None:
-        print("Loading Stanza Turkish model...")
-        _nlp = stanza.Pipeline('tr', processors='tokenize,mwt,pos,lemma,depparse', verbose=False)
-    return _nlp
-
 
 # Propositional semantics (optional)
 try:
-    # Add src directory to path
-    _src_path = Path(__file__).parent.parent / 'src'
-    if str(_src_path) not in sys.path:
-        sys.path.insert(0, str(_src_path))
-    
-    from propositional_semantics import (  # type: ignore
+    from src.propositional_semantics import (
         TurkishPropositionAnalyzer,
         analyze_sentence_with_stanza,
         PredicateType
@@ -48,6 +28,23 @@ except (ImportError, ModuleNotFoundError):
     PredicateType = None  # type: ignore
     analyze_sentence_with_stanza = None  # type: ignore
 
+from src.pipeline_pool import get_pipeline_pool, register_pipeline
+from src.parser_backend import parse
+from src.metrics import record_preference, record_request
+
+STANZA_PROCESSORS = 'tokenize,mwt,pos,lemma,depparse'
+register_pipeline(STANZA_PROCESSORS)  # warmup() listesine ekle
+
+
+def get_nlp() -> Any:
+    """
+    Stanza pipeline havuzunu döndür (thread-safe, lazy load)
+
+    NOT: ``check_sentence`` aktif parser backend'ini kullanır
+    (``src.parser_backend``); bu fonksiyon doğrudan Stanza havuzunu verir.
+    """
+    return get_pipeline_pool(STANZA_PROCESSORS)
+
 
 def check_sentence(sentence: str, include_semantics: bool = False) -> Dict:
     """
@@ -65,8 +62,7 @@ def check_sentence(sentence: str, include_semantics: bool = False) -> Dict:
             'semantics': {...}  # sadece include_semantics=True ise
         }
     """
-    nlp = get_nlp()
-    doc: Any = nlp(sentence)
+    doc: Any = parse(sentence, STANZA_PROCESSORS)
     
     preferences = []
     prop_analyzer = None
@@ -126,6 +122,11 @@ def check_sentence(sentence: str, include_semantics: bool = False) -> Dict:
                         'confidence': confidence
                     })
     
+    record_request('simple_check', len(doc.sentences), sum(len(s.words) for s in doc.sentences))
+    for _ in preferences:
+        # Buradaki tüm tercihler VERB-origin nominal (POSErrorType.NOUN_VERB_CONFUSION)
+        record_preference('NOUN_VERB_CONFUSION')
+    
     result = {
         'sentence': sentence,
         'preferences': preferences,
@@ -0,0 +1,15 @@
+"""
+Performans Ölçümleri
+====================
+
+Public giriş noktalarının (``detect_minimalist_errors``, ``analyze_text``,
+``analyze_to_conllu``, ``check_sentence_enhanced``, ``TurkishPropositionAnalyzer``,
+morfoloji çıkarımı) ölçümleri.
+
+Varsayılan ölçümler kayıtlı parse fixture'ları üzerinde çalışır (torch/Stanza
+yüklenmez); ``model:`` önekli varyantlar gerçek Stanza modeliyle uçtan uca
+ölçer ve model yoksa atlanır.
+
+    python -m benchmarks.suite                 # modelsiz
+    python -m benchmarks.suite --with-model    # + uçtan uca
+"""
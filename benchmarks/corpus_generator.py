@@ -0,0 +1,501 @@
+"""
+Sentetik Türkçe Derlem Üreteci
+==============================
+
+Yük ve ölçekleme testleri için, detector'ın ve ``TurkishPropositionAnalyzer``'ın
+ele aldığı olgulardan kurulu şablonlarla milyonlarca cümle üretir:
+
+- -DIK ortaçlı ilgi yapıları ("Ali'nin okuduğu kitap burada.")
+- -mA / -Iş / -mAk adlaşmaları, leksikalleşmiş -mA bileşikleri ("Yüzme havuzu temiz.")
+- işaret sıfatları, çıplak çoğullar, adlaşmış sıfatlar
+- geniş zaman (Aspect=Hab) / geçmiş / gelecek / şimdiki zaman yüklemleri
+- "ve" ile bağlanmış çok yan cümleli uzun cümleler
+
+Çıktı hem düz metin (satır başına bir doküman, ``api.batch`` girdisi) hem de
+``src.parse_fixtures`` biçiminde parse fixture'ıdır (upos/feats/deprel dahil);
+böylece ``ReplayBackend`` ve ``benchmarks.suite --fixtures`` modelsiz çalışır.
+Etiketler Stanza tr (IMST) çıktısını taklit eder; adlaşmalar Stanza'nın sık
+yaptığı gibi VERB + VerbForm=Vnoun olarak etiketlenir.
+
+Kullanım:
+    python -m benchmarks.corpus_generator --tokens 10000000 --seed 7 \\
+        --fixtures synthetic.json --text synthetic.txt
+    python -m benchmarks.suite --fixtures synthetic.json
+
+    from benchmarks.corpus_generator import CorpusConfig, CorpusGenerator
+
+    generator = CorpusGenerator(CorpusConfig(seed=7, phenomena={"dik_relative": 1.0}))
+    for doc in generator.documents(target_tokens=100_000):
+        ...
+    generator.stats()
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.parse_fixtures import FIXTURE_FORMAT_VERSION, ParsedDocument, ParsedSentence, ParsedWord
+
+# ========== SÖZLÜK ==========
+
+# lemma: (yalın tekil, yalın çoğul, belirtme tekil)
+NOUNS = {
+    'kuş': ('kuş', 'kuşlar', 'kuşu'),
+    'kitap': ('kitap', 'kitaplar', 'kitabı'),
+    'çocuk': ('çocuk', 'çocuklar', 'çocuğu'),
+    'kız': ('kız', 'kızlar', 'kızı'),
+    'öğrenci': ('öğrenci', 'öğrenciler', 'öğrenciyi'),
+    'kedi': ('kedi', 'kediler', 'kediyi'),
+    'mektup': ('mektup', 'mektuplar', 'mektubu'),
+    'araba': ('araba', 'arabalar', 'arabayı'),
+    'elma': ('elma', 'elmalar', 'elmayı'),
+    'şarkı': ('şarkı', 'şarkılar', 'şarkıyı'),
+    'köpek': ('köpek', 'köpekler', 'köpeği'),
+}
+ANIMATE_NOUNS = ['kuş', 'çocuk', 'kız', 'öğrenci', 'kedi', 'köpek']
+OBJECT_NOUNS = ['kitap', 'mektup', 'araba', 'elma', 'şarkı']
+
+# lemma: (geniş, geçmiş, gelecek, şimdiki, -DIK, -mA, -Iş, -mAk, geçişli)
+VERBS = {
+    'oku': ('okur', 'okudu', 'okuyacak', 'okuyor', 'okuduğu', 'okuma', 'okuyuş', 'okumak', True),
+    'yaz': ('yazar', 'yazdı', 'yazacak', 'yazıyor', 'yazdığı', 'yazma', 'yazış', 'yazmak', True),
+    'al': ('alır', 'aldı', 'alacak', 'alıyor', 'aldığı', 'alma', 'alış', 'almak', True),
+    'sev': ('sever', 'sevdi', 'sevecek', 'seviyor', 'sevdiği', 'sevme', 'seviş', 'sevmek', True),
+    'ye': ('yer', 'yedi', 'yiyecek', 'yiyor', 'yediği', 'yeme', 'yiyiş', 'yemek', True),
+    'gel': ('gelir', 'geldi', 'gelecek', 'geliyor', 'geldiği', 'gelme', 'geliş', 'gelmek', False),
+    'uç': ('uçar', 'uçtu', 'uçacak', 'uçuyor', 'uçtuğu', 'uçma', 'uçuş', 'uçmak', False),
+    'koş': ('koşar', 'koştu', 'koşacak', 'koşuyor', 'koştuğu', 'koşma', 'koşuş', 'koşmak', False),
+    'bak': ('bakar', 'baktı', 'bakacak', 'bakıyor', 'baktığı', 'bakma', 'bakış', 'bakmak', False),
+    'uyu': ('uyur', 'uyudu', 'uyuyacak', 'uyuyor', 'uyuduğu', 'uyuma', 'uyuyuş', 'uyumak', False),
+}
+TRANSITIVE_VERBS = [lemma for lemma, forms in VERBS.items() if forms[8]]
+INTRANSITIVE_VERBS = [lemma for lemma, forms in VERBS.items() if not forms[8]]
+
+# Ad: (yalın, ilgi hali)
+PROPER_NOUNS = [('Ali', "Ali'nin"), ('Ayşe', "Ayşe'nin"), ('Mehmet', "Mehmet'in"), ('Zeynep', "Zeynep'in")]
+DEMONSTRATIVES = ['bu', 'şu', 'o']
+TIME_ADVERBS = {'aorist': ['erken', 'genellikle', 'hep'], 'past': ['dün', 'erken'],
+                'future': ['yarın', 'yakında'], 'progressive': ['şimdi', 'hâlâ']}
+ADJECTIVES = ['güzel', 'büyük', 'küçük', 'yeni', 'temiz']
+NOMINALIZED_ADJECTIVES = ['güzel', 'iyi', 'kötü', 'büyük', 'küçük']  # detector.ADJECTIVAL_NOUNS
+LOCATIVES = [('burada', 'bura'), ('orada', 'ora'), ('evde', 'ev')]
+
+# -mA + iyelikli baş ad: (baş ad, lemma)
+MA_HEADS = [('saati', 'saat'), ('zamanı', 'zaman'), ('defteri', 'defter')]
+# Leksikalleşmiş -mA bileşikleri (detector.LEXICALIZED_mA)
+LEXICALIZED_COMPOUNDS = [('yüzme', 'havuzu', 'havuz'), ('koşma', 'parkuru', 'parkur'),
+                         ('dolma', 'tabağı', 'tabak'), ('basma', 'kumaşı', 'kumaş')]
+
+# Stanza tr (IMST) FEATS kalıpları
+FEATS_NOUN = {
+    'nom': 'Case=Nom|Number=Sing|Person=3',
+    'plur': 'Case=Nom|Number=Plur|Person=3',
+    'acc': 'Case=Acc|Number=Sing|Person=3',
+    'gen': 'Case=Gen|Number=Sing|Person=3',
+    'loc': 'Case=Loc|Number=Sing|Person=3',
+    'poss': 'Case=Nom|Number=Sing|Number[psor]=Sing|Person=3|Person[psor]=3',
+}
+FEATS_VERB = {
+    'aorist': 'Aspect=Hab|Mood=Ind|Number=Sing|Person=3|Polarity=Pos|Tense=Pres',
+    'past': 'Aspect=Perf|Mood=Ind|Number=Sing|Person=3|Polarity=Pos|Tense=Past',
+    'future': 'Aspect=Perf|Mood=Ind|Number=Sing|Person=3|Polarity=Pos|Tense=Fut',
+    'progressive': 'Aspect=Prog|Mood=Ind|Number=Sing|Person=3|Polarity=Pos|Polite=Infm|Tense=Pres',
+    'dik': 'Aspect=Perf|Mood=Ind|Number[psor]=Sing|Person[psor]=3|Polarity=Pos|Tense=Past|VerbForm=Part',
+    'vnoun': 'Aspect=Perf|Case=Nom|Mood=Ind|Number=Sing|Person=3|Polarity=Pos|Tense=Pres|VerbForm=Vnoun',
+    'infinitive': 'Aspect=Perf|Case=Nom|Mood=Ind|Polarity=Pos|Tense=Pres|VerbForm=Vnoun',
+}
+TENSE_FORM_INDEX = {'aorist': 0, 'past': 1, 'future': 2, 'progressive': 3}
+
+# ========== ŞABLONLAR ==========
+
+# Yan cümle kelimesi: (metin, lemma, upos, xpos, feats, yerel baş [0 = yan cümle kökü], deprel)
+Token = Tuple[str, str, str, str, Optional[str], int, str]
+Template = Callable[[random.Random], List[Token]]
+
+
+def _noun(lemma: str, case: str) -> Tuple[str, Optional[str]]:
+    sing, plur, acc = NOUNS[lemma]
+    return {'nom': sing, 'plur': plur, 'acc': acc}[case], FEATS_NOUN[case]
+
+
+def _verb(lemma: str, tense: str) -> Tuple[str, str]:
+    return VERBS[lemma][TENSE_FORM_INDEX[tense]], FEATS_VERB[tense]
+
+
+def _adverb(rng: random.Random, tense: str) -> List[Token]:
+    """Yüklemin zamanına uygun zaman zarfı"""
+    text = rng.choice(TIME_ADVERBS[tense])
+    return [(text, text, 'ADV', 'Adverb', None, 0, 'advmod')]
+
+
+def _bare_plural(tense: str) -> Template:
+    """Çıplak çoğul özne: "Kuşlar uçar." (generic) / "Kuşlar uçtu." """
+    def build(rng: random.Random) -> List[Token]:
+        subject = rng.choice(ANIMATE_NOUNS)
+        verb = rng.choice(INTRANSITIVE_VERBS)
+        noun_text, noun_feats = _noun(subject, 'plur')
+        verb_text, verb_feats = _verb(verb, tense)
+        return [(noun_text, subject, 'NOUN', 'Noun', noun_feats, 2, 'nsubj'),
+                (verb_text, verb, 'VERB', 'Verb', verb_feats, 0, 'root')]
+    return build
+
+
+def _proper_subject(tense: str) -> Template:
+    """Özel ad özne + zarf (+ belirtme halinde nesne): "Ali dün kitabı okudu." """
+    def build(rng: random.Random) -> List[Token]:
+        name, _ = rng.choice(PROPER_NOUNS)
+        tokens: List[Token] = [(name, name, 'PROPN', 'Prop', FEATS_NOUN['nom'], 0, 'nsubj')]
+        tokens += _adverb(rng, tense)
+        if rng.random() < 0.6:
+            verb = rng.choice(TRANSITIVE_VERBS)
+            obj = rng.choice(OBJECT_NOUNS)
+            obj_text, obj_feats = _noun(obj, 'acc')
+            tokens.append((obj_text, obj, 'NOUN', 'Noun', obj_feats, 0, 'obj'))
+        else:
+            verb = rng.choice(INTRANSITIVE_VERBS)
+        verb_text, verb_feats = _verb(verb, tense)
+        tokens.append((verb_text, verb, 'VERB', 'Verb', verb_feats, 0, 'root'))
+        return _resolve_root(tokens)
+    return build
+
+
+def _demonstrative(rng: random.Random) -> List[Token]:
+    """İşaret sıfatlı özne: "Bu kız yarın gelecek." """
+    tense = rng.choice(['future', 'past', 'progressive'])
+    det = rng.choice(DEMONSTRATIVES)
+    subject = rng.choice(ANIMATE_NOUNS)
+    noun_text, noun_feats = _noun(subject, 'nom')
+    verb = rng.choice(INTRANSITIVE_VERBS)
+    verb_text, verb_feats = _verb(verb, tense)
+    tokens: List[Token] = [(det, det, 'DET', 'Det', 'PronType=Dem', 2, 'det'),
+                           (noun_text, subject, 'NOUN', 'Noun', noun_feats, 0, 'nsubj')]
+    tokens += _adverb(rng, tense)
+    tokens.append((verb_text, verb, 'VERB', 'Verb', verb_feats, 0, 'root'))
+    return _resolve_root(tokens)
+
+
+def _dik_relative(rng: random.Random) -> List[Token]:
+    """-DIK ortaçlı ilgi yapısı: "Ali'nin okuduğu kitap burada." """
+    _, genitive = rng.choice(PROPER_NOUNS)
+    verb = rng.choice(TRANSITIVE_VERBS)
+    noun = rng.choice(OBJECT_NOUNS)
+    locative, loc_lemma = rng.choice(LOCATIVES)
+    return [(genitive, genitive.split("'")[0], 'PROPN', 'Prop', FEATS_NOUN['gen'], 2, 'nsubj'),
+            (VERBS[verb][4], verb, 'VERB', 'Verb', FEATS_VERB['dik'], 3, 'acl'),
+            (NOUNS[noun][0], noun, 'NOUN', 'Noun', FEATS_NOUN['nom'], 4, 'nsubj'),
+            (locative, loc_lemma, 'NOUN', 'Noun', FEATS_NOUN['loc'], 0, 'root')]
+
+
+def _ma_nominal(rng: random.Random) -> List[Token]:
+    """-mA adlaşması + iyelikli baş ad: "Okuma saati geldi." (VERB etiketli)"""
+    verb = rng.choice(list(VERBS))
+    head, head_lemma = rng.choice(MA_HEADS)
+    predicate = rng.choice(['gel', 'uç', 'koş'])
+    predicate_text, predicate_feats = _verb(predicate, 'past')
+    return [(VERBS[verb][5], verb, 'VERB', 'Verb', FEATS_VERB['vnoun'], 2, 'nmod:poss'),
+            (head, head_lemma, 'NOUN', 'Noun', FEATS_NOUN['poss'], 3, 'nsubj'),
+            (predicate_text, predicate, 'VERB', 'Verb', predicate_feats, 0, 'root')]
+
+
+def _lexicalized_ma(rng: random.Random) -> List[Token]:
+    """Leksikalleşmiş -mA bileşiği: "Yüzme havuzu temiz." (detector kısa devresi)"""
+    modifier, head, head_lemma = rng.choice(LEXICALIZED_COMPOUNDS)
+    adjective = rng.choice(ADJECTIVES)
+    return [(modifier, modifier, 'VERB', 'Verb', FEATS_VERB['vnoun'], 2, 'nmod:poss'),
+            (head, head_lemma, 'NOUN', 'Noun', FEATS_NOUN['poss'], 3, 'nsubj'),
+            (adjective, adjective, 'ADJ', 'Adj', None, 0, 'root')]
+
+
+def _is_nominal(rng: random.Random) -> List[Token]:
+    """-Iş adlaşması: "Bu bakış güzel." """
+    det = rng.choice(DEMONSTRATIVES)
+    verb = rng.choice(list(VERBS))
+    adjective = rng.choice(ADJECTIVES)
+    return [(det, det, 'DET', 'Det', 'PronType=Dem', 2, 'det'),
+            (VERBS[verb][6], verb, 'VERB', 'Verb', FEATS_VERB['vnoun'], 3, 'nsubj'),
+            (adjective, adjective, 'ADJ', 'Adj', None, 0, 'root')]
+
+
+def _mak_complement(rng: random.Random) -> List[Token]:
+    """-mAk tümleci: "Ali yüzmek istiyor." """
+    name, _ = rng.choice(PROPER_NOUNS)
+    verb = rng.choice(list(VERBS))
+    return [(name, name, 'PROPN', 'Prop', FEATS_NOUN['nom'], 3, 'nsubj'),
+            (VERBS[verb][7], verb, 'VERB', 'Verb', FEATS_VERB['infinitive'], 3, 'obj'),
+            ('istiyor', 'iste', 'VERB', 'Verb', FEATS_VERB['progressive'], 0, 'root')]
+
+
+def _nominalized_adjective(rng: random.Random) -> List[Token]:
+    """Adlaşmış sıfat özne: "Güzel geldi." """
+    adjective = rng.choice(NOMINALIZED_ADJECTIVES)
+    verb = rng.choice(INTRANSITIVE_VERBS)
+    verb_text, verb_feats = _verb(verb, rng.choice(['past', 'aorist']))
+    return [(adjective, adjective, 'ADJ', 'Adj', None, 2, 'nsubj'),
+            (verb_text, verb, 'VERB', 'Verb', verb_feats, 0, 'root')]
+
+
+def _resolve_root(tokens: List[Token]) -> List[Token]:
+    """Yerel baş 0 olan bağımlıları (root hariç) yan cümle köküne bağla"""
+    root = next(i for i, token in enumerate(tokens, 1) if token[6] == 'root')
+    return [token if token[6] == 'root' or token[5] else token[:5] + (root,) + token[6:]
+            for token in tokens]
+
+
+TEMPLATES: Dict[str, Template] = {
+    'bare_plural_aorist': _bare_plural('aorist'),
+    'bare_plural_past': _bare_plural('past'),
+    'proper_aorist': _proper_subject('aorist'),
+    'proper_past': _proper_subject('past'),
+    'progressive': _proper_subject('progressive'),
+    'demonstrative': _demonstrative,
+    'dik_relative': _dik_relative,
+    'ma_nominal': _ma_nominal,
+    'lexicalized_ma': _lexicalized_ma,
+    'is_nominal': _is_nominal,
+    'mak_complement': _mak_complement,
+    'nominalized_adjective': _nominalized_adjective,
+}
+
+DEFAULT_PHENOMENA = {
+    'bare_plural_aorist': 0.12,
+    'bare_plural_past': 0.08,
+    'proper_aorist': 0.10,
+    'proper_past': 0.16,
+    'progressive': 0.08,
+    'demonstrative': 0.10,
+    'dik_relative': 0.12,
+    'ma_nominal': 0.06,
+    'lexicalized_ma': 0.05,
+    'is_nominal': 0.04,
+    'mak_complement': 0.05,
+    'nominalized_adjective': 0.04,
+}
+# Cümle başına yan cümle sayısı: çoğu kısa, uzun kuyruk ("ve" ile bağlı)
+DEFAULT_CLAUSES_PER_SENTENCE = {1: 0.70, 2: 0.18, 3: 0.07, 5: 0.03, 10: 0.02}
+DEFAULT_SENTENCES_PER_DOCUMENT = {1: 0.35, 2: 0.25, 3: 0.20, 5: 0.15, 10: 0.05}
+
+
+@dataclass
+class CorpusConfig:
+    """
+    Üreteç ayarları
+
+    ``phenomena``, ``clauses_per_sentence`` ve ``sentences_per_document``
+    ağırlık sözlükleridir (toplamın 1 olması gerekmez).
+    """
+    seed: int = 0
+    phenomena: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_PHENOMENA))
+    clauses_per_sentence: Dict[int, float] = field(default_factory=lambda: dict(DEFAULT_CLAUSES_PER_SENTENCE))
+    sentences_per_document: Dict[int, float] = field(default_factory=lambda: dict(DEFAULT_SENTENCES_PER_DOCUMENT))
+    processors: Optional[str] = None
+
+    def __post_init__(self):
+        unknown = set(self.phenomena) - set(TEMPLATES)
+        if unknown:
+            raise ValueError(f"Unknown phenomena: {', '.join(sorted(unknown))} (known: {', '.join(TEMPLATES)})")
+        for name, weights in (("phenomena", self.phenomena),
+                              ("clauses_per_sentence", self.clauses_per_sentence),
+                              ("sentences_per_document", self.sentences_per_document)):
+            if not weights or any(w < 0 for w in weights.values()) or sum(weights.values()) <= 0:
+                raise ValueError(f"{name} needs at least one positive weight")
+
+
+def _capitalize(text: str) -> str:
+    """Türkçe büyük harf (i → İ)"""
+    if not text:
+        return text
+    first = 'İ' if text[0] == 'i' else text[0].upper()
+    return first + text[1:]
+
+
+class CorpusGenerator:
+    """Tohumlu, akış halinde sentetik doküman üreteci"""
+
+    def __init__(self, config: Optional[CorpusConfig] = None):
+        self.config = config or CorpusConfig()
+        self.rng = random.Random(self.config.seed)
+        self._phenomena = self._weights(self.config.phenomena)
+        self._clauses = self._weights(self.config.clauses_per_sentence)
+        self._sentences = self._weights(self.config.sentences_per_document)
+        self.phenomenon_counts: Dict[str, int] = {name: 0 for name in self.config.phenomena}
+        self.documents_generated = 0
+        self.sentences_generated = 0
+        self.tokens_generated = 0
+
+    @staticmethod
+    def _weights(weights: Dict[Any, float]) -> Tuple[List[Any], List[float]]:
+        items = [(key, weight) for key, weight in weights.items() if weight > 0]
+        return [key for key, _ in items], [weight for _, weight in items]
+
+    def _choose(self, table: Tuple[List[Any], List[float]]) -> Any:
+        return self.rng.choices(table[0], weights=table[1])[0]
+
+    def sentence(self) -> ParsedSentence:
+        """Bir cümle üret (birden fazla yan cümle "ve" ile bağlanır)"""
+        clauses = []
+        for _ in range(self._choose(self._clauses)):
+            phenomenon = self._choose(self._phenomena)
+            self.phenomenon_counts[phenomenon] += 1
+            clauses.append(TEMPLATES[phenomenon](self.rng))
+
+        words: List[ParsedWord] = []
+        sentence_root = 0
+        for clause in clauses:
+            if words:
+                words.append(ParsedWord(id=len(words) + 1, text='ve', lemma='ve', upos='CCONJ', xpos='Conj',
+                                        feats=None, head=None, deprel='cc', misc=None))
+            offset = len(words)
+            clause_root = offset + next(i for i, token in enumerate(clause, 1) if token[6] == 'root')
+            for text, lemma, upos, xpos, feats, head, deprel in clause:
+                if deprel == 'root':
+                    head, deprel = (sentence_root, 'conj') if sentence_root else (0, 'root')
+                else:
+                    head += offset
+                words.append(ParsedWord(id=len(words) + 1, text=text, lemma=lemma, upos=upos, xpos=xpos,
+                                        feats=feats, head=head, deprel=deprel, misc=None))
+            if words[offset - 1:offset] and words[offset - 1].deprel == 'cc':
+                words[offset - 1].head = clause_root  # "ve" sonraki yan cümlenin köküne bağlanır
+            sentence_root = sentence_root or clause_root
+
+        words[0].text = _capitalize(words[0].text)
+        words.append(ParsedWord(id=len(words) + 1, text='.', lemma='.', upos='PUNCT', xpos='Punc',
+                                feats=None, head=sentence_root, deprel='punct', misc=None))
+        text = " ".join(w.text for w in words[:-1]) + "."
+        self.sentences_generated += 1
+        self.tokens_generated += len(words)
+        return ParsedSentence(text, words)
+
+    def document(self) -> ParsedDocument:
+        sentences = [self.sentence() for _ in range(self._choose(self._sentences))]
+        self.documents_generated += 1
+        return ParsedDocument(" ".join(s.text for s in sentences), sentences, self.config.processors)
+
+    def documents(self, count: Optional[int] = None,
+                  target_tokens: Optional[int] = None) -> Iterator[ParsedDocument]:
+        """
+        Doküman akışı
+
+        Args:
+            count: Üretilecek doküman sayısı
+            target_tokens: Bu kadar token'a ulaşınca dur (son doküman tamamlanır)
+        """
+        if count is None and target_tokens is None:
+            raise ValueError("Pass count and/or target_tokens")
+        start_tokens = self.tokens_generated
+        produced = 0
+        while (count is None or produced < count) and \
+                (target_tokens is None or self.tokens_generated - start_tokens < target_tokens):
+            yield self.document()
+            produced += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Üretilen doküman/cümle/token ve olgu dağılımı"""
+        clauses = sum(self.phenomenon_counts.values())
+        return {
+            "seed": self.config.seed,
+            "documents": self.documents_generated,
+            "sentences": self.sentences_generated,
+            "tokens": self.tokens_generated,
+            "clauses": clauses,
+            "phenomena": {name: {"count": n, "rate": round(n / clauses, 4) if clauses else 0.0}
+                          for name, n in sorted(self.phenomenon_counts.items())},
+        }
+
+
+# ========== YAZICILAR ==========
+
+def write_corpus(documents: Iterator[ParsedDocument],
+                 fixture_path: Optional[str] = None,
+                 text_path: Optional[str] = None,
+                 source: str = "benchmarks.corpus_generator") -> int:
+    """
+    Dokümanları akış halinde yaz (bellekte tutulmaz)
+
+    Fixture dosyası ``src.parse_fixtures.load_parse_fixtures`` ile okunabilir;
+    metin dosyası satır başına bir dokümandır.
+
+    Returns:
+        Yazılan doküman sayısı
+    """
+    if fixture_path is None and text_path is None:
+        raise ValueError("Pass fixture_path and/or text_path")
+    fixture = open(f"{fixture_path}.tmp", 'w', encoding='utf-8') if fixture_path else None
+    text = open(f"{text_path}.tmp", 'w', encoding='utf-8') if text_path else None
+    written = 0
+    try:
+        if fixture:
+            header = json.dumps({"version": FIXTURE_FORMAT_VERSION, "source": source}, ensure_ascii=False)
+            fixture.write(header[:-1] + ', "documents": [\n')
+        for doc in documents:
+            if fixture:
+                fixture.write((",\n" if written else "") + json.dumps(doc.to_dict(), ensure_ascii=False))
+            if text:
+                text.write(doc.text + "\n")
+            written += 1
+        if fixture:
+            fixture.write("\n]}\n")
+    finally:
+        for handle in (fixture, text):
+            if handle:
+                handle.close()
+    for path in (fixture_path, text_path):
+        if path:
+            os.replace(f"{path}.tmp", path)
+    return written
+
+
+def _parse_weights(spec: str, key_type: Callable[[str], Any]) -> Dict[Any, float]:
+    """'ad:ağırlık,ad:ağırlık' biçimi"""
+    weights = {}
+    for part in spec.split(','):
+        key, _, weight = part.partition(':')
+        weights[key_type(key.strip())] = float(weight) if weight else 1.0
+    return weights
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.corpus_generator",
+                                     description="Sentetik Türkçe derlem (metin + parse fixture)")
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument("--tokens", type=int, help="Hedef token sayısı")
+    size.add_argument("--documents", type=int, help="Doküman sayısı")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures", help="Parse fixture çıktısı (JSON)")
+    parser.add_argument("--text", help="Düz metin çıktısı (satır başına doküman)")
+    parser.add_argument("--phenomena", help="Olgu ağırlıkları, ör. 'dik_relative:3,bare_plural_aorist:1'")
+    parser.add_argument("--clauses", help="Cümle başına yan cümle dağılımı, ör. '1:0.8,4:0.2'")
+    parser.add_argument("--sentences", help="Doküman başına cümle dağılımı, ör. '1:0.5,3:0.5'")
+    parser.add_argument("--processors", help="Fixture'lara yazılacak processor seti")
+    parser.add_argument("--list", action="store_true", help="Olguları listele")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, template in TEMPLATES.items():
+            print(f"{name:<24} {(template.__doc__ or '').strip()}")
+        return 0
+    if not args.fixtures and not args.text:
+        parser.error("at least one of --fixtures / --text is required")
+
+    config = CorpusConfig(seed=args.seed, processors=args.processors)
+    if args.phenomena:
+        config.phenomena = _parse_weights(args.phenomena, str)
+    if args.clauses:
+        config.clauses_per_sentence = _parse_weights(args.clauses, int)
+    if args.sentences:
+        config.sentences_per_document = _parse_weights(args.sentences, int)
+    config.__post_init__()
+
+    generator = CorpusGenerator(config)
+    write_corpus(generator.documents(count=args.documents, target_tokens=args.tokens),
+                 fixture_path=args.fixtures, text_path=args.text,
+                 source=f"benchmarks.corpus_generator seed={args.seed}")
+    print(json.dumps(generator.stats(), ensure_ascii=False), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Ölçüm Altyapısı
+===============
+
+Her ölçüm bir "geçiş" fonksiyonunu (tüm iş yükünü bir kez işler) tekrar
+tekrar çalıştırır ve medyan geçiş süresinden throughput hesaplar.
+"""
+
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Sürecin şimdiye kadarki en yüksek RSS değeri (MB)
+
+    Süreç boyunca monoton artar; ölçüm başına izole değer için
+    ``python -m benchmarks.suite --isolate`` kullanın.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: byte
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 2)
+
+
+@dataclass
+class Benchmark:
+    """
+    Tek bir ölçüm tanımı
+
+    ``setup`` iş yükünü hazırlar ve bir geçiş fonksiyonu döndürür; geçiş
+    fonksiyonu çağrıldığında tüm iş yükünü bir kez işler.
+    """
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    sentences: int
+    tokens: int
+    requires_model: bool = False
+    description: str = ""
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    sentences: int
+    tokens: int
+    median_seconds: float
+    best_seconds: float
+    sentences_per_sec: float
+    tokens_per_sec: float
+    peak_rss_mb: Optional[float]
+    requires_model: bool = False
+    skipped: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def skipped_result(benchmark: Benchmark, reason: str) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=benchmark.name, iterations=0,
+        sentences=benchmark.sentences, tokens=benchmark.tokens,
+        median_seconds=0.0, best_seconds=0.0,
+        sentences_per_sec=0.0, tokens_per_sec=0.0,
+        peak_rss_mb=peak_rss_mb(), requires_model=benchmark.requires_model,
+        skipped=reason,
+    )
+
+
+def run_benchmark(benchmark: Benchmark,
+                  min_time: float = 0.5,
+                  min_iterations: int = 5,
+                  max_iterations: int = 10000,
+                  warmup_iterations: int = 1) -> BenchmarkResult:
+    """
+    Ölçümü çalıştır
+
+    En az ``min_iterations`` geçiş ve toplamda en az ``min_time`` saniye
+    çalışır. Isınma geçişleri (import, lazy init, JIT yok ama cache'ler)
+    ölçüme dahil edilmez.
+    """
+    run_pass = benchmark.setup()
+    for _ in range(warmup_iterations):
+        run_pass()
+
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < max_iterations:
+        t0 = time.perf_counter()
+        run_pass()
+        timings.append(time.perf_counter() - t0)
+        if len(timings) >= min_iterations and time.perf_counter() - started >= min_time:
+            break
+
+    median = statistics.median(timings)
+    return BenchmarkResult(
+        name=benchmark.name,
+        iterations=len(timings),
+        sentences=benchmark.sentences,
+        tokens=benchmark.tokens,
+        median_seconds=round(median, 6),
+        best_seconds=round(min(timings), 6),
+        sentences_per_sec=round(benchmark.sentences / median, 1) if median else 0.0,
+        tokens_per_sec=round(benchmark.tokens / median, 1) if median else 0.0,
+        peak_rss_mb=peak_rss_mb(),
+        requires_model=benchmark.requires_model,
+    )
+
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    """Sonuçları hizalı tablo olarak biçimlendir"""
+    header = f"{'benchmark':<34} {'iter':>6} {'ms/pass':>10} {'sent/s':>11} {'tok/s':>12} {'peakRSS MB':>11}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        if r.skipped:
+            lines.append(f"{r.name:<34} {'skipped: ' + r.skipped}")
+            continue
+        rss = f"{r.peak_rss_mb:.1f}" if r.peak_rss_mb is not None else "n/a"
+        lines.append(
+            f"{r.name:<34} {r.iterations:>6} {r.median_seconds * 1000:>10.3f} "
+            f"{r.sentences_per_sec:>11.1f} {r.tokens_per_sec:>12.1f} {rss:>11}"
+        )
+    return "\n".join(lines)
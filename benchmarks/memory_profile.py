@@ -0,0 +1,352 @@
+"""
+Bellek Profili (tracemalloc)
+============================
+
+Büyük dokümanlarda belleğin nereye gittiğini gösteren teşhis modu: Stanza
+Document'ları mı, ``analyze_text``'in iç içe kelime dict'leri mi, yoksa
+süreçte kalan durum (cache, detector) mı?
+
+Rapor (JSON, sürümler arası karşılaştırılabilir):
+- ``stages``       : aşama başına (parse, morphology, detect_errors, ...)
+                     net ayrılan byte toplamı ve en yüksek geçici artış
+- ``sentences``    : cümle başına net byte, geçici tepe ve süre
+- ``batches``      : batch başına izlenen tepe bellek, kalıcı artış ve peak RSS
+- ``retained_by_package`` / ``top_allocations``: profil sonunda hâlâ ayrılmış
+  olan belleğin paket ve kaynak satırı kırılımı (başlangıç anına göre fark)
+
+tracemalloc yalnızca Python ayırımlarını görür; torch tensörleri gibi yerel
+bellek peak RSS'te görünür ama aşama byte'larında görünmez. Profil
+çalışırken kod belirgin şekilde yavaşlar; süreleri ölçüm olarak kullanmayın.
+Tek thread'li kullanım içindir.
+
+Kullanım:
+    # Satır başına bir doküman; kayıtlı parse'larla (modelsiz)
+    python -m benchmarks.memory_profile docs.txt --fixtures tests/fixtures/parses.json -o mem.json
+
+    # Gerçek Stanza ile (TURKISH_ANALYZER_PARSER ayarına göre)
+    python -m benchmarks.memory_profile docs.txt --batch-size 16 -o mem.json
+
+    # İki sürümün raporunu karşılaştır
+    python -m benchmarks.memory_profile --compare old.json mem.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from benchmarks.harness import peak_rss_mb
+from src.instrumentation import set_stage_observer
+
+REPORT_FORMAT_VERSION = 1
+
+# Dosya yolu parçası → rapordaki paket adı (ilk eşleşen)
+PACKAGE_MARKERS = (
+    ('/stanza/', 'stanza'),
+    ('/torch/', 'torch'),
+    ('/api/', 'api'),
+    ('/error_detection/', 'error_detection'),
+    ('/src/', 'src'),
+    ('/benchmarks/', 'benchmarks'),
+)
+
+_IGNORED_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+    tracemalloc.Filter(False, __file__),  # profilin kendi kayıtları
+)
+
+
+def _package_of(filename: str) -> str:
+    path = filename.replace('\\', '/')
+    for marker, package in PACKAGE_MARKERS:
+        if marker in path:
+            return package
+    return 'other'
+
+
+class MemoryProfiler:
+    """
+    ``src.instrumentation`` aşama gözlemcisi: her aşamanın net ve tepe bellek artışı
+
+    İç içe aşamalarda tepe değer ebeveyne aktarılır, böylece ``reset_peak``
+    çağrıları dış aşamanın tepesini kaybettirmez.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.sentences: List[Dict[str, Any]] = []  # henüz dokümana bağlanmamış cümle ölçümleri
+        self._stack: List[List[int]] = []  # [başlangıç, görülen tepe]
+        self._outer_peak = 0  # aşama dışında görülen tepe (reset_peak'ten korunur)
+
+    def stage_enter(self, name: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        else:
+            self._outer_peak = max(self._outer_peak, peak)
+        tracemalloc.reset_peak()
+        self._stack.append([current, current])
+
+    def stage_exit(self, name: str, token: None, seconds: float) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        start, seen_peak = self._stack.pop()
+        seen_peak = max(seen_peak, peak)
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], seen_peak)
+        else:
+            self._outer_peak = max(self._outer_peak, seen_peak)
+
+        net, peak_delta = current - start, seen_peak - start
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = {"count": 0, "net_bytes": 0, "max_peak_bytes": 0, "seconds": 0.0}
+        stats["count"] += 1
+        stats["net_bytes"] += net
+        stats["max_peak_bytes"] = max(stats["max_peak_bytes"], peak_delta)
+        stats["seconds"] += seconds
+        if name == "sentence":
+            self.sentences.append({"net_bytes": net, "peak_bytes": peak_delta, "seconds": round(seconds, 6)})
+
+    def take_peak(self) -> int:
+        """Son çağrıdan beri izlenen tepe bellek (sayaç sıfırlanır)"""
+        peak = max(self._outer_peak, tracemalloc.get_traced_memory()[1])
+        self._outer_peak = 0
+        tracemalloc.reset_peak()
+        return peak
+
+    def take_sentences(self) -> List[Dict[str, Any]]:
+        sentences, self.sentences = self.sentences, []
+        return sentences
+
+    def stage_report(self) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for name, stats in sorted(self.stages.items()):
+            count = stats["count"]
+            report[name] = {
+                "count": count,
+                "net_bytes": stats["net_bytes"],
+                "mean_net_bytes": round(stats["net_bytes"] / count) if count else 0,
+                "max_peak_bytes": stats["max_peak_bytes"],
+                "seconds": round(stats["seconds"], 6),
+            }
+        return report
+
+
+def _retained(snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot,
+              top: int) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+    by_package: Dict[str, int] = {}
+    for stat in snapshot.compare_to(baseline, 'filename'):
+        package = _package_of(stat.traceback[0].filename)
+        by_package[package] = by_package.get(package, 0) + stat.size_diff
+
+    sites = []
+    for stat in snapshot.compare_to(baseline, 'lineno')[:top]:
+        frame = stat.traceback[0]
+        sites.append({
+            "site": f"{frame.filename}:{frame.lineno}",
+            "package": _package_of(frame.filename),
+            "size_bytes": stat.size_diff,
+            "count": stat.count_diff,
+        })
+    return dict(sorted(by_package.items(), key=lambda kv: -kv[1])), sites
+
+
+def profile_memory(documents: Iterable[str],
+                   batch_size: int = 32,
+                   include_semantics: bool = True,
+                   top: int = 25,
+                   frames: int = 1,
+                   analyzer: Optional[Callable[..., Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Dokümanları ``analyze_text`` ile işle ve bellek raporu üret
+
+    Sonuçlar her dokümandan sonra bırakılır; böylece kalıcı artış
+    (``retained_*``) kütüphane durumunu gösterir, çağıranın tuttuğu çıktıyı değil.
+
+    Args:
+        documents: Analiz edilecek metinler
+        batch_size: Peak RSS / tepe bellek ölçümü başına doküman sayısı
+        include_semantics: Propositional semantics katmanı
+        top: Raporlanacak kaynak satırı sayısı
+        frames: tracemalloc traceback derinliği
+        analyzer: ``analyze_text`` uyumlu fonksiyon (varsayılan: api.pos_semantic_analyzer)
+
+    Returns:
+        JSON'a yazılabilir rapor
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    if analyzer is None:
+        from api.pos_semantic_analyzer import analyze_text as analyzer
+
+    documents = list(documents)
+    profiler = MemoryProfiler()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(frames)
+    baseline = tracemalloc.take_snapshot().filter_traces(_IGNORED_FRAMES)
+    previous_observer = set_stage_observer(profiler)
+
+    sentences: List[Dict[str, Any]] = []
+    batches: List[Dict[str, Any]] = []
+    overall_peak = 0
+    started = time.perf_counter()
+    try:
+        for batch_index, offset in enumerate(range(0, len(documents), batch_size)):
+            batch = documents[offset:offset + batch_size]
+            batch_start = time.perf_counter()
+            retained_before, _ = tracemalloc.get_traced_memory()
+            profiler.take_peak()
+            batch_peak = 0
+            batch_sentences = 0
+
+            for doc_offset, text in enumerate(batch):
+                result = analyzer(text, include_semantics=include_semantics, use_cache=False)
+                measured = profiler.take_sentences()
+                for index, (sentence, data) in enumerate(zip(result["sentences"], measured)):
+                    data.update({"document": offset + doc_offset, "index": index, "text": sentence["text"],
+                                 "words": len(sentence["words"])})
+                    sentences.append(data)
+                batch_sentences += len(measured)
+                del result
+                batch_peak = max(batch_peak, profiler.take_peak())
+
+            retained_after, _ = tracemalloc.get_traced_memory()
+            overall_peak = max(overall_peak, batch_peak)
+            batches.append({
+                "batch": batch_index,
+                "documents": len(batch),
+                "sentences": batch_sentences,
+                "seconds": round(time.perf_counter() - batch_start, 4),
+                "traced_peak_bytes": batch_peak,
+                "retained_delta_bytes": retained_after - retained_before,
+                "peak_rss_mb": peak_rss_mb(),
+            })
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_FRAMES)
+    finally:
+        set_stage_observer(previous_observer)
+        if not was_tracing:
+            tracemalloc.stop()
+
+    by_package, sites = _retained(snapshot, baseline, top)
+    sentence_bytes = [s["net_bytes"] for s in sentences]
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "tracemalloc_frames": frames,
+        "summary": {
+            "documents": len(documents),
+            "sentences": len(sentences),
+            "seconds": round(time.perf_counter() - started, 4),
+            "traced_peak_bytes": overall_peak,
+            "retained_bytes": sum(by_package.values()),
+            "mean_sentence_net_bytes": round(sum(sentence_bytes) / len(sentence_bytes)) if sentence_bytes else 0,
+            "max_sentence_peak_bytes": max((s["peak_bytes"] for s in sentences), default=0),
+            "peak_rss_mb": peak_rss_mb(),
+        },
+        "stages": profiler.stage_report(),
+        "sentences": sentences,
+        "batches": batches,
+        "retained_by_package": by_package,
+        "top_allocations": sites,
+    }
+
+
+def compare_reports(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """İki raporun özet ve aşama değerleri arasındaki fark (yeni - eski)"""
+    summary = {}
+    for key, value in new["summary"].items():
+        before = old["summary"].get(key)
+        if isinstance(value, (int, float)) and isinstance(before, (int, float)):
+            summary[key] = {"old": before, "new": value, "delta": round(value - before, 4)}
+
+    stages = {}
+    for name in sorted(set(old["stages"]) | set(new["stages"])):
+        before = old["stages"].get(name, {})
+        after = new["stages"].get(name, {})
+        stages[name] = {
+            key: {"old": before.get(key, 0), "new": after.get(key, 0),
+                  "delta": after.get(key, 0) - before.get(key, 0)}
+            for key in ("mean_net_bytes", "max_peak_bytes")
+        }
+    return {"summary": summary, "stages": stages}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Raporun kısa metin özeti"""
+    summary = report["summary"]
+    lines = [
+        f"{summary['documents']} doküman, {summary['sentences']} cümle, "
+        f"tepe (izlenen): {summary['traced_peak_bytes'] / 1024:.1f} KiB, "
+        f"kalıcı: {summary['retained_bytes'] / 1024:.1f} KiB, peak RSS: {summary['peak_rss_mb']} MB",
+        "",
+        f"{'stage':<28} {'count':>7} {'mean net B':>12} {'max peak B':>12}",
+    ]
+    for name, stats in sorted(report["stages"].items(), key=lambda kv: -kv[1]["max_peak_bytes"]):
+        lines.append(f"{name:<28} {stats['count']:>7} {stats['mean_net_bytes']:>12} {stats['max_peak_bytes']:>12}")
+    if report["top_allocations"]:
+        lines.extend(["", "kalıcı ayırımlar (ilk 5):"])
+        for site in report["top_allocations"][:5]:
+            lines.append(f"  {site['size_bytes']:>10} B  {site['site']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory_profile",
+                                     description="tracemalloc ile cümle/aşama başına bellek raporu")
+    parser.add_argument("input", nargs="?", help="Satır başına bir doküman (UTF-8, '-' = stdin)")
+    parser.add_argument("-o", "--output", help="JSON rapor dosyası (varsayılan: stdout)")
+    parser.add_argument("--fixtures", help="Kayıtlı parse'larla çalış (ReplayBackend, modelsiz)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--top", type=int, default=25, help="Raporlanacak kaynak satırı sayısı")
+    parser.add_argument("--frames", type=int, default=1, help="tracemalloc traceback derinliği")
+    parser.add_argument("--no-semantics", action="store_true")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="İki raporu karşılaştır")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        old, new = (json.loads(Path(p).read_text(encoding="utf-8")) for p in args.compare)
+        print(json.dumps(compare_reports(old, new), ensure_ascii=False, indent=2))
+        return 0
+    if not args.input:
+        parser.error("input is required (or use --compare)")
+
+    if args.input == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(args.input, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    documents = [line for line in lines if line.strip()]
+
+    previous_backend = None
+    if args.fixtures:
+        from src.parser_backend import ReplayBackend, set_parser_backend
+        previous_backend = set_parser_backend(ReplayBackend(args.fixtures))
+    try:
+        report = profile_memory(documents, batch_size=args.batch_size,
+                                include_semantics=not args.no_semantics,
+                                top=args.top, frames=args.frames)
+    finally:
+        if previous_backend is not None:
+            set_parser_backend(previous_backend)
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+        print(format_report(report), file=sys.stderr)
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,329 @@
+"""
+Throughput Regresyon Kapısı
+===========================
+
+Ölçüm setini birkaç kez çalıştırır, sonuçları JSON olarak saklar ve
+commit'lenmiş baseline ile karşılaştırır. tokens/sec'te veya peak RSS'te
+anlamlı bir gerileme varsa sıfırdan farklı kodla çıkar (CI / sürüm öncesi).
+
+Throughput makineden bağımsız karşılaştırılır: her tekrarda depo kodundan
+bağımsız sabit bir referans iş yükü (``reference``) suite'ten önce ve sonra
+aynı süreçte ölçülür; her ölçümün tokens/sec değeri o tekrarın referans
+hızına bölünür (``relative_throughput``). Baseline başka bir makinede
+üretilmiş olsa da donanım farkı büyük ölçüde sadeleşir; mutlak tokens/sec
+yalnızca bilgi için saklanır.
+
+Anlamlılık (ölçüm başına, tekrarlar üzerinden medyan ve IQR):
+- Throughput gerilemesi: yeni göreli medyan baseline medyanından ``tolerance``
+  oranından fazla düşük VE yeni Q3 < baseline Q1 (IQR'lar çakışmıyor)
+- Bellek gerilemesi: yeni medyan peak RSS baseline'dan hem
+  ``memory_tolerance`` oranı hem ``memory_floor_mb`` kadar yüksek
+
+Kullanım:
+    python -m benchmarks.regression_gate                      # çalıştır + karşılaştır
+    python -m benchmarks.regression_gate --repetitions 7 --isolate
+    python -m benchmarks.regression_gate --update-baseline    # baseline'ı yenile
+    python -m benchmarks.regression_gate --results tests/benchmark_results.json  # çalıştırmadan karşılaştır
+
+Çıkış kodları: 0 = geçti, 1 = gerileme, 2 = baseline yok.
+
+Referans ölçümü olmayan (format 1) baseline'larda mutlak tokens/sec
+karşılaştırılır; rapor bunu ve farklı ortamı uyarı olarak belirtir.
+Peak RSS donanımdan büyük ölçüde bağımsızdır ve mutlak karşılaştırılır.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.harness import Benchmark, BenchmarkResult, run_benchmark
+from benchmarks.suite import REPO_ROOT, Workload, build_benchmarks, run_isolated, run_suite
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH, load_parse_fixtures
+
+DEFAULT_BASELINE_PATH = REPO_ROOT / "tests" / "benchmark_baseline.json"
+DEFAULT_RESULTS_PATH = REPO_ROOT / "tests" / "benchmark_results.json"
+RESULTS_FORMAT_VERSION = 2
+
+DEFAULT_REPETITIONS = 5
+DEFAULT_TOLERANCE = 0.10           # tokens/sec'te %10'dan büyük düşüş
+DEFAULT_MEMORY_TOLERANCE = 0.10    # peak RSS'te %10'dan büyük artış
+DEFAULT_MEMORY_FLOOR_MB = 5.0      # ... ve en az 5 MB
+
+# Ölçüm başına karşılaştırma durumları
+STATUS_REGRESSION = "regression"
+STATUS_IMPROVED = "improved"
+STATUS_OK = "ok"
+STATUS_NEW = "new"
+STATUS_MISSING = "missing"
+STATUS_SKIPPED = "skipped"
+
+
+REFERENCE_WORDS = 2000
+
+
+def _reference_setup() -> Callable[[], Any]:
+    """Depo kodundan bağımsız sabit saf-Python iş yükü (dizge, dict, sıralama)"""
+    words = [f"Kelime{i % 97}" for i in range(REFERENCE_WORDS)]
+    joined = " ".join(words)
+
+    def run():
+        counts: Dict[str, int] = {}
+        for word in joined.split():
+            key = word.lower()
+            counts[key] = counts.get(key, 0) + 1
+        sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return run
+
+
+REFERENCE_BENCHMARK = Benchmark(
+    name="reference",
+    setup=_reference_setup,
+    sentences=1,
+    tokens=REFERENCE_WORDS,
+    description="Makine hızı referansı (depo kodundan bağımsız)",
+)
+
+
+def measure_reference(min_time: float = 0.5, min_iterations: int = 5) -> float:
+    """Bu süreçte referans iş yükünün tokens/sec değeri"""
+    return run_benchmark(REFERENCE_BENCHMARK, min_time=min_time, min_iterations=min_iterations).tokens_per_sec
+
+
+def environment() -> Dict[str, Any]:
+    """Baseline'ın üretildiği ortam (karşılaştırma uyarıları için)"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def summarize(samples: Sequence[float], digits: int = 3) -> Dict[str, Any]:
+    """Medyan, çeyrekler ve IQR (tek örnekte IQR = 0)"""
+    values = sorted(samples)
+    if len(values) >= 2:
+        q1, _, q3 = statistics.quantiles(values, n=4, method='inclusive')
+    else:
+        q1 = q3 = values[0]
+    return {
+        "median": round(statistics.median(values), digits),
+        "q1": round(q1, digits),
+        "q3": round(q3, digits),
+        "iqr": round(q3 - q1, digits),
+        "samples": [round(v, digits) for v in samples],
+    }
+
+
+def collect(repetitions: int = DEFAULT_REPETITIONS,
+            fixture_path: Path = DEFAULT_FIXTURE_PATH,
+            with_model: bool = False,
+            only: Optional[Sequence[str]] = None,
+            isolate: bool = False,
+            min_time: float = 0.5,
+            min_iterations: int = 5) -> Dict[str, Any]:
+    """
+    Ölçüm setini ``repetitions`` kez çalıştır ve ölçüm başına özetle
+
+    Her tekrarda referans iş yükü suite'ten önce ve sonra ölçülür; ikisinin
+    ortalaması o tekrarın göreli throughput paydasıdır.
+
+    Args:
+        isolate: Her ölçümü ayrı süreçte çalıştır (ölçüm başına gerçek peak RSS;
+                 aksi halde peak RSS süreç genelidir ve monoton artar). Referans
+                 bu durumda üst süreçte ölçülür.
+    """
+    if repetitions < 1:
+        raise ValueError("repetitions must be >= 1")
+
+    runs: List[List[BenchmarkResult]] = []
+    references: List[float] = []
+    for _ in range(repetitions):
+        before = measure_reference(min_time, min_iterations)
+        if isolate:
+            workload = Workload(load_parse_fixtures(fixture_path))
+            names = list(only) if only else [b.name for b in build_benchmarks(workload, with_model=with_model)]
+            extra = ["--fixtures", str(fixture_path), "--min-time", str(min_time),
+                     "--min-iterations", str(min_iterations)]
+            if with_model:
+                extra.append("--with-model")
+            runs.append(run_isolated(names, extra))
+        else:
+            runs.append(run_suite(fixture_path, with_model=with_model, only=only,
+                                  min_time=min_time, min_iterations=min_iterations))
+        references.append((before + measure_reference(min_time, min_iterations)) / 2)
+
+    benchmarks: Dict[str, Any] = {}
+    for name in [r.name for r in runs[0]]:
+        results = [next(r for r in run if r.name == name) for run in runs]
+        skipped = next((r.skipped for r in results if r.skipped), None)
+        if skipped:
+            benchmarks[name] = {"skipped": skipped}
+            continue
+        rss = [r.peak_rss_mb for r in results if r.peak_rss_mb is not None]
+        benchmarks[name] = {
+            "sentences": results[0].sentences,
+            "tokens": results[0].tokens,
+            "tokens_per_sec": summarize([r.tokens_per_sec for r in results]),
+            "relative_throughput": summarize(
+                [r.tokens_per_sec / reference for r, reference in zip(results, references)], digits=6),
+            "peak_rss_mb": summarize(rss) if rss else None,
+        }
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "repetitions": repetitions,
+        "isolated": isolate,
+        "environment": environment(),
+        "reference_tokens_per_sec": summarize(references),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(baseline: Dict[str, Any],
+            current: Dict[str, Any],
+            tolerance: float = DEFAULT_TOLERANCE,
+            memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+            memory_floor_mb: float = DEFAULT_MEMORY_FLOOR_MB) -> Dict[str, Any]:
+    """
+    Sonuçları baseline ile karşılaştır
+
+    Returns:
+        {"passed": bool, "warnings": [...],
+         "benchmarks": {ad: {"status", "throughput_change", "memory_change_mb", "reasons"}}}
+    """
+    report: Dict[str, Any] = {"passed": True, "warnings": [], "benchmarks": {}}
+    relative = "reference_tokens_per_sec" in baseline and "reference_tokens_per_sec" in current
+    if not relative:
+        report["warnings"].append("baseline or results have no reference measurement; "
+                                  "comparing absolute tokens/sec")
+        if baseline.get("environment") != current.get("environment"):
+            report["warnings"].append("baseline was recorded in a different environment; "
+                                      "refresh it with --update-baseline on this machine")
+    if baseline.get("isolated") != current.get("isolated"):
+        report["warnings"].append("baseline and results differ in --isolate; peak RSS is not comparable")
+
+    base_benchmarks = baseline.get("benchmarks", {})
+    for name, data in current["benchmarks"].items():
+        base = base_benchmarks.get(name)
+        entry: Dict[str, Any] = {"status": STATUS_OK, "reasons": []}
+        report["benchmarks"][name] = entry
+
+        if "skipped" in data:
+            entry["status"] = STATUS_SKIPPED
+            entry["reasons"].append(data["skipped"])
+            continue
+        if base is None or "skipped" in base:
+            entry["status"] = STATUS_NEW
+            continue
+
+        metric = "relative_throughput" if relative else "tokens_per_sec"
+        new_tps, old_tps = data[metric], base[metric]
+        change = (new_tps["median"] - old_tps["median"]) / old_tps["median"] if old_tps["median"] else 0.0
+        entry["throughput_change"] = round(change, 4)
+        if change < -tolerance and new_tps["q3"] < old_tps["q1"]:
+            entry["status"] = STATUS_REGRESSION
+            entry["reasons"].append(
+                f"tokens/sec {base['tokens_per_sec']['median']:.1f} -> "
+                f"{data['tokens_per_sec']['median']:.1f}, "
+                f"{'relative to reference ' if relative else ''}{change:+.1%}")
+        elif change > tolerance and new_tps["q1"] > old_tps["q3"]:
+            entry["status"] = STATUS_IMPROVED
+
+        new_rss, old_rss = data.get("peak_rss_mb"), base.get("peak_rss_mb")
+        if new_rss and old_rss:
+            growth = new_rss["median"] - old_rss["median"]
+            entry["memory_change_mb"] = round(growth, 2)
+            if growth > memory_floor_mb and growth > old_rss["median"] * memory_tolerance:
+                entry["status"] = STATUS_REGRESSION
+                entry["reasons"].append(
+                    f"peak RSS {old_rss['median']:.1f} -> {new_rss['median']:.1f} MB ({growth:+.1f} MB)")
+
+        if entry["status"] == STATUS_REGRESSION:
+            report["passed"] = False
+
+    for name in base_benchmarks:
+        if name not in current["benchmarks"]:
+            report["benchmarks"][name] = {"status": STATUS_MISSING, "reasons": []}
+    return report
+
+
+def format_comparison(report: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<34} {'status':<11} {'tok/s change':>13} {'RSS change':>11}"]
+    lines.append("-" * len(lines[0]))
+    for name, entry in report["benchmarks"].items():
+        change = entry.get("throughput_change")
+        memory = entry.get("memory_change_mb")
+        lines.append(
+            f"{name:<34} {entry['status']:<11} "
+            f"{(f'{change:+.1%}' if change is not None else '-'):>13} "
+            f"{(f'{memory:+.1f} MB' if memory is not None else '-'):>11}"
+        )
+        for reason in entry["reasons"]:
+            lines.append(f"    {reason}")
+    for warning in report["warnings"]:
+        lines.append(f"warning: {warning}")
+    lines.append("PASSED" if report["passed"] else "FAILED: throughput/memory regression")
+    return "\n".join(lines)
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.regression_gate",
+                                     description="Ölçüm sonuçlarını baseline ile karşılaştır")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH))
+    parser.add_argument("--output", default=str(DEFAULT_RESULTS_PATH), help="Sonuç JSON dosyası")
+    parser.add_argument("--results", help="Çalıştırmak yerine bu sonuç dosyasını karşılaştır")
+    parser.add_argument("--update-baseline", action="store_true", help="Sonuçları baseline olarak yaz")
+    parser.add_argument("--repetitions", type=int, default=DEFAULT_REPETITIONS)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Kabul edilen tokens/sec düşüşü (oran)")
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE,
+                        help="Kabul edilen peak RSS artışı (oran)")
+    parser.add_argument("--memory-floor-mb", type=float, default=DEFAULT_MEMORY_FLOOR_MB,
+                        help="Bunun altındaki RSS artışları gerileme sayılmaz")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURE_PATH))
+    parser.add_argument("--with-model", action="store_true")
+    parser.add_argument("--only", action="append")
+    parser.add_argument("--isolate", action="store_true", help="Ölçüm başına ayrı süreç")
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--min-iterations", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.results:
+        current = json.loads(Path(args.results).read_text(encoding="utf-8"))
+    else:
+        current = collect(args.repetitions, Path(args.fixtures), with_model=args.with_model,
+                          only=args.only, isolate=args.isolate,
+                          min_time=args.min_time, min_iterations=args.min_iterations)
+        _write_json(Path(args.output), current)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        _write_json(baseline_path, current)
+        print(f"baseline written: {baseline_path}", file=sys.stderr)
+        return 0
+    if not baseline_path.exists():
+        print(f"no baseline at {baseline_path}; create one with --update-baseline", file=sys.stderr)
+        return 2
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    report = compare(baseline, current, tolerance=args.tolerance,
+                     memory_tolerance=args.memory_tolerance, memory_floor_mb=args.memory_floor_mb)
+    print(format_comparison(report))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
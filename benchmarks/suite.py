@@ -0,0 +1,335 @@
+"""
+Ölçüm Seti
+==========
+
+Kullanım:
+    python -m benchmarks.suite                       # modelsiz ölçümler
+    python -m benchmarks.suite --with-model          # + uçtan uca (Stanza)
+    python -m benchmarks.suite --only analyze_text   # tek ölçüm
+    python -m benchmarks.suite --isolate --json sonuc.json
+
+Modelsiz ölçümler parser backend'ini ``ReplayBackend`` ile değiştirir
+(``src.parser_backend``); böylece yalnızca kural katmanları (preferences,
+önermesel değer, discourse, CONLL-U biçimleme) ölçülür.
+"""
+
+import argparse
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkResult,
+    format_table,
+    run_benchmark,
+    skipped_result,
+)
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH, ParsedDocument, load_parse_fixtures
+from src.parser_backend import ReplayBackend, StanzaBackend, set_parser_backend
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+# ========== İŞ YÜKÜ ==========
+
+class Workload:
+    """Fixture dokümanlarından türetilmiş ölçüm girdileri"""
+
+    def __init__(self, documents: Sequence[ParsedDocument]):
+        self.documents = list(documents)
+        self.texts = [doc.text for doc in self.documents]
+        self.sentences = [s for doc in self.documents for s in doc.sentences]
+        self.num_sentences = len(self.sentences)
+        self.num_tokens = sum(len(s.words) for s in self.sentences)
+
+
+def _bench_detect_minimalist_errors(workload: Workload) -> Callable[[], Any]:
+    from api.main import detect_minimalist_errors
+
+    # check_sentence'ın ürettiği kelime formatı (parse maliyeti hariç)
+    inputs = [
+        [{"text": w.text, "pos": w.upos, "lemma": w.lemma,
+          "dependency": w.deprel, "feats": w.feats or ""} for w in sent.words]
+        for sent in workload.sentences
+    ]
+
+    def run():
+        for words in inputs:
+            detect_minimalist_errors(words)
+    return run
+
+
+def _bench_morphology(workload: Workload) -> Callable[[], Any]:
+    from api.main import extract_morphology_from_text
+
+    tokens = [w.text for sent in workload.sentences for w in sent.words]
+
+    def run():
+        for token in tokens:
+            extract_morphology_from_text(token)
+    return run
+
+
+def _bench_analyze_text(include_semantics: bool) -> Callable[[Workload], Callable[[], Any]]:
+    def setup(workload: Workload) -> Callable[[], Any]:
+        from api.pos_semantic_analyzer import analyze_text
+
+        def run():
+            for text in workload.texts:
+                analyze_text(text, include_semantics=include_semantics, use_cache=False)
+        return run
+    return setup
+
+
+def _bench_analyze_to_conllu(workload: Workload) -> Callable[[], Any]:
+    from api.pos_semantic_analyzer import analyze_to_conllu
+
+    def run():
+        for text in workload.texts:
+            analyze_to_conllu(text)
+    return run
+
+
+def _bench_check_sentence_enhanced(workload: Workload) -> Callable[[], Any]:
+    from api.enhanced_analysis import check_sentence_enhanced
+
+    def run():
+        for text in workload.texts:
+            check_sentence_enhanced(text)
+    return run
+
+
+def _bench_proposition_analyzer(workload: Workload) -> Callable[[], Any]:
+    from src.propositional_semantics import SentenceType, TurkishPropositionAnalyzer
+
+    analyzer = TurkishPropositionAnalyzer()
+    # (yüklem feats, özne feats, özne, özne upos) - analyze_propositions_batch ile aynı
+    # seçim: son root VERB, son nsubj; kök fiili olmayan (ad yüklemli) cümleler atlanır
+    inputs = []
+    for sent in workload.sentences:
+        verb = None
+        subject = None
+        for word in sent.words:
+            if word.deprel == 'root' and word.upos == 'VERB':
+                verb = word
+            elif word.deprel == 'nsubj':
+                subject = word
+        if verb is None:
+            continue
+        inputs.append((
+            verb.feats or "",
+            subject.feats or "" if subject else "",
+            subject.text if subject else "",
+            subject.upos if subject else "",
+        ))
+
+    def run():
+        for verb_feats, subj_feats, subj_text, subj_upos in inputs:
+            predicate_type = analyzer.analyze_predicate_type(verb_feats)
+            features = analyzer.analyze_specificity(subj_feats, subj_text, subj_upos)
+            analyzer.calculate_propositional_value(predicate_type, features, SentenceType.PROPERTY)
+    return run
+
+
+def _bench_propositions_batch(workload: Workload) -> Callable[[], Any]:
+    from src.propositional_semantics import analyze_propositions_batch
+
+    sentences = workload.sentences
+
+    def run():
+        analyze_propositions_batch(sentences)
+    return run
+
+
+def _bench_serialize(mode: str) -> Callable[[Workload], Callable[[], Any]]:
+    """analyze_text sonuçlarını serileştir: 'indent' (mevcut demo yolu) | src.serialization kodlayıcısı"""
+    def setup(workload: Workload) -> Callable[[], Any]:
+        from api.pos_semantic_analyzer import analyze_text
+        from src.serialization import encoder
+
+        results = [analyze_text(text, use_cache=False) for text in workload.texts]
+        if mode == 'indent':
+            def run():
+                for result in results:
+                    json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
+            return run
+
+        dumps = encoder(mode)
+
+        def run():
+            b'\n'.join([dumps(result) for result in results])
+        return run
+    return setup
+
+
+# (ad, setup, açıklama) - modelsiz ve "model:" varyantı olan ölçümler ayrı
+RULE_BENCHMARKS = [
+    ("detect_minimalist_errors", _bench_detect_minimalist_errors,
+     "api.main.detect_minimalist_errors (parse hariç)"),
+    ("extract_morphology", _bench_morphology,
+     "api.main.extract_morphology_from_text, kelime başına"),
+    ("proposition_analyzer", _bench_proposition_analyzer,
+     "TurkishPropositionAnalyzer: predicate + specificity + value"),
+    ("propositions_batch", _bench_propositions_batch,
+     "analyze_propositions_batch, parse edilmiş cümleler (re-parse yok)"),
+    ("serialize_json_indent", _bench_serialize('indent'),
+     "json.dumps(indent=2, ensure_ascii=False), analyze_text sonuçları"),
+    ("serialize_jsonl", _bench_serialize('json'),
+     "src.serialization JSON Lines, stdlib kodlayıcı"),
+]
+
+# orjson kuruluysa hızlandırılmış kodlayıcı da ölçülür
+if importlib.util.find_spec('orjson') is not None:
+    RULE_BENCHMARKS.append(("serialize_jsonl_orjson", _bench_serialize('orjson'),
+                            "src.serialization JSON Lines, orjson kodlayıcı"))
+
+PIPELINE_BENCHMARKS = [
+    ("analyze_text", _bench_analyze_text(True), "analyze_text (semantics dahil)"),
+    ("analyze_text_no_semantics", _bench_analyze_text(False), "analyze_text(include_semantics=False)"),
+    ("analyze_to_conllu", _bench_analyze_to_conllu, "analyze_to_conllu"),
+    ("check_sentence_enhanced", _bench_check_sentence_enhanced, "check_sentence_enhanced"),
+]
+
+
+def build_benchmarks(workload: Workload, with_model: bool = False) -> List[Benchmark]:
+    """Ölçüm tanımlarını oluştur (setup'lar çalıştırılmaz)"""
+    def make(name, setup, description, requires_model=False):
+        return Benchmark(
+            name=name,
+            setup=lambda: setup(workload),
+            sentences=workload.num_sentences,
+            tokens=workload.num_tokens,
+            requires_model=requires_model,
+            description=description,
+        )
+
+    benchmarks = [make(*spec) for spec in RULE_BENCHMARKS + PIPELINE_BENCHMARKS]
+    if with_model:
+        benchmarks += [
+            make(f"model:{name}", setup, f"{description} - Stanza ile uçtan uca", True)
+            for name, setup, description in PIPELINE_BENCHMARKS
+        ]
+    return benchmarks
+
+
+# ========== ÇALIŞTIRMA ==========
+
+def _model_unavailable_reason() -> Optional[str]:
+    """Stanza modeli kullanılamıyorsa nedeni, kullanılabiliyorsa None"""
+    if importlib.util.find_spec('stanza') is None:
+        return "stanza not installed"
+    from src.pipeline_pool import warmup
+    report = warmup()
+    if not report["ready"]:
+        errors = [p.get("error") for p in report["pools"] if p.get("error")]
+        return f"model not ready: {errors[0] if errors else 'unknown'}"
+    return None
+
+
+def run_suite(fixture_path: Path = DEFAULT_FIXTURE_PATH,
+              with_model: bool = False,
+              only: Optional[Sequence[str]] = None,
+              min_time: float = 0.5,
+              min_iterations: int = 5) -> List[BenchmarkResult]:
+    """
+    Ölçümleri sırayla çalıştır (önce modelsiz, sonra ``model:`` varyantları)
+
+    Args:
+        fixture_path: Kayıtlı parse fixture dosyası
+        with_model: Stanza ile uçtan uca varyantları da çalıştır
+        only: Sadece bu isimdeki ölçümler
+        min_time: Ölçüm başına minimum süre (saniye)
+        min_iterations: Ölçüm başına minimum geçiş sayısı
+    """
+    workload = Workload(load_parse_fixtures(fixture_path))
+    benchmarks = build_benchmarks(workload, with_model=with_model)
+    if only:
+        unknown = set(only) - {b.name for b in benchmarks}
+        if unknown:
+            raise ValueError(f"Unknown benchmark(s): {', '.join(sorted(unknown))}")
+        benchmarks = [b for b in benchmarks if b.name in only]
+
+    results = []
+    previous = set_parser_backend(ReplayBackend(fixture_path))
+    try:
+        for benchmark in (b for b in benchmarks if not b.requires_model):
+            results.append(run_benchmark(benchmark, min_time=min_time, min_iterations=min_iterations))
+
+        model_benchmarks = [b for b in benchmarks if b.requires_model]
+        if model_benchmarks:
+            set_parser_backend(StanzaBackend())
+            reason = _model_unavailable_reason()
+            for benchmark in model_benchmarks:
+                if reason:
+                    results.append(skipped_result(benchmark, reason))
+                else:
+                    results.append(run_benchmark(benchmark, min_time=min_time,
+                                                 min_iterations=min_iterations))
+    finally:
+        set_parser_backend(previous)
+    return results
+
+
+def run_isolated(names: Sequence[str], argv_extra: Sequence[str]) -> List[BenchmarkResult]:
+    """Her ölçümü ayrı bir alt süreçte çalıştır (ölçüm başına gerçek peak RSS)"""
+    results = []
+    for name in names:
+        output = subprocess.check_output(
+            [sys.executable, "-m", "benchmarks.suite", "--only", name, "--json", "-", *argv_extra],
+            cwd=str(REPO_ROOT), text=True,
+        )
+        for data in json.loads(output)["results"]:
+            results.append(BenchmarkResult(**data))
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite",
+                                     description="Public API throughput ölçümleri")
+    parser.add_argument("--with-model", action="store_true",
+                        help="Stanza modeliyle uçtan uca 'model:' varyantlarını da çalıştır")
+    parser.add_argument("--only", action="append", help="Sadece bu ölçüm (tekrarlanabilir)")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURE_PATH), help="Parse fixture dosyası")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Ölçüm başına minimum süre (s)")
+    parser.add_argument("--min-iterations", type=int, default=5)
+    parser.add_argument("--isolate", action="store_true",
+                        help="Her ölçümü ayrı süreçte çalıştır (izole peak RSS)")
+    parser.add_argument("--json", help="Sonuçları JSON olarak yaz ('-' = stdout)")
+    parser.add_argument("--list", action="store_true", help="Ölçümleri listele")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        workload = Workload(load_parse_fixtures(args.fixtures))
+        for b in build_benchmarks(workload, with_model=True):
+            print(f"{b.name:<34} {b.description}")
+        return 0
+
+    if args.isolate:
+        workload = Workload(load_parse_fixtures(args.fixtures))
+        names = args.only or [b.name for b in build_benchmarks(workload, with_model=args.with_model)]
+        extra = ["--fixtures", args.fixtures, "--min-time", str(args.min_time),
+                 "--min-iterations", str(args.min_iterations)]
+        if args.with_model:
+            extra.append("--with-model")
+        results = run_isolated(names, extra)
+    else:
+        results = run_suite(Path(args.fixtures), with_model=args.with_model, only=args.only,
+                            min_time=args.min_time, min_iterations=args.min_iterations)
+
+    payload: Dict[str, Any] = {"results": [r.to_dict() for r in results]}
+    if args.json == "-":
+        print(json.dumps(payload, ensure_ascii=False))
+        return 0
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
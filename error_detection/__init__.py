@@ -0,0 +1,5 @@
+"""
+Minimalist Program tabanlı POS preference tespiti
+
+    from error_detection.minimalist_pos_error_detection import MinimalistPOSErrorDetector
+"""
@@ -17,20 +17,16 @@ Stratejik İki Aşama:
 Referans: Chomsky (1995) - The Minimalist Program
 """
 
-from typing import List, Dict, Optional, Tuple, Set, Any
+from typing import List, Dict, Optional, Sequence, Tuple, Set, Any
 from dataclasses import dataclass
 from enum import Enum
 import re
-import sys
-from pathlib import Path
+
+from src.rule_profiler import count_rule, find_marker, marker_keys, register_rule_methods
 
 # Propositional semantics için optional import
 try:
-    _src_path = Path(__file__).parent.parent / 'src'
-    if str(_src_path) not in sys.path:
-        sys.path.insert(0, str(_src_path))
-    
-    from propositional_semantics import (  # type: ignore
+    from src.propositional_semantics import (
         TurkishPropositionAnalyzer,
         PredicateType,
         PropositionType
@@ -305,6 +301,47 @@ class MinimalistPOSErrorDetector:
         'çizme',   # çizme ayakkabı (ama "çizme defteri" değil)
     ]
     
+    # Derlenmiş tablo (compile_markers): (kaynak liste, marker'lar, küçük harf
+    # anahtarlar). Tek atamayla değişir; okuyan thread'ler tutarlı üçlü görür.
+    _LEXICALIZED_mA_TABLE: Tuple[Sequence[str], Tuple[str, ...], Tuple[str, ...]] = ((), (), ())
+    
+    # Aşama 1 güven değerleri (sonuç cache'i bu değerlerin parmak izini kullanır)
+    CONFIDENCE_NOMINAL_SUFFIX = 0.9       # Nominal ek + VERB etiketi (temel)
+    CONFIDENCE_DIK_PARTITIVE = 0.95       # -DIK + parçalı yüklem (semantik doğrulama)
+    CONFIDENCE_MA_HOLISTIC = 0.85         # -mA + bütüncül yüklem
+    CONFIDENCE_NO_VERBAL_FEATURES = 0.7   # Fiil özelliği yok ama VERB
+    CONFIDENCE_PRON_DET_TRACE = 0.85      # Trace + DET → PRON
+    CONFIDENCE_NOMINALIZED_ADJ = 0.75     # Adlaşmış sıfat
+    
+    @classmethod
+    def compile_markers(cls) -> None:
+        """
+        Kural tablolarını derle (küçük harf anahtarlar sınıf başına bir kez)
+        
+        Sınıf tanımında ve ``register_lexicalized`` ile çağrılır. ``LEXICALIZED_mA``
+        doğrudan değiştirilirse (yeni liste veya farklı uzunluk) ilk kullanımda
+        kendiliğinden yeniden derlenir; aynı uzunlukta yerinde değişiklikten
+        sonra elle çağrılmalıdır.
+        """
+        markers = tuple(cls.LEXICALIZED_mA)
+        cls._LEXICALIZED_mA_TABLE = (cls.LEXICALIZED_mA, markers, marker_keys(markers))
+    
+    @classmethod
+    def _lexicalized_table(cls) -> Tuple[Sequence[str], Tuple[str, ...], Tuple[str, ...]]:
+        table = cls._LEXICALIZED_mA_TABLE
+        source = cls.LEXICALIZED_mA
+        if table[0] is not source or len(table[1]) != len(source):
+            cls.compile_markers()
+            table = cls._LEXICALIZED_mA_TABLE
+        return table
+    
+    @classmethod
+    def register_lexicalized(cls, words: Sequence[str]) -> None:
+        """Runtime'da leksikalleşmiş -mA kelimesi ekle ve tabloyu yeniden derle"""
+        current = list(cls.LEXICALIZED_mA)
+        cls.LEXICALIZED_mA = current + [word for word in words if word not in current]
+        cls.compile_markers()
+    
     def __init__(self):
         self.candidate_errors: List[Dict] = []
         self.confirmed_errors: List[Dict] = []
@@ -343,17 +380,23 @@ class MinimalistPOSErrorDetector:
         """
         # Nominal ek varsa ama VERB olarak etiketlenmişse
         has_nominal_suffix = any(suffix in item.morphology for suffix in self.NOMINAL_SUFFIXES)
+        if item.pos == 'VERB':
+            count_rule('noun_verb.nominal_suffix', has_nominal_suffix)
         
         if has_nominal_suffix and item.pos == 'VERB':
             # -mA eki için lexicalized compound kontrolü
             if '-mA' in item.morphology:
                 word_stem = item.word.lower().rstrip('aeiouıöüAEIOUİÖÜ')  # Son sesli düşür
-                if any(item.word.lower().startswith(lex) for lex in self.LEXICALIZED_mA):
+                _, markers, keys = self._lexicalized_table()
+                lexicalized = find_marker('LEXICALIZED_mA', markers, item.word.lower(),
+                                          prefix=True, keys=keys)
+                count_rule('noun_verb.lexicalized_mA', lexicalized is not None)
+                if lexicalized is not None:
                     # Lexicalized compound - preference üretme
                     return None
             
             # Base confidence
-            confidence = 0.9
+            confidence = self.CONFIDENCE_NOMINAL_SUFFIX
             semantic_note = ""
             
             # SEMANTIC VALIDATION: Propositional semantics ile doğrula
@@ -370,12 +413,14 @@ class MinimalistPOSErrorDetector:
                         
                         # -DIK eki ve parçalı yüklem → Güçlü nominal preference
                         if '-DIK' in item.morphology and predicate_type.value == 'parçalı':
-                            confidence = 0.95  # Semantic validation strengthens confidence
+                            count_rule('noun_verb.dik_partitive', True)
+                            confidence = self.CONFIDENCE_DIK_PARTITIVE  # Semantic validation strengthens confidence
                             semantic_note = " [Semantically verified: partitive predicate → nominal domain]"
                         
                         # -mA eki ve bütüncül yüklem → Potansiyel lexicalized
                         elif '-mA' in item.morphology and predicate_type.value == 'bütüncül':
-                            confidence = 0.85
+                            count_rule('noun_verb.mA_holistic', True)
+                            confidence = self.CONFIDENCE_MA_HOLISTIC
                             semantic_note = " [Holistic predicate: may be lexicalizing]"
                 except Exception:
                     pass  # Semantic analysis başarısız olursa base confidence kullan
@@ -395,14 +440,17 @@ class MinimalistPOSErrorDetector:
         # FINITE_VERB feature varsa, bu normal finit fiil demektir
         is_finite = any(k == 'FINITE_VERB' for k, v in item.features if v)
         
-        if item.pos == 'VERB' and not has_verb_features and not has_nominal_suffix and not is_finite:
+        no_verbal_features = item.pos == 'VERB' and not has_verb_features and not has_nominal_suffix and not is_finite
+        if item.pos == 'VERB':
+            count_rule('noun_verb.no_verbal_features', no_verbal_features)
+        if no_verbal_features:
             return {
                 'type': POSErrorType.NOUN_VERB_CONFUSION,
                 'item': item,
                 'expected_pos': 'NOUN',
                 'found_pos': 'VERB',
                 'reason': 'No verbal features but tagged as VERB',
-                'confidence': 0.7
+                'confidence': self.CONFIDENCE_NO_VERBAL_FEATURES
             }
         
         return None
@@ -432,7 +480,7 @@ class MinimalistPOSErrorDetector:
                     'expected_pos': 'PRON',
                     'found_pos': 'DET',
                     'reason': 'Trace detected, should be PRON (pro-drop recovery)',
-                    'confidence': 0.85
+                    'confidence': self.CONFIDENCE_PRON_DET_TRACE
                 }
         
         # İsimden önce geliyorsa DET olmalı
@@ -472,7 +520,7 @@ class MinimalistPOSErrorDetector:
                 'expected_pos': 'NOUN',
                 'found_pos': 'ADJ',
                 'reason': 'Nominalized adjective (no following noun)',
-                'confidence': 0.75
+                'confidence': self.CONFIDENCE_NOMINALIZED_ADJ
             }
         
         return None
@@ -760,6 +808,17 @@ class MinimalistPOSErrorDetector:
 
 # ========== EXPORT FONKSİYONLARI ==========
 
+MinimalistPOSErrorDetector.compile_markers()
+
+# Kural profili (src.rule_profiler) açıkken ölçülen metodlar
+register_rule_methods(MinimalistPOSErrorDetector, 'detector', [
+    'detect_noun_verb_confusion',
+    'detect_pron_det_confusion',
+    'detect_adj_noun_confusion',
+    'detect_subject_object_mislabel',
+])
+
+
 def create_lexical_item(word: str, pos: str, morphology: Optional[List[str]] = None, features: Optional[Dict] = None) -> LexicalItem:
     """
     LexicalItem oluşturmak için yardımcı fonksiyon
@@ -782,8 +841,9 @@ def export_for_centering_integration(detector: MinimalistPOSErrorDetector) -> Di
     """
     Merkezleme kuramı entegrasyonu için hata listesi export et
     
-    Gelecekte centering_integration.py gibi bir dosyada:
-    - Minimalist hatalar + Centering hatalar → Birleşik analiz
+    Merkezleme katmanı ``src.centering`` içindedir (``CenteringEngine``,
+    ``api.main.detect_centering_errors``); NOUN tercihi alan fiil kökenli
+    kelimeler orada varlık (Cf öğesi) olarak sayılır.
     """
     return {
         'minimalist_errors': detector.candidate_errors + detector.confirmed_errors,
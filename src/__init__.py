@@ -0,0 +1,6 @@
+"""
+Çekirdek modüller: önermesel semantik ve Stanza pipeline havuzu
+
+    from src.propositional_semantics import TurkishPropositionAnalyzer
+    from src.pipeline_pool import get_pipeline_pool
+"""
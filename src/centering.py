@@ -0,0 +1,216 @@
+"""
+Merkezleme Kuramı (Centering Theory) - Artımlı Doküman Motoru
+=============================================================
+
+Cümleler sırayla geldikçe her söz (utterance) için ileri bakan merkezler
+(Cf), geri bakan merkez (Cb) ve tercih edilen merkez (Cp) hesaplanır; ardışık
+sözler arasındaki geçiş sınıflandırılır (Grosz, Joshi & Weinstein 1995;
+Brennan, Friedman & Pollard 1987):
+
+    Cb(Un) = Cb(Un-1) veya Cb(Un-1) yok:  Cb = Cp → CONTINUE,     değilse RETAIN
+    Cb(Un) ≠ Cb(Un-1):                    Cb = Cp → SMOOTH-SHIFT, değilse ROUGH-SHIFT
+    Cf(Un-1) öğelerinden hiçbiri Un'de yok:        NO-CB
+
+Cf sıralaması dilbilgisel işleve göredir: özne > nesne > dolaylı nesne >
+dolaylı tümleç > diğer adlar (eşitlikte yüzey sırası). Türkçe pro-drop
+olduğundan öznesi olmayan cümlede yüklemin kişi/sayı ekinden bir sıfır
+adıl (∅) üretilir. 3. kişi adıllar ve sıfır adıllar pencere içindeki önceki
+Cf listelerinde sayıca uyumlu en yüksek sıralı varlığa bağlanır; adlar
+lemma ile eşleşir.
+
+Motor yalnızca son ``window`` sözün Cf listesini, geçiş sayaçlarını ve son
+``max_errors`` hatayı tutar: yeni bir cümlenin maliyeti O(penceredeki varlık
+sayısı)'dır, bellek dokümanın uzunluğundan bağımsızdır.
+
+Kelime dict'leri iki biçimde kabul edilir: ``analyze_text`` çıktısı
+(upos, deprel, lemma, feats, preference) ve ``api.main`` biçimi (pos,
+dependency). NOUN tercihi (``preference.expected_pos == "NOUN"``) olan
+fiil kökenli kelimeler de varlık sayılır. Gönderim çıkarımı ve ad
+normalizasyonu varlık indeksiyle ortaktır (``src.mentions``).
+
+Kullanım (akış):
+    from src.centering import CenteringEngine
+
+    engine = CenteringEngine()
+    for sentence in analyze_text(text)["sentences"]:
+        step = engine.add(sentence["words"])
+        step["transition"]          # None (ilk söz), "CONTINUE", ...
+    engine.summary()                 # {"discourse_score", "transition_counts", "error_count", "errors"}
+
+Toplu:
+    from api.main import detect_centering_errors
+    detect_centering_errors(sentences)
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from src.mentions import Mention, extract_mentions, turkish_lower
+
+CONTINUE = "CONTINUE"
+RETAIN = "RETAIN"
+SMOOTH_SHIFT = "SMOOTH-SHIFT"
+ROUGH_SHIFT = "ROUGH-SHIFT"
+NO_CB = "NO-CB"
+
+# Geçiş puanları (yüksek = tutarlı); discourse_score bunların ortalaması
+TRANSITION_SCORES = {CONTINUE: 4, RETAIN: 3, SMOOTH_SHIFT: 2, ROUGH_SHIFT: 1, NO_CB: 0}
+
+# CONTINUE dışındaki geçişler söylem sorunu olarak raporlanır
+TRANSITION_SEVERITY = {RETAIN: "low", SMOOTH_SHIFT: "medium", ROUGH_SHIFT: "high", NO_CB: "high"}
+
+DEFAULT_WINDOW = 3
+
+# Akış modunda tutulan en fazla hata (en yenileri); sayaçlar tüm dokümanı kapsar
+DEFAULT_MAX_ERRORS = 100
+
+
+class CenteringEngine:
+    """
+    Artımlı Cb/Cf takibi
+
+    Args:
+        window: Adıl çözümlemesinde geriye bakılacak söz sayısı (Cb her zaman
+                yalnızca bir önceki söze göre hesaplanır)
+        max_errors: Tutulacak en fazla hata kaydı (en yenileri; 0 = hiç,
+                    None = sınırsız - yalnızca toplu işlerde)
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, max_errors: Optional[int] = DEFAULT_MAX_ERRORS):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        if max_errors is not None and max_errors < 0:
+            raise ValueError("max_errors must be >= 0 or None")
+        self.window = window
+        self._history: Deque[List[Mention]] = deque(maxlen=window)
+        self._previous_cb: Optional[str] = None
+        self._unresolved = 0
+        self.index = -1
+        self.transition_counts: Dict[str, int] = dict.fromkeys(TRANSITION_SCORES, 0)
+        self.errors: Deque[Dict[str, Any]] = deque(maxlen=max_errors)
+        self.error_count = 0
+        self._transition_total = 0
+        self._score_total = 0
+
+    # ---------- Cf çıkarımı ----------
+
+    def _mentions(self, words: Sequence[Dict[str, Any]]) -> List[Mention]:
+        mentions = extract_mentions(words, self._resolve)
+        mentions.sort(key=lambda m: (m.rank, m.position))
+        return mentions
+
+    def _resolve(self, number: Optional[str], text: str, position: int) -> str:
+        """3. kişi adılı penceredeki en yakın sözün en yüksek sıralı uyumlu varlığına bağla"""
+        for cf in reversed(self._history):
+            for mention in cf:
+                if mention.person in ("1", "2"):
+                    continue
+                if number is not None and mention.number is not None and mention.number != number:
+                    continue
+                return mention.entity
+        self._unresolved += 1
+        return f"{turkish_lower(text)}#{self._unresolved}"
+
+    # ---------- artımlı adım ----------
+
+    def add(self, words: Sequence[Dict[str, Any]], text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir sonraki sözü ekle
+
+        Returns:
+            {"index": int, "text": str | None,
+             "cf": [{"entity", "text", "role"}],   # sıralı
+             "cb": str | None, "cp": str | None,
+             "transition": str | None,             # ilk söz için None
+             "score": int | None}
+        """
+        self.index += 1
+        cf = self._mentions(words)
+        previous = self._history[-1] if self._history else None
+
+        # Bir Cf öğesi aynı varlığa birden çok gönderim içerebilir: ilk (en yüksek) kalır
+        seen = set()
+        ranked: List[Mention] = []
+        for mention in cf:
+            if mention.entity not in seen:
+                seen.add(mention.entity)
+                ranked.append(mention)
+
+        cp = ranked[0].entity if ranked else None
+        cb = None
+        if previous is not None:
+            cb = next((m.entity for m in previous if m.entity in seen), None)
+
+        transition = None
+        if previous is not None:
+            transition = self._classify(cb, cp)
+            score = TRANSITION_SCORES[transition]
+            self.transition_counts[transition] += 1
+            self._transition_total += 1
+            self._score_total += score
+            if transition in TRANSITION_SEVERITY:
+                self.error_count += 1
+                self.errors.append({
+                    "sentence_index": self.index,
+                    "transition": transition,
+                    "score": score,
+                    "severity": TRANSITION_SEVERITY[transition],
+                })
+
+        self._history.append(ranked)
+        self._previous_cb = cb
+        return {
+            "index": self.index,
+            "text": text,
+            "cf": [{"entity": m.entity, "text": m.text, "role": m.role} for m in ranked],
+            "cb": cb,
+            "cp": cp,
+            "transition": transition,
+            "score": TRANSITION_SCORES[transition] if transition else None,
+        }
+
+    def _classify(self, cb: Optional[str], cp: Optional[str]) -> str:
+        if cb is None:
+            return NO_CB
+        if self._previous_cb is None or cb == self._previous_cb:
+            return CONTINUE if cb == cp else RETAIN
+        return SMOOTH_SHIFT if cb == cp else ROUGH_SHIFT
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Şimdiye kadarki söylem özeti
+
+        Returns:
+            {"discourse_score": float,          # 0.0-4.0, geçiş yoksa 4.0
+             "transition_counts": {geçiş: int},
+             "error_count": int,                 # tüm doküman
+             "errors": [{"sentence_index", "transition", "score", "severity"}]}  # son max_errors
+        """
+        count = self._transition_total
+        return {
+            "discourse_score": round(self._score_total / count, 2) if count else 4.0,
+            "transition_counts": dict(self.transition_counts),
+            "error_count": self.error_count,
+            "errors": list(self.errors),
+        }
+
+
+def analyze_centering(sentences: Sequence[Dict[str, Any]],
+                      window: int = DEFAULT_WINDOW) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Cümle listesini tek geçişte işle
+
+    Args:
+        sentences: ``{"text": str, "words": [...]}`` dict'leri (analyze_text
+                   ``sentences`` listesi veya api.main biçimi)
+
+    Returns:
+        (summary, adımlar) - bkz. ``CenteringEngine.summary`` / ``add``;
+        adımlar zaten O(doküman) olduğundan özet tüm hataları ve sıralı
+        ``transitions`` listesini de içerir
+    """
+    engine = CenteringEngine(window=window, max_errors=None)
+    steps = [engine.add(sentence.get("words", []), sentence.get("text")) for sentence in sentences]
+    summary = engine.summary()
+    summary["transitions"] = [step["transition"] for step in steps[1:]]
+    return summary, steps
@@ -0,0 +1,185 @@
+"""
+Varlık İndeksi (Entity Index) - Anafor ve Gönderim Takibi
+=========================================================
+
+Uzun dokümanlarda şimdiye kadar görülen varlıkları lemma anahtarıyla tutar:
+her varlık için gönderim (mention) konumları, ``analyze_information_structure``
+kaynaklı verili/yeni (given/new) durumu ve söylem içinde ilk kez mi geçtiği.
+Gönderimler merkezleme motoruyla aynı çıkarımdan gelir (``src.mentions``):
+ad gönderimleri indekslenir, adıllar ``most_recent`` ile çözülür.
+
+İndeks artımlı güncellenir ve kayan bir pencereyle sınırlıdır:
+- ``window`` cümleden eski gönderimler atılır; gönderimi kalmayan varlık
+  indeksten çıkar (bellek O(pencere))
+- Varlık başına en fazla ``max_mentions`` gönderim tutulur (en eskisi düşer)
+
+Sorgular O(1)'dir (``in``, ``get``, ``is_given``, ``last_mention``);
+``most_recent`` en son anılan varlıktan geriye doğru yürür ve çoğunlukla ilk
+adımda döner. Böylece 100k cümlelik bir doküman önceki cümleler yeniden
+taranmadan işlenebilir.
+
+Kullanım:
+    from src.entity_index import EntityIndex
+
+    index = EntityIndex(window=200)
+    for sentence in analyze_text(text)["sentences"]:
+        context = analyze_discourse_features(sentence["words"], entity_index=index)
+        index.add_sentence(sentence["words"],
+                           (sentence.get("semantics") or {}).get("information_structure"))
+
+    index.get("kitap").mentions      # [Mention(entity='kitap', sentence=0, position=2, ...), ...]
+"""
+
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.mentions import Mention, extract_mentions, nominal_entity
+
+DEFAULT_WINDOW = 200
+DEFAULT_MAX_MENTIONS = 32
+
+
+class EntityRecord:
+    """Lemma başına varlık kaydı"""
+
+    __slots__ = ('lemma', 'mentions', 'first_sentence', 'mention_count', 'number')
+
+    def __init__(self, lemma: str, first_sentence: int, max_mentions: int):
+        self.lemma = lemma
+        self.mentions: Deque[Mention] = deque(maxlen=max_mentions)
+        self.first_sentence = first_sentence   # İndekse girdiği cümle
+        self.mention_count = 0                 # Atılanlar dahil toplam gönderim
+        self.number: Optional[str] = None      # Son gönderimin sayısı (Sing/Plur)
+
+    @property
+    def last_mention(self) -> Mention:
+        return self.mentions[-1]
+
+
+class EntityIndex:
+    """
+    Lemma → gönderim listesi, kayan pencere ve eviction ile
+
+    Args:
+        window: Tutulacak cümle sayısı
+        max_mentions: Varlık başına tutulacak en fazla gönderim
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, max_mentions: int = DEFAULT_MAX_MENTIONS):
+        if window < 1 or max_mentions < 1:
+            raise ValueError("window and max_mentions must be >= 1")
+        self.window = window
+        self.max_mentions = max_mentions
+        # Son anılan en sonda (recency sırası)
+        self._entities: 'OrderedDict[str, EntityRecord]' = OrderedDict()
+        # Penceredeki cümlelerin lemma listeleri (eviction için)
+        self._sentences: Deque[Tuple[int, List[str]]] = deque()
+        self.sentence_count = 0
+        self.evicted_entities = 0
+
+    # ---------- sorgular (O(1)) ----------
+
+    def __contains__(self, lemma: str) -> bool:
+        return lemma in self._entities
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __iter__(self) -> Iterator[str]:
+        """Lemmalar, en eski anılandan en yeniye"""
+        return iter(self._entities)
+
+    def get(self, lemma: str) -> Optional[EntityRecord]:
+        return self._entities.get(lemma)
+
+    def is_given(self, lemma: str) -> bool:
+        """Varlık penceredeki önceki cümlelerde anıldı mı (söylemde verili)?"""
+        return lemma in self._entities
+
+    def last_mention(self, lemma: str) -> Optional[Mention]:
+        record = self._entities.get(lemma)
+        return record.mentions[-1] if record is not None else None
+
+    def most_recent(self, number: Optional[str] = None) -> Optional[str]:
+        """
+        En son anılan varlık (adıl öncülü adayı)
+
+        Args:
+            number: 'Sing' | 'Plur' verilirse sayısı uyuşmayan varlıklar atlanır
+        """
+        for lemma in reversed(self._entities):
+            record = self._entities[lemma]
+            if number is None or record.number is None or record.number == number:
+                return lemma
+        return None
+
+    @staticmethod
+    def entity_key(word: Dict[str, Any]) -> Optional[str]:
+        """Kelime ad varlığı ise indeks anahtarı (küçük harf lemma), değilse None"""
+        return nominal_entity(word)
+
+    # ---------- güncelleme ----------
+
+    def add_sentence(self,
+                     words: Sequence[Dict[str, Any]],
+                     information_structure: Optional[Dict[str, Any]] = None) -> List[Mention]:
+        """
+        Sıradaki cümlenin varlık gönderimlerini ekle, pencereden çıkanları at
+
+        Args:
+            words: ``analyze_text`` veya ``api.main`` biçimi kelimeler
+            information_structure: ``analyze_information_structure`` çıktısı
+                (given/new durumu için; yoksa durum None)
+
+        Returns:
+            Bu cümlede eklenen gönderimler
+        """
+        sentence = self.sentence_count
+        self.sentence_count += 1
+
+        given = set(information_structure.get("given_entities", ())) if information_structure else ()
+        new = set(information_structure.get("new_entities", ())) if information_structure else ()
+
+        mentions = extract_mentions(words)
+        lemmas: List[str] = []
+        entities = self._entities
+        for mention in mentions:
+            lemma = mention.entity
+            record = entities.get(lemma)
+            mention.sentence = sentence
+            mention.discourse_new = record is None
+            mention.status = "given" if mention.text in given else "new" if mention.text in new else None
+            if record is None:
+                record = entities[lemma] = EntityRecord(lemma, sentence, self.max_mentions)
+            else:
+                entities.move_to_end(lemma)
+            record.mentions.append(mention)
+            record.mention_count += 1
+            if mention.number is not None:
+                record.number = mention.number
+            lemmas.append(lemma)
+
+        self._sentences.append((sentence, lemmas))
+        while len(self._sentences) > self.window:
+            self._evict(*self._sentences.popleft())
+        return mentions
+
+    def _evict(self, sentence: int, lemmas: List[str]) -> None:
+        for lemma in lemmas:
+            record = self._entities.get(lemma)
+            if record is None:
+                continue
+            mentions = record.mentions
+            while mentions and mentions[0].sentence <= sentence:
+                mentions.popleft()
+            if not mentions:
+                del self._entities[lemma]
+                self.evicted_entities += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sentences": self.sentence_count,
+            "entities": len(self._entities),
+            "window_sentences": len(self._sentences),
+            "evicted_entities": self.evicted_entities,
+        }
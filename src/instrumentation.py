@@ -0,0 +1,226 @@
+"""
+Aşama Süresi Ölçümü (Stage Timings)
+===================================
+
+Yavaş bir isteğin süresinin nereye gittiğini (tokenize, pos, depparse,
+dedektör, semantik re-parse, discourse...) görmek için hafif aşama
+zamanlayıcıları.
+
+Üç tüketici vardır:
+- İstek bazında: ``collect_timings()`` bloğu içindeki aşamalar bir dict'e
+  toplanır (``analyze_text(..., timings=True)`` bunu kullanır)
+- Süreç genelinde: ``enable_stage_histogram()`` açıkken her aşama süresi
+  sabit kovalı bir histograma eklenir
+- Gözlemci: ``set_stage_observer()`` ile kurulan nesne her aşamanın giriş ve
+  çıkışında çağrılır (ör. ``benchmarks.memory_profile`` aşama başına bellek)
+- İzleyici: ``src.tracing.enable_tracing()`` açıkken her aşama bir span olur
+
+Hepsi kapalıyken ``stage()`` paylaşılan boş bir context manager döndürür;
+maliyet bir ContextVar okuması ve bir bool kontrolüdür.
+
+Kullanım:
+    from src.instrumentation import collect_timings, stage
+
+    with collect_timings() as timings:
+        with stage("detect_errors"):
+            ...
+    timings   # {"detect_errors": 0.0012}
+
+    enable_stage_histogram()         # veya TURKISH_ANALYZER_STAGE_HISTOGRAM=1
+    get_stage_histogram().snapshot()
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# Histogram kova üst sınırları (saniye) - Prometheus "le" sınırlarıyla uyumlu
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_current: ContextVar[Optional[Dict[str, float]]] = ContextVar('stage_timings', default=None)
+_histogram_enabled = os.environ.get('TURKISH_ANALYZER_STAGE_HISTOGRAM', '').lower() not in ('', '0', 'false', 'no')
+
+# Kapalıyken her stage() çağrısı aynı nesneyi döndürür (allocation yok)
+_NULL_STAGE = nullcontext()
+
+# stage_enter(name) -> token, stage_exit(name, token, seconds) metodları olan nesne
+_observer: Optional[Any] = None
+
+# start(name) -> span, end(span, error) metodları olan nesne (src.tracing kurar)
+_tracer: Optional[Any] = None
+
+
+class StageHistogram:
+    """Aşama adı → sabit kovalı süre histogramı (thread-safe)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        index = bisect_left(self.buckets, seconds)  # len(buckets) = +Inf kovası
+        with self._lock:
+            counts = self._counts.get(name)
+            if counts is None:
+                counts = self._counts[name] = [0] * (len(self.buckets) + 1)
+                self._sums[name] = 0.0
+            counts[index] += 1
+            self._sums[name] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            {stage: {"count": int, "sum": float, "mean": float,
+                     "buckets": [(le, kümülatif sayı), ..., ("+Inf", count)]}}
+        """
+        with self._lock:
+            data = {name: (list(counts), self._sums[name]) for name, counts in self._counts.items()}
+
+        result = {}
+        for name, (counts, total) in sorted(data.items()):
+            cumulative, running = [], 0
+            for le, count in zip(list(self.buckets) + ["+Inf"], counts):
+                running += count
+                cumulative.append((le, running))
+            result[name] = {
+                "count": running,
+                "sum": round(total, 6),
+                "mean": round(total / running, 6) if running else 0.0,
+                "buckets": cumulative,
+            }
+        return result
+
+
+_histogram = StageHistogram()
+
+
+def enable_stage_histogram(enabled: bool = True) -> None:
+    """Süreç geneli aşama histogramını aç/kapat"""
+    global _histogram_enabled
+    _histogram_enabled = bool(enabled)
+
+
+def get_stage_histogram() -> StageHistogram:
+    return _histogram
+
+
+def set_stage_observer(observer: Optional[Any]) -> Optional[Any]:
+    """
+    Aşama gözlemcisini kur (None = kaldır)
+
+    Gözlemci ``stage_enter(name)`` (bir token döndürür) ve
+    ``stage_exit(name, token, seconds)`` metodları sağlamalıdır.
+
+    Returns:
+        Önceki gözlemci (geri yüklemek için)
+    """
+    global _observer
+    previous = _observer
+    _observer = observer
+    return previous
+
+
+def set_stage_tracer(tracer: Optional[Any]) -> Optional[Any]:
+    """
+    Aşamaları span'e çevirecek izleyiciyi kur (None = kaldır)
+
+    Doğrudan değil ``src.tracing.enable_tracing()`` üzerinden kullanılır.
+
+    Returns:
+        Önceki izleyici
+    """
+    global _tracer
+    previous = _tracer
+    _tracer = tracer
+    return previous
+
+
+def timings_active() -> bool:
+    """Şu an herhangi bir tüketici aşama süresi topluyor mu?"""
+    return (_histogram_enabled or _observer is not None or _tracer is not None
+            or _current.get() is not None)
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """Ölçülmüş bir süreyi aktif tüketicilere ekle (aynı aşama toplanır)"""
+    timings = _current.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+    if _histogram_enabled:
+        _histogram.observe(name, seconds)
+
+
+@contextmanager
+def _timed_stage(name: str) -> Iterator[None]:
+    observer = _observer
+    tracer = _tracer
+    token = observer.stage_enter(name) if observer is not None else None
+    span = tracer.start(name) if tracer is not None else None
+    error = None
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        record_stage(name, seconds)
+        if span is not None:
+            tracer.end(span, error)
+        if observer is not None:
+            observer.stage_exit(name, token, seconds)
+
+
+def stage(name: str):
+    """Bloğun süresini ``name`` aşamasına ekle (kimse toplamıyorsa no-op)"""
+    if not _histogram_enabled and _observer is None and _tracer is None and _current.get() is None:
+        return _NULL_STAGE
+    return _timed_stage(name)
+
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[str, float]]:
+    """Blok içindeki aşama sürelerini bir dict'e topla (iç içe çağrılar ayrı dict alır)"""
+    timings: Dict[str, float] = {}
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def instrument_stanza_pipeline(nlp: Any) -> Any:
+    """
+    Stanza processor'larının ``process`` metodlarını aşama zamanlayıcısıyla sar
+
+    Her processor ``stanza.<ad>`` aşaması olarak raporlanır (stanza.tokenize,
+    stanza.pos, stanza.depparse ...). Processor sözlüğü olmayan nesneler
+    (fixture pipeline'ları) olduğu gibi döner.
+    """
+    processors = getattr(nlp, 'processors', None)
+    if not isinstance(processors, dict):
+        return nlp
+    for name, processor in processors.items():
+        original = processor.process
+
+        def timed_process(doc, _original=original, _stage=f"stanza.{name}"):
+            with stage(_stage):
+                return _original(doc)
+
+        processor.process = timed_process
+    return nlp
@@ -0,0 +1,156 @@
+"""
+Varlık Gönderimleri (Mentions) - Ortak Çıkarım
+==============================================
+
+Merkezleme motoru (``src.centering``) ve varlık indeksi (``src.entity_index``)
+cümledeki varlık gönderimlerini aynı kurallarla çıkarır; böylece ikisi bir
+gönderimin hangi varlığa ait olduğu konusunda ayrışamaz:
+
+- Varlık: NOUN/PROPN, NOUN tercihi (``preference.expected_pos == "NOUN"``)
+  olan kelimeler ve adıllar (PRON)
+- Ad anahtarı: Türkçe küçük harfli lemma (yoksa metin) - ``I``/``İ`` → ``ı``/``i``
+- 1./2. kişi adıllar: ``person:<kişi><sayı>`` (ör. ``person:1sing``)
+- 3. kişi adıllar ve pro-drop sıfır adıl (∅): çağıranın verdiği öncül
+  çözücüsüne bağlanır; çözücü verilmezse atlanır
+
+Kelime dict'leri iki biçimde kabul edilir: ``analyze_text`` çıktısı
+(upos, deprel, lemma, feats) ve ``api.main`` biçimi (pos, dependency).
+
+Kullanım:
+    from src.mentions import extract_mentions
+
+    extract_mentions(words)                       # yalnızca adlar
+    extract_mentions(words, resolve=engine._resolve)   # adıllar dahil (Cf)
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Dilbilgisel işlev → Cf sırası (küçük = yüksek)
+ROLE_RANKS = {
+    "nsubj": 0, "csubj": 0, "nsubj:pass": 0,
+    "obj": 1, "ccomp": 1,
+    "iobj": 2,
+    "obl": 3,
+}
+OTHER_RANK = 4
+
+ZERO = "∅"
+
+_NOMINAL_POS = ("NOUN", "PROPN")
+
+# (sayı, metin, konum) → öncül varlık anahtarı
+Resolver = Callable[[Optional[str], str, int], str]
+
+
+def turkish_lower(text: str) -> str:
+    """Türkçe küçük harf (``I`` → ``ı``, ``İ`` → ``i``)"""
+    return text.replace('I', 'ı').replace('İ', 'i').lower()
+
+
+def feature(feats: str, name: str) -> Optional[str]:
+    """``Anahtar=Değer|...`` dizgisinden tek özelliğin değeri"""
+    for pair in feats.split('|'):
+        key, _, value = pair.partition('=')
+        if key == name:
+            return value
+    return None
+
+
+def nominal_entity(word: Dict[str, Any]) -> Optional[str]:
+    """Kelime ad varlığı ise anahtarı (küçük harf lemma), değilse None"""
+    upos = word.get("upos") or word.get("pos") or ""
+    if upos not in _NOMINAL_POS:
+        # Fiil kökenli ama NOUN tercihi olan kelimeler de ad sayılır (adıllar hariç)
+        if upos == "PRON" or (word.get("preference") or {}).get("expected_pos") != "NOUN":
+            return None
+    return turkish_lower(word.get("lemma") or word.get("text", ""))
+
+
+def speaker_entity(person: str, number: Optional[str]) -> str:
+    """1./2. kişi adılın varlık anahtarı"""
+    return f"person:{person}{(number or 'sing').lower()}"
+
+
+class Mention:
+    """
+    Bir varlığın tek gönderimi
+
+    ``sentence``, ``status`` ve ``discourse_new`` varlık indeksi tarafından
+    doldurulur (merkezleme motorunda kullanılmaz).
+    """
+
+    __slots__ = ('entity', 'text', 'role', 'rank', 'position', 'number', 'person', 'pronominal',
+                 'sentence', 'status', 'discourse_new')
+
+    def __init__(self, entity: str, text: str, role: str, rank: int, position: int,
+                 number: Optional[str], person: Optional[str], pronominal: bool = False):
+        self.entity = entity
+        self.text = text
+        self.role = role                    # deprel
+        self.rank = rank                    # Cf sırası (ROLE_RANKS)
+        self.position = position            # Cümle içi kelime sırası (0'dan; ∅ için -1)
+        self.number = number
+        self.person = person
+        self.pronominal = pronominal        # Adıl veya sıfır adıl
+        self.sentence: Optional[int] = None     # Doküman içi cümle sırası
+        self.status: Optional[str] = None       # "given" | "new" | None (information structure)
+        self.discourse_new = False              # İndeks penceresinde ilk gönderim mi?
+
+    def __repr__(self):
+        return (f"Mention(entity={self.entity!r}, sentence={self.sentence}, "
+                f"position={self.position}, text={self.text!r}, status={self.status!r})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entity": self.entity,
+            "sentence": self.sentence,
+            "position": self.position,
+            "text": self.text,
+            "role": self.role,
+            "status": self.status,
+            "discourse_new": self.discourse_new,
+        }
+
+
+def extract_mentions(words: Sequence[Dict[str, Any]],
+                     resolve: Optional[Resolver] = None) -> List[Mention]:
+    """
+    Cümlenin varlık gönderimleri (yüzey sırasıyla; sıfır adıl en sonda)
+
+    Args:
+        resolve: 3. kişi adıl ve sıfır adıl öncül çözücüsü; None ise adıllar
+                 (1./2. kişi dahil) ve sıfır adıl atlanır
+    """
+    mentions: List[Mention] = []
+    has_subject = False
+    root = None
+    for position, word in enumerate(words):
+        deprel = word.get("deprel") or word.get("dependency") or ""
+        if deprel == "root":
+            root = word
+        upos = word.get("upos") or word.get("pos") or ""
+        entity = nominal_entity(word)
+        if entity is None and (upos != "PRON" or resolve is None):
+            continue
+        rank = ROLE_RANKS.get(deprel, ROLE_RANKS.get(deprel.split(':')[0], OTHER_RANK))
+        has_subject = has_subject or rank == 0
+        text = word.get("text", "")
+        feats = word.get("feats") or ""
+        person = feature(feats, "Person")
+        number = feature(feats, "Number")
+        pronominal = entity is None
+        if pronominal:
+            entity = (speaker_entity(person, number) if person in ("1", "2")
+                      else resolve(number, text, position))
+        mentions.append(Mention(entity, text, deprel, rank, position, number, person, pronominal))
+
+    # Pro-drop: öznesiz cümlede yüklem ekinden sıfır adıl
+    if resolve is not None and not has_subject and root is not None:
+        feats = root.get("feats") or ""
+        person = feature(feats, "Person")
+        if person is not None:
+            number = feature(feats, "Number")
+            entity = (speaker_entity(person, number) if person in ("1", "2")
+                      else resolve(number, ZERO, -1))
+            mentions.append(Mention(entity, ZERO, "nsubj", 0, -1, number, person, True))
+    return mentions
@@ -0,0 +1,371 @@
+"""
+Metrik Kaydı ve Prometheus Dışa Aktarımı
+========================================
+
+API fonksiyonları (``analyze_text``, ``check_sentence``, ``analyze_corpus``)
+süreç genelindeki ``REGISTRY``'deki sayaçları günceller. Anlık değerler
+(cache hit/miss, havuz doluluğu ve kuyruk derinliği, model yükleme süresi,
+aşama gecikmeleri) ihracat anında collector fonksiyonlarıyla okunur.
+
+Çıktı Prometheus text exposition formatındadır (0.0.4); harici bir servis
+gerekmez:
+
+    from src.metrics import render_prometheus, write_metrics_file, start_metrics_server
+
+    print(render_prometheus())
+    write_metrics_file("/var/lib/node_exporter/turkish_analyzer.prom")  # textfile collector
+    server = start_metrics_server(port=9464)   # http://127.0.0.1:9464/metrics
+    server.shutdown()
+
+Aşama gecikmesi histogramı (``turkish_analyzer_stage_seconds``) için
+``src.instrumentation.enable_stage_histogram()`` açık olmalıdır;
+``start_metrics_server`` bunu varsayılan olarak açar.
+"""
+
+import math
+import os
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.instrumentation import DEFAULT_BUCKETS
+
+METRIC_PREFIX = 'turkish_analyzer_'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_METRICS_PORT = 9464
+MAX_PROFILE_SECONDS = 300   # /debug/profile üst sınırı
+
+LabelValues = Tuple[str, ...]
+# (örnek adı eki, etiketler, değer) ve (metrik adı, tip, yardım metni, örnekler)
+Sample = Tuple[str, Dict[str, str], float]
+MetricFamily = Tuple[str, str, str, List[Sample]]
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    inner = ','.join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+    return '{' + inner + '}'
+
+
+class _Metric:
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+
+class Counter(_Metric):
+    """Yalnızca artan sayaç"""
+
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [('', self._labels(k), v) for k, v in items]
+
+
+class Gauge(_Metric):
+    """Anlık değer"""
+
+    type = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [('', self._labels(k), v) for k, v in items]
+
+
+class Histogram(_Metric):
+    """Sabit kovalı histogram"""
+
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = sorted((k, list(c), self._sums[k]) for k, c in self._counts.items())
+        samples: List[Sample] = []
+        for key, counts, total in items:
+            labels = self._labels(key)
+            running = 0
+            for le, count in zip(list(self.buckets) + [math.inf], counts):
+                running += count
+                samples.append(('_bucket', {**labels, 'le': _format_value(le)}, running))
+            samples.append(('_sum', labels, total))
+            samples.append(('_count', labels, running))
+        return samples
+
+
+class MetricsRegistry:
+    """Metrik ve collector kaydı"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different type/labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        # Prometheus adlandırması: sayaçlar _total ile biter
+        return self._register(Counter(METRIC_PREFIX + name + '_total', documentation, labelnames))  # type: ignore
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(METRIC_PREFIX + name, documentation, labelnames))  # type: ignore
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(METRIC_PREFIX + name, documentation, labelnames, buckets))  # type: ignore
+
+    def register_collector(self, collector: Collector) -> None:
+        """İhracat anında çağrılacak collector ekle (aynı fonksiyon bir kez)"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        families = [(m.name, m.type, m.documentation, m.samples()) for m in metrics]
+        for collector in collectors:
+            families.extend(collector())
+        return families
+
+
+REGISTRY = MetricsRegistry()
+
+# ========== API METRİKLERİ ==========
+
+REQUESTS = REGISTRY.counter('requests', 'Analysis requests by entry point', ['entry_point'])
+SENTENCES = REGISTRY.counter('sentences', 'Sentences processed by entry point', ['entry_point'])
+TOKENS = REGISTRY.counter('tokens', 'Tokens (Stanza words) processed by entry point', ['entry_point'])
+PREFERENCES = REGISTRY.counter('preferences', 'POS preferences emitted by POSErrorType', ['type'])
+BATCH_DOCUMENTS = REGISTRY.histogram(
+    'batch_documents', 'Documents per analyze_corpus batch',
+    buckets=(1, 10, 100, 1000, 10000, 100000))
+BATCH_SENTENCES = REGISTRY.histogram(
+    'batch_sentences', 'Sentences per analyze_corpus batch (before deduplication)',
+    buckets=(1, 10, 100, 1000, 10000, 100000, 1000000))
+BATCH_DUPLICATES = REGISTRY.counter(
+    'batch_duplicate_sentences', 'Sentences skipped by batch deduplication', ['kind'])
+
+
+def record_request(entry_point: str, sentences: int, tokens: int) -> None:
+    """Bir API çağrısını say"""
+    REQUESTS.inc(entry_point=entry_point)
+    if sentences:
+        SENTENCES.inc(sentences, entry_point=entry_point)
+    if tokens:
+        TOKENS.inc(tokens, entry_point=entry_point)
+
+
+def record_preference(error_type: str) -> None:
+    """Tercih (preference) sayacı; ``error_type`` POSErrorType adı"""
+    PREFERENCES.inc(type=error_type)
+
+
+# ========== COLLECTOR'LAR (anlık değerler) ==========
+
+def _collect_pipeline_pools() -> Iterable[MetricFamily]:
+    from src.pipeline_pool import readiness
+
+    instances: List[Sample] = []
+    in_use: List[Sample] = []
+    waiting: List[Sample] = []
+    load: List[Sample] = []
+    for pool in readiness()["pools"]:
+        labels = {'lang': pool['lang'], 'processors': pool['processors'] or 'default'}
+        instances.append(('', labels, pool['instances']))
+        in_use.append(('', labels, pool['instances'] - pool['available']))
+        waiting.append(('', labels, pool['waiting']))
+        load.append(('', labels, pool['load_seconds']))
+    yield (METRIC_PREFIX + 'pipeline_instances', 'gauge', 'Loaded Stanza pipelines per pool', instances)
+    yield (METRIC_PREFIX + 'pipeline_in_use', 'gauge', 'Pipelines currently checked out', in_use)
+    yield (METRIC_PREFIX + 'pipeline_queue_depth', 'gauge', 'Callers waiting for an idle pipeline', waiting)
+    yield (METRIC_PREFIX + 'model_load_seconds', 'gauge', 'Total model load time per pool', load)
+
+
+def _collect_stage_latency() -> Iterable[MetricFamily]:
+    from src.instrumentation import get_stage_histogram
+
+    samples: List[Sample] = []
+    for stage_name, data in get_stage_histogram().snapshot().items():
+        labels = {'stage': stage_name}
+        for le, count in data['buckets']:
+            le_text = '+Inf' if le == '+Inf' else _format_value(le)
+            samples.append(('_bucket', {**labels, 'le': le_text}, count))
+        samples.append(('_sum', labels, data['sum']))
+        samples.append(('_count', labels, data['count']))
+    yield (METRIC_PREFIX + 'stage_seconds', 'histogram', 'Per-stage latency (seconds)', samples)
+
+
+REGISTRY.register_collector(_collect_pipeline_pools)
+REGISTRY.register_collector(_collect_stage_latency)
+
+
+# ========== DIŞA AKTARIM ==========
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    """Prometheus text exposition formatı"""
+    registry = registry or REGISTRY
+    lines = []
+    for name, metric_type, documentation, samples in registry.collect():
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics_file(path: str, registry: Optional[MetricsRegistry] = None) -> str:
+    """Metrikleri dosyaya yaz (atomik; node_exporter textfile collector için)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(render_prometheus(registry))
+    os.replace(tmp_path, path)
+    return path
+
+
+def start_metrics_server(port: int = DEFAULT_METRICS_PORT,
+                         host: str = '127.0.0.1',
+                         registry: Optional[MetricsRegistry] = None,
+                         stage_histogram: bool = True,
+                         profiling: bool = False):
+    """
+    ``/metrics`` sunan yerel HTTP sunucusunu arka plan thread'inde başlat
+
+    Args:
+        port: Dinlenecek port (0 = boş bir port seç; ``server.server_port``)
+        host: Varsayılan yalnızca localhost
+        stage_histogram: Aşama gecikmesi histogramını da aç
+        profiling: ``/debug/profile?seconds=N&interval=S`` uç noktasını aç;
+                   süreci N saniye örnekler ve collapsed stack metni döndürür
+                   (``src.sampling_profiler``)
+
+    Returns:
+        ``ThreadingHTTPServer`` (durdurmak için ``server.shutdown()``)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    if stage_histogram:
+        from src.instrumentation import enable_stage_histogram
+        enable_stage_histogram()
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path, _, query = self.path.partition('?')
+            if profiling and path == '/debug/profile':
+                self._send_profile(query)
+                return
+            if path not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+            self._send(render_prometheus(registry).encode('utf-8'), CONTENT_TYPE)
+
+        def _send_profile(self, query: str):
+            from urllib.parse import parse_qs
+            from src.sampling_profiler import DEFAULT_INTERVAL, sample_for
+
+            params = parse_qs(query)
+            try:
+                seconds = float(params.get('seconds', ['10'])[0])
+                interval = float(params.get('interval', [str(DEFAULT_INTERVAL)])[0])
+            except ValueError:
+                self.send_error(400, 'seconds and interval must be numbers')
+                return
+            if not 0 < seconds <= MAX_PROFILE_SECONDS or interval <= 0:
+                self.send_error(400, f'seconds must be in (0, {MAX_PROFILE_SECONDS}], interval > 0')
+                return
+            profiler = sample_for(seconds, interval=interval)
+            body = "".join(line + "\n" for line in profiler.collapsed()).encode('utf-8')
+            self._send(body, 'text/plain; charset=utf-8')
+
+        def _send(self, body: bytes, content_type: str):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # noqa: A002 - stdlib imzası
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,234 @@
+"""
+Kayıtlı Parse Fixture'ları - Modelsiz Stanza Yerine Geçen Pipeline
+==================================================================
+
+Kural katmanları (preferences, önermesel değer, discourse) Stanza çıktısı
+üzerinde çalışır, ancak torch + model yüklemeden ölçülmeleri/test edilmeleri
+için gerçek bir parse'a gerek yoktur. Bu modül önceden kaydedilmiş Stanza
+çıktılarını Stanza'nın Document/Sentence/Word arayüzüyle sunar.
+
+Fixture formatı (JSON):
+    {
+        "version": 1,
+        "source": str,
+        "documents": [
+            {"text": str,
+             "processors": str,      # opsiyonel: kaydedilen processor seti
+             "sentences": [{"text": str, "words": [{"id", "text", "lemma", "upos",
+                                                    "xpos", "feats", "head",
+                                                    "deprel", "misc"}]}]}
+        ]
+    }
+
+Kullanım:
+    from src.parse_fixtures import install_fixture_pipeline
+
+    install_fixture_pipeline("tests/fixtures/parses.json")
+    analyze_text("Kuşlar uçar.")      # Stanza yüklenmez
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+FIXTURE_FORMAT_VERSION = 1
+
+# Depodaki varsayılan fixture (tests/test_results.json içindeki kayıtlı parse'lar)
+DEFAULT_FIXTURE_PATH = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'parses.json'
+
+WORD_FIELDS = ('id', 'text', 'lemma', 'upos', 'xpos', 'feats', 'head', 'deprel', 'misc')
+
+
+class ParsedWord:
+    """Stanza ``Word`` ile aynı öznitelikler"""
+
+    __slots__ = WORD_FIELDS
+
+    def __init__(self, **fields: Any):
+        for name in WORD_FIELDS:
+            setattr(self, name, fields.get(name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in WORD_FIELDS}
+
+    def __repr__(self):
+        return f"ParsedWord(id={self.id}, text={self.text!r}, upos={self.upos})"
+
+
+class ParsedSentence:
+    """Stanza ``Sentence`` ile aynı öznitelikler (``text``, ``words``)"""
+
+    def __init__(self, text: str, words: List[ParsedWord]):
+        self.text = text
+        self.words = words
+
+    @property
+    def tokens(self) -> List[ParsedWord]:
+        return self.words
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"text": self.text, "words": [w.to_dict() for w in self.words]}
+
+
+class ParsedDocument:
+    """
+    Stanza ``Document`` ile aynı öznitelikler (``text``, ``sentences``)
+
+    ``processors`` parse'ın hangi processor setiyle kaydedildiğini tutar
+    (bilinmiyorsa None).
+    """
+
+    def __init__(self, text: str, sentences: List[ParsedSentence],
+                 processors: Optional[str] = None):
+        self.text = text
+        self.sentences = sentences
+        self.processors = processors
+
+    @property
+    def num_tokens(self) -> int:
+        return sum(len(s.words) for s in self.sentences)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"text": self.text}
+        if self.processors is not None:
+            data["processors"] = self.processors
+        data["sentences"] = [s.to_dict() for s in self.sentences]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ParsedDocument':
+        sentences = [
+            ParsedSentence(s["text"], [ParsedWord(**w) for w in s["words"]])
+            for s in data["sentences"]
+        ]
+        return cls(data["text"], sentences, data.get("processors"))
+
+    @classmethod
+    def from_stanza(cls, doc: Any, processors: Optional[str] = None) -> 'ParsedDocument':
+        """Gerçek Stanza Document'ını fixture formatına çevir"""
+        sentences = []
+        for sent in getattr(doc, 'sentences', []):
+            words = [
+                ParsedWord(**{name: getattr(word, name, None) for name in WORD_FIELDS})
+                for word in sent.words
+            ]
+            sentences.append(ParsedSentence(sent.text, words))
+        text = getattr(doc, 'text', None) or ' '.join(s.text for s in sentences)
+        return cls(text, sentences, processors)
+
+
+def _first_token(text: str) -> str:
+    return text.split(None, 1)[0] if text else ''
+
+
+class FixturePipeline:
+    """
+    Kayıtlı parse'ları döndüren, Stanza pipeline'ı gibi çağrılabilen nesne
+
+    Metin birebir kayıtlı bir doküman veya cümleyse onun parse'ı döner.
+    Değilse metin bilinen cümlelerin boşlukla birleşimi olarak çözülmeye
+    çalışılır (çok cümleli dokümanlar için). Bilinmeyen metin ``KeyError`` verir.
+
+    Cümleler ilk token'larına göre indekslenir: birleştirmede her adım
+    yalnızca aynı token'la başlayan kayıtlara bakar, arama maliyeti fixture
+    boyutuyla büyümez.
+    """
+
+    def __init__(self, documents: Iterable[ParsedDocument]):
+        self.documents: Dict[str, ParsedDocument] = {}
+        self.sentences: Dict[str, ParsedSentence] = {}
+        for doc in documents:
+            self.documents[doc.text] = doc
+            for sent in doc.sentences:
+                self.sentences.setdefault(sent.text, sent)
+        # İlk token → o token'la başlayan cümle metinleri (uzundan kısaya)
+        self._by_first_token: Dict[str, List[str]] = {}
+        for sentence_text in self.sentences:
+            self._by_first_token.setdefault(_first_token(sentence_text), []).append(sentence_text)
+        for candidates in self._by_first_token.values():
+            candidates.sort(key=len, reverse=True)
+        self.calls = 0
+
+    def __contains__(self, text: str) -> bool:
+        return self.lookup(text) is not None
+
+    def lookup(self, text: str) -> Optional[ParsedDocument]:
+        """Metnin kayıtlı (veya birleştirilmiş) parse'ı; yoksa None"""
+        doc = self.documents.get(text)
+        if doc is not None:
+            return doc
+        sent = self.sentences.get(text)
+        if sent is not None:
+            return ParsedDocument(text, [sent])
+        sentences = self._compose(text)
+        return ParsedDocument(text, sentences) if sentences is not None else None
+
+    def _compose(self, text: str) -> Optional[List[ParsedSentence]]:
+        # En uzun önek eşleşmesiyle cümle cümle ilerle
+        remaining = text.strip()
+        found = []
+        while remaining:
+            match = None
+            for candidate in self._by_first_token.get(_first_token(remaining), ()):
+                if remaining.startswith(candidate):
+                    match = candidate
+                    break
+            if match is None:
+                return None
+            found.append(self.sentences[match])
+            remaining = remaining[len(match):].lstrip()
+        return found or None
+
+    def __call__(self, text: str) -> ParsedDocument:
+        self.calls += 1
+        doc = self.lookup(text)
+        if doc is None:
+            raise KeyError(f"No recorded parse for text: {text!r}")
+        return doc
+
+
+# ========== YÜKLEME / KAYDETME ==========
+
+def load_parse_fixtures(path: Union[str, Path] = DEFAULT_FIXTURE_PATH) -> List[ParsedDocument]:
+    """Fixture dosyasını oku"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("version") != FIXTURE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported fixture version: {data.get('version')!r}")
+    return [ParsedDocument.from_dict(d) for d in data["documents"]]
+
+
+def save_parse_fixtures(documents: Iterable[ParsedDocument],
+                        path: Union[str, Path],
+                        source: str = "") -> None:
+    """Fixture dosyasını yaz (aynı metin + processor seti birden fazla varsa ilki tutulur)"""
+    seen: Dict[Any, ParsedDocument] = {}
+    for doc in documents:
+        seen.setdefault((doc.processors, doc.text), doc)
+    data = {
+        "version": FIXTURE_FORMAT_VERSION,
+        "source": source,
+        "documents": [doc.to_dict() for doc in seen.values()],
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def install_fixture_pipeline(path: Union[str, Path] = DEFAULT_FIXTURE_PATH) -> FixturePipeline:
+    """
+    Tüm pipeline havuzlarını fixture pipeline'ı ile değiştir
+
+    Varsayılana dönmek için:
+        configure_pipeline_pools(factory=build_stanza_pipeline)
+    """
+    from src.pipeline_pool import configure_pipeline_pools
+
+    pipeline = FixturePipeline(load_parse_fixtures(path))
+    # FixturePipeline salt-okunur; tüm havuzlar aynı örneği paylaşabilir
+    configure_pipeline_pools(factory=lambda lang, processors: pipeline)
+    return pipeline
@@ -0,0 +1,232 @@
+"""
+Parser Backend - Stanza / Kayıt / Tekrar Oynatma
+================================================
+
+API modülleri (``api.main``, ``api.simple_check``, ``api.pos_semantic_analyzer``,
+``src.propositional_semantics``) cümleleri doğrudan Stanza'ya değil bu modülün
+``parse()`` fonksiyonuna verir. Aktif backend değiştirilerek:
+
+- ``StanzaBackend``    : gerçek inference (varsayılan, pipeline havuzu üzerinden)
+- ``RecordingBackend`` : Stanza çıktısını fixture dosyasına kaydeder
+- ``ReplayBackend``    : kayıtlı çıktıları indeksten sunar (torch yüklenmez)
+
+Test ve ölçümler böylece saniyeler içinde, Stanza sürümünden bağımsız olarak
+tüm kural kodunu çalıştırır.
+
+Kullanım:
+    from src.parser_backend import ReplayBackend, set_parser_backend
+
+    set_parser_backend(ReplayBackend("tests/fixtures/parses.json"))
+
+Ortam değişkeni (import sırasında okunur):
+    TURKISH_ANALYZER_PARSER=stanza                     # varsayılan
+    TURKISH_ANALYZER_PARSER=record:tests/fixtures/parses.json
+    TURKISH_ANALYZER_PARSER=replay:tests/fixtures/parses.json
+    TURKISH_ANALYZER_PARSER=replay-record:tests/fixtures/parses.json  # eksikleri kaydet
+
+    # Örnek: Stanza'lı demo testlerini model varken bir kez yerel bir dosyaya
+    # kaydet, sonra o dosyadan modelsiz çalıştır. Depodaki tests/fixtures/parses.json
+    # yalnızca modelsiz testlerin beş cümlesini içerir; bu testler onunla
+    # FixtureMissError verir.
+    TURKISH_ANALYZER_PARSER=record:parses.local.json python tests/test_pos_fixes.py
+    TURKISH_ANALYZER_PARSER=replay:parses.local.json python tests/test_pos_fixes.py
+"""
+
+import atexit
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.parse_fixtures import (
+    FixturePipeline,
+    ParsedDocument,
+    load_parse_fixtures,
+    save_parse_fixtures,
+)
+from src.pipeline_pool import DEFAULT_LANG, get_pipeline_pool
+
+PARSER_ENV_VAR = 'TURKISH_ANALYZER_PARSER'
+
+
+class FixtureMissError(KeyError):
+    """Replay modunda metnin kayıtlı parse'ı yok"""
+
+
+class ParserBackend:
+    """
+    Parser backend arayüzü
+
+    ``parse`` Stanza Document arayüzüne uyan bir nesne döndürmelidir
+    (``.sentences`` → ``.words`` → id, text, lemma, upos, xpos, feats, head, deprel).
+    """
+
+    name = 'base'
+
+    def parse(self, text: str, processors: Optional[str] = None, lang: str = DEFAULT_LANG) -> Any:
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class StanzaBackend(ParserBackend):
+    """Gerçek Stanza inference (``src.pipeline_pool`` havuzları üzerinden)"""
+
+    name = 'stanza'
+
+    def parse(self, text: str, processors: Optional[str] = None, lang: str = DEFAULT_LANG) -> Any:
+        return get_pipeline_pool(processors, lang)(text)
+
+
+class RecordingBackend(ParserBackend):
+    """
+    Başka bir backend'in (varsayılan: Stanza) çıktısını kaydeder
+
+    Kayıtlar ``save()`` ile (veya süreç sonunda ``autosave=True`` ise)
+    fixture dosyasına yazılır; dosyada zaten olan kayıtlar korunur.
+    """
+
+    name = 'record'
+
+    def __init__(self, path: Union[str, Path],
+                 inner: Optional[ParserBackend] = None,
+                 autosave: bool = False,
+                 source: str = "RecordingBackend"):
+        self.path = Path(path)
+        self.inner = inner or StanzaBackend()
+        self.source = source
+        self.recorded: List[ParsedDocument] = []
+        self._lock = threading.Lock()
+        if autosave:
+            atexit.register(self._autosave)
+
+    def __repr__(self):
+        return f"RecordingBackend({str(self.path)!r}, recorded={len(self.recorded)})"
+
+    def parse(self, text: str, processors: Optional[str] = None, lang: str = DEFAULT_LANG) -> Any:
+        doc = self.inner.parse(text, processors, lang)
+        recorded = ParsedDocument.from_stanza(doc, processors)
+        # Stanza doc.text normalize edebilir; anahtar her zaman girdi metni
+        recorded.text = text
+        with self._lock:
+            self.recorded.append(recorded)
+        return doc
+
+    def _autosave(self) -> None:
+        # Hiç kayıt yoksa mevcut dosyaya dokunma
+        if self.recorded:
+            self.save()
+
+    def save(self) -> Path:
+        """Kayıtları mevcut fixture dosyasıyla birleştirip yaz"""
+        with self._lock:
+            new = list(self.recorded)
+        existing = load_parse_fixtures(self.path) if self.path.exists() else []
+        # Yeni kayıtlar aynı (processors, text) için eskisinin yerini alır
+        save_parse_fixtures(new + existing, self.path, source=self.source)
+        return self.path
+
+
+class ReplayBackend(ParserBackend):
+    """
+    Kayıtlı parse'ları indeksten sunar
+
+    Arama sırası: aynı processor setiyle kaydedilmiş parse → herhangi bir
+    processor setiyle kaydedilmiş parse (``match_processors=False`` ise).
+    Çok cümleli metinler kayıtlı cümlelerden birleştirilebilir.
+    Kayıt yoksa ``fallback`` backend'e gidilir; fallback yoksa
+    ``FixtureMissError`` verilir.
+    """
+
+    name = 'replay'
+
+    def __init__(self, path: Union[str, Path],
+                 fallback: Optional[ParserBackend] = None,
+                 match_processors: bool = False):
+        self.path = Path(path)
+        self.fallback = fallback
+        self.match_processors = match_processors
+        documents = load_parse_fixtures(self.path)
+
+        by_processors: Dict[Optional[str], List[ParsedDocument]] = {}
+        for doc in documents:
+            by_processors.setdefault(doc.processors, []).append(doc)
+        self._exact = {procs: FixturePipeline(docs) for procs, docs in by_processors.items()}
+        self._any = FixturePipeline(documents)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"ReplayBackend({str(self.path)!r}, documents={len(self._any.documents)})"
+
+    def parse(self, text: str, processors: Optional[str] = None, lang: str = DEFAULT_LANG) -> Any:
+        candidates = [self._exact.get(processors)]
+        if not self.match_processors:
+            candidates.append(self._any)
+        for pipeline in candidates:
+            if pipeline is None:
+                continue
+            doc = pipeline.lookup(text)
+            if doc is not None:
+                self.hits += 1
+                return doc
+
+        self.misses += 1
+        if self.fallback is not None:
+            return self.fallback.parse(text, processors, lang)
+        raise FixtureMissError(
+            f"No recorded parse for {text!r} (processors={processors!r}) in {self.path}. "
+            f"Record it with {PARSER_ENV_VAR}=record:{self.path}"
+        )
+
+
+# ========== AKTİF BACKEND ==========
+
+def backend_from_spec(spec: str) -> ParserBackend:
+    """
+    ``TURKISH_ANALYZER_PARSER`` biçimindeki tanımdan backend oluştur
+
+    'stanza' | 'record:<yol>' | 'replay:<yol>' | 'replay-record:<yol>'
+    """
+    mode, _, path = spec.partition(':')
+    mode = mode.strip().lower()
+    if mode in ('', 'stanza'):
+        return StanzaBackend()
+    if not path:
+        raise ValueError(f"{PARSER_ENV_VAR}={spec!r}: '{mode}' mode needs a fixture path ('{mode}:<path>')")
+    if mode == 'record':
+        return RecordingBackend(path, autosave=True)
+    if mode == 'replay':
+        return ReplayBackend(path)
+    if mode == 'replay-record':
+        recorder = RecordingBackend(path, autosave=True)
+        if not Path(path).exists():
+            return recorder
+        return ReplayBackend(path, fallback=recorder)
+    raise ValueError(f"Unknown parser backend mode: {mode!r}")
+
+
+_backend: ParserBackend = backend_from_spec(os.environ.get(PARSER_ENV_VAR, 'stanza'))
+
+
+def set_parser_backend(backend: ParserBackend) -> ParserBackend:
+    """
+    Aktif backend'i değiştir
+
+    Returns:
+        Önceki backend (geri yüklemek için)
+    """
+    global _backend
+    previous = _backend
+    _backend = backend
+    return previous
+
+
+def get_parser_backend() -> ParserBackend:
+    return _backend
+
+
+def parse(text: str, processors: Optional[str] = None, lang: str = DEFAULT_LANG) -> Any:
+    """Metni aktif backend ile parse et (Stanza Document arayüzü)"""
+    return _backend.parse(text, processors, lang)
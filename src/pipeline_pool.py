@@ -0,0 +1,494 @@
+"""
+Stanza Pipeline Havuzu - Thread-safe Erişim
+===========================================
+
+Stanza pipeline'ları eşzamanlı çağrılar için güvenli değildir ve ilk yükleme
+(torch + model ağırlıkları) saniyeler sürer. Bu modül her (dil, processor seti)
+için sınırlı sayıda pipeline örneği tutan bir havuz sağlar:
+
+- Tek seferlik, kilit korumalı başlatma (aynı anda iki thread model yüklemez)
+- Model eksikse ``stanza.download`` süreç başına yalnızca bir kez çağrılır
+- checkout/checkin API'si ile her pipeline aynı anda tek bir çağırana verilir
+- ``warmup()`` ile deploy sonrası modeller önceden yüklenir (cold start yok)
+- Offline mod: model eksikse indirmeye çalışmadan hemen hata verir
+
+Kullanım:
+    from src.pipeline_pool import get_pipeline_pool, configure_pipeline_pools
+
+    # Threaded web sunucusu için 4 eşzamanlı pipeline
+    configure_pipeline_pools(size=4)
+
+    pool = get_pipeline_pool('tokenize,pos,lemma,depparse')
+    with pool.pipeline() as nlp:
+        doc = nlp("Kuşlar uçar.")
+
+    # Kısa yol: havuz doğrudan çağrılabilir (checkout → parse → checkin)
+    doc = pool("Kuşlar uçtu.")
+
+    # Servis açılışında: tüm kayıtlı pipeline'ları yükle ve ısıt
+    report = warmup()
+    assert report["ready"]
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.instrumentation import instrument_stanza_pipeline, stage
+
+DEFAULT_LANG = 'tr'
+
+# Havuz başına varsayılan pipeline sayısı (TURKISH_ANALYZER_POOL_SIZE ile değiştirilebilir)
+DEFAULT_POOL_SIZE = max(1, int(os.environ.get('TURKISH_ANALYZER_POOL_SIZE', '1')))
+
+# Offline mod: model eksikse indirme yapma, hemen hata ver (TURKISH_ANALYZER_OFFLINE=1)
+_offline_mode = os.environ.get('TURKISH_ANALYZER_OFFLINE', '').lower() not in ('', '0', 'false', 'no')
+
+# Warmup sırasında çalıştırılan kalibrasyon cümleleri (torch kernel'leri ısınsın diye
+# farklı uzunluk ve yapılarda: -DIK, aorist, geçmiş zaman, copula)
+CALIBRATION_SENTENCES = [
+    "Ali'nin okuduğu kitap burada.",
+    "Kuşlar uçar.",
+    "Ali sabahları erken kalkar.",
+    "Bu kız yarın bize gelecek ve annesinin yaptığı yemeği getirecek.",
+]
+
+# (lang, processors) → pipeline nesnesi üreten fonksiyon
+PipelineFactory = Callable[[str, Optional[str]], Any]
+
+# stanza.download süreç başına dil başına bir kez
+_download_lock = threading.Lock()
+_downloaded_langs: Set[str] = set()
+
+
+class ModelNotAvailableError(RuntimeError):
+    """Offline modda model dosyaları bulunamadı"""
+
+
+def set_offline_mode(enabled: bool) -> None:
+    """Offline modu aç/kapat (açıkken ``stanza.download`` hiç çağrılmaz)"""
+    global _offline_mode
+    _offline_mode = bool(enabled)
+
+
+def is_offline_mode() -> bool:
+    return _offline_mode
+
+
+def _download_model(lang: str) -> None:
+    """Model dosyalarını indir (eşzamanlı çağrılar tek indirmeye indirgenir)"""
+    with _download_lock:
+        if lang in _downloaded_langs:
+            return
+        import stanza
+        stanza.download(lang)
+        _downloaded_langs.add(lang)
+
+
+def build_stanza_pipeline(lang: str, processors: Optional[str]) -> Any:
+    """
+    Varsayılan factory: Stanza pipeline'ı oluştur, model yoksa indir
+
+    Args:
+        lang: Dil kodu ('tr')
+        processors: Virgülle ayrılmış processor listesi, None ise Stanza varsayılanı
+    """
+    try:
+        import stanza
+    except ImportError:
+        raise ImportError("Stanza kurulu değil. Yüklemek için: pip install stanza")
+
+    kwargs: Dict[str, Any] = {'verbose': False}
+    if processors:
+        kwargs['processors'] = processors
+
+    if _offline_mode:
+        # resources.json dahil hiçbir şey indirilmesin
+        kwargs['download_method'] = None
+        try:
+            return instrument_stanza_pipeline(stanza.Pipeline(lang, **kwargs))
+        except Exception as e:
+            raise ModelNotAvailableError(
+                f"Stanza '{lang}' modeli yüklenemedi (offline mod, indirme kapalı): {e}. "
+                f"Önceden indirmek için: python -c \"import stanza; stanza.download('{lang}')\""
+            ) from e
+
+    try:
+        nlp = stanza.Pipeline(lang, **kwargs)
+    except Exception:
+        # Model yoksa indir (diğer thread'ler indirme bitene kadar kilitte bekler)
+        _download_model(lang)
+        nlp = stanza.Pipeline(lang, **kwargs)
+    # Processor başına süre (stanza.tokenize, stanza.depparse ...) - kapalıyken no-op
+    return instrument_stanza_pipeline(nlp)
+
+
+class PipelinePool:
+    """
+    Sınırlı sayıda pipeline örneği tutan thread-safe havuz
+
+    Örnekler ihtiyaç oldukça (lazy) ``size`` sınırına kadar oluşturulur.
+    Oluşturma işlemi kilit altında sıralı yapılır; böylece aynı anda birden
+    fazla torch modeli belleğe yüklenmez. Boşta örnek yoksa ``checkout``
+    bir örnek geri verilene kadar bekler.
+    """
+
+    def __init__(self,
+                 lang: str = DEFAULT_LANG,
+                 processors: Optional[str] = None,
+                 size: int = DEFAULT_POOL_SIZE,
+                 factory: Optional[PipelineFactory] = None):
+        if size < 1:
+            raise ValueError(f"Pool size must be >= 1, got {size}")
+        self.lang = lang
+        self.processors = processors
+        self._size = size
+        self._factory: PipelineFactory = factory or build_stanza_pipeline
+        self._idle: 'queue.LifoQueue[Any]' = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()        # _created / _size sayacı
+        self._build_lock = threading.Lock()  # pipeline oluşturma (sıralı yükleme)
+        self.load_seconds: List[float] = []  # Her pipeline'ın yükleme süresi
+        self.warmed = False
+        self._waiting = 0                    # Boşta pipeline bekleyen çağıran sayısı
+
+    def __repr__(self):
+        return (f"PipelinePool({self.lang}, processors={self.processors!r}, "
+                f"size={self._size}, created={self._created})")
+
+    @property
+    def size(self) -> int:
+        """Havuzun izin verdiği en fazla pipeline sayısı"""
+        return self._size
+
+    @property
+    def created(self) -> int:
+        """Şu ana kadar oluşturulmuş (canlı) pipeline sayısı"""
+        return self._created
+
+    @property
+    def available(self) -> int:
+        """Boşta bekleyen pipeline sayısı"""
+        return self._idle.qsize()
+
+    @property
+    def waiting(self) -> int:
+        """Pipeline boşa çıkmasını bekleyen çağıran sayısı (kuyruk derinliği)"""
+        return self._waiting
+
+    def _build(self) -> Any:
+        with self._build_lock:
+            start = time.perf_counter()
+            nlp = self._factory(self.lang, self.processors)
+            self.load_seconds.append(time.perf_counter() - start)
+            return nlp
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """
+        Havuzdan bir pipeline al (kullanım sonrası ``checkin`` zorunlu)
+
+        Args:
+            timeout: Boşta pipeline beklenecek en fazla süre (saniye), None = sınırsız
+
+        Raises:
+            TimeoutError: ``timeout`` içinde pipeline boşa çıkmazsa
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self._size
+            if can_create:
+                self._created += 1
+
+        if can_create:
+            try:
+                return self._build()
+            except BaseException:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        with self._lock:
+            self._waiting += 1
+        try:
+            # Kuyruk beklemesi hesaplamadan ayrı ölçülür (aşama süresi / tracing span'i)
+            with stage("pipeline_wait"):
+                return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No idle pipeline in {self!r} after {timeout} seconds"
+            )
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def checkin(self, pipeline: Any) -> None:
+        """Pipeline'ı havuza geri ver"""
+        with self._lock:
+            if self._created > self._size:
+                # Havuz küçültülmüş: fazla örneği bırak
+                self._created -= 1
+                return
+        self._idle.put(pipeline)
+
+    @contextmanager
+    def pipeline(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """``with pool.pipeline() as nlp:`` - checkout/checkin'i otomatik yap"""
+        nlp = self.checkout(timeout)
+        try:
+            yield nlp
+        finally:
+            self.checkin(nlp)
+
+    def __call__(self, text: str) -> Any:
+        """Metni havuzdaki bir pipeline ile parse et"""
+        with self.pipeline() as nlp:
+            return nlp(text)
+
+    def warmup(self, calibration_sentences: Sequence[str] = CALIBRATION_SENTENCES,
+               fill: bool = True) -> Dict[str, Any]:
+        """
+        Pipeline'ları önceden yükle ve kalibrasyon cümleleriyle ısıt
+
+        Args:
+            calibration_sentences: Her pipeline üzerinde bir kez parse edilecek cümleler
+            fill: True ise havuz ``size`` örneğe kadar doldurulur, False ise tek örnek
+
+        Returns:
+            {"processors", "instances", "load_seconds", "calibration_seconds", "ready"}
+        """
+        target = self._size if fill else 1
+        held = []
+        calibration_seconds = 0.0
+        try:
+            # Hepsini aynı anda checkout et ki yeni örnekler oluşturulsun
+            # Beklemesiz checkout: boşta örnek yoksa ve yenisi oluşturulamıyorsa
+            # kalanlar başka çağıranlar tarafından kullanımda demektir
+            while len(held) < target:
+                try:
+                    held.append(self.checkout(timeout=0))
+                except TimeoutError:
+                    break
+            for nlp in held:
+                start = time.perf_counter()
+                for sentence in calibration_sentences:
+                    nlp(sentence)
+                calibration_seconds += time.perf_counter() - start
+        finally:
+            for nlp in held:
+                self.checkin(nlp)
+        self.warmed = True
+        return {
+            "processors": self.processors,
+            "instances": self._created,
+            "load_seconds": round(sum(self.load_seconds), 4),
+            "calibration_seconds": round(calibration_seconds, 4),
+            "ready": self.is_ready(),
+        }
+
+    def is_ready(self) -> bool:
+        """En az bir pipeline yüklenmiş ve ısıtılmış mı?"""
+        return self.warmed and self._created > 0
+
+    def resize(self, size: int) -> None:
+        """
+        Havuz boyutunu değiştir
+
+        Büyütme hemen etkili olur; küçültmede fazla örnekler geri verildikçe bırakılır.
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be >= 1, got {size}")
+        with self._lock:
+            self._size = size
+        # Boştaki fazla örnekleri hemen bırak
+        while True:
+            with self._lock:
+                if self._created <= self._size:
+                    break
+                try:
+                    self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                self._created -= 1
+
+    def clear(self) -> None:
+        """Boştaki tüm pipeline'ları bırak (kullanımdakiler checkin'de bırakılmaz)"""
+        self.warmed = False
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._created -= 1
+
+
+# ========== HAVUZ KAYDI (process-wide) ==========
+
+_pools: Dict[Tuple[str, Optional[str]], PipelinePool] = {}
+_pools_lock = threading.Lock()
+_pool_size = DEFAULT_POOL_SIZE
+_pool_factory: PipelineFactory = build_stanza_pipeline
+
+# API modüllerinin kullandığı (lang, processors) setleri - warmup() bunları yükler
+_configured: List[Tuple[str, Optional[str]]] = []
+
+
+def register_pipeline(processors: Optional[str] = None, lang: str = DEFAULT_LANG) -> None:
+    """
+    Bir processor setini warmup listesine ekle (model yüklemez)
+
+    API modülleri import sırasında kendi setlerini kaydeder.
+    """
+    key = (lang, processors)
+    with _pools_lock:
+        if key not in _configured:
+            _configured.append(key)
+
+
+def get_pipeline_pool(processors: Optional[str] = None, lang: str = DEFAULT_LANG) -> PipelinePool:
+    """
+    (lang, processors) için paylaşılan havuzu döndür
+
+    Havuz nesnesi ucuzdur; model ilk ``checkout``'ta yüklenir.
+    """
+    key = (lang, processors)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = PipelinePool(lang, processors, size=_pool_size, factory=_pool_factory)
+                _pools[key] = pool
+                if key not in _configured:
+                    _configured.append(key)
+    return pool
+
+
+def configure_pipeline_pools(size: Optional[int] = None,
+                             factory: Optional[PipelineFactory] = None) -> None:
+    """
+    Tüm havuzların ayarlarını değiştir
+
+    Args:
+        size: Havuz başına pipeline sayısı (mevcut havuzlar yeniden boyutlanır)
+        factory: Pipeline üreticisi (değişirse mevcut havuzlar sıfırlanır).
+            Varsayılana dönmek için ``build_stanza_pipeline`` verin.
+    """
+    global _pool_size, _pool_factory
+    with _pools_lock:
+        if size is not None:
+            if size < 1:
+                raise ValueError(f"Pool size must be >= 1, got {size}")
+            _pool_size = size
+            for pool in _pools.values():
+                pool.resize(size)
+        if factory is not None and factory is not _pool_factory:
+            _pool_factory = factory
+            for pool in _pools.values():
+                pool.clear()
+            _pools.clear()
+
+
+def reset_pipeline_pools() -> None:
+    """Tüm havuzları boşalt ve kaydı temizle (testler için)"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.clear()
+        _pools.clear()
+
+
+# ========== WARMUP & READINESS ==========
+
+def warmup(processor_sets: Optional[Sequence[Optional[str]]] = None,
+           calibration_sentences: Sequence[str] = CALIBRATION_SENTENCES,
+           fill: bool = True,
+           lang: str = DEFAULT_LANG) -> Dict[str, Any]:
+    """
+    Tüm yapılandırılmış pipeline'ları önceden yükle (deploy sonrası cold start'ı önler)
+
+    Servis açılışında, ilk kullanıcı isteğinden önce çağrılmalıdır. Bir havuzun
+    yüklenmesi başarısız olursa diğerleri yine denenir; hata raporda görünür.
+
+    Args:
+        processor_sets: Yüklenecek processor setleri (None = kayıtlı tüm setler)
+        calibration_sentences: Her pipeline'da çalıştırılacak kalibrasyon cümleleri
+        fill: Havuzları ``size`` örneğe kadar doldur
+        lang: ``processor_sets`` verildiğinde kullanılacak dil
+
+    Returns:
+        {
+            "ready": bool,
+            "offline": bool,
+            "total_seconds": float,
+            "pools": [{"processors", "instances", "load_seconds",
+                       "calibration_seconds", "ready", "error"?}]
+        }
+    """
+    if processor_sets is None:
+        with _pools_lock:
+            keys = list(_configured)
+    else:
+        keys = [(lang, processors) for processors in processor_sets]
+
+    start = time.perf_counter()
+    pools_report = []
+    for key_lang, processors in keys:
+        pool = get_pipeline_pool(processors, key_lang)
+        try:
+            pools_report.append(pool.warmup(calibration_sentences, fill=fill))
+        except Exception as e:
+            pools_report.append({
+                "processors": processors,
+                "instances": pool.created,
+                "load_seconds": round(sum(pool.load_seconds), 4),
+                "calibration_seconds": 0.0,
+                "ready": False,
+                "error": f"{type(e).__name__}: {e}",
+            })
+
+    return {
+        "ready": bool(pools_report) and all(p["ready"] for p in pools_report),
+        "offline": _offline_mode,
+        "total_seconds": round(time.perf_counter() - start, 4),
+        "pools": pools_report,
+    }
+
+
+def readiness() -> Dict[str, Any]:
+    """
+    Readiness probe: kayıtlı tüm pipeline'lar yüklenip ısıtıldı mı?
+
+    Model yüklemez; sadece mevcut durumu raporlar (health endpoint için ucuz).
+    """
+    with _pools_lock:
+        keys = list(_configured)
+        pools = [(key, _pools.get(key)) for key in keys]
+
+    report = []
+    for (key_lang, processors), pool in pools:
+        report.append({
+            "lang": key_lang,
+            "processors": processors,
+            "instances": pool.created if pool else 0,
+            "available": pool.available if pool else 0,
+            "waiting": pool.waiting if pool else 0,
+            "load_seconds": round(sum(pool.load_seconds), 4) if pool else 0.0,
+            "ready": pool.is_ready() if pool else False,
+        })
+    return {
+        "ready": bool(report) and all(p["ready"] for p in report),
+        "offline": _offline_mode,
+        "pools": report,
+    }
+
+
+def is_ready() -> bool:
+    """Tüm kayıtlı pipeline'lar kullanıma hazır mı?"""
+    return readiness()["ready"]
@@ -21,11 +21,32 @@ Teorik Temel:
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-# Module-level cache for Stanza pipeline to avoid attaching attributes to functions
-_stanza_nlp: Optional[Any] = None
+from src.pipeline_pool import register_pipeline
+from src.parser_backend import parse
+from src.instrumentation import stage
+from src.rule_profiler import count_rule, register_rule_methods
+
+# analyze_sentence_with_stanza Stanza'nın varsayılan processor setini kullanır
+register_pipeline()
+
+# Önermesel değer sabitleri. SYNTHETIC_* import sırasında _PROPOSITIONAL_VALUES
+# tablosuna gömülür (runtime değişikliği etkisizdir); sonuç cache'i bunların
+# etkili değerlerini ``propositional_value_signature`` ile okur.
+SYNTHETIC_VERIFIABLE = 0.7        # Sentetik önerme: bağlama bağlı
+SYNTHETIC_FALSIFIABLE = 0.7
+SYNTHETIC_ASSERTIVE_VALUE = 0.8
+COPULA_VERIFIABILITY = 0.7        # Copula cümlesi (VERB yok): sentetik varsayım
+FALLBACK_VERIFIABILITY = 0.5      # Semantik analiz hatası
+
+# Her çağrıda modül üzerinden okunan sabitler (sonuç cache'i parmak izine katar)
+PROPOSITIONAL_CONSTANTS = (
+    'COPULA_VERIFIABILITY',
+    'FALLBACK_VERIFIABILITY',
+)
 
 
 class PropositionType(Enum):
@@ -64,9 +85,15 @@ class SemanticFeatures:
     semantically_definite: bool      # Anlamsal belirlilik (alıcı için kimliklendirme)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PropositionalValue:
-    """Önermesel değer"""
+    """
+    Önermesel değer (değişmez)
+    
+    ``calculate_propositional_value`` olası her girdi için önceden üretilmiş
+    paylaşılan örnekleri döndürür; değiştirmek yerine ``dataclasses.replace``
+    kullanın.
+    """
     proposition_type: PropositionType
     predicate_type: PredicateType
     sentence_type: SentenceType
@@ -81,6 +108,90 @@ class PropositionalValue:
     generic: bool               # Generic encoding?
     
     explanation: str
+    
+    @cached_property
+    def _dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.proposition_type.value,
+            'predicate_type': self.predicate_type.value,
+            'sentence_type': self.sentence_type.value,
+            'verifiable': self.verifiable,
+            'falsifiable': self.falsifiable,
+            'assertive_value': self.assertive_value,
+            'time_bound': self.time_bound,
+            'generic': self.generic,
+            'explanation': self.explanation
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Analiz çıktısındaki ``propositional_value`` biçimi (örnek başına bir kez üretilir, kopya döner)"""
+        return dict(self._dict)
+
+
+class MarkerTable:
+    """
+    Özellik anahtarlı marker tablosu: ``'tense=past'`` → (öncelik, aile, marker)
+    
+    Gruplar öncelik sırasıyla verilir; grup içinde liste sırası korunur.
+    ``resolve`` feats'in her ``Anahtar=Değer`` çiftine bir kez bakar (O(özellik))
+    ve en yüksek öncelikli eşleşmeyi döndürür. Çok değerli özellikler
+    (``PronType=Dem,Prs``) değer başına ayrı çift olarak aranır.
+    
+    Feats dizgilerinin çeşitliliği küçüktür (birkaç yüz); ``lookup`` ham
+    dizge başına sonucu saklar, tekrar eden feats tek dict okumasıdır.
+    """
+    
+    MAX_CACHED_FEATS = 4096
+    
+    __slots__ = ('_entries', '_cache')
+    
+    def __init__(self, groups: Sequence[Tuple[str, Sequence[str]]]):
+        entries: Dict[str, Tuple[int, str, str, str]] = {}
+        rank = 0
+        for family, markers in groups:
+            for marker in markers:
+                key = marker.lower()
+                if '=' not in key:
+                    raise ValueError(f"marker must be a Feature=Value pair, got {marker!r}")
+                # Aynı marker iki ailede varsa önceki (daha öncelikli) kazanır;
+                # son alan kural profili satır adı
+                entries.setdefault(key, (rank, family, marker, f"{family}:{marker}"))
+                rank += 1
+        self._entries = entries
+        self._cache: Dict[str, Optional[Tuple[str, str, str]]] = {}
+    
+    def resolve(self, feats_lower: str) -> Optional[Tuple[str, str, str]]:
+        """Küçük harfli feats için en öncelikli (aile, marker, kural adı), yoksa None"""
+        entries = self._entries
+        best = None
+        for pair in feats_lower.split('|'):
+            hit = entries.get(pair)
+            if hit is None:
+                if ',' not in pair:
+                    continue
+                name, _, values = pair.partition('=')
+                for value in values.split(','):
+                    candidate = entries.get(f"{name}={value}")
+                    if candidate is not None and (hit is None or candidate[0] < hit[0]):
+                        hit = candidate
+                if hit is None:
+                    continue
+            if best is None or hit[0] < best[0]:
+                best = hit
+        return best[1:] if best is not None else None
+    
+    def lookup(self, feats: str) -> Optional[Tuple[str, str, str]]:
+        """Ham feats dizgesi için ``resolve`` sonucu (dizge başına saklanır)"""
+        cache = self._cache
+        try:
+            return cache[feats]
+        except KeyError:
+            pass
+        result = self.resolve(feats.lower())
+        if len(cache) >= self.MAX_CACHED_FEATS:
+            cache.clear()
+        cache[feats] = result
+        return result
 
 
 class TurkishPropositionAnalyzer:
@@ -125,6 +236,66 @@ class TurkishPropositionAnalyzer:
         'PronType=Dem',     # İşaret zamiri (bu, şu, o)
     ]
     
+    # Derlenmiş tablolar (compile_markers): (kaynak imzası, yüklem tablosu,
+    # özgüllük tablosu); parçalı > bütüncül önceliği. Tek atamayla değişir.
+    _MARKER_TABLES: Tuple[Tuple[Tuple[Sequence[str], int], ...], MarkerTable, MarkerTable]
+    
+    MARKER_FAMILIES = ('PARTITIVE_MARKERS', 'HOLISTIC_MARKERS', 'SPECIFICITY_MARKERS')
+    
+    @classmethod
+    def compile_markers(cls) -> None:
+        """
+        Marker listelerini lookup tablolarına derle
+        
+        Sınıf tanımında ve ``register_markers`` ile çağrılır. Bir liste doğrudan
+        değiştirilirse (yeni liste veya farklı uzunluk) ilk kullanımda
+        kendiliğinden yeniden derlenir; aynı uzunlukta yerinde değişiklikten
+        sonra elle çağrılmalıdır.
+        """
+        cls._MARKER_TABLES = (
+            cls._marker_sources(),
+            MarkerTable([
+                ('PARTITIVE_MARKERS', cls.PARTITIVE_MARKERS),
+                ('HOLISTIC_MARKERS', cls.HOLISTIC_MARKERS),
+            ]),
+            MarkerTable([
+                ('SPECIFICITY_MARKERS', cls.SPECIFICITY_MARKERS),
+            ]),
+        )
+    
+    @classmethod
+    def _marker_sources(cls) -> Tuple[Tuple[Sequence[str], int], ...]:
+        return tuple((markers, len(markers))
+                     for markers in (cls.PARTITIVE_MARKERS, cls.HOLISTIC_MARKERS, cls.SPECIFICITY_MARKERS))
+    
+    @classmethod
+    def _marker_tables(cls) -> Tuple[MarkerTable, MarkerTable]:
+        sources, predicate_table, specificity_table = cls._MARKER_TABLES
+        for (compiled, length), markers in zip(sources, (cls.PARTITIVE_MARKERS, cls.HOLISTIC_MARKERS,
+                                                         cls.SPECIFICITY_MARKERS)):
+            if compiled is not markers or length != len(markers):
+                cls.compile_markers()
+                _, predicate_table, specificity_table = cls._MARKER_TABLES
+                break
+        return predicate_table, specificity_table
+    
+    @classmethod
+    def register_markers(cls, family: str, markers: Sequence[str], prepend: bool = False) -> None:
+        """
+        Runtime'da marker ekle ve tabloları yeniden derle
+        
+        Args:
+            family: 'PARTITIVE_MARKERS' | 'HOLISTIC_MARKERS' | 'SPECIFICITY_MARKERS'
+            markers: ``Anahtar=Değer`` biçiminde UD özellikleri (ör. 'Mood=Gen')
+            prepend: Aile içinde mevcut marker'lardan önce (daha öncelikli) ekle
+        """
+        if family not in cls.MARKER_FAMILIES:
+            raise ValueError(f"family must be one of {cls.MARKER_FAMILIES}, got {family!r}")
+        current = list(getattr(cls, family))
+        added = [marker for marker in markers if marker not in current]
+        setattr(cls, family, added + current if prepend else current + added)
+        cls.compile_markers()
+    
     def analyze_predicate_type(self, verb_feats: str) -> PredicateType:
         """
         Yüklem tipini belirle
@@ -135,19 +306,14 @@ class TurkishPropositionAnalyzer:
         Parçalı yüklem: Zamanda bir noktaya oturur, özgül
         Örnek: "Ali dün erken kalktı" (olay)
         """
-        feats_lower = verb_feats.lower() if verb_feats else ""
-        
-        # Parçalı yüklem kontrol (öncelik: zaman belirtici)
-        for marker in self.PARTITIVE_MARKERS:
-            if marker.lower() in feats_lower:
-                return PredicateType.PARTITIVE
-        
-        # Bütüncül yüklem kontrol
-        for marker in self.HOLISTIC_MARKERS:
-            if marker.lower() in feats_lower:
-                return PredicateType.HOLISTIC
+        # Parçalı marker'lar bütüncüllerden önceliklidir (zaman belirtici)
+        hit = self._marker_tables()[0].lookup(verb_feats) if verb_feats else None
+        if hit is not None:
+            count_rule(hit[2], True)
+            return PredicateType.PARTITIVE if hit[0] == 'PARTITIVE_MARKERS' else PredicateType.HOLISTIC
         
         # Default: Belirsiz
+        count_rule('predicate_type.default_holistic', True)
         return PredicateType.HOLISTIC  # Conservative
     
     def analyze_specificity(self, noun_feats: str, word: str, upos: str = "") -> SemanticFeatures:
@@ -164,11 +330,10 @@ class TurkishPropositionAnalyzer:
         word_lower = word.lower()
         
         # Özgüllük
-        specific = False
-        for marker in self.SPECIFICITY_MARKERS:
-            if marker.lower() in feats_lower:
-                specific = True
-                break
+        hit = self._marker_tables()[1].lookup(noun_feats) if noun_feats else None
+        specific = hit is not None
+        if hit is not None:
+            count_rule(hit[2], True)
         
         # Özel adlar → özgül (UPOS=PROPN ile kontrol et, büyük harf heuristic KALDIRILDI)
         if upos == 'PROPN':
@@ -185,6 +350,7 @@ class TurkishPropositionAnalyzer:
             'case=nom' in feats_lower and
             not specific  # Zaten demonstrative vs ile işaretlenmemişse
         )
+        count_rule('specificity.bare_plural_generic', is_bare_plural)
         if is_bare_plural:
             specific = False
         
@@ -221,47 +387,91 @@ class TurkishPropositionAnalyzer:
         
         Analitik önerme: verifiable=1.0, falsifiable=1.0 (mutlak doğru/yanlış)
         Sentetik önerme: verifiable<1.0, falsifiable<1.0 (bağlama bağlı)
-        """
-        # Soru, istek, hayret → önerme değil
-        if sentence_type in [SentenceType.QUESTION, SentenceType.REQUEST, SentenceType.EXCLAMATION]:
-            return PropositionalValue(
-                proposition_type=PropositionType.NON_PROPOSITIONAL,
-                predicate_type=predicate_type,
-                sentence_type=sentence_type,
-                verifiable=0.0,
-                falsifiable=0.0,
-                assertive_value=0.0,
-                time_bound=False,
-                generic=False,
-                explanation="Soru/İstek/Hayret tümcelerinin bildirim değeri yok"
-            )
-        
-        # Analitik önerme: Bütüncül yüklem + generic subject
-        if predicate_type == PredicateType.HOLISTIC and not subject_features.specific:
-            return PropositionalValue(
-                proposition_type=PropositionType.ANALYTIC,
-                predicate_type=predicate_type,
-                sentence_type=SentenceType.PROPERTY,
-                verifiable=1.0,
-                falsifiable=1.0,
-                assertive_value=1.0,
-                time_bound=False,
-                generic=True,
-                explanation="Analitik önerme: Genel-geçer, bütüncül yüklem"
-            )
         
-        # Sentetik önerme: Parçalı yüklem veya özgül subject
+        Sonuç yalnızca (yüklem tipi, özne özgüllüğü, tümce tipi) üçlüsüne
+        bağlıdır; olası 24 değer import sırasında üretilir ve paylaşılır.
+        """
+        value, rule = _PROPOSITIONAL_VALUES[(predicate_type, subject_features.specific, sentence_type)]
+        count_rule(rule, True)
+        return value
+
+
+def _compute_propositional_value(predicate_type: PredicateType,
+                                 specific: bool,
+                                 sentence_type: SentenceType) -> Tuple[PropositionalValue, str]:
+    """Önermesel değer ve kural profili dal adı (tablo üretimi için)"""
+    # Soru, istek, hayret → önerme değil
+    if sentence_type in [SentenceType.QUESTION, SentenceType.REQUEST, SentenceType.EXCLAMATION]:
         return PropositionalValue(
-            proposition_type=PropositionType.SYNTHETIC,
+            proposition_type=PropositionType.NON_PROPOSITIONAL,
             predicate_type=predicate_type,
-            sentence_type=SentenceType.EVENT if predicate_type == PredicateType.PARTITIVE else SentenceType.HABITUAL,
-            verifiable=0.7,   # Bağlama bağlı
-            falsifiable=0.7,
-            assertive_value=0.8,
-            time_bound=predicate_type == PredicateType.PARTITIVE,
+            sentence_type=sentence_type,
+            verifiable=0.0,
+            falsifiable=0.0,
+            assertive_value=0.0,
+            time_bound=False,
             generic=False,
-            explanation="Sentetik önerme: Zamana gönderimli, parçalı yüklem"
-        )
+            explanation="Soru/İstek/Hayret tümcelerinin bildirim değeri yok"
+        ), 'proposition.non_propositional'
+    
+    # Analitik önerme: Bütüncül yüklem + generic subject
+    if predicate_type == PredicateType.HOLISTIC and not specific:
+        return PropositionalValue(
+            proposition_type=PropositionType.ANALYTIC,
+            predicate_type=predicate_type,
+            sentence_type=SentenceType.PROPERTY,
+            verifiable=1.0,
+            falsifiable=1.0,
+            assertive_value=1.0,
+            time_bound=False,
+            generic=True,
+            explanation="Analitik önerme: Genel-geçer, bütüncül yüklem"
+        ), 'proposition.analytic'
+    
+    # Sentetik önerme: Parçalı yüklem veya özgül subject
+    return PropositionalValue(
+        proposition_type=PropositionType.SYNTHETIC,
+        predicate_type=predicate_type,
+        sentence_type=SentenceType.EVENT if predicate_type == PredicateType.PARTITIVE else SentenceType.HABITUAL,
+        verifiable=SYNTHETIC_VERIFIABLE,
+        falsifiable=SYNTHETIC_FALSIFIABLE,
+        assertive_value=SYNTHETIC_ASSERTIVE_VALUE,
+        time_bound=predicate_type == PredicateType.PARTITIVE,
+        generic=False,
+        explanation="Sentetik önerme: Zamana gönderimli, parçalı yüklem"
+    ), 'proposition.synthetic'
+
+
+# (yüklem tipi, özne özgül mü, tümce tipi) → (paylaşılan değer, profil dal adı)
+_PROPOSITIONAL_VALUES: Dict[Tuple[PredicateType, bool, SentenceType], Tuple[PropositionalValue, str]] = {
+    (predicate_type, specific, sentence_type): _compute_propositional_value(predicate_type, specific, sentence_type)
+    for predicate_type in PredicateType
+    for specific in (False, True)
+    for sentence_type in SentenceType
+}
+
+
+
+def propositional_value_signature() -> List[Tuple[float, float, float]]:
+    """Paylaşılan değer tablosunun sayısal alanları (verifiable, falsifiable, assertive)"""
+    return [(value.verifiable, value.falsifiable, value.assertive_value)
+            for value, _ in _PROPOSITIONAL_VALUES.values()]
+
+
+TurkishPropositionAnalyzer.compile_markers()
+
+# Kural profili (src.rule_profiler) açıkken ölçülen metodlar
+register_rule_methods(TurkishPropositionAnalyzer, 'analyzer', [
+    'analyze_predicate_type',
+    'analyze_specificity',
+    'calculate_propositional_value',
+])
+
+
+# Analyzer durumsuzdur; tüm çağrılar aynı örneği paylaşır
+_ANALYZER = TurkishPropositionAnalyzer()
+
+_DEMONSTRATIVES = ('bu', 'şu', 'o')
 
 
 def analyze_sentence_with_stanza(sentence: str) -> Dict[str, Any]:
@@ -274,32 +484,17 @@ def analyze_sentence_with_stanza(sentence: str) -> Dict[str, Any]:
     Returns:
         Önermesel analiz sonuçları
     """
+    # Aktif parser backend (Stanza varsayılan processor'ları). Stanza kurulu mu
+    # kontrolü backend'e bırakılır: replay modunda stanza olmadan da çalışır.
     try:
-        import stanza
+        with stage("semantics_reparse"):
+            doc = parse(sentence)
     except ImportError:
         return {
             'error': 'Stanza not installed. Run: pip install stanza',
             'sentence': sentence
         }
     
-    # Stanza pipeline (lazy load)
-    import os
-    global _stanza_nlp
-    if _stanza_nlp is None:
-        print("Stanza Turkish model yükleniyor...")
-        try:
-            _stanza_nlp = stanza.Pipeline('tr', verbose=False)
-        except:
-            print("Model bulunamadı. İndiriliyor: stanza.download('tr')")
-            stanza.download('tr')
-            _stanza_nlp = stanza.Pipeline('tr', verbose=False)
-    
-    nlp = _stanza_nlp
-    doc = nlp(sentence)
-    
-    analyzer = TurkishPropositionAnalyzer()
-    results = []
-    
     # doc may be a Stanza Document with .sentences or already a list of sentences;
     # handle both cases to avoid attribute errors from type checkers.
     if isinstance(doc, list):
@@ -309,103 +504,115 @@ def analyze_sentence_with_stanza(sentence: str) -> Dict[str, Any]:
         # and fall back to wrapping doc in a list if needed.
         sentences = getattr(doc, 'sentences', [doc])
     
-    for sent in sentences:
-        # Ana yüklemi bul
-        main_verb = None
-        subject = None
+    return {
+        'sentence': sentence,
+        'analyses': [analysis for analysis in analyze_propositions_batch(sentences) if analysis is not None]
+    }
+
+
+def analyze_propositions_batch(sentences: Iterable[Any]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Parse edilmiş cümlelerin önermesel analizi (yeniden parse yok)
+    
+    Her cümlede kelimeler tek geçişte taranır: kök fiil, özne ve
+    head → ilk ``det`` indeksi birlikte çıkarılır; özne determiner'ı
+    indeksten okunur. Tüm cümleler paylaşılan analyzer örneğini kullanır.
+    
+    Args:
+        sentences: ``.text`` ve ``.words`` alanları olan cümleler (Stanza
+                   Sentence, ``ParsedSentence``)
         
-        for word in sent.words:
-            if word.deprel == 'root' and word.upos == 'VERB':
+    Returns:
+        Girdiyle hizalı liste: ``analyze_sentence_with_stanza`` ``analyses``
+        öğesi biçiminde dict, kök fiili olmayan cümle için None
+    """
+    return [_analyze_parsed_sentence(sent) for sent in sentences]
+
+
+def _analyze_parsed_sentence(sent: Any) -> Optional[Dict[str, Any]]:
+    # Tek geçiş: son root VERB, son nsubj, her head için ilk det
+    main_verb = None
+    subject = None
+    first_det: Dict[int, Any] = {}
+    for word in sent.words:
+        deprel = word.deprel
+        if deprel == 'root':
+            if word.upos == 'VERB':
                 main_verb = word
-            if word.deprel == 'nsubj':
-                subject = word
-        
-        if not main_verb:
-            continue
-        
-        # Yüklem tipi analizi
-        predicate_type = analyzer.analyze_predicate_type(main_verb.feats or "")
+        elif deprel == 'nsubj':
+            subject = word
+        elif deprel == 'det' and word.head not in first_det:
+            first_det[word.head] = word
+    
+    if not main_verb:
+        return None
+    
+    analyzer = _ANALYZER
+    
+    # Yüklem tipi analizi
+    predicate_type = analyzer.analyze_predicate_type(main_verb.feats or "")
+    
+    # Özne özellikleri
+    subject_features = SemanticFeatures(
+        specific=False,
+        existential=False,
+        definite=False,
+        singular=True,
+        morphologically_definite=False,
+        semantically_definite=False
+    )
+    
+    if subject:
+        # Öznenin determiner'ı (demonstratives için)
+        subject_determiner = first_det.get(subject.id)
         
-        # Özne özellikleri
-        subject_features = SemanticFeatures(
-            specific=False,
-            existential=False,
-            definite=False,
-            singular=True,
-            morphologically_definite=False,
-            semantically_definite=False
+        # Demonstrative varsa özneyi +belirli, +özgül olarak işaretle
+        has_demonstrative = (
+            subject_determiner is not None and
+            subject_determiner.text.lower() in _DEMONSTRATIVES
         )
         
-        if subject:
-            # Öznenin determiner'ını kontrol et (demonstratives için)
-            subject_determiner = None
-            for word in sent.words:
-                if word.deprel == 'det' and word.head == subject.id:
-                    subject_determiner = word
-                    break
-            
-            # Demonstrative varsa özneyi +belirli, +özgül olarak işaretle
-            has_demonstrative = (
-                subject_determiner and 
-                subject_determiner.text.lower() in ['bu', 'şu', 'o']
-            )
-            
-            subject_features = analyzer.analyze_specificity(
-                subject.feats or "",
-                subject.text,
-                subject.upos
-            )
-            
-            # Demonstrative bilgisini ekle
-            if has_demonstrative:
-                subject_features.specific = True
-                subject_features.definite = True
-                subject_features.semantically_definite = True
-                subject_features.existential = True
-        
-        # Tümce tipi (basit sınıflandırma)
-        sentence_type = SentenceType.PROPERTY if predicate_type == PredicateType.HOLISTIC else SentenceType.EVENT
-        
-        # Önermesel değer hesapla
-        prop_value = analyzer.calculate_propositional_value(
-            predicate_type,
-            subject_features,
-            sentence_type
+        subject_features = analyzer.analyze_specificity(
+            subject.feats or "",
+            subject.text,
+            subject.upos
         )
         
-        results.append({
-            'sentence': sent.text,
-            'main_verb': {
-                'text': main_verb.text,
-                'lemma': main_verb.lemma,
-                'feats': main_verb.feats,
-                'predicate_type': predicate_type.value
-            },
-            'subject': {
-                'text': subject.text if subject else None,
-                'features': {
-                    'specific': subject_features.specific,
-                    'existential': subject_features.existential,
-                    'definite': subject_features.definite,
-                    'singular': subject_features.singular
-                }
-            } if subject else None,
-            'propositional_value': {
-                'type': prop_value.proposition_type.value,
-                'predicate_type': prop_value.predicate_type.value,
-                'sentence_type': prop_value.sentence_type.value,
-                'verifiable': prop_value.verifiable,
-                'falsifiable': prop_value.falsifiable,
-                'assertive_value': prop_value.assertive_value,
-                'time_bound': prop_value.time_bound,
-                'generic': prop_value.generic,
-                'explanation': prop_value.explanation
-            }
-        })
+        # Demonstrative bilgisini ekle
+        if has_demonstrative:
+            subject_features.specific = True
+            subject_features.definite = True
+            subject_features.semantically_definite = True
+            subject_features.existential = True
+    
+    # Tümce tipi (basit sınıflandırma)
+    sentence_type = SentenceType.PROPERTY if predicate_type == PredicateType.HOLISTIC else SentenceType.EVENT
+    
+    # Önermesel değer hesapla
+    prop_value = analyzer.calculate_propositional_value(
+        predicate_type,
+        subject_features,
+        sentence_type
+    )
     
     return {
-        'sentence': sentence,
-        'analyses': results
+        'sentence': sent.text,
+        'main_verb': {
+            'text': main_verb.text,
+            'lemma': main_verb.lemma,
+            'feats': main_verb.feats,
+            'predicate_type': predicate_type.value
+        },
+        'subject': {
+            'text': subject.text,
+            'features': {
+                'specific': subject_features.specific,
+                'existential': subject_features.existential,
+                'definite': subject_features.definite,
+                'singular': subject_features.singular
+            }
+        } if subject else None,
+        'propositional_value': prop_value.to_dict()
     }
 
 
@@ -0,0 +1,293 @@
+"""
+Kural İsabet Profili (Rule Hit-Rate Profiler)
+=============================================
+
+Hangi kuralların gerçek trafikte tetiklendiğini ve her birinin ne kadar
+süre harcadığını ölçer; kural/marker sıralamasını ve budamayı veriye
+dayandırmak için.
+
+Üç tür satır toplanır:
+- Kural metodları (``detector.detect_noun_verb_confusion``,
+  ``analyzer.analyze_predicate_type`` ...): değerlendirme, eşleşme
+  (sonuç boş değil) ve kümülatif süre. ``register_rule_methods`` ile
+  kaydedilen metodlar profil açıkken sarılır, kapatılınca geri yüklenir
+  (kapalıyken ek maliyet yok).
+- Dallar (``noun_verb.lexicalized_mA``, ``noun_verb.no_verbal_features`` ...):
+  kural içindeki kararların kaç kez değerlendirildiği / tetiklendiği.
+- Marker'lar (``LEXICALIZED_mA:yüzme`` ...): ``find_marker`` ile taranan
+  listedeki her girdinin kaç kez denendiği, kaç kez kararı verdiği ve süresi.
+  Liste ilk eşleşmede durduğu için değerlendirme sayısı sıralamanın etkisini
+  de gösterir. Derlenmiş marker tablolarında (``PARTITIVE_MARKERS:Tense=Past``
+  ...) yalnızca kararı veren marker sayılır.
+
+Süreler kapsayıcıdır (inclusive): ``detect_noun_verb_confusion`` içinden
+çağrılan ``analyze_predicate_type`` süresi iki satırda da görünür.
+Cümle sonucu cache'inden dönen cümleler kural çalıştırmadığı için sayılmaz.
+
+Kullanım:
+    from src.rule_profiler import profile_rules
+
+    with profile_rules() as profiler:
+        for text in corpus:
+            analyze_text(text, use_cache=False)
+    print(profiler.format_report())
+    profiler.write_report("rule_profile.json")
+
+Ortam değişkeni (import sırasında okunur; rapor süreç sonunda yazılır):
+    TURKISH_ANALYZER_RULE_PROFILE=rule_profile.json   # .json dışı uzantı → metin tablo
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+RULE_PROFILE_ENV_VAR = 'TURKISH_ANALYZER_RULE_PROFILE'
+
+SORT_KEYS = ('seconds', 'evaluations', 'matches', 'match_rate', 'rule')
+
+
+class RuleStats:
+    """Tek bir kural/dal/marker satırı"""
+
+    __slots__ = ('evaluations', 'matches', 'seconds')
+
+    def __init__(self):
+        self.evaluations = 0
+        self.matches = 0
+        self.seconds = 0.0
+
+
+class RuleProfiler:
+    """Kural adı → değerlendirme / eşleşme / kümülatif süre (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rules: Dict[str, RuleStats] = {}
+
+    def record(self, rule: str, matched: bool, seconds: float = 0.0) -> None:
+        with self._lock:
+            stats = self.rules.get(rule)
+            if stats is None:
+                stats = self.rules[rule] = RuleStats()
+            stats.evaluations += 1
+            if matched:
+                stats.matches += 1
+            stats.seconds += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self.rules.clear()
+
+    def find_marker(self, family: str, markers: Sequence[str], text: str, prefix: bool,
+                    keys: Tuple[str, ...]) -> Optional[str]:
+        for marker, key in zip(markers, keys):
+            start = time.perf_counter()
+            hit = text.startswith(key) if prefix else key in text
+            self.record(f"{family}:{marker}", hit, time.perf_counter() - start)
+            if hit:
+                return marker
+        return None
+
+    def report(self, sort_by: str = 'seconds') -> List[Dict[str, Any]]:
+        """
+        Sıralı rapor satırları
+
+        Args:
+            sort_by: 'seconds' | 'evaluations' | 'matches' | 'match_rate' | 'rule'
+                     (ad dışındakiler büyükten küçüğe)
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {SORT_KEYS}, got {sort_by!r}")
+        with self._lock:
+            items = [(name, s.evaluations, s.matches, s.seconds) for name, s in self.rules.items()]
+
+        rows = []
+        for name, evaluations, matches, seconds in items:
+            rows.append({
+                "rule": name,
+                "evaluations": evaluations,
+                "matches": matches,
+                "match_rate": round(matches / evaluations, 4) if evaluations else 0.0,
+                "seconds": round(seconds, 6),
+                "mean_us": round(seconds / evaluations * 1e6, 3) if evaluations else 0.0,
+            })
+        if sort_by == 'rule':
+            rows.sort(key=lambda row: row["rule"])
+        else:
+            rows.sort(key=lambda row: (-row[sort_by], row["rule"]))
+        return rows
+
+    def format_report(self, sort_by: str = 'seconds') -> str:
+        """İnsan okunur tablo"""
+        rows = self.report(sort_by)
+        width = max([len("rule")] + [len(row["rule"]) for row in rows])
+        lines = [
+            f"{'rule':<{width}}  {'evals':>9}  {'matches':>9}  {'rate':>7}  {'total ms':>10}  {'mean us':>9}",
+            "-" * (width + 56),
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['rule']:<{width}}  {row['evaluations']:>9}  {row['matches']:>9}  "
+                f"{row['match_rate']:>7.2%}  {row['seconds'] * 1000:>10.3f}  {row['mean_us']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def write_report(self, path: str, sort_by: str = 'seconds') -> str:
+        """Raporu yaz (.json → JSON satırları, diğerleri → metin tablo)"""
+        if path.endswith('.json'):
+            payload = json.dumps({"sort_by": sort_by, "rules": self.report(sort_by)},
+                                 ensure_ascii=False, indent=2)
+        else:
+            payload = self.format_report(sort_by) + "\n"
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        return path
+
+
+# ========== AKTİF PROFİL ==========
+
+_active: Optional[RuleProfiler] = None
+_registered: List[Tuple[type, str, str]] = []
+_patched: List[Tuple[type, str, Callable]] = []
+
+
+def register_rule_methods(cls: type, prefix: str, names: Sequence[str]) -> None:
+    """
+    Profil açıkken sarılacak kural metodlarını kaydet (rapor adı ``<prefix>.<metod>``)
+
+    Kural modülleri sınıf tanımından hemen sonra çağırır; profil o anda
+    açıksa (ör. ortam değişkeniyle) metodlar hemen sarılır.
+    """
+    for name in names:
+        entry = (cls, name, f"{prefix}.{name}")
+        if entry not in _registered:
+            _registered.append(entry)
+            if _active is not None:
+                _patch(*entry)
+
+
+def _patch(cls: type, name: str, rule: str) -> None:
+    original = cls.__dict__[name]
+    _patched.append((cls, name, original))
+    setattr(cls, name, _wrap(original, rule))
+
+
+def _wrap(method: Callable, rule: str) -> Callable:
+    def profiled(*args, **kwargs):
+        start = time.perf_counter()
+        result = method(*args, **kwargs)
+        profiler = _active
+        if profiler is not None:
+            profiler.record(rule, bool(result), time.perf_counter() - start)
+        return result
+
+    profiled.__wrapped__ = method  # type: ignore[attr-defined]
+    profiled.__name__ = method.__name__
+    profiled.__doc__ = method.__doc__
+    return profiled
+
+
+def enable_rule_profiling(profiler: Optional[RuleProfiler] = None) -> RuleProfiler:
+    """
+    Kural profilini aç (zaten açıksa mevcut profil döner)
+
+    Args:
+        profiler: Sayaçların yazılacağı profil (None → yeni profil)
+    """
+    global _active
+    if _active is not None:
+        return _active
+    _active = profiler or RuleProfiler()
+    for entry in _registered:
+        _patch(*entry)
+    return _active
+
+
+def disable_rule_profiling() -> Optional[RuleProfiler]:
+    """Profili kapat, kural metodlarını geri yükle; kapanan profili döndür"""
+    global _active
+    profiler, _active = _active, None
+    while _patched:
+        cls, name, original = _patched.pop()
+        setattr(cls, name, original)
+    return profiler
+
+
+def get_rule_profiler() -> Optional[RuleProfiler]:
+    return _active
+
+
+def rule_profiling_active() -> bool:
+    return _active is not None
+
+
+@contextmanager
+def profile_rules(profiler: Optional[RuleProfiler] = None) -> Iterator[RuleProfiler]:
+    """Blok boyunca kural profilini aç"""
+    already_active = _active is not None
+    active = enable_rule_profiling(profiler)
+    try:
+        yield active
+    finally:
+        if not already_active:
+            disable_rule_profiling()
+
+
+# ========== KURAL İÇİ KANCALAR ==========
+
+def count_rule(rule: str, matched: bool) -> None:
+    """Kural içindeki bir dalın değerlendirildiğini say (profil kapalıysa no-op)"""
+    profiler = _active
+    if profiler is not None:
+        profiler.record(rule, matched)
+
+
+def marker_keys(markers: Sequence[str]) -> Tuple[str, ...]:
+    """``find_marker`` için küçük harfli anahtarlar (tablo kaydında bir kez üretilir)"""
+    return tuple(marker.lower() for marker in markers)
+
+
+def find_marker(family: str,
+                markers: Sequence[str],
+                text: str,
+                prefix: bool = False,
+                keys: Optional[Tuple[str, ...]] = None) -> Optional[str]:
+    """
+    ``markers`` listesinde ``text`` içinde (``prefix=True`` ise başında)
+    geçen ilk girdiyi döndür; karşılaştırma küçük harfle yapılır
+
+    Profil açıkken her girdi ``<family>:<marker>`` satırına sayılır.
+
+    Args:
+        keys: ``marker_keys(markers)`` - sıcak yolda her çağrıda küçük harfe
+              çevirmemek için kural tablosu kaydında önceden hesaplanır
+    """
+    if keys is None:
+        keys = marker_keys(markers)
+    profiler = _active
+    if profiler is not None:
+        return profiler.find_marker(family, markers, text, prefix, keys)
+    if prefix and not text.startswith(keys):
+        return None   # Tek C çağrısıyla ıskalama (çoğu kelime)
+    for marker, key in zip(markers, keys):
+        if text.startswith(key) if prefix else key in text:
+            return marker
+    return None
+
+
+def _write_env_report(path: str) -> None:
+    profiler = _active
+    if profiler is not None and profiler.rules:
+        profiler.write_report(path)
+
+
+_env_report_path = os.environ.get(RULE_PROFILE_ENV_VAR, '')
+if _env_report_path:
+    enable_rule_profiling()
+    atexit.register(_write_env_report, _env_report_path)
@@ -0,0 +1,241 @@
+"""
+İstatistiksel Örnekleyici (Sampling Profiler)
+=============================================
+
+Harici profiler bağlamadan sıcak yolu görmek için saf Python örnekleyici.
+Belirli aralıklarla çağrı yığını örneklenir ve flamegraph araçlarının
+(flamegraph.pl, speedscope, inferno) okuduğu "collapsed stack" biçiminde
+yazılır::
+
+    benchmarks.suite:main;api.pos_semantic_analyzer:analyze_text;... 42
+
+İki mod vardır:
+- ``signal``: ``SIGPROF`` + ``setitimer(ITIMER_PROF)``; süreç CPU zamanıyla
+  ana thread'i örnekler. Yükü en düşük moddur; yalnızca ana thread'den ve
+  POSIX'te başlatılabilir (toplu iş / CLI için).
+- ``thread``: arka plan thread'i duvar saati aralığıyla tüm thread'lerin
+  yığınını okur (``sys._current_frames``). Servis içinde, istek thread'lerini
+  görmek için; beklemedeki thread'ler de örneklenir. Kök çerçeve thread adıdır.
+
+C kodunda (Stanza/torch) geçen süre, onu çağıran Python çerçevesine yazılır.
+
+Kullanım:
+    from src.sampling_profiler import SamplingProfiler
+
+    with SamplingProfiler(interval=0.005) as profiler:
+        run_corpus()
+    profiler.write_collapsed("profile.folded")   # flamegraph.pl profile.folded > out.svg
+
+    # Canlı servis: metrics sunucusunda profil uç noktası
+    start_metrics_server(port=9464, profiling=True)
+    # curl 'http://127.0.0.1:9464/debug/profile?seconds=30' > profile.folded
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_INTERVAL = 0.005   # 5 ms (≈200 örnek/sn)
+MAX_DEPTH = 128
+MODES = ('signal', 'thread')
+
+# Yığın anahtarı: kökten yaprağa (thread adı veya None, code nesneleri)
+StackKey = Tuple[Any, ...]
+
+
+def _module_name(filename: str) -> str:
+    """Dosya yolundan kısa modül adı (repo içi: api.batch, site-packages: stanza.pipeline.core)"""
+    path = filename.replace('\\', '/')
+    if path.endswith('.py'):
+        path = path[:-3]
+    for marker in ('/site-packages/', '/dist-packages/'):
+        if marker in path:
+            return path.split(marker, 1)[1].replace('/', '.')
+    parts = path.split('/')
+    for anchor in ('api', 'src', 'error_detection', 'benchmarks', 'tests'):
+        if anchor in parts:
+            return '.'.join(parts[len(parts) - 1 - parts[::-1].index(anchor):])
+    return parts[-1]
+
+
+def _frame_label(code: Any) -> str:
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{_module_name(code.co_filename)}:{name}"
+
+
+def signal_mode_available() -> bool:
+    """Bu thread'den ve platformda signal modu kullanılabilir mi?"""
+    return hasattr(signal, 'SIGPROF') and threading.current_thread() is threading.main_thread()
+
+
+class SamplingProfiler:
+    """
+    Collapsed stack üreten örnekleyici
+
+    Args:
+        interval: Örnekleme aralığı (saniye)
+        mode: 'signal' | 'thread' | None (ana thread'de ve POSIX'te signal, aksi halde thread)
+        all_threads: thread modunda tüm thread'ler (False → yalnızca ana thread)
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL,
+                 mode: Optional[str] = None,
+                 all_threads: bool = True):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if mode is None:
+            mode = 'signal' if signal_mode_available() else 'thread'
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        self.interval = interval
+        self.mode = mode
+        self.all_threads = all_threads
+        self.samples: Counter = Counter()
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self._previous_handler: Any = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._exclude: set = set()
+
+    # ---------- örnekleme ----------
+
+    @staticmethod
+    def _stack(frame: Any, root: Optional[str] = None) -> StackKey:
+        codes = []
+        while frame is not None and len(codes) < MAX_DEPTH:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return (root, *codes)
+
+    def _on_signal(self, signum: int, frame: Any) -> None:
+        if frame is not None:
+            self.samples[self._stack(frame)] += 1
+
+    def _sample_threads(self) -> None:
+        own = threading.get_ident()
+        main = threading.main_thread().ident
+        names = {t.ident: t.name for t in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own or ident in self._exclude or (not self.all_threads and ident != main):
+                    continue
+                self.samples[self._stack(frame, names.get(ident) or f"thread-{ident}")] += 1
+            if len(names) != threading.active_count():
+                names = {t.ident: t.name for t in threading.enumerate()}
+
+    # ---------- yaşam döngüsü ----------
+
+    def start(self) -> 'SamplingProfiler':
+        if self.started_at is not None:
+            raise RuntimeError("profiler already running")
+        self.started_at = time.perf_counter()
+        if self.mode == 'signal':
+            if not signal_mode_available():
+                raise RuntimeError("signal mode needs SIGPROF and must start from the main thread")
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample_threads,
+                                            name='sampling-profiler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> 'SamplingProfiler':
+        if self.started_at is None:
+            return self
+        if self.mode == 'signal':
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        else:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+        self.duration += time.perf_counter() - self.started_at
+        self.started_at = None
+        return self
+
+    def __enter__(self) -> 'SamplingProfiler':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # ---------- çıktı ----------
+
+    @property
+    def total_samples(self) -> int:
+        return sum(self.samples.values())
+
+    def collapsed(self) -> List[str]:
+        """Collapsed stack satırları ("kök;...;yaprak sayı"), sayıya göre azalan"""
+        merged: Counter = Counter()
+        for key, count in self.samples.items():
+            root, codes = key[0], key[1:]
+            labels = [_frame_label(code) for code in codes]
+            if root is not None:
+                labels.insert(0, root)
+            merged[";".join(labels)] += count
+        return [f"{stack} {count}" for stack, count in sorted(merged.items(), key=lambda kv: (-kv[1], kv[0]))]
+
+    def write_collapsed(self, path: str) -> str:
+        """Collapsed stack dosyasını yaz (flamegraph.pl / speedscope girdisi)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def top_functions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        En çok örneklenen fonksiyonlar
+
+        ``self``: yığının yaprağında olduğu örnekler, ``inclusive``: yığında
+        herhangi bir yerde olduğu örnekler (özyinelemede bir kez sayılır).
+        """
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for key, count in self.samples.items():
+            codes = key[1:]
+            if not codes:
+                continue
+            own[_frame_label(codes[-1])] += count
+            for label in {_frame_label(code) for code in codes}:
+                inclusive[label] += count
+        total = self.total_samples or 1
+        rows = []
+        for label, count in inclusive.most_common(limit):
+            rows.append({
+                "function": label,
+                "inclusive": count,
+                "inclusive_ratio": round(count / total, 4),
+                "self": own.get(label, 0),
+                "self_ratio": round(own.get(label, 0) / total, 4),
+            })
+        return rows
+
+
+def sample_for(seconds: float, interval: float = DEFAULT_INTERVAL,
+               all_threads: bool = True) -> SamplingProfiler:
+    """
+    Çalışan süreci ``seconds`` boyunca thread modunda örnekle (çağıran bekler)
+
+    Canlı servisin istek thread'lerini görmek içindir; bekleyen çağıran
+    thread örneklere dahil edilmez.
+    """
+    profiler = SamplingProfiler(interval=interval, mode='thread', all_threads=all_threads)
+    profiler._exclude.add(threading.get_ident())
+    profiler.start()
+    try:
+        time.sleep(seconds)
+    finally:
+        profiler.stop()
+    return profiler
@@ -0,0 +1,195 @@
+"""
+Hızlı JSON Serileştirme (JSON Lines)
+====================================
+
+Analiz sonuçlarını doğrudan byte olarak, kompakt JSON ve JSON Lines
+biçiminde yazar. ``json.dumps(result, indent=2, ensure_ascii=False)`` büyük
+toplu işlerde kural katmanları kadar zaman alır; burada:
+
+- ``orjson`` kuruluysa kullanılır (opsiyonel, ``pip install orjson``)
+- Değilse ayarlı stdlib yolu: tek ``JSONEncoder`` örneği, C hızlandırıcı,
+  girintisiz ayırıcılar, ``check_circular=False``, UTF-8 (ASCII kaçışı yok)
+- ``Enum`` değerleri (``POSErrorType``, ``PredicateType`` ...) ara dönüşüm
+  yapılmadan kodlayıcı içinde ``.value`` olarak yazılır; ``to_dict()``
+  metodu olan nesneler (``PropositionalValue``, ``LazyAnalysis``) o
+  metodun çıktısıyla yazılır
+
+İki kodlayıcının çıktısı ``analyze_text`` sonuçları için (str anahtarlar,
+sonlu float'lar) byte byte aynıdır. Farklar:
+
+- str olmayan anahtarlar (int, float, bool, None) ikisinde de str'ye çevrilir
+  (orjson'a ``OPT_NON_STR_KEYS`` verilir)
+- NaN/Infinity: stdlib ``ValueError`` verir (geçersiz JSON yazılmaz),
+  orjson ``null`` yazar
+- Üslü float'lar: stdlib ``1e+20``, orjson ``1e20`` yazar (aynı değer)
+
+Kullanım:
+    from src.serialization import dumps, write_jsonl, JsonlWriter
+
+    payload = dumps(analyze_text(text))             # bytes
+    write_jsonl(results, sys.stdout.buffer)         # satır başına bir sonuç
+
+    with JsonlWriter("sonuc.jsonl") as writer:
+        for document in documents:
+            writer.write(document)
+
+Ortam değişkeni (import sırasında okunur):
+    TURKISH_ANALYZER_JSON=json     # orjson kurulu olsa da stdlib yolunu kullan
+"""
+
+import json
+import os
+from enum import Enum
+from typing import Any, BinaryIO, Callable, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # opsiyonel bağımlılık
+    orjson = None
+
+JSON_ENCODER_ENV_VAR = 'TURKISH_ANALYZER_JSON'
+ENCODERS = ('orjson', 'json')
+
+# Yazıcı tamponu: bu boyutu aşınca akışa boşaltılır
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def _default(obj: Any) -> Any:
+    """JSON'a doğrudan girmeyen değerler (Enum → value, to_dict() → dict)"""
+    if isinstance(obj, Enum):
+        return obj.value
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_STDLIB_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    separators=(',', ':'),
+    check_circular=False,
+    allow_nan=False,
+    default=_default,
+)
+
+
+def _dumps_stdlib(obj: Any) -> bytes:
+    return _STDLIB_ENCODER.encode(obj).encode('utf-8')
+
+
+def _dumps_orjson(obj: Any) -> bytes:
+    # Dataclass'lar da to_dict() üzerinden, int anahtarlar str'ye: iki yolun çıktısı aynı kalsın
+    return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+
+_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+_dumps: Callable[[Any], bytes] = _dumps_stdlib
+_encoder = 'json'
+
+
+def encoder(name: Optional[str] = None) -> Callable[[Any], bytes]:
+    """
+    Adı verilen kodlayıcının ``dumps`` fonksiyonu (etkin kodlayıcıyı değiştirmez)
+
+    Args:
+        name: 'orjson' | 'json' | None (None → orjson kuruluysa orjson)
+    """
+    if name is None:
+        name = 'orjson' if orjson is not None else 'json'
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown JSON encoder {name!r}; expected one of {ENCODERS}")
+    if name == 'orjson':
+        if orjson is None:
+            raise ImportError("orjson is not installed. Run: pip install orjson")
+        return _dumps_orjson
+    return _dumps_stdlib
+
+
+def set_encoder(name: Optional[str] = None) -> str:
+    """
+    Etkin kodlayıcıyı seç (bkz. ``encoder``)
+
+    Returns:
+        Etkin kodlayıcının adı
+    """
+    global _dumps, _encoder
+    _dumps = encoder(name)
+    _encoder = 'orjson' if _dumps is _dumps_orjson else 'json'
+    return _encoder
+
+
+def encoder_name() -> str:
+    return _encoder
+
+
+def dumps(obj: Any) -> bytes:
+    """Kompakt JSON, UTF-8 byte olarak"""
+    return _dumps(obj)
+
+
+def write_jsonl(records: Iterable[Any], stream: BinaryIO) -> int:
+    """
+    Kayıtları JSON Lines olarak ikili akışa yaz
+
+    Returns:
+        Yazılan kayıt sayısı
+    """
+    encode = _dumps
+    count = 0
+    chunk = []
+    size = 0
+    for record in records:
+        line = encode(record)
+        chunk.append(line)
+        size += len(line) + 1
+        count += 1
+        if size >= DEFAULT_BUFFER_SIZE:
+            stream.write(b'\n'.join(chunk) + b'\n')
+            chunk = []
+            size = 0
+    if chunk:
+        stream.write(b'\n'.join(chunk) + b'\n')
+    return count
+
+
+class JsonlWriter:
+    """
+    Satır satır JSON Lines yazıcı (dosya yolu veya ikili akış)
+
+    Yol verilirse dosya yazıcı tarafından açılır ve ``close`` ile kapanır;
+    akış verilirse yalnızca boşaltılır.
+    """
+
+    def __init__(self, target: Union[str, os.PathLike, BinaryIO]):
+        if isinstance(target, (str, os.PathLike)):
+            self._stream: BinaryIO = open(target, 'wb')
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+        self.records = 0
+
+    def write(self, record: Any) -> None:
+        self._stream.write(_dumps(record) + b'\n')
+        self.records += 1
+
+    def write_all(self, records: Iterable[Any]) -> int:
+        written = write_jsonl(records, self._stream)
+        self.records += written
+        return written
+
+    def close(self) -> None:
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+    def __enter__(self) -> 'JsonlWriter':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+set_encoder(os.environ.get(JSON_ENCODER_ENV_VAR) or None)
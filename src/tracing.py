@@ -0,0 +1,279 @@
+"""
+İzleme Span'leri (Tracing) ve Korelasyon Kimlikleri
+===================================================
+
+Bir dokümanı toplu iş → cümle → aşama (parse, detect_errors, semantics ...)
+boyunca izlemek için hafif span'ler. SDK gerektirmez; span'ler
+OpenTelemetry veri modeline uygun alanlarla (trace_id, span_id,
+parent_span_id, start/end_time_unix_nano, attributes, links, status)
+JSON satırları olarak yerel bir dosyaya yazılır::
+
+    {"trace_id": "4bf9...", "span_id": "00f0...", "parent_span_id": "a3ce...",
+     "name": "detect_errors", "kind": "INTERNAL",
+     "start_time_unix_nano": 1760000000000000000, "end_time_unix_nano": ...,
+     "attributes": {"correlation_ids": ["doc-17"]}, "links": [],
+     "status": {"code": "UNSET"}, "resource": {"service.name": "turkish-analyzer"}}
+
+Tracing açıkken ``src.instrumentation.stage()`` blokları otomatik olarak span
+olur; ayrıca ``span()`` ile istenen blok sarılabilir. Korelasyon kimlikleri
+(``correlation_ids``) üst span'den alt span'lere miras kalır; toplu işte
+birden fazla dokümanın paylaştığı cümlenin span'i hepsinin kimliğini taşır
+ve doküman span'lerine ``links`` ile bağlanır.
+
+Kuyruk bekleme süresi hesaplamadan ayrı görünür: toplu işte her doküman
+span'i ``batch.queue_seconds`` / ``batch.compute_seconds`` niteliklerini,
+pipeline havuzunda boşta örnek beklenen süre ``pipeline_wait`` span'ini taşır.
+
+Kullanım:
+    from src.tracing import JsonlSpanExporter, enable_tracing, span
+
+    enable_tracing(JsonlSpanExporter("traces.jsonl"))
+    analyze_corpus(documents, correlation_ids=["doc-1", "doc-2"])
+
+    with span("request", correlation_ids=["req-42"]):
+        analyze_text(text)
+
+Ortam değişkeni (import sırasında okunur):
+    TURKISH_ANALYZER_TRACE=traces.jsonl
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from src.instrumentation import set_stage_tracer
+
+TRACE_ENV_VAR = 'TURKISH_ANALYZER_TRACE'
+SERVICE_NAME = 'turkish-analyzer'
+
+_NULL_SPAN = nullcontext()
+
+
+class Span:
+    """Tek bir iş birimi (OpenTelemetry span alanlarıyla)"""
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_span_id', 'start_ns', 'end_ns',
+                 'attributes', 'links', 'status', 'status_message', 'correlation_ids',
+                 '_perf_start', '_token')
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str],
+                 correlation_ids: Sequence[str] = (),
+                 attributes: Optional[Dict[str, Any]] = None,
+                 links: Optional[Sequence['Span']] = None,
+                 start_ns: Optional[int] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.links = [(link.trace_id, link.span_id) for link in links or ()]
+        self.status = 'UNSET'
+        self.status_message = ''
+        self.correlation_ids = tuple(correlation_ids)
+        self._perf_start = time.perf_counter_ns()
+        self._token: Any = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, exc: BaseException) -> None:
+        self.status = 'ERROR'
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        attributes = dict(self.attributes)
+        if self.correlation_ids:
+            attributes["correlation_ids"] = list(self.correlation_ids)
+        status: Dict[str, Any] = {"code": self.status}
+        if self.status_message:
+            status["message"] = self.status_message
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": "INTERNAL",
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "attributes": attributes,
+            "links": [{"trace_id": trace_id, "span_id": span_id} for trace_id, span_id in self.links],
+            "status": status,
+            "resource": {"service.name": SERVICE_NAME},
+        }
+
+
+# ========== DIŞA AKTARICILAR ==========
+
+class JsonlSpanExporter:
+    """Biten her span'i bir JSON satırı olarak dosyaya ekle (thread-safe)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class InMemorySpanExporter:
+    """Span'leri listede tut (testler ve programatik inceleme için)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: List[Dict[str, Any]] = []
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span.to_dict())
+
+    def close(self) -> None:
+        pass
+
+
+# ========== AKTİF İZLEYİCİ ==========
+
+_current: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+_exporter: Optional[Any] = None
+
+
+def enable_tracing(exporter: Any) -> None:
+    """Tracing'i aç; biten span'ler ``exporter.export(span)`` ile yazılır"""
+    global _exporter
+    _exporter = exporter
+    set_stage_tracer(_StageTracer)
+
+
+def disable_tracing() -> Optional[Any]:
+    """Tracing'i kapat; kapanan exporter'ı döndür (kapatmak çağırana kalır)"""
+    global _exporter
+    exporter, _exporter = _exporter, None
+    set_stage_tracer(None)
+    return exporter
+
+
+def tracing_active() -> bool:
+    return _exporter is not None
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def set_span_attribute(key: str, value: Any) -> None:
+    """Aktif span'e nitelik ekle (tracing kapalıysa no-op)"""
+    active = _current.get()
+    if active is not None:
+        active.attributes[key] = value
+
+
+def new_span(name: str,
+             parent: Optional[Span] = None,
+             correlation_ids: Optional[Sequence[str]] = None,
+             attributes: Optional[Dict[str, Any]] = None,
+             links: Optional[Sequence[Span]] = None,
+             start_ns: Optional[int] = None) -> Span:
+    """
+    Aktif bağlama geçmeyen span oluştur (bitirmek için ``finish_span``)
+
+    Süresi sonradan bilinen işler (toplu işte doküman span'leri) içindir.
+    ``parent`` verilmezse aktif span kullanılır; o da yoksa yeni trace başlar.
+    Korelasyon kimlikleri verilmezse üst span'den miras alınır.
+    """
+    parent = parent if parent is not None else _current.get()
+    if parent is None:
+        trace_id, parent_id, inherited = secrets.token_hex(16), None, ()
+    else:
+        trace_id, parent_id, inherited = parent.trace_id, parent.span_id, parent.correlation_ids
+    return Span(name, trace_id, parent_id,
+                correlation_ids=inherited if correlation_ids is None else correlation_ids,
+                attributes=attributes, links=links, start_ns=start_ns)
+
+
+def finish_span(span: Span, end_ns: Optional[int] = None) -> None:
+    """Span'i bitir ve dışa aktar (``end_ns`` yoksa başlangıçtan geçen monotonik süre)"""
+    if end_ns is None:
+        end_ns = span.start_ns + (time.perf_counter_ns() - span._perf_start)
+    span.end_ns = end_ns
+    exporter = _exporter
+    if exporter is not None:
+        exporter.export(span)
+
+
+def _start_active(name: str, **kwargs: Any) -> Span:
+    active = new_span(name, **kwargs)
+    active._token = _current.set(active)
+    return active
+
+
+def _end_active(active: Span, error: Optional[BaseException] = None) -> None:
+    if error is not None:
+        active.set_error(error)
+    _current.reset(active._token)
+    finish_span(active)
+
+
+@contextmanager
+def _active_span(name: str, **kwargs: Any) -> Iterator[Span]:
+    active = _start_active(name, **kwargs)
+    error = None
+    try:
+        yield active
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        _end_active(active, error)
+
+
+def span(name: str,
+         correlation_ids: Optional[Sequence[str]] = None,
+         attributes: Optional[Dict[str, Any]] = None,
+         links: Optional[Sequence[Span]] = None):
+    """
+    Bloğu aktif span olarak izle (tracing kapalıysa no-op, ``as`` değeri None)
+
+    Args:
+        correlation_ids: Bu span ve altındakilere iliştirilecek kimlikler
+                         (None → üst span'den miras)
+        attributes: Başlangıç nitelikleri
+        links: İlişkili (üst olmayan) span'ler
+    """
+    if _exporter is None:
+        return _NULL_SPAN
+    return _active_span(name, correlation_ids=correlation_ids, attributes=attributes, links=links)
+
+
+class _StageTracer:
+    """``src.instrumentation`` aşamalarını span'e çeviren köprü"""
+
+    start = staticmethod(_start_active)
+    end = staticmethod(_end_active)
+
+
+def _close_env_exporter() -> None:
+    exporter = disable_tracing()
+    if exporter is not None:
+        exporter.close()
+
+
+_env_trace_path = os.environ.get(TRACE_ENV_VAR, '')
+if _env_trace_path:
+    import atexit
+
+    enable_tracing(JsonlSpanExporter(_env_trace_path))
+    atexit.register(_close_env_exporter)
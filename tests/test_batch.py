@@ -0,0 +1,153 @@
+"""
+Toplu Analiz / Tekrar Eleme Testleri
+====================================
+
+Stanza gerektirmez: analyze_text yerine çağrıları sayan sahte bir analyzer
+kullanılır.
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from api import batch
+from api.batch import Deduplicator, analyze_corpus, normalize_sentence, split_sentences
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text, include_semantics=True):
+        self.calls.append(text)
+        return {"text": text, "sentences": [{"text": text, "words": []}]}
+
+
+class TestNormalization(unittest.TestCase):
+
+    def test_whitespace_and_punctuation(self):
+        self.assertEqual(normalize_sentence("  Ali’nin   okuduğu kitap burada !!! "),
+                         "Ali'nin okuduğu kitap burada!")
+        self.assertEqual(normalize_sentence("“Kuşlar uçar” dedi."), '"Kuşlar uçar" dedi.')
+
+    def test_case_is_preserved(self):
+        self.assertNotEqual(normalize_sentence("Ali geldi."), normalize_sentence("ali geldi."))
+
+    def test_split_sentences(self):
+        self.assertEqual(split_sentences("Kuşlar uçar.  Ali sabahları erken kalkar! İyi mi?"),
+                         ["Kuşlar uçar.", "Ali sabahları erken kalkar!", "İyi mi?"])
+        self.assertEqual(split_sentences("   "), [])
+
+    def test_split_keeps_abbreviations_and_ordinals(self):
+        self.assertEqual(split_sentences("Dr. Ahmet geldi."), ["Dr. Ahmet geldi."])
+        self.assertEqual(split_sentences("2. Dünya Savaşı bitti. Mustafa K. Atatürk geldi."),
+                         ["2. Dünya Savaşı bitti.", "Mustafa K. Atatürk geldi."])
+        self.assertEqual(split_sentences("M.Ö. 500 yılında yazıldı. Prof. Dr. Ayşe Kaya vb. kişiler okudu."),
+                         ["M.Ö. 500 yılında yazıldı.", "Prof. Dr. Ayşe Kaya vb. kişiler okudu."])
+
+    def test_split_preserves_original_text(self):
+        self.assertEqual(split_sentences(" Ali’nin   kitabı burada.  Kuşlar uçar. "),
+                         ["Ali’nin   kitabı burada.", "Kuşlar uçar."])
+
+
+class TestDeduplicator(unittest.TestCase):
+
+    def test_exact_duplicates(self):
+        dedup = Deduplicator()
+        first = dedup.add("Kuşlar uçar.")
+        second = dedup.add("Kuşlar  uçar .")
+        self.assertEqual(first["unique_id"], second["unique_id"])
+        self.assertEqual(second["duplicate"], "exact")
+        self.assertEqual(dedup.unique, ["Kuşlar uçar."])
+
+    def test_near_duplicates_only_when_enabled(self):
+        a = "Merkez Bankası faiz oranlarını yüzde elli seviyesinde sabit tuttu."
+        b = "Merkez Bankası faiz oranlarını yüzde elli seviyesinde sabit tuttu!"
+
+        exact_only = Deduplicator()
+        exact_only.add(a)
+        self.assertIsNone(exact_only.add(b)["duplicate"])
+
+        near = Deduplicator(near_duplicates=True, threshold=0.8)
+        near.add(a)
+        entry = near.add(b)
+        self.assertEqual(entry["duplicate"], "near")
+        self.assertEqual(entry["unique_id"], 0)
+        self.assertGreaterEqual(entry["similarity"], 0.8)
+
+    def test_different_sentences_not_merged(self):
+        dedup = Deduplicator(near_duplicates=True)
+        dedup.add("Kuşlar uçar.")
+        self.assertIsNone(dedup.add("Ali sabahları erken kalkar.")["duplicate"])
+        self.assertEqual(len(dedup.unique), 2)
+
+
+class TestAnalyzeCorpus(unittest.TestCase):
+
+    def test_each_unique_sentence_analyzed_once(self):
+        analyzer = FakeAnalyzer()
+        documents = [
+            "Kuşlar uçar. Ali sabahları erken kalkar.",
+            "Kuşlar uçar.",
+            "Kuşlar   uçar.  Yüzme havuzu temiz.",
+        ]
+        result = analyze_corpus(documents, analyzer=analyzer)
+
+        self.assertEqual(sorted(analyzer.calls),
+                         sorted(["Kuşlar uçar.", "Ali sabahları erken kalkar.", "Yüzme havuzu temiz."]))
+
+        # Sonuçlar her tekrara dağıtılmalı
+        texts = [[s["text"] for s in d["sentences"]] for d in result["documents"]]
+        self.assertEqual(texts, [
+            ["Kuşlar uçar.", "Ali sabahları erken kalkar."],
+            ["Kuşlar uçar."],
+            ["Kuşlar uçar.", "Yüzme havuzu temiz."],
+        ])
+
+        report = result["report"]
+        self.assertEqual(report["total_sentences"], 5)
+        self.assertEqual(report["unique_sentences"], 3)
+        self.assertEqual(report["exact_duplicates"], 2)
+        self.assertEqual(report["saved_ratio"], 0.4)
+
+    def test_first_original_occurrence_is_analyzed(self):
+        """Normalize hal yalnızca tekrar anahtarı: analyzer özgün metni görmeli"""
+        analyzer = FakeAnalyzer()
+        result = analyze_corpus(["Ali’nin okuduğu kitap burada !", "Ali'nin okuduğu kitap burada!"],
+                                analyzer=analyzer)
+        self.assertEqual(analyzer.calls, ["Ali’nin okuduğu kitap burada !"])
+        self.assertEqual(result["documents"][1]["occurrences"][0]["duplicate"], "exact")
+
+    def test_cli_writes_jsonl(self):
+        analyzer = FakeAnalyzer()
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "girdi.txt")
+            dst = os.path.join(tmp, "cikti.jsonl")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write("Kuşlar uçar.\n\nKuşlar uçar.\n")
+
+            original = batch.analyze_corpus
+            with mock.patch.object(batch, "analyze_corpus",
+                                   lambda docs, **kw: original(docs, analyzer=analyzer, **kw)), \
+                    mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+                self.assertEqual(batch.main([src, "-o", dst, "--no-semantics"]), 0)
+
+            with open(dst, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(analyzer.calls, ["Kuşlar uçar."])
+        self.assertIn("tasarruf: 50%", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
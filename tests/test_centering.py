@@ -0,0 +1,139 @@
+"""
+Merkezleme Kuramı (Centering) Testleri
+======================================
+
+Stanza gerektirmez: kelime listeleri elle yazılır veya kayıtlı parse'lardan
+(ReplayBackend) gelir.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from api.main import detect_centering_errors
+from src.centering import CenteringEngine
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+
+def w(text, pos, dependency, feats="", lemma=None):
+    word = {"text": text, "pos": pos, "dependency": dependency, "feats": feats}
+    if lemma:
+        word["lemma"] = lemma
+    return word
+
+
+AHMET_GITTI = [w("Ahmet", "PROPN", "nsubj"), w("markete", "NOUN", "obl", lemma="market"),
+               w("gitti", "VERB", "root", "Number=Sing|Person=3|Tense=Past")]
+
+
+class TestCenteringEngine(unittest.TestCase):
+
+    def test_readme_example(self):
+        result = detect_centering_errors([
+            {"text": "Ahmet markete gitti.", "words": AHMET_GITTI},
+            {"text": "O süt aldı.", "words": [
+                w("O", "PRON", "nsubj"), w("süt", "NOUN", "obj"), w("aldı", "VERB", "root")]},
+        ])
+        self.assertEqual(result["discourse_score"], 4.0)
+        self.assertEqual(result["transitions"], ["CONTINUE"])
+        self.assertEqual(result["errors"], [])
+        self.assertEqual(result["centers"][1]["cb"], "ahmet")
+
+    def test_zero_subject_from_verb_agreement(self):
+        engine = CenteringEngine()
+        engine.add(AHMET_GITTI)
+        step = engine.add([w("Süt", "NOUN", "obj"), w("aldı", "VERB", "root", "Number=Sing|Person=3|Tense=Past")])
+        self.assertEqual(step["cf"][0], {"entity": "ahmet", "text": "∅", "role": "nsubj"})
+        self.assertEqual(step["transition"], "CONTINUE")
+
+    def test_retain_smooth_and_rough_shift(self):
+        engine = CenteringEngine()
+        engine.add(AHMET_GITTI)
+        # Ayşe onu aradı: Cb = Ahmet (onu), Cp = Ayşe
+        retain = engine.add([w("Ayşe", "PROPN", "nsubj"), w("onu", "PRON", "obj", "Number=Sing|Person=3"),
+                             w("aradı", "VERB", "root")])
+        self.assertEqual((retain["cb"], retain["cp"], retain["transition"]), ("ahmet", "ayşe", "RETAIN"))
+        # Ayşe eve döndü: Cb = Ayşe (değişti) = Cp
+        smooth = engine.add([w("Ayşe", "PROPN", "nsubj"), w("eve", "NOUN", "obl", lemma="ev"),
+                             w("döndü", "VERB", "root")])
+        self.assertEqual(smooth["transition"], "SMOOTH-SHIFT")
+        # Kedi evi dağıtmıştı: Cb = ev (değişti) ≠ Cp (kedi)
+        rough = engine.add([w("Kedi", "NOUN", "nsubj"), w("evi", "NOUN", "obj", "Case=Acc", lemma="ev"),
+                            w("dağıtmıştı", "VERB", "root")])
+        self.assertEqual(rough["transition"], "ROUGH-SHIFT")
+        nocb = engine.add([w("Yağmur", "NOUN", "nsubj"), w("yağdı", "VERB", "root")])
+        self.assertEqual(nocb["transition"], "NO-CB")
+
+        summary = engine.summary()
+        self.assertEqual(summary["transition_counts"], {"CONTINUE": 0, "RETAIN": 1, "SMOOTH-SHIFT": 1,
+                                                        "ROUGH-SHIFT": 1, "NO-CB": 1})
+        self.assertEqual(summary["error_count"], 4)
+        self.assertEqual(summary["discourse_score"], 1.5)
+        self.assertEqual([e["severity"] for e in summary["errors"]], ["low", "medium", "high", "high"])
+        self.assertEqual(summary["errors"][0]["sentence_index"], 1)
+
+    def test_pronoun_number_agreement(self):
+        engine = CenteringEngine()
+        engine.add([w("Çocuklar", "NOUN", "nsubj", "Number=Plur", lemma="çocuk"),
+                    w("kediyi", "NOUN", "obj", "Case=Acc|Number=Sing", lemma="kedi"),
+                    w("sevdi", "VERB", "root")])
+        step = engine.add([w("Onlar", "PRON", "nsubj", "Number=Plur|Person=3"), w("uyudu", "VERB", "root")])
+        self.assertEqual(step["cb"], "çocuk")
+        step = engine.add([w("O", "PRON", "nsubj", "Number=Sing|Person=3"), w("kaçtı", "VERB", "root")])
+        self.assertEqual(step["cf"][0]["entity"], "kedi")
+
+    def test_state_bounded_by_window(self):
+        engine = CenteringEngine(window=2)
+        for _ in range(50):
+            engine.add(AHMET_GITTI)
+        self.assertEqual(len(engine._history), 2)
+        self.assertEqual(engine.summary()["transition_counts"]["CONTINUE"], 49)
+
+    def test_errors_bounded_on_long_stream(self):
+        """Uzun akışta hata kayıtları max_errors ile sınırlı, sayaçlar tam"""
+        engine = CenteringEngine(max_errors=10)
+        rain = [w("Yağmur", "NOUN", "nsubj"), w("yağdı", "VERB", "root")]
+        for i in range(20_000):
+            engine.add(AHMET_GITTI if i % 2 else rain)
+        summary = engine.summary()
+        self.assertEqual(summary["error_count"], 19_999)
+        self.assertEqual(summary["transition_counts"]["NO-CB"], 19_999)
+        self.assertEqual(len(summary["errors"]), 10)
+        self.assertEqual(summary["errors"][-1]["sentence_index"], 19_999)
+        self.assertNotIn("transitions", summary)
+
+
+class TestCenteringPipelines(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_analyze_text_sentences(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        sentences = analyze_text("Kuşlar uçar. Kuşlar uçtu.", use_cache=False)["sentences"]
+        result = detect_centering_errors(sentences)
+        self.assertEqual(result["transitions"], ["CONTINUE"])
+        self.assertEqual(result["centers"][0]["cp"], "kuş")
+
+    def test_batch_centering(self):
+        from api.batch import analyze_corpus
+
+        result = analyze_corpus(["Kuşlar uçar. Kuşlar uçtu.", "Kuşlar uçar."],
+                                include_semantics=False, centering=True)
+        first, second = result["documents"]
+        self.assertEqual(first["centering"]["transitions"], ["CONTINUE"])
+        self.assertEqual(second["centering"]["transitions"], [])
+        self.assertEqual(second["centering"]["discourse_score"], 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Sentetik Derlem Üreteci Testleri
+================================
+
+Stanza gerektirmez: üretilen fixture'lar ReplayBackend ile analiz edilir.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from benchmarks import corpus_generator
+from benchmarks.corpus_generator import CorpusConfig, CorpusGenerator, write_corpus
+from src.parse_fixtures import load_parse_fixtures
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+
+class TestGenerator(unittest.TestCase):
+
+    def test_seed_is_deterministic(self):
+        first = [d.text for d in CorpusGenerator(CorpusConfig(seed=5)).documents(count=20)]
+        second = [d.text for d in CorpusGenerator(CorpusConfig(seed=5)).documents(count=20)]
+        other = [d.text for d in CorpusGenerator(CorpusConfig(seed=6)).documents(count=20)]
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_target_tokens(self):
+        generator = CorpusGenerator(CorpusConfig(seed=1))
+        documents = list(generator.documents(target_tokens=5000))
+        self.assertGreaterEqual(generator.tokens_generated, 5000)
+        self.assertEqual(sum(d.num_tokens for d in documents), generator.tokens_generated)
+
+    def test_trees_are_well_formed(self):
+        config = CorpusConfig(seed=2, clauses_per_sentence={4: 1.0})
+        for doc in CorpusGenerator(config).documents(count=30):
+            for sentence in doc.sentences:
+                words = sentence.words
+                self.assertEqual([w.id for w in words], list(range(1, len(words) + 1)))
+                self.assertEqual(sum(w.head == 0 for w in words), 1)
+                self.assertTrue(all(0 <= w.head <= len(words) and w.head != w.id for w in words))
+                self.assertEqual(sum(w.deprel == 'conj' for w in words), 3)
+                for w in words:
+                    if w.deprel == 'cc':
+                        self.assertEqual(words[w.head - 1].deprel, 'conj')
+
+    def test_phenomenon_rates(self):
+        generator = CorpusGenerator(CorpusConfig(seed=3, phenomena={"dik_relative": 1, "bare_plural_aorist": 3}))
+        list(generator.documents(count=500))
+        rates = {name: data["rate"] for name, data in generator.stats()["phenomena"].items()}
+        self.assertAlmostEqual(rates["bare_plural_aorist"], 0.75, delta=0.05)
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            CorpusConfig(phenomena={"bilinmeyen": 1.0})
+        with self.assertRaises(ValueError):
+            CorpusConfig(clauses_per_sentence={1: 0.0})
+
+
+class TestOutput(unittest.TestCase):
+
+    def test_fixtures_replay_through_analyzer(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        generator = CorpusGenerator(CorpusConfig(seed=4, phenomena={"dik_relative": 1, "ma_nominal": 1}))
+        with tempfile.TemporaryDirectory() as tmp:
+            fixture_path = os.path.join(tmp, "synthetic.json")
+            text_path = os.path.join(tmp, "synthetic.txt")
+            written = write_corpus(generator.documents(count=25), fixture_path, text_path)
+            documents = load_parse_fixtures(fixture_path)
+            lines = Path(text_path).read_text(encoding="utf-8").splitlines()
+
+            self.assertEqual(written, 25)
+            self.assertEqual([d.text for d in documents], lines)
+
+            previous = set_parser_backend(ReplayBackend(fixture_path))
+            try:
+                result = analyze_text(lines[0], use_cache=False)
+            finally:
+                set_parser_backend(previous)
+        self.assertEqual(len(result["sentences"]), len(documents[0].sentences))
+        self.assertTrue(any(s["preferences"] for s in result["sentences"]))
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            text_path = os.path.join(tmp, "out.txt")
+            corpus_generator.main(["--documents", "5", "--seed", "9", "--text", text_path,
+                                   "--clauses", "1:1", "--sentences", "2:1"])
+            lines = Path(text_path).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(all(line.count(".") == 2 for line in lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Varlık İndeksi (Entity Index) Testleri
+======================================
+
+Stanza gerektirmez: kelime listeleri elle yazılır veya kayıtlı parse'lardan
+(ReplayBackend) gelir.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.entity_index import EntityIndex
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+
+def w(text, upos, deprel, feats="", lemma=None):
+    return {"text": text, "upos": upos, "deprel": deprel, "feats": feats, "lemma": lemma or text}
+
+
+AHMET = [w("Ahmet", "PROPN", "nsubj", "Case=Nom|Number=Sing"),
+         w("kitabı", "NOUN", "obj", "Case=Acc|Number=Sing", lemma="kitap"),
+         w("okudu", "VERB", "root")]
+COCUKLAR = [w("Çocuklar", "NOUN", "nsubj", "Case=Nom|Number=Plur", lemma="çocuk"),
+            w("uyudu", "VERB", "root")]
+
+
+class TestEntityIndex(unittest.TestCase):
+
+    def test_mentions_positions_and_status(self):
+        index = EntityIndex()
+        mentions = index.add_sentence(AHMET, {"given_entities": ["kitabı"], "new_entities": ["Ahmet"]})
+        self.assertEqual([(m.text, m.position, m.status, m.discourse_new) for m in mentions],
+                         [("Ahmet", 0, "new", True), ("kitabı", 1, "given", True)])
+        index.add_sentence(COCUKLAR)
+        index.add_sentence([w("Kitap", "NOUN", "nsubj", lemma="kitap"), w("güzel", "ADJ", "root")])
+
+        record = index.get("kitap")
+        self.assertEqual([(m.sentence, m.position) for m in record.mentions], [(0, 1), (2, 0)])
+        self.assertFalse(record.last_mention.discourse_new)
+        self.assertEqual(record.first_sentence, 0)
+        self.assertTrue(index.is_given("ahmet"))
+        self.assertNotIn("okudu", index)
+        self.assertIsNone(index.get("ev"))
+
+    def test_most_recent_with_number(self):
+        index = EntityIndex()
+        index.add_sentence(AHMET)
+        index.add_sentence(COCUKLAR)
+        self.assertEqual(index.most_recent(), "çocuk")
+        self.assertEqual(index.most_recent("Plur"), "çocuk")
+        self.assertEqual(index.most_recent("Sing"), "kitap")
+        # Yeniden anılan varlık en sona taşınır
+        index.add_sentence([w("Ahmet", "PROPN", "nsubj", "Number=Sing"), w("güldü", "VERB", "root")])
+        self.assertEqual(index.most_recent("Sing"), "ahmet")
+        self.assertEqual(list(index), ["kitap", "çocuk", "ahmet"])
+
+    def test_window_eviction(self):
+        index = EntityIndex(window=2)
+        index.add_sentence(AHMET)
+        index.add_sentence(COCUKLAR)
+        index.add_sentence([w("Ahmet", "PROPN", "nsubj"), w("güldü", "VERB", "root")])
+        # 0. cümle pencereden çıktı: kitap tamamen, Ahmet'in eski gönderimi atıldı
+        self.assertNotIn("kitap", index)
+        self.assertEqual([m.sentence for m in index.get("ahmet").mentions], [2])
+        self.assertEqual(index.get("ahmet").mention_count, 2)
+        self.assertEqual(index.stats(), {"sentences": 3, "entities": 2,
+                                         "window_sentences": 2, "evicted_entities": 1})
+
+    def test_max_mentions(self):
+        index = EntityIndex(max_mentions=2)
+        for _ in range(5):
+            index.add_sentence(AHMET)
+        self.assertEqual([m.sentence for m in index.get("ahmet").mentions], [3, 4])
+        self.assertEqual(index.get("ahmet").mention_count, 5)
+
+    def test_long_document_state_bounded(self):
+        index = EntityIndex(window=50)
+        for i in range(100_000):
+            index.add_sentence([w(f"Varlık{i % 500}", "PROPN", "nsubj"), w("geldi", "VERB", "root")])
+        self.assertEqual(index.sentence_count, 100_000)
+        self.assertEqual(len(index), 50)
+        self.assertEqual(len(index._sentences), 50)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            EntityIndex(window=0)
+
+
+class TestDiscourseWithIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_discourse_features_query_index(self):
+        from api.pos_semantic_analyzer import analyze_discourse_features
+
+        index = EntityIndex()
+        index.add_sentence(COCUKLAR)
+        features = analyze_discourse_features(
+            [w("Onlar", "PRON", "nsubj", "Number=Plur|Person=3"),
+             w("çocukları", "NOUN", "obj", "Case=Acc|Number=Plur", lemma="çocuk"),
+             w("evi", "NOUN", "obl", lemma="ev"), w("sevdi", "VERB", "root")],
+            entity_index=index)
+        self.assertEqual(features["discourse_old"], ["çocuk"])
+        self.assertEqual(features["discourse_new"], ["ev"])
+        self.assertEqual(features["antecedents"], [{"text": "Onlar", "antecedent": "çocuk"}])
+        # Öznesiz cümle: sıfır adıl da merkezlemedeki gibi çözülür
+        features = analyze_discourse_features(
+            [w("uyudular", "VERB", "root", "Number=Plur|Person=3")], entity_index=index)
+        self.assertEqual(features["antecedents"], [{"text": "∅", "antecedent": "çocuk"}])
+        # İndeks sorgulanır, güncellenmez
+        self.assertNotIn("ev", index)
+        self.assertNotIn("discourse_old", analyze_discourse_features(COCUKLAR))
+
+    def test_track_discourse(self):
+        from api.pos_semantic_analyzer import analyze_text, track_discourse
+
+        sentences = analyze_text("Kuşlar uçar. Kuşlar uçtu. Yüzme havuzu temiz.",
+                                 use_cache=False)["sentences"]
+        steps = list(track_discourse(sentences))
+        self.assertEqual(steps[0]["discourse"]["discourse_new"], ["kuş"])
+        self.assertEqual(steps[1]["discourse"]["discourse_old"], ["kuş"])
+        self.assertEqual(steps[1]["mentions"][0]["status"], "new")
+        self.assertFalse(steps[1]["mentions"][0]["discourse_new"])
+        self.assertEqual(steps[2]["index"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Import Süresi Bütçesi
+=====================
+
+``import api.*`` stanza/torch yüklememeli ve milisaniyeler içinde bitmeli.
+Her ölçüm temiz bir alt süreçte yapılır (sys.modules önbelleği olmadan).
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+parent_dir = Path(__file__).parent.parent
+
+# Tüm API modüllerinin birlikte import süresi için üst sınır (saniye)
+IMPORT_BUDGET_SECONDS = 0.25
+
+# Ölçüm gürültüsünü azaltmak için en iyi N sonucu alınır
+REPETITIONS = 3
+
+API_MODULES = [
+    "api.main",
+    "api.pos_semantic_analyzer",
+    "api.simple_check",
+    "api.enhanced_analysis",
+]
+
+HEAVY_MODULES = ["stanza", "torch"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "heavy_loaded": [m for m in {heavy!r} if m in sys.modules],
+    "sys_path_len": len(sys.path),
+}}))
+"""
+
+
+def measure_import(modules=API_MODULES):
+    """Temiz bir alt süreçte modülleri import et ve ölçümü döndür"""
+    code = _PROBE.format(modules=list(modules), heavy=HEAVY_MODULES)
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], cwd=str(parent_dir), text=True
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_no_heavy_imports(self):
+        """API modülleri import sırasında stanza/torch yüklememeli"""
+        result = measure_import()
+        self.assertEqual(result["heavy_loaded"], [])
+
+    def test_import_budget(self):
+        """API modüllerinin import süresi bütçe içinde olmalı"""
+        best = min(measure_import()["seconds"] for _ in range(REPETITIONS))
+        self.assertLess(
+            best, IMPORT_BUDGET_SECONDS,
+            f"import api.* took {best * 1000:.1f} ms (budget {IMPORT_BUDGET_SECONDS * 1000:.0f} ms)"
+        )
+
+    def test_no_sys_path_mutation(self):
+        """Import işlemi sys.path'i değiştirmemeli"""
+        baseline = measure_import(modules=[])["sys_path_len"]
+        self.assertEqual(measure_import()["sys_path_len"], baseline)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Artımlı Yeniden Analiz (reanalyze_text) Testleri
+================================================
+
+Stanza gerektirmez: parse'lar kayıtlı fixture'lardan (ReplayBackend) gelir.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+ORIGINAL = "Kuşlar uçar. Ali sabahları erken kalkar. Yüzme havuzu temiz. Kuşlar uçar."
+
+
+class CountingBackend(ReplayBackend):
+    """Parse edilen karakter sayısını sayan replay backend"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.parsed_chars = 0
+
+    def parse(self, text, processors=None, lang='tr'):
+        self.parsed_chars += len(text)
+        return super().parse(text, processors, lang)
+
+
+class TestReanalyzeText(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = CountingBackend(DEFAULT_FIXTURE_PATH)
+        self.previous_backend = set_parser_backend(self.backend)
+
+    def tearDown(self):
+        set_parser_backend(self.previous_backend)
+
+    def assert_matches_full(self, previous, text, **kwargs):
+        from api.pos_semantic_analyzer import analyze_text, reanalyze_text
+
+        result = reanalyze_text(previous, text, use_cache=False, **kwargs)
+        full = analyze_text(text, use_cache=False, **kwargs)
+        self.assertEqual(result["text"], text)
+        self.assertEqual(result["sentences"], full["sentences"])
+        return result
+
+    def test_edits_match_full_analysis(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        previous = analyze_text(ORIGINAL, use_cache=False)
+        replaced = self.assert_matches_full(previous, ORIGINAL.replace("Yüzme havuzu temiz.", "Kuşlar uçtu."))
+        self.assertEqual(replaced["incremental"]["changed"], [2])
+        self.assertEqual(replaced["incremental"]["reanalyzed"], 1)
+        self.assertEqual(replaced["incremental"]["reused"], 3)
+
+        appended = self.assert_matches_full(previous, ORIGINAL + " Kuşlar uçtu.")
+        self.assertEqual(appended["incremental"]["changed"], [4])
+
+        first = self.assert_matches_full(previous, ORIGINAL.replace("uçar", "uçtu", 1))
+        self.assertEqual(first["incremental"]["changed"], [0])
+
+        deleted = self.assert_matches_full(previous, ORIGINAL[len("Kuşlar uçar. "):])
+        self.assertEqual(deleted["incremental"]["reanalyzed"], 0)
+        self.assertEqual(len(deleted["sentences"]), 3)
+
+    def test_unchanged_text_is_not_parsed(self):
+        from api.pos_semantic_analyzer import analyze_text, reanalyze_text
+
+        previous = analyze_text(ORIGINAL, use_cache=False)
+        self.backend.parsed_chars = 0
+        result = reanalyze_text(previous, ORIGINAL, use_cache=False)
+        self.assertEqual(self.backend.parsed_chars, 0)
+        self.assertEqual(result["incremental"]["reused"], 4)
+        self.assertIs(result["sentences"][0], previous["sentences"][0])
+
+    def test_cost_scales_with_edit(self):
+        from api.pos_semantic_analyzer import analyze_text, reanalyze_text
+
+        sentences = ["Kuşlar uçar.", "Ali sabahları erken kalkar.", "Yüzme havuzu temiz."] * 100
+        text = " ".join(sentences)
+        previous = analyze_text(text, include_semantics=False, use_cache=False)
+        sentences[150] = "Kuşlar uçtu."
+        edited = " ".join(sentences)
+
+        self.backend.parsed_chars = 0
+        result = reanalyze_text(previous, edited, include_semantics=False, use_cache=False)
+        self.assertLess(self.backend.parsed_chars, 100)
+        self.assertEqual(result["incremental"]["changed"], [150])
+        self.assertEqual(result["sentences"],
+                         analyze_text(edited, include_semantics=False, use_cache=False)["sentences"])
+
+    def test_chained_and_fallback(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        previous = analyze_text(ORIGINAL, use_cache=False)
+        step = self.assert_matches_full(previous, ORIGINAL + " Kuşlar uçtu.")
+        self.assert_matches_full(step, ORIGINAL)
+        # Cümleleri metinde bulunamayan önceki sonuç → tam analiz
+        stale = {"text": "başka metin", "sentences": previous["sentences"]}
+        result = self.assert_matches_full(stale, ORIGINAL)
+        self.assertEqual(result["incremental"]["reanalyzed"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Aşama Süresi Ölçümü Testleri
+============================
+
+Stanza gerektirmez: analyze_text kayıtlı parse'larla (ReplayBackend) çalışır.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src import instrumentation
+from src.instrumentation import (
+    StageHistogram,
+    collect_timings,
+    enable_stage_histogram,
+    get_stage_histogram,
+    instrument_stanza_pipeline,
+    stage,
+)
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+
+class FakeProcessor:
+    def __init__(self):
+        self.docs = []
+
+    def process(self, doc):
+        self.docs.append(doc)
+        return doc
+
+
+class FakeStanzaPipeline:
+    def __init__(self):
+        self.processors = {"tokenize": FakeProcessor(), "depparse": FakeProcessor()}
+
+    def __call__(self, text):
+        doc = text
+        for processor in self.processors.values():
+            doc = processor.process(doc)
+        return doc
+
+
+class TestStages(unittest.TestCase):
+
+    def test_disabled_stage_is_shared_noop(self):
+        self.assertFalse(instrumentation.timings_active())
+        self.assertIs(stage("a"), stage("b"))
+
+    def test_collect_accumulates(self):
+        with collect_timings() as timings:
+            for _ in range(3):
+                with stage("detect_errors"):
+                    pass
+        self.assertEqual(list(timings), ["detect_errors"])
+        self.assertGreater(timings["detect_errors"], 0.0)
+        self.assertFalse(instrumentation.timings_active())
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = StageHistogram(buckets=(0.001, 0.01))
+        for seconds in (0.0005, 0.005, 0.005, 1.0):
+            histogram.observe("parse", seconds)
+        snapshot = histogram.snapshot()["parse"]
+        self.assertEqual(snapshot["count"], 4)
+        self.assertEqual(snapshot["buckets"], [(0.001, 1), (0.01, 3), ("+Inf", 4)])
+
+    def test_stanza_processors_instrumented(self):
+        nlp = instrument_stanza_pipeline(FakeStanzaPipeline())
+        with collect_timings() as timings:
+            self.assertEqual(nlp("Kuşlar uçar."), "Kuşlar uçar.")
+        self.assertEqual(sorted(timings), ["stanza.depparse", "stanza.tokenize"])
+
+
+class TestAnalyzeTextTimings(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+        enable_stage_histogram(False)
+        get_stage_histogram().reset()
+
+    def test_timings_key_optional(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        self.assertNotIn("timings", analyze_text("Kuşlar uçar.", use_cache=False))
+
+        result = analyze_text("Kuşlar uçar.", use_cache=False, timings=True)
+        for name in ("parse", "morphology", "detect_errors", "propositional_semantics",
+                     "semantics_reparse", "sentence_layers", "total"):
+            self.assertIn(name, result["timings"])
+        self.assertGreaterEqual(result["timings"]["total"], result["timings"]["detect_errors"])
+
+    def test_process_histogram(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        enable_stage_histogram()
+        analyze_text("Kuşlar uçar. Kuşlar uçtu.", use_cache=False)
+        snapshot = get_stage_histogram().snapshot()
+        self.assertEqual(snapshot["analyze_text"]["count"], 1)
+        self.assertEqual(snapshot["detect_errors"]["count"], 2)  # cümle başına
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tembel Analiz Sonuçları (LazyAnalysis) Testleri
+===============================================
+
+Stanza gerektirmez: parse'lar kayıtlı fixture'lardan (ReplayBackend) gelir.
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.instrumentation import collect_timings
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+TEXTS = [
+    "Ali'nin okuduğu kitap burada.",
+    "Kuşlar uçar. Kuşlar uçtu.",
+    "Ali sabahları erken kalkar.",
+    "Yüzme havuzu temiz.",
+]
+
+
+class TestLazyAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_to_dict_matches_analyze_text(self):
+        from api.lazy_result import analyze_text_lazy
+        from api.pos_semantic_analyzer import analyze_text
+
+        for text in TEXTS:
+            for include_semantics in (True, False):
+                expected = analyze_text(text, include_semantics=include_semantics, use_cache=False)
+                lazy = analyze_text_lazy(text, include_semantics=include_semantics)
+                self.assertEqual(json.dumps(lazy.to_dict(), ensure_ascii=False),
+                                 json.dumps(expected, ensure_ascii=False))
+
+    def test_preferences_only_skips_other_layers(self):
+        from api.lazy_result import analyze_text_lazy
+
+        with collect_timings() as timings:
+            result = analyze_text_lazy("Ali'nin okuduğu kitap burada.")
+            (sentence,) = result["sentences"]
+            preferences = sentence["preferences"]
+        self.assertEqual(preferences[0]["word"], "okuduğu")
+        self.assertIn("detect_errors", timings)
+        self.assertNotIn("sentence_layers", timings)
+        self.assertNotIn("propositional_semantics", timings)
+        self.assertNotIn("words", vars(sentence))
+        self.assertNotIn("semantics", vars(sentence))
+
+    def test_layers_computed_once(self):
+        from api.lazy_result import analyze_text_lazy
+
+        (sentence,) = analyze_text_lazy("Kuşlar uçar.").sentences
+        self.assertIs(sentence.semantics, sentence["semantics"])
+        self.assertIs(sentence.words, sentence.to_dict()["words"])
+        self.assertEqual(sentence.semantics["discourse"]["topic_candidates"], ["Kuşlar"])
+
+    def test_mapping_access(self):
+        from api.lazy_result import analyze_text_lazy
+
+        result = analyze_text_lazy("Kuşlar uçar. Kuşlar uçtu.", include_semantics=False)
+        self.assertEqual(result["text"], "Kuşlar uçar. Kuşlar uçtu.")
+        self.assertEqual(len(result), 2)
+        self.assertEqual([s["text"] for s in result], ["Kuşlar uçar.", "Kuşlar uçtu."])
+        self.assertIsNone(result.sentences[0].get("semantics"))
+        self.assertEqual(result.sentences[0].get("timings", "yok"), "yok")
+        with self.assertRaises(KeyError):
+            result.sentences[0]["words_count"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Bellek Profili Testleri
+=======================
+
+Stanza gerektirmez: analyze_text kayıtlı parse'larla (ReplayBackend) çalışır.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from benchmarks import memory_profile
+from benchmarks.memory_profile import compare_reports, profile_memory
+from src import instrumentation
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+DOCUMENTS = ["Kuşlar uçar. Kuşlar uçtu.", "Ali'nin okuduğu kitap burada.", "Yüzme havuzu temiz."]
+
+
+class TestMemoryProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_report_shape(self):
+        report = profile_memory(DOCUMENTS, batch_size=2)
+
+        self.assertEqual(report["summary"]["documents"], 3)
+        self.assertEqual(report["summary"]["sentences"], 4)
+        self.assertEqual([s["text"] for s in report["sentences"][:2]], ["Kuşlar uçar.", "Kuşlar uçtu."])
+        self.assertEqual([s["document"] for s in report["sentences"]], [0, 0, 1, 2])
+        for name in ("analyze_text", "parse", "sentence", "detect_errors", "propositional_semantics"):
+            self.assertIn(name, report["stages"])
+        self.assertEqual(report["stages"]["sentence"]["count"], 4)
+        # İç içe aşamanın tepesi dış aşamayı aşamaz
+        self.assertGreaterEqual(report["stages"]["analyze_text"]["max_peak_bytes"],
+                                report["stages"]["sentence"]["max_peak_bytes"])
+        self.assertEqual([b["documents"] for b in report["batches"]], [2, 1])
+        self.assertGreater(report["summary"]["traced_peak_bytes"], 0)
+        json.dumps(report)  # JSON'a yazılabilir
+
+    def test_state_restored(self):
+        profile_memory(DOCUMENTS[:1])
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertFalse(instrumentation.timings_active())
+
+    def test_compare(self):
+        old = profile_memory(DOCUMENTS[:1])
+        new = profile_memory(DOCUMENTS)
+        diff = compare_reports(old, new)
+        self.assertEqual(diff["summary"]["documents"]["delta"], 2)
+        self.assertIn("mean_net_bytes", diff["stages"]["parse"])
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "docs.txt")
+            output = os.path.join(tmp, "mem.json")
+            Path(source).write_text("\n".join(DOCUMENTS) + "\n", encoding="utf-8")
+            memory_profile.main([source, "--fixtures", str(DEFAULT_FIXTURE_PATH), "-o", output])
+            self.assertEqual(json.loads(Path(output).read_text(encoding="utf-8"))["summary"]["sentences"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
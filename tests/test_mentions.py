@@ -0,0 +1,68 @@
+"""
+Ortak Gönderim Çıkarımı Testleri
+================================
+
+Stanza gerektirmez: kelime listeleri elle yazılır.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.centering import CenteringEngine
+from src.entity_index import EntityIndex
+from src.mentions import ZERO, extract_mentions, feature, turkish_lower
+
+
+def w(text, upos, deprel, feats="", lemma=None, preference=None):
+    return {"text": text, "upos": upos, "deprel": deprel, "feats": feats,
+            "lemma": lemma or text, "preference": preference}
+
+
+# Büyük harfli Türkçe lemma ve NOUN tercihli fiil: iki tüketici aynı anahtarı görmeli
+ISIK = [w("IŞIK", "PROPN", "nsubj", "Number=Sing", lemma="IŞIK"),
+        w("okuduğu", "VERB", "obj", "Number=Sing", preference={"expected_pos": "NOUN"}),
+        w("söndü", "VERB", "root", "Number=Sing|Person=3")]
+
+
+class TestMentions(unittest.TestCase):
+
+    def test_helpers(self):
+        self.assertEqual(turkish_lower("IŞIK İzmir"), "ışık izmir")
+        self.assertEqual(feature("Case=Nom|Number=Plur", "Number"), "Plur")
+        self.assertIsNone(feature("", "Person"))
+
+    def test_nominal_only_without_resolver(self):
+        words = ISIK + [w("o", "PRON", "obl", "Number=Sing|Person=3"),
+                        w("ben", "PRON", "nmod", "Number=Sing|Person=1")]
+        self.assertEqual([m.entity for m in extract_mentions(words)], ["ışık", "okuduğu"])
+
+    def test_resolver_covers_pronouns_and_zero(self):
+        calls = []
+
+        def resolve(number, text, position):
+            calls.append((number, text, position))
+            return "kedi"
+
+        mentions = extract_mentions([w("onu", "PRON", "obj", "Number=Sing|Person=3"),
+                                     w("sevdi", "VERB", "root", "Number=Sing|Person=3")], resolve)
+        self.assertEqual([(m.entity, m.text, m.pronominal) for m in mentions],
+                         [("kedi", "onu", True), ("kedi", ZERO, True)])
+        self.assertEqual(calls, [("Sing", "onu", 0), ("Sing", ZERO, -1)])
+
+    def test_centering_and_index_agree(self):
+        """Merkezleme Cf'i ile indeks aynı ad anahtarlarını üretmeli"""
+        index = EntityIndex()
+        indexed = {m.entity for m in index.add_sentence(ISIK)}
+        cf = {entry["entity"] for entry in CenteringEngine().add(ISIK)["cf"]}
+        self.assertEqual(indexed, {"ışık", "okuduğu"})
+        self.assertEqual(cf, indexed)
+        self.assertIn("ışık", index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Metrik Kaydı Testleri
+=====================
+
+Stanza gerektirmez: API çağrıları kayıtlı parse'larla (ReplayBackend) çalışır.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import urllib.request
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.metrics import (
+    CONTENT_TYPE,
+    PREFERENCES,
+    REQUESTS,
+    TOKENS,
+    MetricsRegistry,
+    render_prometheus,
+    start_metrics_server,
+    write_metrics_file,
+)
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+
+class TestExposition(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge(self):
+        counter = self.registry.counter('istek', 'Test counter', ['entry_point'])
+        counter.inc(entry_point='analyze_text')
+        counter.inc(2, entry_point='analyze_text')
+        self.registry.gauge('doluluk', 'Test gauge').set(0.5)
+
+        text = render_prometheus(self.registry)
+        self.assertIn('# TYPE turkish_analyzer_istek_total counter', text)
+        self.assertIn('turkish_analyzer_istek_total{entry_point="analyze_text"} 3', text)
+        self.assertIn('turkish_analyzer_doluluk 0.5', text)
+        with self.assertRaises(ValueError):
+            counter.inc(-1, entry_point='analyze_text')
+        with self.assertRaises(ValueError):
+            counter.inc(yanlis='etiket')
+
+    def test_histogram_buckets(self):
+        histogram = self.registry.histogram('boyut', 'Test histogram', buckets=(1, 10))
+        for value in (1, 5, 50):
+            histogram.observe(value)
+        text = render_prometheus(self.registry)
+        self.assertIn('turkish_analyzer_boyut_bucket{le="1"} 1', text)
+        self.assertIn('turkish_analyzer_boyut_bucket{le="10"} 2', text)
+        self.assertIn('turkish_analyzer_boyut_bucket{le="+Inf"} 3', text)
+        self.assertIn('turkish_analyzer_boyut_count 3', text)
+
+    def test_label_escaping(self):
+        self.registry.counter('x', 'Escaping', ['v']).inc(v='a"b\\c')
+        self.assertIn('{v="a\\"b\\\\c"}', render_prometheus(self.registry))
+
+    def test_write_file(self):
+        self.registry.counter('dosya', 'File export').inc()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_metrics_file(os.path.join(tmp, "metrics.prom"), self.registry)
+            with open(path, encoding='utf-8') as f:
+                self.assertIn('turkish_analyzer_dosya_total 1', f.read())
+            self.assertEqual(os.listdir(tmp), ["metrics.prom"])
+
+
+class TestApiMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_analyze_text_counts(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        requests_before = REQUESTS.value(entry_point='analyze_text')
+        tokens_before = TOKENS.value(entry_point='analyze_text')
+        preferences_before = PREFERENCES.value(type='NOUN_VERB_CONFUSION')
+
+        analyze_text("Ali'nin okuduğu kitap burada.", use_cache=False)
+
+        self.assertEqual(REQUESTS.value(entry_point='analyze_text'), requests_before + 1)
+        self.assertEqual(TOKENS.value(entry_point='analyze_text'), tokens_before + 5)
+        self.assertEqual(PREFERENCES.value(type='NOUN_VERB_CONFUSION'), preferences_before + 1)
+
+    def test_batch_metrics(self):
+        from api.batch import analyze_corpus
+
+        analyze_corpus(["Kuşlar uçar. Kuşlar uçar."], include_semantics=False)
+        text = render_prometheus()
+        self.assertIn('turkish_analyzer_batch_duplicate_sentences_total{kind="exact"}', text)
+        self.assertIn('turkish_analyzer_batch_sentences_count', text)
+
+    def test_http_server(self):
+        server = start_metrics_server(port=0, stage_histogram=False)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertEqual(response.headers['Content-Type'], CONTENT_TYPE)
+                body = response.read().decode('utf-8')
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn('# TYPE turkish_analyzer_requests_total counter', body)
+        self.assertIn('turkish_analyzer_pipeline_queue_depth', body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Parse Fixture ve Ölçüm Seti Testleri
+====================================
+
+Stanza gerektirmez: tests/fixtures/parses.json içindeki kayıtlı parse'lar
+kullanılır.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from benchmarks import suite
+from src import pipeline_pool
+from src.parser_backend import StanzaBackend, get_parser_backend
+from src.parse_fixtures import (
+    FixturePipeline,
+    ParsedDocument,
+    install_fixture_pipeline,
+    load_parse_fixtures,
+)
+
+
+class TestFixturePipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = FixturePipeline(load_parse_fixtures())
+
+    def test_recorded_text(self):
+        doc = self.pipeline("Kuşlar uçar.")
+        self.assertEqual([w.upos for w in doc.sentences[0].words], ["NOUN", "VERB", "PUNCT"])
+        self.assertEqual(doc.sentences[0].words[1].feats.split("|")[0], "Aspect=Hab")
+
+    def test_composed_multi_sentence_text(self):
+        doc = self.pipeline("Kuşlar uçar. Kuşlar uçtu.")
+        self.assertEqual([s.text for s in doc.sentences], ["Kuşlar uçar.", "Kuşlar uçtu."])
+
+    def test_unknown_text(self):
+        self.assertNotIn("Bilinmeyen cümle.", self.pipeline)
+        self.assertIsNone(self.pipeline.lookup("Kuşlar uçar. Bilinmeyen cümle."))
+        with self.assertRaises(KeyError):
+            self.pipeline("Bilinmeyen cümle.")
+
+    def test_longest_recorded_prefix_wins(self):
+        """Aynı ilk token'la başlayan kayıtlardan en uzun önek seçilmeli"""
+        def sentence(text):
+            return ParsedDocument.from_dict({"text": text, "sentences": [{"text": text, "words": []}]})
+
+        pipeline = FixturePipeline([sentence("Ali geldi."), sentence("Ali geldi. Veli de geldi."),
+                                    sentence("Sonra gitti.")])
+        doc = pipeline.lookup("Ali geldi. Veli de geldi. Sonra gitti.")
+        self.assertEqual([s.text for s in doc.sentences], ["Ali geldi. Veli de geldi.", "Sonra gitti."])
+        doc = pipeline.lookup("Ali geldi. Sonra gitti.")
+        self.assertEqual([s.text for s in doc.sentences], ["Ali geldi.", "Sonra gitti."])
+
+    def test_roundtrip(self):
+        doc = self.pipeline("Ali'nin okuduğu kitap burada.")
+        self.assertEqual(ParsedDocument.from_dict(doc.to_dict()).to_dict(), doc.to_dict())
+
+
+class TestFixtureInstall(unittest.TestCase):
+
+    def tearDown(self):
+        pipeline_pool.configure_pipeline_pools(factory=pipeline_pool.build_stanza_pipeline)
+
+    def test_analyze_text_without_model(self):
+        """Fixture kurulunca analyze_text ve semantik katman Stanza'sız çalışmalı"""
+        from api.pos_semantic_analyzer import analyze_text
+
+        install_fixture_pipeline()
+        result = analyze_text("Ali'nin okuduğu kitap burada.", use_cache=False)
+        words = result["sentences"][0]["words"]
+        self.assertEqual(words[1]["preference"]["expected_pos"], "NOUN")
+
+        result = analyze_text("Kuşlar uçar.", use_cache=False)
+        self.assertEqual(result["sentences"][0]["semantics"]["proposition_type"], "analytic")
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_smoke(self):
+        """Her modelsiz ölçüm çalışmalı ve throughput raporlamalı"""
+        results = suite.run_suite(min_time=0.0, min_iterations=1)
+        names = [r.name for r in results]
+        self.assertIn("analyze_text", names)
+        self.assertIn("check_sentence_enhanced", names)
+        for result in results:
+            self.assertIsNone(result.skipped)
+            self.assertGreater(result.tokens_per_sec, 0)
+            self.assertGreater(result.sentences_per_sec, 0)
+
+        # Ölçüm sonrası önceki parser backend geri yüklenmeli
+        self.assertIsInstance(get_parser_backend(), StanzaBackend)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Parser Backend Testleri (kayıt / tekrar oynatma)
+================================================
+
+Stanza gerektirmez: kayıt için sahte bir iç backend, tekrar oynatma için
+tests/fixtures/parses.json kullanılır.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src import parser_backend
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH, FixturePipeline, load_parse_fixtures
+from src.parser_backend import (
+    FixtureMissError,
+    RecordingBackend,
+    ReplayBackend,
+    StanzaBackend,
+    backend_from_spec,
+    set_parser_backend,
+)
+
+
+class CannedBackend(parser_backend.ParserBackend):
+    """Fixture dosyasından okuyan, çağrıları sayan sahte 'Stanza'"""
+
+    def __init__(self):
+        self.replay = ReplayBackend(DEFAULT_FIXTURE_PATH)
+        self.calls = []
+
+    def parse(self, text, processors=None, lang='tr'):
+        self.calls.append((text, processors))
+        return self.replay.parse(text, processors, lang)
+
+
+class TestReplayBackend(unittest.TestCase):
+
+    def test_serves_recorded_parse(self):
+        backend = ReplayBackend(DEFAULT_FIXTURE_PATH)
+        doc = backend.parse("Kuşlar uçtu.", 'tokenize,pos,lemma,depparse')
+        self.assertEqual(doc.sentences[0].words[1].feats.split("|")[0], "Aspect=Perf")
+        self.assertEqual(backend.hits, 1)
+
+    def test_miss_raises(self):
+        backend = ReplayBackend(DEFAULT_FIXTURE_PATH)
+        with self.assertRaises(FixtureMissError):
+            backend.parse("Bilinmeyen cümle.")
+        self.assertEqual(backend.misses, 1)
+
+    def test_single_lookup_per_hit(self):
+        """Kayıt bir kez aranmalı (``in`` + çağrı ile iki kez değil)"""
+        backend = ReplayBackend(DEFAULT_FIXTURE_PATH)
+        with mock.patch.object(FixturePipeline, 'lookup', autospec=True,
+                               side_effect=FixturePipeline.lookup) as lookup:
+            backend.parse("Kuşlar uçar. Kuşlar uçtu.", 'tokenize,pos,lemma,depparse')
+        self.assertEqual(lookup.call_count, 1)
+
+    def test_processor_matching(self):
+        """Varsayılan: farklı processor setiyle kaydedilmiş parse da kullanılır"""
+        lenient = ReplayBackend(DEFAULT_FIXTURE_PATH)
+        self.assertIsNotNone(lenient.parse("Kuşlar uçar.", 'tokenize,mwt,pos,lemma,depparse'))
+
+        strict = ReplayBackend(DEFAULT_FIXTURE_PATH, match_processors=True)
+        with self.assertRaises(FixtureMissError):
+            strict.parse("Kuşlar uçar.", 'tokenize,mwt,pos,lemma,depparse')
+
+    def test_fallback(self):
+        inner = CannedBackend()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bos.json")
+            RecordingBackend(path).save()  # boş fixture
+            backend = ReplayBackend(path, fallback=inner)
+            backend.parse("Kuşlar uçar.")
+        self.assertEqual(inner.calls, [("Kuşlar uçar.", None)])
+
+
+class TestRecordingBackend(unittest.TestCase):
+
+    def test_record_then_replay(self):
+        inner = CannedBackend()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "kayit.json")
+            recorder = RecordingBackend(path, inner=inner)
+            recorder.parse("Kuşlar uçar.", 'tokenize,pos')
+            recorder.save()
+
+            # İkinci kayıt oturumu mevcut kayıtları korumalı
+            recorder = RecordingBackend(path, inner=inner)
+            recorder.parse("Yüzme havuzu temiz.", 'tokenize,pos')
+            recorder.save()
+
+            documents = load_parse_fixtures(path)
+            self.assertEqual(sorted(d.text for d in documents),
+                             ["Kuşlar uçar.", "Yüzme havuzu temiz."])
+            self.assertEqual({d.processors for d in documents}, {'tokenize,pos'})
+
+            replay = ReplayBackend(path, match_processors=True)
+            doc = replay.parse("Kuşlar uçar.", 'tokenize,pos')
+            self.assertEqual([w.upos for w in doc.sentences[0].words], ["NOUN", "VERB", "PUNCT"])
+
+
+class TestBackendSelection(unittest.TestCase):
+
+    def test_spec(self):
+        self.assertIsInstance(backend_from_spec("stanza"), StanzaBackend)
+        self.assertIsInstance(backend_from_spec(f"replay:{DEFAULT_FIXTURE_PATH}"), ReplayBackend)
+        self.assertIsInstance(backend_from_spec("record:kayit.json"), RecordingBackend)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "kayit.json")
+            RecordingBackend(path).save()
+            replay_record = backend_from_spec(f"replay-record:{path}")
+            self.assertIsInstance(replay_record.fallback, RecordingBackend)
+        with self.assertRaises(ValueError):
+            backend_from_spec("replay")
+        with self.assertRaises(ValueError):
+            backend_from_spec("bilinmeyen:x")
+
+    def test_api_modules_use_backend(self):
+        """api.main, simple_check ve propositional_semantics aktif backend'i kullanmalı"""
+        from api.main import check_sentence
+        from api.simple_check import check_sentence as simple_check
+        from src.propositional_semantics import analyze_sentence_with_stanza
+
+        inner = CannedBackend()
+        previous = set_parser_backend(inner)
+        try:
+            self.assertEqual(check_sentence("Ali'nin okuduğu kitap burada.")["total_errors"], 1)
+            simple_check("Kuşlar uçar.")
+            analysis = analyze_sentence_with_stanza("Kuşlar uçtu.")
+        finally:
+            set_parser_backend(previous)
+
+        self.assertEqual(analysis["analyses"][0]["propositional_value"]["type"], "synthetic")
+        self.assertEqual([p for _, p in inner.calls],
+                         ['tokenize,pos,lemma,depparse', 'tokenize,mwt,pos,lemma,depparse', None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+"""
+Pipeline Havuzu Testleri
+========================
+
+Stanza modeli gerektirmez: sahte bir factory ile eşzamanlı erişim,
+tek seferlik yükleme ve checkout/checkin davranışı doğrulanır.
+"""
+
+import sys
+import threading
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src import pipeline_pool
+from src.pipeline_pool import PipelinePool
+
+
+class FakePipeline:
+    """Eşzamanlı çağrıları sayan sahte pipeline"""
+
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __call__(self, text):
+        with FakePipeline.lock:
+            FakePipeline.active += 1
+            FakePipeline.max_active = max(FakePipeline.max_active, FakePipeline.active)
+        time.sleep(0.01)
+        with FakePipeline.lock:
+            FakePipeline.active -= 1
+        return text
+
+
+class CountingFactory:
+    def __init__(self, delay=0.05):
+        self.calls = 0
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, lang, processors):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)  # Yavaş model yüklemesi
+        return FakePipeline()
+
+
+def _run_threads(target, count=8):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestPipelinePool(unittest.TestCase):
+
+    def setUp(self):
+        FakePipeline.active = 0
+        FakePipeline.max_active = 0
+
+    def test_single_load_under_concurrency(self):
+        """Eşzamanlı ilk çağrılar pipeline'ı yalnızca bir kez oluşturmalı"""
+        factory = CountingFactory()
+        pool = PipelinePool(size=1, factory=factory)
+
+        _run_threads(lambda: pool("Kuşlar uçar."))
+
+        self.assertEqual(factory.calls, 1)
+        self.assertEqual(pool.created, 1)
+        self.assertEqual(FakePipeline.max_active, 1)
+
+    def test_bounded_concurrency(self):
+        """Aynı anda en fazla ``size`` pipeline kullanılmalı"""
+        factory = CountingFactory(delay=0.0)
+        pool = PipelinePool(size=3, factory=factory)
+
+        _run_threads(lambda: [pool("Kuşlar uçtu.") for _ in range(5)], count=10)
+
+        self.assertLessEqual(factory.calls, 3)
+        self.assertLessEqual(FakePipeline.max_active, 3)
+        self.assertEqual(pool.available, pool.created)
+
+    def test_checkout_timeout(self):
+        """Boşta pipeline yoksa timeout sonrası TimeoutError"""
+        pool = PipelinePool(size=1, factory=CountingFactory(delay=0.0))
+        nlp = pool.checkout()
+        with self.assertRaises(TimeoutError):
+            pool.checkout(timeout=0.01)
+        pool.checkin(nlp)
+        self.assertIs(pool.checkout(timeout=0.01), nlp)
+
+    def test_failed_build_releases_slot(self):
+        """Factory hatası havuz kapasitesini tüketmemeli"""
+        def broken(lang, processors):
+            raise RuntimeError("model yok")
+
+        pool = PipelinePool(size=1, factory=broken)
+        with self.assertRaises(RuntimeError):
+            pool.checkout()
+        self.assertEqual(pool.created, 0)
+
+    def test_resize_shrinks_idle(self):
+        pool = PipelinePool(size=3, factory=CountingFactory(delay=0.0))
+        held = [pool.checkout() for _ in range(3)]
+        for nlp in held:
+            pool.checkin(nlp)
+        pool.resize(1)
+        self.assertEqual(pool.created, 1)
+        self.assertEqual(pool.available, 1)
+
+    def test_registry_shares_pools(self):
+        """Aynı (lang, processors) için aynı havuz döner"""
+        factory = CountingFactory(delay=0.0)
+        pipeline_pool.configure_pipeline_pools(factory=factory)
+        try:
+            a = pipeline_pool.get_pipeline_pool('tokenize,pos')
+            b = pipeline_pool.get_pipeline_pool('tokenize,pos')
+            c = pipeline_pool.get_pipeline_pool('tokenize')
+            self.assertIs(a, b)
+            self.assertIsNot(a, c)
+        finally:
+            pipeline_pool.configure_pipeline_pools(factory=pipeline_pool.build_stanza_pipeline)
+
+
+class TestWarmup(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = CountingFactory(delay=0.0)
+        pipeline_pool.configure_pipeline_pools(size=2, factory=self.factory)
+
+    def tearDown(self):
+        pipeline_pool.configure_pipeline_pools(size=1, factory=pipeline_pool.build_stanza_pipeline)
+
+    def test_warmup_fills_pools(self):
+        """warmup() kayıtlı setleri havuz boyutuna kadar yüklemeli"""
+        self.assertFalse(pipeline_pool.get_pipeline_pool('tokenize').is_ready())
+
+        report = pipeline_pool.warmup(['tokenize', 'tokenize,pos'])
+
+        self.assertTrue(report["ready"])
+        self.assertEqual(len(report["pools"]), 2)
+        for pool_report in report["pools"]:
+            self.assertEqual(pool_report["instances"], 2)
+            self.assertGreaterEqual(pool_report["load_seconds"], 0.0)
+        self.assertEqual(self.factory.calls, 4)
+
+        # İkinci warmup yeni model yüklememeli
+        pipeline_pool.warmup(['tokenize'])
+        self.assertEqual(self.factory.calls, 4)
+
+    def test_warmup_does_not_block_when_all_in_use(self):
+        """Tüm örnekler başkalarındayken warmup beklemeden dönmeli"""
+        pool = PipelinePool(size=2, factory=CountingFactory(delay=0.0))
+        held = [pool.checkout(), pool.checkout()]
+        done = threading.Event()
+
+        def run():
+            pool.warmup(fill=True)
+            done.set()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.assertTrue(done.wait(2.0))
+        for nlp in held:
+            pool.checkin(nlp)
+        self.assertEqual(pool.available, 2)
+
+    def test_warmup_reports_failures(self):
+        """Yüklenemeyen havuz raporda hata ile görünmeli, ready=False"""
+        def broken(lang, processors):
+            raise pipeline_pool.ModelNotAvailableError("model yok")
+
+        pipeline_pool.configure_pipeline_pools(factory=broken)
+        report = pipeline_pool.warmup(['tokenize'])
+
+        self.assertFalse(report["ready"])
+        self.assertIn("ModelNotAvailableError", report["pools"][0]["error"])
+
+    def test_readiness_does_not_load(self):
+        """readiness() model yüklememeli"""
+        pipeline_pool.get_pipeline_pool('tokenize,lemma')
+        report = pipeline_pool.readiness()
+        self.assertFalse(report["ready"])
+        self.assertEqual(self.factory.calls, 0)
+
+
+class TestModelDownload(unittest.TestCase):
+
+    def test_download_once(self):
+        """Model eksikse stanza.download eşzamanlı çağrılarda bir kez çalışmalı"""
+        downloads = []
+        fake_stanza = types.ModuleType('stanza')
+
+        def download(lang):
+            downloads.append(lang)
+            time.sleep(0.05)
+
+        def pipeline(lang, **kwargs):
+            if not downloads:
+                raise FileNotFoundError("resources.json")
+            return FakePipeline()
+
+        fake_stanza.download = download  # type: ignore
+        fake_stanza.Pipeline = pipeline  # type: ignore
+
+        with mock.patch.dict(sys.modules, {'stanza': fake_stanza}), \
+                mock.patch.object(pipeline_pool, '_downloaded_langs', set()):
+            _run_threads(lambda: pipeline_pool.build_stanza_pipeline('tr', None), count=6)
+
+        self.assertEqual(downloads, ['tr'])
+
+    def test_offline_mode_fails_fast(self):
+        """Offline modda model eksikse indirme yapılmadan hata verilmeli"""
+        downloads = []
+        fake_stanza = types.ModuleType('stanza')
+        fake_stanza.download = downloads.append  # type: ignore
+
+        def pipeline(lang, **kwargs):
+            self.assertIsNone(kwargs.get('download_method', 'missing'))
+            raise FileNotFoundError("resources.json")
+
+        fake_stanza.Pipeline = pipeline  # type: ignore
+
+        with mock.patch.dict(sys.modules, {'stanza': fake_stanza}), \
+                mock.patch.object(pipeline_pool, '_offline_mode', True):
+            with self.assertRaises(pipeline_pool.ModelNotAvailableError):
+                pipeline_pool.build_stanza_pipeline('tr', 'tokenize')
+
+        self.assertEqual(downloads, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
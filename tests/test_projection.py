@@ -0,0 +1,119 @@
+"""
+Çıktı Alan Seçimi (Field Projection) Testleri
+=============================================
+
+Stanza gerektirmez: parse'lar kayıtlı fixture'lardan (ReplayBackend) gelir.
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from api.projection import parse_fields
+from api.result_cache import disable_result_cache, enable_result_cache
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+TEXT = "Ali'nin okuduğu kitap burada. Kuşlar uçar."
+FIELDS = "words.text,words.preference,semantics.proposition_type"
+
+
+def manual_projection(result):
+    return [
+        {"words": [{"text": w["text"], "preference": w["preference"]} for w in s["words"]],
+         "semantics": None if s["semantics"] is None
+         else {"proposition_type": s["semantics"]["proposition_type"]}}
+        for s in result["sentences"]
+    ]
+
+
+class TestFieldSelection(unittest.TestCase):
+
+    def test_parse_and_schema_order(self):
+        selection = parse_fields("semantics.discourse, words.upos,words.text,words")
+        self.assertEqual([key for key, _ in selection.tree], ["words", "semantics"])
+        # "words" tek başına alt ağacın tamamını seçer
+        self.assertIsNone(dict(selection.tree)["words"])
+        self.assertTrue(selection.needs("semantics"))
+        self.assertFalse(selection.needs("preferences"))
+
+    def test_unknown_fields_rejected(self):
+        for spec in ("words.colour", "semantic", "text.length", "", " , "):
+            with self.assertRaises(ValueError):
+                parse_fields(spec)
+
+    def test_union(self):
+        selection = parse_fields(["preferences.word"]).union("words.text")
+        self.assertEqual(selection.paths, ("preferences.word", "words.text"))
+
+
+class TestProjectedAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+        disable_result_cache()
+
+    def test_matches_full_result(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        full = analyze_text(TEXT, use_cache=False)
+        projected = analyze_text(TEXT, use_cache=False, fields=FIELDS)
+        self.assertEqual(projected["text"], TEXT)
+        self.assertEqual(projected["sentences"], manual_projection(full))
+
+        # Cache açıkken tam sonuç cache'lenir, çıktı yine seçime indirilir
+        enable_result_cache()
+        self.assertEqual(analyze_text(TEXT, fields=FIELDS)["sentences"], manual_projection(full))
+        self.assertEqual(analyze_text(TEXT, fields=FIELDS)["sentences"], manual_projection(full))
+
+    def test_unrequested_layers_not_computed(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        result = analyze_text(TEXT, use_cache=False, timings=True, fields="preferences")
+        self.assertNotIn("propositional_semantics", result["timings"])
+        self.assertNotIn("sentence_layers", result["timings"])
+        self.assertEqual(list(result["sentences"][0]), ["preferences"])
+        self.assertEqual(result["sentences"][0]["preferences"][0]["word"], "okuduğu")
+        self.assertIsNone(result["sentences"][1]["preferences"])
+
+    def test_batch_with_centering(self):
+        from api.batch import analyze_corpus
+
+        result = analyze_corpus(["Kuşlar uçar. Kuşlar uçtu."], fields="words.text", centering=True)
+        (document,) = result["documents"]
+        self.assertEqual(document["sentences"][0], {"words": [{"text": "Kuşlar"}, {"text": "uçar"},
+                                                              {"text": "."}]})
+        self.assertEqual(document["centering"]["transitions"], ["CONTINUE"])
+
+    def test_cli_fields(self):
+        from api import batch
+
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "girdi.txt")
+            dst = os.path.join(tmp, "cikti.jsonl")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write("Kuşlar uçar.\n")
+            with mock.patch("sys.stderr", new_callable=io.StringIO):
+                self.assertEqual(batch.main([src, "-o", dst, "--fields", "words.upos"]), 0)
+                with self.assertRaises(SystemExit):
+                    batch.main([src, "-o", dst, "--fields", "words.nope"])
+            with open(dst, encoding="utf-8") as f:
+                (document,) = [json.loads(line) for line in f]
+        self.assertEqual(document["sentences"], [{"words": [{"upos": "NOUN"}, {"upos": "VERB"},
+                                                            {"upos": "PUNCT"}]}])
+
+
+if __name__ == "__main__":
+    unittest.main()
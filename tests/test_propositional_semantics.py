@@ -0,0 +1,184 @@
+"""
+Önermesel Semantik Testleri (modelsiz)
+======================================
+
+Stanza gerektirmez: cümleler kayıtlı parse'lardan (tests/fixtures/parses.json)
+okunur.
+"""
+
+import dataclasses
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH, ParsedSentence, ParsedWord, load_parse_fixtures
+from src.parser_backend import ReplayBackend, set_parser_backend
+from api.result_cache import rule_fingerprint
+from src.propositional_semantics import (
+    MarkerTable,
+    PredicateType,
+    SemanticFeatures,
+    SentenceType,
+    TurkishPropositionAnalyzer,
+    analyze_propositions_batch,
+    analyze_sentence_with_stanza,
+)
+
+
+def _word(id, text, upos, deprel, head, feats=None):
+    return ParsedWord(id=id, text=text, lemma=text.lower(), upos=upos, xpos=None,
+                      feats=feats, head=head, deprel=deprel, misc=None)
+
+
+class TestPropositionsBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+        self.documents = load_parse_fixtures()
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_matches_single_sentence_api(self):
+        sentences = [sent for doc in self.documents for sent in doc.sentences]
+        batch = analyze_propositions_batch(sentences)
+        self.assertEqual(len(batch), len(sentences))
+
+        expected = []
+        for doc in self.documents:
+            expected.extend(analyze_sentence_with_stanza(doc.text)["analyses"])
+        self.assertEqual([analysis for analysis in batch if analysis is not None], expected)
+
+    def test_aligned_none_without_root_verb(self):
+        nominal = ParsedSentence("Yüzme havuzu temiz.", [
+            _word(1, "Yüzme", "NOUN", "nmod:poss", 2),
+            _word(2, "havuzu", "NOUN", "nsubj", 3),
+            _word(3, "temiz", "ADJ", "root", 0),
+        ])
+        self.assertEqual(analyze_propositions_batch([nominal]), [None])
+
+    def test_subject_determiner_from_head_index(self):
+        sentence = ParsedSentence("Bu kız geldi.", [
+            _word(1, "Bu", "DET", "det", 2),
+            _word(2, "kız", "NOUN", "nsubj", 3, "Case=Nom|Number=Sing"),
+            _word(3, "geldi", "VERB", "root", 0, "Tense=Past"),
+            _word(4, "o", "DET", "det", 3),
+        ])
+        (analysis,) = analyze_propositions_batch([sentence])
+        features = analysis["subject"]["features"]
+        self.assertTrue(features["specific"])
+        self.assertTrue(features["definite"])
+        self.assertEqual(analysis["propositional_value"]["type"], "synthetic")
+
+
+class TestMarkerTables(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = {family: getattr(TurkishPropositionAnalyzer, family)
+                      for family in TurkishPropositionAnalyzer.MARKER_FAMILIES}
+
+    def tearDown(self):
+        for family, markers in self.saved.items():
+            setattr(TurkishPropositionAnalyzer, family, markers)
+        TurkishPropositionAnalyzer.compile_markers()
+
+    def test_precedence(self):
+        table = MarkerTable([("A", ["Tense=Past", "Aspect=Perf"]), ("B", ["Aspect=Hab"])])
+        self.assertEqual(table.resolve("aspect=hab|aspect=perf|tense=past")[:2], ("A", "Tense=Past"))
+        self.assertEqual(table.resolve("aspect=hab|mood=ind")[:2], ("B", "Aspect=Hab"))
+        self.assertIsNone(table.resolve("case=nom"))
+        self.assertEqual(table.lookup("Aspect=Hab|Tense=Past"), ("A", "Tense=Past", "A:Tense=Past"))
+
+    def test_multi_valued_feature(self):
+        table = MarkerTable([("S", ["PronType=Dem"])])
+        self.assertEqual(table.resolve("prontype=prs,dem")[:2], ("S", "PronType=Dem"))
+
+    def test_invalid_marker(self):
+        with self.assertRaises(ValueError):
+            MarkerTable([("A", ["Past"])])
+
+    def test_partitive_over_holistic(self):
+        analyzer = TurkishPropositionAnalyzer()
+        self.assertEqual(analyzer.analyze_predicate_type("Aspect=Hab|Tense=Past"), PredicateType.PARTITIVE)
+        self.assertEqual(analyzer.analyze_predicate_type("Aspect=Hab|Tense=Pres"), PredicateType.HOLISTIC)
+        self.assertEqual(analyzer.analyze_predicate_type(""), PredicateType.HOLISTIC)
+
+    def test_register_markers_recompiles(self):
+        analyzer = TurkishPropositionAnalyzer()
+        fingerprint = rule_fingerprint()
+        self.assertFalse(analyzer.analyze_specificity("Case=Gen", "kızın", "NOUN").specific)
+
+        TurkishPropositionAnalyzer.register_markers('SPECIFICITY_MARKERS', ['Case=Gen'])
+        self.assertTrue(analyzer.analyze_specificity("Case=Gen", "kızın", "NOUN").specific)
+        self.assertNotEqual(rule_fingerprint(), fingerprint)
+
+        TurkishPropositionAnalyzer.register_markers('PARTITIVE_MARKERS', ['Aspect=Hab'], prepend=True)
+        self.assertEqual(analyzer.analyze_predicate_type("Aspect=Hab|Tense=Pres"), PredicateType.PARTITIVE)
+
+        with self.assertRaises(ValueError):
+            TurkishPropositionAnalyzer.register_markers('LEXICALIZED_mA', ['yüzme'])
+
+    def test_direct_list_edit_recompiles(self):
+        """compile_markers çağrılmadan yapılan ekleme ve liste değişimi görülür"""
+        analyzer = TurkishPropositionAnalyzer()
+        TurkishPropositionAnalyzer.SPECIFICITY_MARKERS.append('Case=Gen')
+        try:
+            self.assertTrue(analyzer.analyze_specificity("Case=Gen", "kızın", "NOUN").specific)
+        finally:
+            TurkishPropositionAnalyzer.SPECIFICITY_MARKERS.remove('Case=Gen')
+        self.assertFalse(analyzer.analyze_specificity("Case=Gen", "kızın", "NOUN").specific)
+
+        TurkishPropositionAnalyzer.PARTITIVE_MARKERS = ['Aspect=Hab']
+        self.assertEqual(analyzer.analyze_predicate_type("Aspect=Hab|Tense=Pres"), PredicateType.PARTITIVE)
+
+
+def _features(specific):
+    return SemanticFeatures(specific=specific, existential=specific, definite=False, singular=True,
+                            morphologically_definite=False, semantically_definite=False)
+
+
+class TestPropositionalValueInterning(unittest.TestCase):
+
+    def test_shared_instances(self):
+        analyzer = TurkishPropositionAnalyzer()
+        first = analyzer.calculate_propositional_value(PredicateType.HOLISTIC, _features(False),
+                                                       SentenceType.PROPERTY)
+        second = analyzer.calculate_propositional_value(PredicateType.HOLISTIC, _features(False),
+                                                        SentenceType.PROPERTY)
+        self.assertIs(first, second)
+        self.assertEqual(first.proposition_type.value, "analytic")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            first.verifiable = 0.0
+
+    def test_every_key_reachable(self):
+        analyzer = TurkishPropositionAnalyzer()
+        for predicate_type in PredicateType:
+            for specific in (False, True):
+                for sentence_type in SentenceType:
+                    value = analyzer.calculate_propositional_value(predicate_type, _features(specific),
+                                                                   sentence_type)
+                    if sentence_type in (SentenceType.QUESTION, SentenceType.REQUEST,
+                                         SentenceType.EXCLAMATION):
+                        self.assertEqual(value.proposition_type.value, "non_propositional")
+                        self.assertIs(value.sentence_type, sentence_type)
+                    elif predicate_type == PredicateType.HOLISTIC and not specific:
+                        self.assertTrue(value.generic)
+                    else:
+                        self.assertEqual(value.time_bound, predicate_type == PredicateType.PARTITIVE)
+
+    def test_to_dict_returns_copy(self):
+        value = TurkishPropositionAnalyzer().calculate_propositional_value(
+            PredicateType.PARTITIVE, _features(True), SentenceType.EVENT)
+        data = value.to_dict()
+        self.assertEqual(data["type"], "synthetic")
+        self.assertEqual(data["sentence_type"], "olay")
+        data["type"] = "changed"
+        self.assertEqual(value.to_dict()["type"], "synthetic")
+
+
+if __name__ == "__main__":
+    unittest.main()
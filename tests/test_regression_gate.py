@@ -0,0 +1,153 @@
+"""
+Regresyon Kapısı Testleri
+=========================
+
+Karşılaştırma mantığı sentetik sonuçlarla, çalıştırma yolu kısa bir
+modelsiz ölçümle test edilir.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from benchmarks import regression_gate
+from benchmarks.suite import Workload, build_benchmarks
+from benchmarks.regression_gate import (
+    DEFAULT_BASELINE_PATH,
+    collect,
+    compare,
+    environment,
+    summarize,
+)
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH, load_parse_fixtures
+
+
+def results(tokens_per_sec, rss=(100.0, 100.0, 100.0)):
+    return {
+        "isolated": False,
+        "environment": environment(),
+        "benchmarks": {
+            "analyze_text": {
+                "sentences": 6, "tokens": 21,
+                "tokens_per_sec": summarize(tokens_per_sec),
+                "peak_rss_mb": summarize(rss),
+            }
+        },
+    }
+
+
+def relative_results(tokens_per_sec, references, environment_info=None):
+    """Referans ölçümlü (format 2) sonuç"""
+    data = results(tokens_per_sec)
+    data["environment"] = environment_info or environment()
+    data["reference_tokens_per_sec"] = summarize(references)
+    data["benchmarks"]["analyze_text"]["relative_throughput"] = summarize(
+        [tps / ref for tps, ref in zip(tokens_per_sec, references)], digits=6)
+    return data
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_summarize(self):
+        stats = summarize([10, 20, 30, 40, 50])
+        self.assertEqual((stats["median"], stats["q1"], stats["q3"], stats["iqr"]), (30, 20, 40, 20))
+        self.assertEqual(summarize([7])["iqr"], 0)
+
+    def test_halved_throughput_is_regression(self):
+        """Cümle başına ikinci bir parse → throughput yarıya iner"""
+        report = compare(results([1000, 1010, 990, 1005, 995]), results([500, 505, 495, 510, 490]))
+        self.assertFalse(report["passed"])
+        self.assertEqual(report["benchmarks"]["analyze_text"]["status"], "regression")
+
+    def test_noise_within_iqr_passes(self):
+        """Medyan düşse de IQR'lar çakışıyorsa gerileme sayılmaz"""
+        report = compare(results([1000, 600, 1400, 900, 1100]), results([850, 500, 1300, 800, 1000]))
+        self.assertTrue(report["passed"])
+        self.assertEqual(report["benchmarks"]["analyze_text"]["status"], "ok")
+
+    def test_memory_regression(self):
+        base = results([1000] * 3, rss=(100, 100, 101))
+        self.assertTrue(compare(base, results([1000] * 3, rss=(104, 104, 104)))["passed"])  # < 5 MB
+        report = compare(base, results([1000] * 3, rss=(150, 151, 150)))
+        self.assertFalse(report["passed"])
+        self.assertIn("peak RSS", report["benchmarks"]["analyze_text"]["reasons"][0])
+
+    def test_slower_machine_is_not_regression(self):
+        """Başka makinede üretilmiş baseline: her şey (referans dahil) %40 yavaş"""
+        base = relative_results([1000, 1010, 990, 1005, 995], [5000, 5050, 4950, 5025, 4975],
+                                {"machine": "hızlı"})
+        current = relative_results([600, 606, 594, 603, 597], [3000, 3030, 2970, 3015, 2985])
+        report = compare(base, current)
+        self.assertTrue(report["passed"])
+        self.assertEqual(report["benchmarks"]["analyze_text"]["status"], "ok")
+        self.assertEqual(report["warnings"], [])
+        # Aynı karşılaştırma mutlak tokens/sec ile gerileme olurdu
+        del base["reference_tokens_per_sec"]
+        self.assertFalse(compare(base, current)["passed"])
+
+    def test_code_regression_relative_to_reference(self):
+        """Referans aynı kalırken ölçüm yarıya inerse gerileme"""
+        references = [5000, 5050, 4950, 5025, 4975]
+        base = relative_results([1000, 1010, 990, 1005, 995], references)
+        report = compare(base, relative_results([500, 505, 495, 510, 490], references))
+        self.assertFalse(report["passed"])
+        self.assertIn("relative to reference", report["benchmarks"]["analyze_text"]["reasons"][0])
+
+    def test_new_missing_and_environment(self):
+        base = results([1000] * 3)
+        base["environment"] = {"python": "0.0"}
+        current = results([1000] * 3)
+        current["benchmarks"]["new_bench"] = current["benchmarks"].pop("analyze_text")
+        report = compare(base, current)
+        self.assertTrue(report["passed"])
+        self.assertEqual(report["benchmarks"]["new_bench"]["status"], "new")
+        self.assertEqual(report["benchmarks"]["analyze_text"]["status"], "missing")
+        self.assertTrue(report["warnings"])
+
+
+class TestGate(unittest.TestCase):
+
+    def test_collect_and_exit_codes(self):
+        current = collect(repetitions=2, only=["extract_morphology"], min_time=0.0, min_iterations=1)
+        self.assertEqual(len(current["benchmarks"]["extract_morphology"]["tokens_per_sec"]["samples"]), 2)
+        self.assertEqual(len(current["benchmarks"]["extract_morphology"]["relative_throughput"]["samples"]), 2)
+        self.assertEqual(len(current["reference_tokens_per_sec"]["samples"]), 2)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            results_path = os.path.join(tmp, "results.json")
+            baseline_path = os.path.join(tmp, "baseline.json")
+            Path(results_path).write_text(json.dumps(current), encoding="utf-8")
+            argv = ["--results", results_path, "--baseline", baseline_path]
+
+            self.assertEqual(regression_gate.main(argv), 2)  # baseline yok
+            self.assertEqual(regression_gate.main(argv + ["--update-baseline"]), 0)
+            self.assertEqual(regression_gate.main(argv), 0)
+
+            # Kod yavaşladı, referans aynı
+            slower = json.loads(json.dumps(current))
+            bench = slower["benchmarks"]["extract_morphology"]
+            bench["tokens_per_sec"] = summarize([s / 3 for s in bench["tokens_per_sec"]["samples"]])
+            bench["relative_throughput"] = summarize(
+                [s / 3 for s in bench["relative_throughput"]["samples"]], digits=6)
+            Path(results_path).write_text(json.dumps(slower), encoding="utf-8")
+            self.assertEqual(regression_gate.main(argv), 1)
+
+    def test_committed_baseline_covers_suite(self):
+        """Suite'e eklenen her modelsiz ölçüm baseline'da göreli değerle bulunmalı"""
+        baseline = json.loads(DEFAULT_BASELINE_PATH.read_text(encoding="utf-8"))
+        self.assertIn("reference_tokens_per_sec", baseline)
+        workload = Workload(load_parse_fixtures(DEFAULT_FIXTURE_PATH))
+        for benchmark in build_benchmarks(workload):
+            self.assertIn("relative_throughput", baseline["benchmarks"].get(benchmark.name, {}),
+                          benchmark.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
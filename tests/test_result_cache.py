@@ -0,0 +1,224 @@
+"""
+Cümle Sonucu Cache Testleri
+===========================
+
+Stanza gerektirmez: kayıtlı parse çıktılarıyla sahte bir pipeline kullanılır.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from api import result_cache
+from api.pos_semantic_analyzer import analyze_text
+from api.result_cache import SentenceResultCache, make_cache_key, rule_fingerprint
+from error_detection.minimalist_pos_error_detection import MinimalistPOSErrorDetector
+from src import pipeline_pool, propositional_semantics
+from src.propositional_semantics import TurkishPropositionAnalyzer
+
+# (id, text, lemma, upos, xpos, feats, head, deprel) - Stanza tr çıktısı
+# NOT: "Yüzme" bilerek VERB etiketli (lexicalized -mA kuralını tetiklemek için)
+PARSES = {
+    "Kuşlar uçar.": [
+        (1, "Kuşlar", "kuş", "NOUN", "Noun", "Case=Nom|Number=Plur|Person=3", 2, "nsubj"),
+        (2, "uçar", "uç", "VERB", "Verb",
+         "Aspect=Hab|Mood=Ind|Number=Sing|Person=3|Polarity=Pos|Tense=Pres", 0, "root"),
+        (3, ".", ".", "PUNCT", "Punc", None, 2, "punct"),
+    ],
+    "Yüzme havuzu temiz.": [
+        (1, "Yüzme", "yüzme", "VERB", "Verb", "Case=Nom|Number=Sing|Person=3", 2, "nmod:poss"),
+        (2, "havuzu", "havuz", "NOUN", "Noun",
+         "Case=Nom|Number=Sing|Number[psor]=Sing|Person=3|Person[psor]=3", 3, "nsubj"),
+        (3, "temiz", "temiz", "ADJ", "Adj", None, 0, "root"),
+        (4, ".", ".", "PUNCT", "Punc", None, 3, "punct"),
+    ],
+}
+
+
+class FakePipeline:
+    calls = 0
+
+    def __call__(self, text):
+        FakePipeline.calls += 1
+        words = [
+            SimpleNamespace(id=i, text=t, lemma=l, upos=u, xpos=x, feats=f, head=h, deprel=d)
+            for i, t, l, u, x, f, h, d in PARSES[text]
+        ]
+        return SimpleNamespace(sentences=[SimpleNamespace(text=text, words=words)])
+
+
+class TestSentenceResultCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = SentenceResultCache(max_entries=2)
+        fp = rule_fingerprint()
+        keys = [make_cache_key(f"cümle {i}", "tokenize", ["preferences"], fp) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, {"i": i})
+
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertEqual(cache.get(keys[2]), {"i": 2})
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_returns_independent_copies(self):
+        """Çağıranın sonucu değiştirmesi cache'i bozmamalı"""
+        cache = SentenceResultCache()
+        key = make_cache_key("Kuşlar uçar.", "tokenize", ["preferences"], rule_fingerprint())
+        cache.put(key, {"words": [1, 2]})
+        cache.get(key)["words"].append(3)
+        self.assertEqual(cache.get(key), {"words": [1, 2]})
+
+    def test_fingerprint_tracks_rule_tables(self):
+        """Tablo veya güven sabiti doğrudan değişince (compile_markers yok) iz değişmeli"""
+        before = rule_fingerprint()
+
+        MinimalistPOSErrorDetector.LEXICALIZED_mA.append('kazma')
+        try:
+            self.assertNotEqual(rule_fingerprint(), before)
+        finally:
+            MinimalistPOSErrorDetector.LEXICALIZED_mA.remove('kazma')
+        self.assertEqual(rule_fingerprint(), before)
+
+        MinimalistPOSErrorDetector.NOMINAL_SUFFIXES.append('-GAn')
+        try:
+            self.assertNotEqual(rule_fingerprint(), before)
+        finally:
+            MinimalistPOSErrorDetector.NOMINAL_SUFFIXES.remove('-GAn')
+
+        original = MinimalistPOSErrorDetector.CONFIDENCE_NOMINAL_SUFFIX
+        MinimalistPOSErrorDetector.CONFIDENCE_NOMINAL_SUFFIX = 0.8
+        try:
+            self.assertNotEqual(rule_fingerprint(), before)
+        finally:
+            MinimalistPOSErrorDetector.CONFIDENCE_NOMINAL_SUFFIX = original
+
+        self.assertEqual(rule_fingerprint(), before)
+
+    def test_fingerprint_covers_propositional_constants(self):
+        """Sonuca etki eden önermesel sabitler ize girmeli, etkisizler girmemeli"""
+        before = rule_fingerprint()
+        original = propositional_semantics.COPULA_VERIFIABILITY
+        propositional_semantics.COPULA_VERIFIABILITY = 0.6
+        try:
+            self.assertNotEqual(rule_fingerprint(), before)
+        finally:
+            propositional_semantics.COPULA_VERIFIABILITY = original
+        self.assertEqual(rule_fingerprint(), before)
+
+        # SYNTHETIC_* import sırasında tabloya gömülü: runtime değişikliği sonucu etkilemez
+        with mock.patch.object(propositional_semantics, 'SYNTHETIC_VERIFIABLE', 0.1):
+            self.assertEqual(rule_fingerprint(), before)
+
+    def test_fingerprint_memoized_until_tables_change(self):
+        """İz tablolar değişmedikçe yeniden hesaplanmamalı"""
+        rule_fingerprint()
+        with mock.patch.object(result_cache, '_compute_rule_fingerprint',
+                               wraps=result_cache._compute_rule_fingerprint) as compute:
+            rule_fingerprint()
+            rule_fingerprint()
+            self.assertEqual(compute.call_count, 0)
+            TurkishPropositionAnalyzer.HOLISTIC_MARKERS.append('Mood=Gen')
+            try:
+                rule_fingerprint()
+                rule_fingerprint()
+                self.assertEqual(compute.call_count, 1)
+            finally:
+                TurkishPropositionAnalyzer.HOLISTIC_MARKERS.remove('Mood=Gen')
+
+    def test_stale_entries_invalidated(self):
+        cache = SentenceResultCache()
+        cache.put(make_cache_key("Kuşlar uçar.", "p", ["preferences"], "eski"), {"v": 1})
+        self.assertIsNone(cache.get(make_cache_key("Kuşlar uçar.", "p", ["preferences"], "yeni")))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+    def test_persistence_roundtrip(self):
+        fp = rule_fingerprint()
+        key = make_cache_key("Kuşlar uçar.", "p", ["preferences", "semantics"], fp)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.json")
+            cache = SentenceResultCache(persist_path=path)
+            cache.put(key, {"text": "Kuşlar uçar."})
+            cache.save()
+
+            restored = SentenceResultCache(persist_path=path)
+            self.assertEqual(restored.get(key), {"text": "Kuşlar uçar."})
+
+            # Kurallar değiştiyse diskteki cache yüklenmemeli
+            MinimalistPOSErrorDetector.NOMINAL_SUFFIXES.append('-GAn')
+            try:
+                self.assertEqual(SentenceResultCache().load(path), 0)
+            finally:
+                MinimalistPOSErrorDetector.NOMINAL_SUFFIXES.remove('-GAn')
+
+
+class TestAnalyzeTextCache(unittest.TestCase):
+
+    def setUp(self):
+        FakePipeline.calls = 0
+        pipeline_pool.configure_pipeline_pools(factory=lambda lang, processors: FakePipeline())
+        self.cache = result_cache.enable_result_cache(max_entries=100)
+
+    def tearDown(self):
+        result_cache.disable_result_cache()
+        pipeline_pool.configure_pipeline_pools(factory=pipeline_pool.build_stanza_pipeline)
+
+    def test_cached_sentence_skips_rule_layers(self):
+        """İkinci çağrıda semantik re-parse yapılmamalı, çıktı aynı olmalı"""
+        first = analyze_text("Kuşlar uçar.")
+        calls_after_first = FakePipeline.calls   # parse + semantik re-parse
+
+        second = analyze_text("Kuşlar uçar.")
+
+        self.assertEqual(first, second)
+        self.assertEqual(FakePipeline.calls - calls_after_first, 1)  # sadece parse
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_layers_are_part_of_key(self):
+        analyze_text("Kuşlar uçar.")
+        result = analyze_text("Kuşlar uçar.", include_semantics=False)
+        self.assertIsNone(result["sentences"][0]["semantics"])
+
+    def test_rule_change_invalidates(self):
+        """Runtime'da eklenen lexicalized kelime eski sonucu geçersiz kılmalı"""
+        result = analyze_text("Yüzme havuzu temiz.", include_semantics=False)
+        self.assertIsNone(result["sentences"][0]["words"][0]["preference"])
+
+        MinimalistPOSErrorDetector.LEXICALIZED_mA.remove('yüzme')
+        try:
+            result = analyze_text("Yüzme havuzu temiz.", include_semantics=False)
+            self.assertIsNotNone(result["sentences"][0]["words"][0]["preference"])
+        finally:
+            MinimalistPOSErrorDetector.LEXICALIZED_mA.insert(0, 'yüzme')
+
+    def test_same_length_edit_invalidates(self):
+        """Uzunluğu koruyan yerinde değişiklik de (compile_markers yok) görülmeli"""
+        result = analyze_text("Yüzme havuzu temiz.", include_semantics=False)
+        self.assertIsNone(result["sentences"][0]["words"][0]["preference"])
+
+        index = MinimalistPOSErrorDetector.LEXICALIZED_mA.index('yüzme')
+        MinimalistPOSErrorDetector.LEXICALIZED_mA[index] = 'kazma'
+        try:
+            result = analyze_text("Yüzme havuzu temiz.", include_semantics=False)
+            self.assertIsNotNone(result["sentences"][0]["words"][0]["preference"])
+        finally:
+            MinimalistPOSErrorDetector.LEXICALIZED_mA[index] = 'yüzme'
+        result = analyze_text("Yüzme havuzu temiz.", include_semantics=False)
+        self.assertIsNone(result["sentences"][0]["words"][0]["preference"])
+
+    def test_cache_bypass(self):
+        analyze_text("Kuşlar uçar.")
+        analyze_text("Kuşlar uçar.", use_cache=False)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
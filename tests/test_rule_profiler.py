@@ -0,0 +1,150 @@
+"""
+Kural İsabet Profili Testleri
+=============================
+
+Stanza gerektirmez: analyze_text kayıtlı parse'larla (ReplayBackend) çalışır.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from error_detection.minimalist_pos_error_detection import (
+    MinimalistPOSErrorDetector,
+    create_lexical_item,
+)
+from src import rule_profiler
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+from src.propositional_semantics import TurkishPropositionAnalyzer
+from src.rule_profiler import RuleProfiler, find_marker, marker_keys, profile_rules
+
+
+class TestRuleProfiler(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        self.assertFalse(rule_profiler.rule_profiling_active())
+        self.assertNotIn('__wrapped__', vars(TurkishPropositionAnalyzer.analyze_predicate_type))
+
+    def test_methods_restored(self):
+        original = MinimalistPOSErrorDetector.__dict__['detect_noun_verb_confusion']
+        with profile_rules():
+            self.assertIsNot(MinimalistPOSErrorDetector.__dict__['detect_noun_verb_confusion'], original)
+        self.assertIs(MinimalistPOSErrorDetector.__dict__['detect_noun_verb_confusion'], original)
+
+    def test_marker_order_counts(self):
+        """İlk eşleşmede durulur: sonraki marker'lar değerlendirilmez"""
+        analyzer = TurkishPropositionAnalyzer()
+        with profile_rules() as profiler:
+            analyzer.analyze_predicate_type("Aspect=Perf|Mood=Ind|Tense=Past")
+        rows = {row["rule"]: row for row in profiler.report('rule')}
+        self.assertEqual(rows["PARTITIVE_MARKERS:Tense=Past"]["matches"], 1)
+        self.assertNotIn("PARTITIVE_MARKERS:Aspect=Perf", rows)
+        self.assertNotIn("HOLISTIC_MARKERS:Aspect=Hab", rows)
+        self.assertEqual(rows["analyzer.analyze_predicate_type"]["evaluations"], 1)
+
+    def test_lexicalized_short_circuit(self):
+        detector = MinimalistPOSErrorDetector()
+        item = create_lexical_item("yüzme", "VERB", ["-mA"])
+        with profile_rules() as profiler:
+            self.assertIsNone(detector.detect_noun_verb_confusion(item, [item]))
+        rows = {row["rule"]: row for row in profiler.report('rule')}
+        self.assertEqual(rows["noun_verb.lexicalized_mA"]["matches"], 1)
+        self.assertEqual(rows["LEXICALIZED_mA:yüzme"]["matches"], 1)
+        self.assertEqual(rows["detector.detect_noun_verb_confusion"]["matches"], 0)
+
+    def test_find_marker_without_profile(self):
+        self.assertEqual(find_marker('X', ['Tense=Past'], "tense=past"), 'Tense=Past')
+        self.assertIsNone(find_marker('X', ['yüzme'], "koşma", prefix=True))
+        keys = marker_keys(['Yüzme', 'koşma'])
+        self.assertEqual(find_marker('X', ['Yüzme', 'koşma'], "koşmak", prefix=True, keys=keys), 'koşma')
+
+    def test_nominal_suffix_counts_misses(self):
+        """Nominal ek dalı her VERB için değerlendirilmeli (eşleşmese de)"""
+        detector = MinimalistPOSErrorDetector()
+        suffixed = create_lexical_item("okuduğu", "VERB", ["-DIK"])
+        plain = create_lexical_item("geldi", "VERB", ["PAST"])
+        with profile_rules() as profiler:
+            detector.detect_noun_verb_confusion(suffixed, [suffixed])
+            detector.detect_noun_verb_confusion(plain, [plain])
+        row = {row["rule"]: row for row in profiler.report('rule')}["noun_verb.nominal_suffix"]
+        self.assertEqual((row["evaluations"], row["matches"]), (2, 1))
+
+    def test_registered_lexicalized_word(self):
+        """Kayıtlı kelimenin anahtarı derlenir; profil kapalıyken de bulunur"""
+        original = MinimalistPOSErrorDetector.LEXICALIZED_mA
+        MinimalistPOSErrorDetector.register_lexicalized(['Kazma'])
+        try:
+            self.assertIn('kazma', MinimalistPOSErrorDetector._LEXICALIZED_mA_TABLE[2])
+            item = create_lexical_item("kazma", "VERB", ["-mA"])
+            self.assertIsNone(MinimalistPOSErrorDetector().detect_noun_verb_confusion(item, [item]))
+        finally:
+            MinimalistPOSErrorDetector.LEXICALIZED_mA = original
+            MinimalistPOSErrorDetector.compile_markers()
+
+    def test_direct_list_edit_recompiles(self):
+        """compile_markers çağrılmadan yapılan ekleme/silme de görülür"""
+        detector = MinimalistPOSErrorDetector()
+        item = create_lexical_item("kazma", "VERB", ["-mA"])
+        MinimalistPOSErrorDetector.LEXICALIZED_mA.insert(0, 'kazma')
+        try:
+            with profile_rules() as profiler:
+                self.assertIsNone(detector.detect_noun_verb_confusion(item, [item]))
+            self.assertIn("LEXICALIZED_mA:kazma", {row["rule"] for row in profiler.report()})
+        finally:
+            MinimalistPOSErrorDetector.LEXICALIZED_mA.remove('kazma')
+        self.assertIsNotNone(detector.detect_noun_verb_confusion(item, [item]))
+
+        original = MinimalistPOSErrorDetector.LEXICALIZED_mA
+        MinimalistPOSErrorDetector.LEXICALIZED_mA = ['kazma']
+        try:
+            self.assertIsNone(detector.detect_noun_verb_confusion(item, [item]))
+        finally:
+            MinimalistPOSErrorDetector.LEXICALIZED_mA = original
+
+    def test_report_sorting_and_files(self):
+        profiler = RuleProfiler()
+        profiler.record("a", True, 0.001)
+        profiler.record("b", False, 0.001)
+        profiler.record("b", True, 0.001)
+        self.assertEqual([r["rule"] for r in profiler.report('evaluations')], ["b", "a"])
+        self.assertEqual(profiler.report()[0]["match_rate"], 0.5)  # b: 2 ms
+        with self.assertRaises(ValueError):
+            profiler.report('bilinmeyen')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            data = json.loads(Path(profiler.write_report(os.path.join(tmp, "p.json"))).read_text())
+            self.assertEqual(data["rules"][0]["rule"], "b")
+            text = Path(profiler.write_report(os.path.join(tmp, "p.txt"))).read_text()
+            self.assertIn("evals", text)
+
+
+class TestAnalyzeTextProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_counts_across_run(self):
+        from api.pos_semantic_analyzer import analyze_text
+
+        with profile_rules() as profiler:
+            analyze_text("Kuşlar uçar. Kuşlar uçtu.", use_cache=False)
+        rows = {row["rule"]: row for row in profiler.report('rule')}
+        self.assertEqual(rows["analyzer.analyze_predicate_type"]["evaluations"], 2)
+        self.assertEqual(rows["proposition.analytic"]["matches"], 1)
+        self.assertEqual(rows["proposition.synthetic"]["matches"], 1)
+        self.assertEqual(rows["detector.detect_noun_verb_confusion"]["evaluations"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
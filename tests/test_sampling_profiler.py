@@ -0,0 +1,139 @@
+"""
+Örnekleyici (Sampling Profiler) Testleri
+========================================
+
+Stanza gerektirmez: analyze_text kayıtlı parse'larla (ReplayBackend) çalışır.
+"""
+
+import os
+import re
+import signal
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.request
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.metrics import start_metrics_server
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+from src.sampling_profiler import SamplingProfiler, sample_for
+
+COLLAPSED_LINE = re.compile(r'^\S.* \d+$')
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(200))
+
+
+def _sleeper(stop: threading.Event) -> None:
+    while not stop.is_set():
+        _busy(0.01)
+
+
+class TestSamplingProfiler(unittest.TestCase):
+
+    @unittest.skipUnless(hasattr(signal, 'SIGPROF'), "SIGPROF yok")
+    def test_signal_mode_collapsed(self):
+        previous = signal.getsignal(signal.SIGPROF)
+        with SamplingProfiler(interval=0.001, mode='signal') as profiler:
+            _busy(0.3)
+        self.assertIs(signal.getsignal(signal.SIGPROF), previous)
+        self.assertGreater(profiler.total_samples, 0)
+
+        lines = profiler.collapsed()
+        for line in lines:
+            self.assertRegex(line, COLLAPSED_LINE)
+        self.assertTrue(any('test_sampling_profiler:_busy' in line for line in lines))
+        top = {row["function"]: row for row in profiler.top_functions(limit=1000)}
+        self.assertGreater(top['tests.test_sampling_profiler:_busy']["inclusive_ratio"], 0.5)
+
+    def test_thread_mode_roots_are_thread_names(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=_sleeper, args=(stop,), name='busy-worker')
+        worker.start()
+        try:
+            with SamplingProfiler(interval=0.002, mode='thread') as profiler:
+                time.sleep(0.2)
+        finally:
+            stop.set()
+            worker.join()
+        lines = profiler.collapsed()
+        self.assertTrue(any(line.startswith('busy-worker;') and '_busy' in line for line in lines))
+        self.assertFalse(any(line.startswith('sampling-profiler;') for line in lines))
+
+    def test_sample_for_excludes_caller(self):
+        profiler = sample_for(0.05, interval=0.005)
+        self.assertFalse(any(line.startswith('MainThread;') for line in profiler.collapsed()))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SamplingProfiler(interval=0)
+        with self.assertRaises(ValueError):
+            SamplingProfiler(mode='perf')
+
+
+class TestProfileRuns(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_batch_cli_writes_collapsed(self):
+        from api.batch import main
+
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = os.path.join(tmp, "corpus.txt")
+            folded = os.path.join(tmp, "profile.folded")
+            with open(corpus, "w", encoding="utf-8") as f:
+                f.write("Kuşlar uçar. Ali sabahları erken kalkar.\n" * 20)
+            self.assertEqual(main([corpus, "-o", os.path.join(tmp, "out.jsonl"),
+                                   "--profile-output", folded, "--profile-interval", "0.0005"]), 0)
+            with open(folded, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        for line in lines:
+            self.assertRegex(line, COLLAPSED_LINE)
+
+    def test_metrics_server_profile_endpoint(self):
+        server = start_metrics_server(port=0, stage_histogram=False, profiling=True)
+        stop = threading.Event()
+        worker = threading.Thread(target=_sleeper, args=(stop,), name='request-worker')
+        worker.start()
+        try:
+            base = f"http://127.0.0.1:{server.server_port}"
+            with urllib.request.urlopen(f"{base}/debug/profile?seconds=0.2&interval=0.002",
+                                        timeout=10) as response:
+                body = response.read().decode('utf-8')
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{base}/debug/profile?seconds=-1", timeout=5)
+        finally:
+            stop.set()
+            worker.join()
+            server.shutdown()
+            server.server_close()
+        self.assertIn('request-worker;', body)
+
+    def test_profile_endpoint_disabled_by_default(self):
+        server = start_metrics_server(port=0, stage_histogram=False)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/debug/profile?seconds=0.1"
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(url, timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
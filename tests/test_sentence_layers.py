@@ -0,0 +1,74 @@
+"""
+Tek Geçişli Cümle Katmanları Testleri
+=====================================
+
+analyze_text'in birleşik (fused) geçişi, ayrı katman fonksiyonlarıyla birebir
+aynı çıktıyı üretmeli. Stanza gerektirmez: kayıtlı parse'lar (ReplayBackend).
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+
+TEXTS = [
+    "Ali'nin okuduğu kitap burada.",
+    "Kuşlar uçar.",
+    "Kuşlar uçtu.",
+    "Ali sabahları erken kalkar.",
+    "Yüzme havuzu temiz.",
+]
+
+
+class TestSentenceLayers(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+
+    def test_matches_standalone_layers(self):
+        from api.pos_semantic_analyzer import (
+            _sentence_layers,
+            analyze_discourse_features,
+            analyze_information_structure,
+            analyze_propositional_semantics,
+            analyze_text,
+        )
+
+        for text in TEXTS:
+            for sentence in analyze_text(text, use_cache=False)["sentences"]:
+                words = sentence["words"]
+                preference_map = {w["text"]: w["preference"] for w in words if w["preference"]}
+                summary, discourse, information, finiteness = _sentence_layers(
+                    words, preference_map, True)
+                self.assertEqual(summary, sentence["preferences"] or [])
+                self.assertEqual(discourse, analyze_discourse_features(words))
+                self.assertEqual(information, analyze_information_structure(words, sentence["text"]))
+                expected = analyze_propositional_semantics(sentence["text"], words)
+                self.assertEqual(finiteness, expected["clause_finiteness"])
+                if sentence["semantics"]:
+                    self.assertEqual(sentence["semantics"]["discourse"], discourse)
+                    self.assertEqual(sentence["semantics"]["information_structure"], information)
+
+    def test_without_semantics(self):
+        from api.pos_semantic_analyzer import _sentence_layers, analyze_text
+
+        (sentence,) = analyze_text("Ali'nin okuduğu kitap burada.", include_semantics=False,
+                                   use_cache=False)["sentences"]
+        self.assertIsNone(sentence["semantics"])
+        self.assertTrue(sentence["preferences"])
+        summary, discourse, information, _ = _sentence_layers(sentence["words"], {}, False)
+        self.assertEqual((summary, discourse, information), ([], None, None))
+        self.assertTrue(all(w["preference"] is None for w in sentence["words"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
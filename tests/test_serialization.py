@@ -0,0 +1,138 @@
+"""
+Hızlı JSON Serileştirme Testleri
+================================
+
+Stanza gerektirmez: analiz sonuçları kayıtlı parse'larla (ReplayBackend)
+üretilir. orjson opsiyoneldir; kurulu değilse ilgili testler atlanır.
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from error_detection.minimalist_pos_error_detection import POSErrorType
+from src import serialization
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+from src.propositional_semantics import PredicateType, SentenceType, TurkishPropositionAnalyzer
+
+TEXTS = [
+    "Ali'nin okuduğu kitap burada.",
+    "Kuşlar uçar. Kuşlar uçtu.",
+    "Ali sabahları erken kalkar.",
+    "Yüzme havuzu temiz.",
+]
+
+
+class TestSerialization(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from api.pos_semantic_analyzer import analyze_text
+
+        previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+        try:
+            cls.results = [analyze_text(text, use_cache=False) for text in TEXTS]
+        finally:
+            set_parser_backend(previous)
+
+    def tearDown(self):
+        serialization.set_encoder()
+
+    def test_compact_utf8_roundtrip(self):
+        dumps = serialization.encoder('json')
+        for result in self.results:
+            payload = dumps(result)
+            self.assertEqual(payload, json.dumps(result, ensure_ascii=False,
+                                                 separators=(',', ':')).encode('utf-8'))
+            self.assertEqual(json.loads(payload), result)
+        self.assertIn("okuduğu".encode('utf-8'), dumps(self.results[0]))
+
+    def test_enums_and_to_dict_objects(self):
+        analyzer = TurkishPropositionAnalyzer()
+        value = analyzer.calculate_propositional_value(
+            PredicateType.HOLISTIC, analyzer.analyze_specificity("Number=Plur", "Kuşlar", "NOUN"),
+            SentenceType.PROPERTY)
+        record = {"type": POSErrorType.NOUN_VERB_CONFUSION, "predicate": PredicateType.PARTITIVE,
+                  "value": value}
+        for name in serialization.ENCODERS:
+            if name == 'orjson' and serialization.orjson is None:
+                continue
+            decoded = json.loads(serialization.encoder(name)(record))
+            self.assertEqual(decoded["type"], "NOUN ↔ VERB")
+            self.assertEqual(decoded["predicate"], "parçalı")
+            self.assertEqual(decoded["value"], value.to_dict())
+        with self.assertRaises(TypeError):
+            serialization.dumps({"x": object()})
+
+    @unittest.skipIf(serialization.orjson is None, "orjson not installed")
+    def test_orjson_matches_stdlib(self):
+        for result in self.results:
+            self.assertEqual(serialization.encoder('orjson')(result),
+                             serialization.encoder('json')(result))
+
+    def test_edge_cases(self):
+        """str olmayan anahtarlar ve sonlu olmayan float'lar (stdlib yolu)"""
+        dumps = serialization.encoder('json')
+        self.assertEqual(dumps({1: "a", "b": 2}), b'{"1":"a","b":2}')
+        with self.assertRaises(ValueError):
+            dumps({"x": float('nan')})
+        with self.assertRaises(ValueError):
+            dumps([float('inf')])
+        self.assertEqual(json.loads(dumps({"x": 1e20})), {"x": 1e20})
+
+    @unittest.skipIf(serialization.orjson is None, "orjson not installed")
+    def test_orjson_edge_cases(self):
+        """İki kodlayıcının bilinen ve belgelenen farkları"""
+        orjson_dumps = serialization.encoder('orjson')
+        stdlib_dumps = serialization.encoder('json')
+        self.assertEqual(orjson_dumps({1: "a", "b": 2}), stdlib_dumps({1: "a", "b": 2}))
+        self.assertEqual(orjson_dumps({"x": float('nan')}), b'{"x":null}')
+        self.assertEqual(json.loads(orjson_dumps({"x": 1e20})), json.loads(stdlib_dumps({"x": 1e20})))
+
+    def test_stdlib_fallback_without_orjson(self):
+        with mock.patch.object(serialization, 'orjson', None):
+            self.assertEqual(serialization.set_encoder(), 'json')
+            with self.assertRaises(ImportError):
+                serialization.encoder('orjson')
+        with self.assertRaises(ValueError):
+            serialization.encoder('ujson')
+
+    def test_write_jsonl(self):
+        stream = io.BytesIO()
+        with mock.patch.object(serialization, 'DEFAULT_BUFFER_SIZE', 100):
+            self.assertEqual(serialization.write_jsonl(self.results * 3, stream), 12)
+        lines = stream.getvalue().split(b'\n')
+        self.assertEqual(lines[-1], b'')
+        self.assertEqual([json.loads(line) for line in lines[:-1]], self.results * 3)
+
+    def test_jsonl_writer(self):
+        from api.lazy_result import analyze_text_lazy
+
+        previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+        try:
+            lazy = analyze_text_lazy(TEXTS[0])
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "sonuc.jsonl")
+                with serialization.JsonlWriter(path) as writer:
+                    writer.write(lazy)
+                    writer.write_all(self.results[1:])
+                self.assertEqual(writer.records, 4)
+                with open(path, encoding="utf-8") as f:
+                    records = [json.loads(line) for line in f]
+        finally:
+            set_parser_backend(previous)
+        self.assertEqual(records, self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tracing Span Testleri
+=====================
+
+Stanza gerektirmez: analyze_text kayıtlı parse'larla (ReplayBackend) çalışır.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Parent directory ekle
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from src import instrumentation
+from src.instrumentation import stage
+from src.parse_fixtures import DEFAULT_FIXTURE_PATH
+from src.parser_backend import ReplayBackend, set_parser_backend
+from src.pipeline_pool import PipelinePool
+from src.tracing import (
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    disable_tracing,
+    enable_tracing,
+    span,
+    tracing_active,
+)
+
+
+class TracingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        enable_tracing(self.exporter)
+
+    def tearDown(self):
+        disable_tracing()
+
+    def by_name(self, name):
+        return [s for s in self.exporter.spans if s["name"] == name]
+
+
+class TestSpans(TracingTestCase):
+
+    def test_disabled_is_noop(self):
+        disable_tracing()
+        self.assertFalse(tracing_active())
+        self.assertIsNone(instrumentation._tracer)
+        with span("request") as active:
+            self.assertIsNone(active)
+        self.assertEqual(self.exporter.spans, [])
+
+    def test_parent_child_and_correlation(self):
+        with span("request", correlation_ids=["req-1"]) as root:
+            with stage("detect_errors"):
+                pass
+        child, parent = self.exporter.spans
+        self.assertEqual(parent["span_id"], root.span_id)
+        self.assertIsNone(parent["parent_span_id"])
+        self.assertEqual(child["name"], "detect_errors")
+        self.assertEqual(child["parent_span_id"], parent["span_id"])
+        self.assertEqual(child["trace_id"], parent["trace_id"])
+        self.assertEqual(len(parent["trace_id"]), 32)
+        self.assertEqual(len(parent["span_id"]), 16)
+        self.assertEqual(child["attributes"]["correlation_ids"], ["req-1"])
+        self.assertLessEqual(parent["start_time_unix_nano"], child["start_time_unix_nano"])
+        self.assertLessEqual(child["end_time_unix_nano"], parent["end_time_unix_nano"])
+
+    def test_error_status(self):
+        with self.assertRaises(KeyError):
+            with span("request"):
+                with stage("parse"):
+                    raise KeyError("x")
+        for exported in self.exporter.spans:
+            self.assertEqual(exported["status"]["code"], "ERROR")
+            self.assertIn("KeyError", exported["status"]["message"])
+
+    def test_pipeline_wait_span(self):
+        pool = PipelinePool(processors='tokenize', size=1, factory=lambda lang, processors: object())
+        held = pool.checkout()
+        waiter = threading.Thread(target=lambda: pool.checkin(pool.checkout()))
+        waiter.start()
+        while pool.waiting == 0:
+            time.sleep(0.001)
+        pool.checkin(held)
+        waiter.join()
+        self.assertEqual(len(self.by_name("pipeline_wait")), 1)
+
+    def test_jsonl_exporter(self):
+        disable_tracing()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "traces.jsonl")
+            exporter = JsonlSpanExporter(path)
+            enable_tracing(exporter)
+            with span("request", attributes={"user": "ç"}):
+                pass
+            disable_tracing()
+            exporter.close()
+            with open(path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["attributes"], {"user": "ç"})
+        self.assertEqual(records[0]["resource"], {"service.name": "turkish-analyzer"})
+
+
+class TestBatchTracing(TracingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.previous = set_parser_backend(ReplayBackend(DEFAULT_FIXTURE_PATH))
+
+    def tearDown(self):
+        set_parser_backend(self.previous)
+        super().tearDown()
+
+    def test_document_spans_and_links(self):
+        from api.batch import analyze_corpus
+
+        result = analyze_corpus(["Kuşlar uçar. Kuşlar uçtu.", "Kuşlar uçar."],
+                                include_semantics=False, correlation_ids=["a", "b"])
+        self.assertEqual([d["correlation_id"] for d in result["documents"]], ["a", "b"])
+
+        (batch,) = self.by_name("analyze_corpus")
+        documents = {tuple(s["attributes"]["correlation_ids"]): s for s in self.by_name("document")}
+        self.assertEqual(set(documents), {("a",), ("b",)})
+        for document in documents.values():
+            self.assertEqual(document["parent_span_id"], batch["span_id"])
+            self.assertGreaterEqual(document["attributes"]["batch.queue_seconds"], 0)
+            self.assertGreater(document["attributes"]["batch.compute_seconds"], 0)
+
+        shared, own = self.by_name("batch_sentence")
+        self.assertEqual(shared["attributes"]["correlation_ids"], ["a", "b"])
+        self.assertEqual({link["span_id"] for link in shared["links"]},
+                         {documents[("a",)]["span_id"], documents[("b",)]["span_id"]})
+        self.assertEqual(own["attributes"]["correlation_ids"], ["a"])
+
+        # Aşama span'leri cümle span'inin altında ve korelasyonu miras alır
+        (detect,) = [s for s in self.by_name("detect_errors")
+                     if s["attributes"]["correlation_ids"] == ["a"]]
+        self.assertEqual(detect["trace_id"], batch["trace_id"])
+
+    def test_correlation_ids_length_checked(self):
+        from api.batch import analyze_corpus
+
+        with self.assertRaises(ValueError):
+            analyze_corpus(["Kuşlar uçar."], include_semantics=False, correlation_ids=["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()